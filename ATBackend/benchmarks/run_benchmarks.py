@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmark Suite
+Measures the hot path of every Python engine over the fixed corpus in corpus.json
+Each benchmark runs in its own process so peak RSS and import cost are isolated,
+and reports wall time, Swiss Ephemeris call counts, subprocess launches and errors
+
+Usage:
+    python benchmarks/run_benchmarks.py                        # run everything
+    python benchmarks/run_benchmarks.py -k panchang -r 5       # filter by name, 5 repeats
+    python benchmarks/run_benchmarks.py -o results.json        # save for later comparison
+    python benchmarks/run_benchmarks.py --compare base.json results.json
+
+Runs fully offline: engines that normally fetch their chart from the platform
+API are fed the in-process JyotishaEngine result instead.
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+SERVER_DIR = os.path.join(BACKEND_DIR, 'server')
+CORPUS_PATH = os.path.join(BENCH_DIR, 'corpus.json')
+
+
+def load_engine(filename: str, module_name: str):
+    """Import an engine script by file name (most have hyphenated names)"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(SERVER_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def birth_chart(record: Dict) -> Dict:
+    """In-process chart from the primary engine, shared by benchmarks that need one"""
+    engine = load_engine('jyotisha-engine.py', 'jyotisha_engine')
+    return engine.JyotishaEngine.calculate_birth_chart(dict(record))
+
+
+# Each setup function receives the corpus and returns one zero-argument callable per case
+
+def setup_birth_chart(corpus: Dict) -> List[Callable]:
+    engine = load_engine('jyotisha-engine.py', 'jyotisha_engine').JyotishaEngine
+    return [lambda r=r: engine.calculate_birth_chart(dict(r)) for r in corpus['birth_records']]
+
+
+def setup_panchang(corpus: Dict) -> List[Callable]:
+    engine = load_engine('drik-panchang-corrected.py', 'drik_panchang_corrected').DrikPanchangCorrected
+    return [
+        lambda d=d: engine.calculate_comprehensive_panchang(d['date'], d['latitude'], d['longitude'], d['timezone'])
+        for d in corpus['panchang_days']
+    ]
+
+
+def setup_premium_report(corpus: Dict) -> List[Callable]:
+    premium = load_engine('premium-report-engine.py', 'premium_report_engine')
+    engine = premium.PremiumReportEngine()
+    # The platform API round-trip is not part of the engine; serve the chart in-process
+    engine.get_jyotisha_data = birth_chart
+    return [lambda r=r: engine.generate_complete_report(dict(r)) for r in corpus['birth_records']]
+
+
+def setup_dasha_timeline(corpus: Dict) -> List[Callable]:
+    dasha = load_engine('authentic-dasha-timeline.py', 'authentic_dasha_timeline')
+    return [lambda r=r: dasha.calculate_authentic_dasha_timeline(dict(r)) for r in corpus['birth_records']]
+
+
+def setup_sade_sati(corpus: Dict) -> List[Callable]:
+    sade_sati = load_engine('enhanced-sade-sati.py', 'enhanced_sade_sati')
+    cases = []
+    for r in corpus['birth_records']:
+        dt = datetime.strptime(f"{r['date']} {r['time']}", '%Y-%m-%d %H:%M')
+        cases.append(lambda dt=dt, r=r: sade_sati.calculate_sade_sati(
+            dt.year, dt.month, dt.day, dt.hour, dt.minute, r['place'], r['latitude'], r['longitude']))
+    return cases
+
+
+def setup_marriage_matching(corpus: Dict) -> List[Callable]:
+    marriage = load_engine('marriage-analysis-engine.py', 'marriage_analysis_engine')
+    records = corpus['birth_records']
+    return [
+        lambda a=records[i], b=records[j]: marriage.marriage_analysis_main(dict(a), dict(b))
+        for i, j in corpus['matching_pairs']
+    ]
+
+
+def setup_lal_kitab(corpus: Dict) -> List[Callable]:
+    lal_kitab = load_engine('lal-kitab-jyotisha.py', 'lal_kitab_jyotisha')
+
+    def analyze(record: Dict) -> Dict:
+        chart = birth_chart(record)
+        return lal_kitab.analyze_lal_kitab_planets(chart['planets'], chart['ascendant'], {
+            'name': record['name'],
+            'birthDate': record['date'],
+            'birthTime': record['time'],
+            'birthPlace': record['place']
+        })
+
+    return [lambda r=r: analyze(r) for r in corpus['birth_records']]
+
+
+BENCHMARKS = {
+    'birth_chart': setup_birth_chart,
+    'panchang': setup_panchang,
+    'premium_report': setup_premium_report,
+    'dasha_timeline': setup_dasha_timeline,
+    'sade_sati': setup_sade_sati,
+    'marriage_matching': setup_marriage_matching,
+    'lal_kitab': setup_lal_kitab,
+}
+
+
+def install_counters(counts: Counter):
+    """Count every swisseph function call and every subprocess launch in this process"""
+    try:
+        import swisseph as swe
+    except ImportError:
+        swe = None
+
+    if swe is not None:
+        for name in dir(swe):
+            func = getattr(swe, name)
+            if name.startswith('_') or not callable(func) or isinstance(func, type):
+                continue
+
+            def counted(*args, _func=func, _key=f"swe.{name}", **kwargs):
+                counts[_key] += 1
+                return _func(*args, **kwargs)
+
+            setattr(swe, name, counted)
+
+    original_popen_init = subprocess.Popen.__init__
+
+    def counted_popen_init(self, *args, **kwargs):
+        counts['subprocess'] += 1
+        original_popen_init(self, *args, **kwargs)
+
+    subprocess.Popen.__init__ = counted_popen_init
+
+
+def is_failure(result) -> bool:
+    if not isinstance(result, dict):
+        return result is None
+    return result.get('success') is False or ('error' in result and 'success' not in result)
+
+
+def run_child(name: str, repeat: int, verbose: bool, conn):
+    """Body of the per-benchmark process; sends its measurements back through conn"""
+    if not verbose:
+        # Engines print heavily to both streams; keep the report readable
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+
+    counts = Counter()
+    install_counters(counts)
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, SERVER_DIR)
+
+    with open(CORPUS_PATH) as f:
+        corpus = json.load(f)
+
+    start = time.perf_counter()
+    cases = BENCHMARKS[name](corpus)
+    setup_s = time.perf_counter() - start
+
+    counts.clear()
+    timings, cold, errors = [], [], 0
+    for iteration in range(repeat):
+        for case in cases:
+            start = time.perf_counter()
+            try:
+                failed = is_failure(case())
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+            if iteration == 0:
+                cold.append(elapsed)
+            errors += failed
+
+    calls = len(timings)
+    swe_counts = {k: v for k, v in counts.items() if k.startswith('swe.')}
+    conn.send({
+        'cases': len(cases),
+        'calls': calls,
+        'errors': errors,
+        'setup_ms': round(setup_s * 1000, 3),
+        'cold_mean_ms': round(statistics.mean(cold) * 1000, 3),
+        'min_ms': round(min(timings) * 1000, 3),
+        'median_ms': round(statistics.median(timings) * 1000, 3),
+        'mean_ms': round(statistics.mean(timings) * 1000, 3),
+        'swe_calls_per_call': round(sum(swe_counts.values()) / calls, 1),
+        'swe_calls_by_function': {k: round(v / calls, 1) for k, v in sorted(swe_counts.items())},
+        'subprocesses_per_call': round(counts['subprocess'] / calls, 2),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    })
+    conn.close()
+
+
+def run_benchmark(name: str, repeat: int, verbose: bool) -> Dict:
+    ctx = multiprocessing.get_context('spawn')
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=run_child, args=(name, repeat, verbose, child_conn))
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:
+        result = {'crashed': True}
+    process.join()
+    if process.exitcode:
+        result['exit_code'] = process.exitcode
+    return result
+
+
+def environment() -> Dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    try:
+        import swisseph as swe
+        swe_version = swe.version
+    except ImportError:
+        swe_version = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'swisseph': swe_version
+    }
+
+
+def print_results(results: Dict):
+    header = f"{'benchmark':<20}{'cases':>6}{'err':>5}{'cold ms':>11}{'median ms':>11}{'min ms':>10}{'swe/call':>10}{'procs':>7}{'rss MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results['benchmarks'].items():
+        if r.get('crashed'):
+            print(f"{name:<20}  crashed (exit code {r.get('exit_code')})")
+            continue
+        print(f"{name:<20}{r['cases']:>6}{r['errors']:>5}{r['cold_mean_ms']:>11.1f}{r['median_ms']:>11.1f}"
+              f"{r['min_ms']:>10.1f}{r['swe_calls_per_call']:>10.0f}{r['subprocesses_per_call']:>7.1f}"
+              f"{r['peak_rss_kb'] / 1024:>8.1f}")
+
+
+def compare(base_path: str, new_path: str):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    print(f"base {base['meta'].get('commit') or base_path}  ->  new {new['meta'].get('commit') or new_path}")
+    header = f"{'benchmark':<20}{'median ms':>22}{'change':>9}{'swe/call':>18}{'rss MB':>16}"
+    print(header)
+    print('-' * len(header))
+    for name, n in new['benchmarks'].items():
+        b = base['benchmarks'].get(name)
+        if not b or b.get('crashed') or n.get('crashed'):
+            print(f"{name:<20}  not comparable")
+            continue
+        change = (n['median_ms'] - b['median_ms']) / b['median_ms'] * 100 if b['median_ms'] else 0.0
+        print(f"{name:<20}{b['median_ms']:>10.1f} -> {n['median_ms']:>8.1f}{change:>+8.1f}%"
+              f"{b['swe_calls_per_call']:>8.0f} -> {n['swe_calls_per_call']:>6.0f}"
+              f"{b['peak_rss_kb'] / 1024:>7.1f} -> {n['peak_rss_kb'] / 1024:>5.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Python astrology engines')
+    parser.add_argument('-k', dest='filter', help='only run benchmarks whose name contains this text')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='passes over the corpus (first is cold)')
+    parser.add_argument('-o', '--output', help='write results as JSON to this path')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show engine stdout/stderr')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help='compare two result files')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    names = [n for n in BENCHMARKS if not args.filter or args.filter in n]
+    results = {'meta': environment(), 'benchmarks': {}}
+    results['meta']['repeat'] = args.repeat
+    for name in names:
+        results['benchmarks'][name] = run_benchmark(name, args.repeat, args.verbose)
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
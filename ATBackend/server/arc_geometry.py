@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Zodiac Arc Geometry
+Shared helpers for questions of the form "which grahas lie on which side of an
+axis": normalized arcs, a sorted-longitude sweep that splits grahas around the
+Rahu-Ketu axis in one pass, and the complete/partial hemming classification
+used for Kaal Sarp dosha. The counting helpers are plain arithmetic, so they
+work on floats for one chart or on NumPy columns for many.
+
+Usage:
+    python arc_geometry.py --verify 10000      # randomized property checks
+"""
+
+import json
+import random
+import sys
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Dict, Optional, Sequence
+
+import engine_logging
+
+log = engine_logging.get_logger('arc_geometry')
+
+COMPLETE, PARTIAL, NONE = 'Complete', 'Partial', 'None'
+STATUS_CODES = {NONE: 0, PARTIAL: 1, COMPLETE: 2}
+
+# Side of the axis holding the grahas, named head-tail in zodiacal order
+RAHU_TO_KETU, KETU_TO_RAHU = 'Rahu-Ketu', 'Ketu-Rahu'
+
+# Grahas hemmed by the nodes for Kaal Sarp
+KAAL_SARP_GRAHAS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+
+# A single graha escaping the axis still counts as partial hemming
+PARTIAL_LIMIT = 1
+
+Hemming = namedtuple('Hemming', ['status', 'side', 'ahead', 'behind', 'order', 'outside'])
+
+
+def normalize(longitude: float) -> float:
+    return longitude % 360
+
+
+def arc_length(start: float, end: float) -> float:
+    """Length of the arc travelling forward in the zodiac from start to end"""
+    return (end - start) % 360
+
+
+def in_arc(longitude: float, start: float, end: float) -> bool:
+    """Whether longitude lies on the closed forward arc from start to end"""
+    return (longitude - start) % 360 <= arc_length(start, end)
+
+
+def arc_counts(longitudes: Sequence, head, tail=None):
+    """
+    (ahead, behind): how many longitudes fall on the forward arc head -> tail
+    and how many on the rest of the circle. The tail defaults to the point
+    opposite the head. Longitudes may be floats or NumPy columns.
+    """
+    span = 180 if tail is None else (tail - head) % 360
+    ahead = sum((longitude - head) % 360 < span for longitude in longitudes)
+    return ahead, len(longitudes) - ahead
+
+
+def classify_counts(ahead, behind, partial_limit: int = PARTIAL_LIMIT):
+    """Status code per STATUS_CODES for side counts (ints or NumPy columns)"""
+    complete = (ahead == 0) | (behind == 0)
+    partial = (complete ^ True) & ((ahead <= partial_limit) | (behind <= partial_limit))
+    return complete * 2 + partial
+
+
+def hemming(longitudes: Dict[str, float], head: float, tail: Optional[float] = None,
+            partial_limit: int = PARTIAL_LIMIT) -> Hemming:
+    """
+    Split named longitudes around the head -> tail axis with one sort: the
+    grahas ahead of the head come first in the sweep, so the side counts are
+    a single bisection and the escaping grahas are a slice
+    """
+    span = 180 if tail is None else arc_length(head, tail)
+    sweep = sorted(((longitude - head) % 360, name) for name, longitude in longitudes.items())
+    split = bisect_left(sweep, (span,))
+    order = [name for _, name in sweep]
+    ahead, behind = split, len(order) - split
+
+    status = (COMPLETE, PARTIAL, NONE)[2 - classify_counts(ahead, behind, partial_limit)]
+    if status == NONE:
+        side, outside = None, []
+    elif behind <= ahead:
+        side, outside = RAHU_TO_KETU, order[split:]
+    else:
+        side, outside = KETU_TO_RAHU, order[:split]
+    return Hemming(status, side, ahead, behind, order, outside)
+
+
+def kaal_sarp(planets: Dict[str, Dict], partial_limit: int = PARTIAL_LIMIT) -> Hemming:
+    """
+    Kaal Sarp hemming for a chart's planets mapping (name -> dict with
+    longitude). Ketu is taken opposite Rahu.
+    """
+    longitudes = {name: planets[name]['longitude'] for name in KAAL_SARP_GRAHAS if name in planets}
+    return hemming(longitudes, planets['Rahu']['longitude'], partial_limit=partial_limit)
+
+
+def classify_bulk(longitudes, heads, tails=None, partial_limit: int = PARTIAL_LIMIT) -> Dict:
+    """
+    Hemming for many charts at once: longitudes is N x k (the hemmed grahas),
+    heads and the optional tails have length N. Returns status codes (see
+    STATUS_CODES) and per-side counts as arrays.
+    """
+    import numpy as np
+
+    longitudes = np.asarray(longitudes, dtype=float)
+    heads = np.asarray(heads, dtype=float)
+    tails = None if tails is None else np.asarray(tails, dtype=float)
+    ahead, behind = arc_counts(list(longitudes.T), heads, tails)
+    return {
+        'status': classify_counts(ahead, behind, partial_limit),
+        'ahead': ahead,
+        'behind': behind
+    }
+
+
+def _random_chart(rng: random.Random) -> Dict[str, float]:
+    """Uniform charts rarely hem; cluster half of them inside a random window"""
+    if rng.random() < 0.5:
+        return {name: rng.uniform(0, 360) for name in KAAL_SARP_GRAHAS}
+    start, width = rng.uniform(0, 360), rng.uniform(60, 220)
+    return {name: (start + rng.uniform(0, width)) % 360 for name in KAAL_SARP_GRAHAS}
+
+
+def verify(count: int, seed: int = 0) -> Dict[str, int]:
+    """
+    Randomized property checks: sweep counts match per-graha arc tests, the
+    classification is invariant under rotating the whole chart, swapping head
+    and tail swaps the sides, and bulk mode agrees with the scalar sweep
+    """
+    rng = random.Random(seed)
+    failures = {'brute_force': 0, 'rotation': 0, 'axis_swap': 0, 'bulk': 0}
+    charts, heads, results = [], [], []
+
+    for _ in range(count):
+        chart, head = _random_chart(rng), rng.uniform(0, 360)
+        result = hemming(chart, head)
+        tail = (head + 180) % 360
+
+        brute_ahead = sum(1 for longitude in chart.values()
+                          if in_arc(longitude, head, tail) and longitude % 360 != tail)
+        failures['brute_force'] += brute_ahead != result.ahead
+
+        shift = rng.uniform(0, 360)
+        rotated = hemming({name: (lon + shift) % 360 for name, lon in chart.items()}, (head + shift) % 360)
+        failures['rotation'] += (rotated.status, rotated.side) != (result.status, result.side)
+
+        swapped = hemming(chart, tail, head)
+        failures['axis_swap'] += (swapped.ahead, swapped.behind) != (result.behind, result.ahead)
+
+        charts.append([chart[name] for name in KAAL_SARP_GRAHAS])
+        heads.append(head)
+        results.append(STATUS_CODES[result.status])
+
+    bulk = classify_bulk(charts, heads)
+    failures['bulk'] = sum(int(code) != expected for code, expected in zip(bulk['status'], results))
+    log.debug("Verified {} charts: {}", count, failures)
+    return failures
+
+
+def main():
+    """Command line: --verify N runs the randomized property checks"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            if len(sys.argv) < 3 or sys.argv[1] != '--verify':
+                raise ValueError("Usage: python arc_geometry.py --verify <count>")
+            count = int(sys.argv[2])
+            failures = verify(count)
+        result = {'success': not any(failures.values()), 'checked': count, 'failures': failures}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,28 @@
 """
 High-precision astronomical engine for Panchang calculations
 Uses professional astronomical libraries for accurate results
+
+The JPL kernel and timescale are opened once per process from local files
+only (the kernel is memory-mapped by jplephem), and Sun/Moon positions can
+be evaluated for whole arrays of instants - a month at minute resolution -
+with the Lahiri ayanamsa taken per instant.
+
+Usage:
+    python astronomical-engine.py <date> <latitude> <longitude> <timezone>
+    python astronomical-engine.py --month <YYYY-MM> <timezone> [step_minutes]
 """
 
+import os
 import sys
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pytz
+
+import ayanamsa_service
 try:
     import ephem
-    from skyfield.api import load, utc
+    from skyfield.api import load, load_file, utc
     from skyfield.almanac import find_discrete, sunrise_sunset
     from skyfield.data import hipparcos, stellarium
     from skyfield.positionlib import Apparent
@@ -18,19 +31,52 @@ except ImportError as e:
     print(f"Error importing astronomical libraries: {e}", file=sys.stderr)
     sys.exit(1)
 
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# NASA JPL DE421 kernel; never downloaded at run time. SKYFIELD_KERNEL may
+# point elsewhere, otherwise the ephemeris cache and the working directory
+# (where skyfield's load() used to save it) are searched.
+KERNEL_NAME = 'de421.bsp'
+KERNEL_ENV = 'SKYFIELD_KERNEL'
+KERNEL_DIRS = (os.path.join(SERVER_DIR, 'cache', 'ephemeris'), SERVER_DIR, os.getcwd())
+
+def kernel_path():
+    """Local path of the JPL kernel, or FileNotFoundError naming the places searched"""
+    candidates = [os.environ[KERNEL_ENV]] if os.environ.get(KERNEL_ENV) else []
+    candidates += [os.path.join(directory, KERNEL_NAME) for directory in KERNEL_DIRS]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"{KERNEL_NAME} not found (set {KERNEL_ENV} or place it in one of: "
+                            f"{', '.join(candidates)})")
+
+
+@lru_cache(maxsize=None)
+def shared_ephemeris():
+    """
+    Process-wide (timescale, kernel): the builtin timescale needs no
+    leap-second or Delta T downloads and load_file never fetches the kernel
+    """
+    return load.timescale(builtin=True), load_file(kernel_path())
+
+
+def lahiri_ayanamsa(jd_ut):
+    """
+    True Lahiri ayanamsa (with nutation, matching the equinox of date) for a
+    Julian day or an array of them
+    """
+    return ayanamsa_service.ayanamsa_bulk(jd_ut, nutation=True)
+
+
 class PrecisionPanchangCalculator:
     """Professional-grade Panchang calculator using Skyfield and PyEphem"""
     
     def __init__(self):
-        self.ts = load.timescale()
-        self.eph = load('de421.bsp')  # NASA JPL ephemeris
+        self.ts, self.eph = shared_ephemeris()  # NASA JPL ephemeris
         self.earth = self.eph['earth']
         self.moon = self.eph['moon']
         self.sun = self.eph['sun']
         
-        # Lahiri Ayanamsa for sidereal calculations
-        self.ayanamsa_2025 = 24.1  # degrees
-        
         # Nakshatra names and lords
         self.nakshatras = [
             ('Ashwini', 'Ketu'), ('Bharani', 'Venus'), ('Krittika', 'Sun'),
@@ -83,20 +129,8 @@ class PrecisionPanchangCalculator:
             # Convert to Skyfield time
             t = self.ts.from_datetime(dt.astimezone(utc))
             
-            # Create observer location
-            observer = self.earth + (latitude * ephem.degree, longitude * ephem.degree)
-            
-            # Get lunar and solar positions
-            moon_pos = observer.at(t).observe(self.moon)
-            sun_pos = observer.at(t).observe(self.sun)
-            
-            # Get ecliptic longitudes
-            moon_lon = moon_pos.ecliptic_latlon()[1].degrees
-            sun_lon = sun_pos.ecliptic_latlon()[1].degrees
-            
-            # Apply Lahiri Ayanamsa for sidereal coordinates
-            moon_sidereal = (moon_lon - self.ayanamsa_2025) % 360
-            sun_sidereal = (sun_lon - self.ayanamsa_2025) % 360
+            # Geocentric sidereal longitudes with the ayanamsa of this instant
+            sun_sidereal, moon_sidereal, ayanamsa = (float(value) for value in self.sidereal_longitudes(t))
             
             # Calculate Panchang elements using authentic formulas
             tithi_data = self.calculate_tithi(moon_sidereal, sun_sidereal, dt)
@@ -139,7 +173,7 @@ class PrecisionPanchangCalculator:
                 'astronomical': {
                     'moonLongitude': moon_sidereal,
                     'sunLongitude': sun_sidereal,
-                    'ayanamsa': self.ayanamsa_2025,
+                    'ayanamsa': ayanamsa,
                     'method': 'NASA JPL DE421 Ephemeris with Skyfield'
                 }
             }
@@ -151,6 +185,75 @@ class PrecisionPanchangCalculator:
                 'date': date_str
             }
 
+    def sidereal_longitudes(self, t):
+        """
+        (sun, moon, ayanamsa) in degrees for a Skyfield Time, scalar or array:
+        apparent geocentric longitudes on the ecliptic of date less the Lahiri
+        ayanamsa of each instant
+        """
+        earth = self.earth.at(t)
+        sun = earth.observe(self.sun).apparent().ecliptic_latlon(epoch='date')[1].degrees
+        moon = earth.observe(self.moon).apparent().ecliptic_latlon(epoch='date')[1].degrees
+        ayanamsa = lahiri_ayanamsa(t.ut1)
+        return (sun - ayanamsa) % 360, (moon - ayanamsa) % 360, ayanamsa
+
+    def panchang_series(self, year, month, timezone_str='Asia/Kolkata', step_minutes=1):
+        """
+        Sun/Moon positions and panchang element indices for every step of a
+        local calendar month, evaluated as arrays in one pass. Indices are
+        0-based: tithi of 30, nakshatra and yoga of 27, karana of 60 half-tithis.
+        """
+        import numpy as np
+
+        tz = pytz.timezone(timezone_str)
+        start = tz.localize(datetime(year, month, 1)).astimezone(utc)
+        end = tz.localize(datetime(year + month // 12, month % 12 + 1, 1)).astimezone(utc)
+        minutes = np.arange(0, (end - start).total_seconds() / 60, step_minutes)
+        t = self.ts.utc(start.year, start.month, start.day, start.hour, start.minute + minutes, start.second)
+
+        sun, moon, ayanamsa = self.sidereal_longitudes(t)
+        elongation = (moon - sun) % 360
+        return {
+            'start': start,
+            'minutes': minutes,
+            'sun': sun,
+            'moon': moon,
+            'ayanamsa': ayanamsa,
+            'tithi': (elongation // 12).astype(int),
+            'karana': (elongation // 6).astype(int),
+            'nakshatra': (moon * 27 / 360).astype(int) % 27,
+            'yoga': ((sun + moon) % 360 * 27 / 360).astype(int) % 27
+        }
+
+    def tithi_name(self, index):
+        """Name and paksha of a 0-based tithi of 30; the last is Amavasya, not Purnima"""
+        paksha = 'Shukla Paksha' if index < 15 else 'Krishna Paksha'
+        return ('Amavasya' if index == 29 else self.tithis[index % 15]), paksha
+
+    def element_changes(self, series, timezone_str='Asia/Kolkata'):
+        """Local start times of every tithi, nakshatra and yoga found in a series"""
+        import numpy as np
+
+        tz = pytz.timezone(timezone_str)
+        names = {
+            'tithi': lambda i: self.tithi_name(i)[0],
+            'nakshatra': lambda i: self.nakshatras[i][0],
+            'yoga': lambda i: self.yogas[i]
+        }
+        changes = {}
+        for element, name in names.items():
+            values = series[element]
+            steps = np.flatnonzero(values[1:] != values[:-1]) + 1
+            changes[element] = [{
+                'number': int(values[step]) + 1,
+                'name': name(int(values[step])),
+                'start': (series['start'] + timedelta(minutes=float(series['minutes'][step])))
+                .astimezone(tz).strftime('%Y-%m-%d %H:%M')
+            } for step in steps]
+        for change in changes['tithi']:
+            change['paksha'] = self.tithi_name(change['number'] - 1)[1]
+        return changes
+
     def calculate_tithi(self, moon_lon, sun_lon, dt):
         """Calculate Tithi using authentic formula: (Moon - Sun longitude) / 12°"""
         diff = (moon_lon - sun_lon) % 360
@@ -344,6 +447,25 @@ class PrecisionPanchangCalculator:
 
 def main():
     """CLI interface for the astronomical engine"""
+    if len(sys.argv) >= 4 and sys.argv[1] == '--month':
+        try:
+            year, month = (int(part) for part in sys.argv[2].split('-'))
+            step = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+            calculator = PrecisionPanchangCalculator()
+            series = calculator.panchang_series(year, month, sys.argv[3], step)
+            result = {
+                'success': True,
+                'month': sys.argv[2],
+                'timezone': sys.argv[3],
+                'stepMinutes': step,
+                'instants': len(series['minutes']),
+                'changes': calculator.element_changes(series, sys.argv[3])
+            }
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        print(json.dumps(result, indent=2))
+        return
+
     if len(sys.argv) != 5:
         print("Usage: python astronomical-engine.py <date> <latitude> <longitude> <timezone>")
         sys.exit(1)
@@ -4,12 +4,16 @@ Authentic Planetary Positions Calculator
 Using Swiss Ephemeris with Lahiri Ayanamsa for precise Vedic calculations
 """
 
-import swisseph as swe
 import math
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any
 import json
 
+import swisseph as swe
+
+import chart_core
+import nakshatra_lookup
+
 class AuthenticPlanetaryCalculator:
     """
     Calculates authentic planetary positions using Swiss Ephemeris
@@ -17,23 +21,7 @@ class AuthenticPlanetaryCalculator:
     """
     
     def __init__(self):
-        """Initialize Swiss Ephemeris with Lahiri Ayanamsa"""
-        # Set Lahiri Ayanamsa (most traditional for Vedic astrology)
-        swe.set_ayanamsa(swe.AYANAMSA_LAHIRI)
-        
-        # Planet constants for Swiss Ephemeris
-        self.PLANETS = {
-            'Sun': swe.SUN,
-            'Moon': swe.MOON,
-            'Mars': swe.MARS,
-            'Mercury': swe.MERCURY,
-            'Jupiter': swe.JUPITER,
-            'Venus': swe.VENUS,
-            'Saturn': swe.SATURN,
-            'Rahu': swe.MEAN_NODE,
-            'Ketu': swe.MEAN_NODE  # Ketu is opposite to Rahu
-        }
-        
+        """Lahiri sidereal positions come from the shared chart core"""
         # Combustion thresholds in degrees (from classical texts)
         self.COMBUSTION_THRESHOLDS = {
             'Mercury': 14.0,
@@ -96,21 +84,6 @@ class AuthenticPlanetaryCalculator:
             utc_datetime.hour + utc_datetime.minute / 60.0
         )
 
-    def get_planetary_longitude(self, jd: float, planet_code: int) -> Tuple[float, float, float, float]:
-        """Get planetary longitude, latitude, distance, and speed"""
-        try:
-            result = swe.calc_ut(jd, planet_code)
-            longitude = result[0][0] % 360  # Normalize to 0-360
-            latitude = result[0][1]
-            distance = result[0][2]
-            speed = result[0][3]
-            
-            return longitude, latitude, distance, speed
-            
-        except Exception as e:
-            print(f"[ERROR] Failed to get planetary position: {e}")
-            return 0.0, 0.0, 0.0, 0.0
-
     def get_sign_from_longitude(self, longitude: float) -> Tuple[str, int, float]:
         """Get Vedic sign, sign number, and degree within sign"""
         sign_number = int(longitude / 30)
@@ -121,48 +94,8 @@ class AuthenticPlanetaryCalculator:
 
     def get_nakshatra_from_longitude(self, longitude: float) -> Tuple[str, int, int]:
         """Get nakshatra name, number, and pada"""
-        # Each nakshatra is 13.333... degrees (360/27)
-        nakshatra_index = int(longitude / 13.333333333333334)
-        nakshatra_index = nakshatra_index % 27  # Ensure within range
-        
-        # Calculate pada (1-4 within each nakshatra)
-        nakshatra_degree = longitude % 13.333333333333334
-        pada = int(nakshatra_degree / 3.333333333333333) + 1
-        
-        return self.NAKSHATRAS[nakshatra_index], nakshatra_index + 1, pada
-
-    def get_houses(self, jd: float, latitude: float, longitude: float) -> Tuple[float, List[float]]:
-        """Get ascendant and house cusps using Swiss Ephemeris"""
-        try:
-            # Use Placidus house system (traditional)
-            ascendant_data = swe.houses_ex(jd, latitude, longitude, b'P')
-            ascendant = ascendant_data[1][0]  # Ascendant longitude
-            cusps = ascendant_data[1]         # House cusps
-            
-            return ascendant, cusps
-            
-        except Exception as e:
-            print(f"[ERROR] Failed to calculate houses: {e}")
-            return 0.0, [0.0] * 12
-
-    def get_house_for_planet(self, planet_longitude: float, cusps: List[float]) -> int:
-        """Determine which house a planet is in"""
-        # Normalize all values to 0-360
-        planet_lon = planet_longitude % 360
-        
-        for i in range(12):
-            cusp_start = cusps[i] % 360
-            cusp_end = cusps[(i + 1) % 12] % 360
-            
-            # Handle wrap-around at 0/360 degrees
-            if cusp_start > cusp_end:
-                if planet_lon >= cusp_start or planet_lon < cusp_end:
-                    return i + 1
-            else:
-                if cusp_start <= planet_lon < cusp_end:
-                    return i + 1
-        
-        return 1  # Default to first house if calculation fails
+        pada = nakshatra_lookup.lookup(longitude)
+        return self.NAKSHATRAS[pada.nakshatra], pada.number, pada.pada
 
     def is_combust(self, planet_name: str, planet_longitude: float, sun_longitude: float) -> bool:
         """Check if planet is combust (too close to Sun)"""
@@ -218,55 +151,39 @@ class AuthenticPlanetaryCalculator:
         
         print(f"[DEBUG] Julian Day: {jd}")
         
-        # Get houses and ascendant
-        ascendant_longitude, cusps = self.get_houses(jd, latitude, longitude)
+        # Sidereal planets, ascendant and Placidus bhavas from the shared chart core
+        chart = chart_core.chart(jd, latitude, longitude)
+        ascendant_longitude = chart.ascendant
         
         print(f"[DEBUG] Ascendant: {ascendant_longitude:.2f}°")
         
         planetary_positions = {}
-        sun_longitude = None
+        sun_longitude = chart['Sun'].longitude
         
-        # Calculate positions for each planet
-        for planet_name, planet_code in self.PLANETS.items():
-            try:
-                # Get basic astronomical data
-                longitude_deg, latitude_deg, distance, speed = self.get_planetary_longitude(jd, planet_code)
-                
-                # Handle Ketu (opposite to Rahu)
-                if planet_name == 'Ketu':
-                    longitude_deg = (longitude_deg + 180) % 360
-                    speed = -speed  # Ketu moves in opposite direction
-                
-                # Get Vedic interpretations
-                sign_name, sign_number, degree_in_sign = self.get_sign_from_longitude(longitude_deg)
-                nakshatra_name, nakshatra_number, pada = self.get_nakshatra_from_longitude(longitude_deg)
-                house_number = self.get_house_for_planet(longitude_deg, cusps)
-                
-                # Determine motion status
-                is_retrograde = speed < 0
-                
-                # Store Sun longitude for combustion calculations
-                if planet_name == 'Sun':
-                    sun_longitude = longitude_deg
-                
-                planetary_positions[planet_name] = {
-                    'longitude': round(longitude_deg, 2),
-                    'sign': sign_name,
-                    'sign_number': sign_number,
-                    'degree_in_sign': round(degree_in_sign, 2),
-                    'nakshatra': nakshatra_name,
-                    'nakshatra_number': nakshatra_number,
-                    'pada': pada,
-                    'house': house_number,
-                    'speed': round(speed, 4),
-                    'retrograde': is_retrograde,
-                    'motion': 'Retrograde' if is_retrograde else 'Direct'
-                }
-                
-                print(f"[DEBUG] {planet_name}: {sign_name}, {longitude_deg:.2f}°, House {house_number}, {nakshatra_name}")
-                
-            except Exception as e:
-                print(f"[ERROR] Failed to calculate {planet_name}: {e}")
+        for graha in chart.grahas:
+            longitude_deg, speed = graha.longitude, graha.speed
+            
+            # Get Vedic interpretations
+            sign_name, sign_number, degree_in_sign = self.get_sign_from_longitude(longitude_deg)
+            
+            # Determine motion status
+            is_retrograde = speed < 0
+            
+            planetary_positions[graha.name] = {
+                'longitude': round(longitude_deg, 2),
+                'sign': sign_name,
+                'sign_number': sign_number,
+                'degree_in_sign': round(degree_in_sign, 2),
+                'nakshatra': self.NAKSHATRAS[graha.nakshatra],
+                'nakshatra_number': graha.nakshatra + 1,
+                'pada': graha.pada,
+                'house': graha.bhava,
+                'speed': round(speed, 4),
+                'retrograde': is_retrograde,
+                'motion': 'Retrograde' if is_retrograde else 'Direct'
+            }
+            
+            print(f"[DEBUG] {graha.name}: {sign_name}, {longitude_deg:.2f}°, House {graha.bhava}, {self.NAKSHATRAS[graha.nakshatra]}")
         
         # Add combustion status
         if sun_longitude is not None:
@@ -17,266 +17,90 @@ Date: July 8, 2025
 
 import sys
 import json
-import math
-from typing import Dict, List, Tuple, Any
+from typing import Dict
+
+import shadbala_engine
 
 class AuthenticShadbalCalculator:
     """
     Authentic Shadbala Calculator implementing classical Vedic principles
     All calculations follow Parashara Hora Shastra methodology
     Results provided in both Virupas and Rupas (1 Rupa = 60 Virupas)
+    The astronomy is computed once per chart by shadbala_engine and shared
+    by all seven planets and twelve houses
     """
     
-    def __init__(self):
-        # Natural strength values for planets (in virupas)
-        self.naisargika_bala = {
-            'Sun': 60.0,
-            'Moon': 51.43,
-            'Mars': 17.14,
-            'Mercury': 25.71,
-            'Jupiter': 34.29,
-            'Venus': 42.86,
-            'Saturn': 8.57
-        }
-        
-        # Exaltation degrees for Uchhabala calculation
-        self.exaltation_degrees = {
-            'Sun': 10.0,      # Aries 10°
-            'Moon': 33.0,     # Taurus 3° (30+3)
-            'Mars': 298.0,    # Capricorn 28° (270+28)
-            'Mercury': 345.0, # Virgo 15° (150+15) - but actually in Virgo is own sign
-            'Jupiter': 95.0,  # Cancer 5° (90+5)
-            'Venus': 357.0,   # Pisces 27° (330+27)
-            'Saturn': 200.0   # Libra 20° (180+20)
-        }
-        
-        # Directional strength houses
-        self.dig_bala_houses = {
-            'Sun': 10,     # 10th house
-            'Moon': 4,     # 4th house
-            'Mars': 10,    # 10th house
-            'Mercury': 1,  # 1st house
-            'Jupiter': 1,  # 1st house
-            'Venus': 4,    # 4th house
-            'Saturn': 7    # 7th house
-        }
-        
-    def calculate_sthanabala(self, planet: str, longitude: float, chart_data: Dict) -> Dict:
+    def chart_strength(self, birth_details: Dict) -> Dict:
+        """Cached Shadbala and Bhavabala for the birth"""
+        return shadbala_engine.chart_strength(birth_details)
+    
+    def calculate_sthanabala(self, planet: str, birth_details: Dict) -> Dict:
         """
         Calculate Sthanabala (Positional Strength)
         Components: Uchhabala, Saptavargajabala, Ojhayugmarashiamshabala, Kendradhibala, Drekshanabala
         """
-        sthanabala = {}
-        
-        # 1. Uchhabala (Exaltation Strength)
-        if planet in self.exaltation_degrees:
-            exalt_deg = self.exaltation_degrees[planet]
-            diff = abs(longitude - exalt_deg)
-            if diff > 180:
-                diff = 360 - diff
-            # Maximum 60 virupas at exact exaltation, 0 at exact debilitation (180° away)
-            uchhabala = 60 * (1 - diff / 180)
-            sthanabala['uchhabala'] = max(0, uchhabala)
-        else:
-            sthanabala['uchhabala'] = 0
-        
-        # 2. Saptavargajabala (Seven Divisional Chart Strength)
-        # Simplified implementation - in full version would check D1, D2, D3, D7, D9, D12, D30
-        saptavarga = 30.0  # Base strength, would be calculated from actual divisional charts
-        sthanabala['saptavargajabala'] = saptavarga
-        
-        # 3. Ojhayugmarashiamshabala (Odd/Even Sign/Navamsa Strength)
-        sign_num = int(longitude / 30) + 1
-        navamsa_num = int((longitude % 30) * 9 / 30) + 1
-        
-        # Male planets get strength in odd signs, female in even
-        male_planets = ['Sun', 'Mars', 'Jupiter']
-        ojhayugma = 0
-        if planet in male_planets and sign_num % 2 == 1:
-            ojhayugma += 15
-        elif planet not in male_planets and sign_num % 2 == 0:
-            ojhayugma += 15
-        
-        sthanabala['ojhayugmarashiamshabala'] = ojhayugma
-        
-        # 4. Kendradhibala (Angular House Strength)
-        planet_house = chart_data.get('planets', {}).get(planet, {}).get('house', 1)
-        if planet_house in [1, 4, 7, 10]:  # Angular houses
-            kendradhi = 60
-        elif planet_house in [2, 5, 8, 11]:  # Succedent houses
-            kendradhi = 30
-        else:  # Cadent houses
-            kendradhi = 15
-        sthanabala['kendradhibala'] = kendradhi
-        
-        # 5. Drekshanabala (Decanate Strength)
-        decanate = int((longitude % 30) / 10) + 1
-        # First decanate ruled by sign lord, second by 5th sign lord, third by 9th sign lord
-        drekshanabala = 10  # Simplified - would need full decanate ruler calculation
-        sthanabala['drekshanabala'] = drekshanabala
-        
-        # Total Sthanabala
-        sthanabala['total'] = sum(sthanabala.values())
-        
-        return sthanabala
-    
-    def calculate_digbala(self, planet: str, chart_data: Dict) -> float:
-        """
-        Calculate Digbala (Directional Strength)
-        Each planet has maximum strength in specific houses
-        """
-        planet_house = chart_data.get('planets', {}).get(planet, {}).get('house', 1)
-        ideal_house = self.dig_bala_houses.get(planet, 1)
-        
-        # Calculate distance from ideal house
-        house_diff = abs(planet_house - ideal_house)
-        if house_diff > 6:
-            house_diff = 12 - house_diff
-        
-        # Maximum 60 virupas in ideal house, decreasing linearly
-        digbala = 60 * (1 - house_diff / 6)
-        return max(0, digbala)
+        sthana = self.chart_strength(birth_details)['planets'][planet]['sthana_bala']
+        return {
+            'uchhabala': sthana['uchcha'],
+            'saptavargajabala': sthana['saptavargaja'],
+            'ojhayugmarashiamshabala': sthana['ojayugma'],
+            'kendradhibala': sthana['kendradi'],
+            'drekshanabala': sthana['drekkana'],
+            'total': sthana['total']
+        }
     
     def calculate_kaalabala(self, planet: str, birth_details: Dict) -> Dict:
         """
         Calculate Kaalabala (Temporal Strength)
-        Components: Natonnatabala, Pakshabala, Tribhagabala, etc.
-        """
-        kaalabala = {}
-        
-        # 1. Natonnatabala (Day/Night Strength)
-        # Benefic planets stronger at night, malefics during day
-        benefics = ['Moon', 'Mercury', 'Jupiter', 'Venus']
-        is_day_birth = True  # Would be calculated from birth time and sunrise
-        
-        if planet in benefics:
-            natonnata = 30 if not is_day_birth else 0
-        else:
-            natonnata = 30 if is_day_birth else 0
-        kaalabala['natonnatabala'] = natonnata
-        
-        # 2. Pakshabala (Lunar Fortnight Strength)
-        # Benefics stronger in bright fortnight, malefics in dark
-        paksha = 15  # Simplified - would be calculated from moon phase
-        kaalabala['pakshabala'] = paksha
-        
-        # 3. Tribhagabala (Day Division Strength)
-        tribhaga = 20  # Simplified
-        kaalabala['tribhagabala'] = tribhaga
-        
-        # 4. Varsha-masa-dina-horabala (Year/Month/Day/Hour Lord Strength)
-        hora_bala = 15  # Simplified
-        kaalabala['varsha_masa_dina_horabala'] = hora_bala
-        
-        # 5. Ayanabala (Declination Strength)
-        ayana = 30  # Simplified
-        kaalabala['ayanabala'] = ayana
-        
-        # 6. Yuddhabala (Planetary War Strength) - only when planets are very close
-        yuddha = 0  # No planetary war in this case
-        kaalabala['yuddhabala'] = yuddha
-        
-        kaalabala['total'] = sum(kaalabala.values())
-        return kaalabala
-    
-    def calculate_cheshtabala(self, planet: str, longitude: float) -> float:
-        """
-        Calculate Cheshtabala (Motional Strength)
-        Based on planetary motion - retrograde planets get more strength
-        """
-        # Simplified - would need actual motion data
-        # Assume normal motion for now
-        if planet in ['Sun', 'Moon']:
-            return 0  # Luminaries don't go retrograde
-        
-        # For other planets, assume normal motion
-        cheshtabala = 30  # Base strength for normal motion
-        return cheshtabala
-    
-    def calculate_drikbala(self, planet: str, chart_data: Dict) -> float:
+        Components: Natonnatabala, Pakshabala, Tribhagabala, Abda/Masa/Vara/Horabala, Ayanabala, Yuddhabala
         """
-        Calculate Drikbala (Aspectual Strength)
-        Based on aspects received from other planets
-        """
-        # Simplified implementation
-        # Would need to calculate aspects from all other planets
-        drikbala = 25  # Base aspectual strength
-        return drikbala
+        kala = self.chart_strength(birth_details)['planets'][planet]['kala_bala']
+        return {
+            'natonnatabala': kala['natonnata'],
+            'pakshabala': kala['paksha'],
+            'tribhagabala': kala['tribhaga'],
+            'varsha_masa_dina_horabala': kala['abda'] + kala['masa'] + kala['vara'] + kala['hora'],
+            'ayanabala': kala['ayana'],
+            'yuddhabala': kala['yuddha'],
+            'total': kala['total']
+        }
     
-    def calculate_complete_shadbala(self, planet: str, longitude: float, chart_data: Dict, birth_details: Dict) -> Dict:
+    def calculate_complete_shadbala(self, planet: str, birth_details: Dict) -> Dict:
         """
         Calculate complete Shadbala for a planet
         Returns all six components plus total in Virupas and Rupas
         """
-        shadbala = {}
-        
-        # Calculate all six components
-        shadbala['sthanabala'] = self.calculate_sthanabala(planet, longitude, chart_data)
-        shadbala['digbala'] = self.calculate_digbala(planet, chart_data)
-        shadbala['kaalabala'] = self.calculate_kaalabala(planet, birth_details)
-        shadbala['cheshtabala'] = self.calculate_cheshtabala(planet, longitude)
-        shadbala['naisargikabala'] = self.naisargika_bala.get(planet, 0)
-        shadbala['drikbala'] = self.calculate_drikbala(planet, chart_data)
-        
-        # Calculate total in Virupas
-        total_virupas = (
-            shadbala['sthanabala'].get('total', 0) +
-            shadbala['digbala'] +
-            shadbala['kaalabala'].get('total', 0) +
-            shadbala['cheshtabala'] +
-            shadbala['naisargikabala'] +
-            shadbala['drikbala']
-        )
-        
-        shadbala['total_virupas'] = total_virupas
-        shadbala['total_rupas'] = total_virupas / 60  # Convert to Rupas
-        
-        # Calculate Ishta/Kashta bala
-        ishta_percentage = min(100, (total_virupas / 390) * 100)  # 390 is theoretical maximum
-        shadbala['ishtabala'] = ishta_percentage
-        shadbala['kashtabala'] = 100 - ishta_percentage
-        
-        return shadbala
+        strength = self.chart_strength(birth_details)['planets'][planet]
+        return {
+            'sthanabala': self.calculate_sthanabala(planet, birth_details),
+            'digbala': strength['dig_bala'],
+            'kaalabala': self.calculate_kaalabala(planet, birth_details),
+            'cheshtabala': strength['cheshta_bala'],
+            'naisargikabala': strength['naisargika_bala'],
+            'drikbala': strength['drik_bala'],
+            'total_virupas': strength['total_virupas'],
+            'total_rupas': strength['total_rupas'],
+            'required_rupas': strength['required_rupas'],
+            'strength_ratio': strength['ratio'],
+            'ishtabala': strength['ishta_phala'],
+            'kashtabala': strength['kashta_phala']
+        }
     
-    def calculate_bhavabala(self, chart_data: Dict) -> Dict:
+    def calculate_bhavabala(self, birth_details: Dict) -> Dict:
         """
         Calculate Bhavabala (House Strength)
         Components: BhavaAdhipathibala, BhavaDigbala, BhavaDrishtibala
         """
         bhavabala = {}
-        
-        for house_num in range(1, 13):
-            house_strength = {}
-            
-            # 1. BhavaAdhipathibala - Shadbala of house lord
-            house_lord = self.get_house_lord(house_num, chart_data)
-            if house_lord:
-                lord_shadbala = 200  # Simplified - would use actual lord's shadbala
-            else:
-                lord_shadbala = 0
-            house_strength['adhipathi_bala'] = lord_shadbala
-            
-            # 2. BhavaDigbala - Directional strength of sign in house
-            dig_bala = 30  # Simplified
-            house_strength['dig_bala'] = dig_bala
-            
-            # 3. BhavaDrishtibala - Aspectual strength on house
-            drishti_bala = 25  # Simplified
-            house_strength['drishti_bala'] = drishti_bala
-            
-            house_strength['total'] = sum(house_strength.values())
-            bhavabala[f'house_{house_num}'] = house_strength
-        
+        for house_num, bhava in self.chart_strength(birth_details)['bhavas'].items():
+            bhavabala[f'house_{house_num}'] = {
+                'lord': bhava['lord'],
+                'adhipathi_bala': bhava['adhipati_bala'],
+                'dig_bala': bhava['dig_bala'],
+                'drishti_bala': bhava['drishti_bala'],
+                'total': bhava['total_virupas']
+            }
         return bhavabala
-    
-    def get_house_lord(self, house_num: int, chart_data: Dict) -> str:
-        """Get the lord of a house based on sign placement"""
-        # Simplified - would need actual sign-to-lord mapping
-        sign_lords = {
-            1: 'Mars', 2: 'Venus', 3: 'Mercury', 4: 'Moon', 5: 'Sun', 6: 'Mercury',
-            7: 'Venus', 8: 'Mars', 9: 'Jupiter', 10: 'Saturn', 11: 'Saturn', 12: 'Jupiter'
-        }
-        return sign_lords.get(house_num % 12 + 1, 'Sun')
 
 def main():
     """Main function for standalone execution"""
@@ -289,7 +113,6 @@ def main():
         
         calculator = AuthenticShadbalCalculator()
         
-        chart_data = input_data.get('chart_data', {})
         birth_details = input_data.get('birth_details', {})
         
         # Calculate Shadbala for all planets
@@ -298,15 +121,10 @@ def main():
         planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
         
         for planet in planets:
-            planet_data = chart_data.get('planets', {}).get(planet, {})
-            longitude = planet_data.get('longitude', 0)
-            
-            shadbala_results[planet] = calculator.calculate_complete_shadbala(
-                planet, longitude, chart_data, birth_details
-            )
+            shadbala_results[planet] = calculator.calculate_complete_shadbala(planet, birth_details)
         
         # Calculate Bhavabala
-        bhava_results = calculator.calculate_bhavabala(chart_data)
+        bhava_results = calculator.calculate_bhavabala(birth_details)
         
         # Prepare final results
         results = {
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Chart Core
+The one sidereal (Lahiri) birth-chart computation behind every engine. A
+chart is nine grahas, the ascendant and Placidus bhava cusps for a Julian
+day and place, returned as an immutable slotted dataclass and memoized per
+(jd, latitude, longitude), so the Jyotisha, fallback, micro, Drik, marriage,
+Lal Kitab and premium engines share one ephemeris pass and one set of
+sign / nakshatra / house rules instead of each running its own loop.
+
+Engines keep their own output shapes and name spellings: Graha and Chart
+carry indices (sign 0-11, nakshatra 0-26, pada 1-4) and the engines map them
+onto their tables.
+
+Usage:
+    echo '{"date": "1990-05-15", "time": "14:30", "latitude": 28.61, "longitude": 77.21}' \\
+        | python chart_core.py
+"""
+
+import json
+import sys
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+import ayanamsa_service
+import chebyshev_ephemeris
+import engine_logging
+from gazetteer import resolve_birth_place
+from nakshatra_lookup import NAKSHATRA_LORDS, NAKSHATRAS, nakshatra_pada
+from tz_resolver import TimezoneResolver
+
+log = engine_logging.get_logger('chart_core')
+
+# Sun to Saturn, Rahu (mean node), then Ketu opposite Rahu
+GRAHAS = chebyshev_ephemeris.BODIES
+ALWAYS_DIRECT = ('Sun', 'Moon', 'Rahu', 'Ketu')
+
+SIGN_NAMES = ['Mesha', 'Vrishabha', 'Mithuna', 'Karka', 'Simha', 'Kanya',
+              'Tula', 'Vrishchika', 'Dhanu', 'Makara', 'Kumbha', 'Meena']
+NAKSHATRA_SPAN = 360 / 27
+
+# Bhava cusps; Placidus has no solution inside the polar circles
+HOUSE_SYSTEM = b'P'
+POLAR_FALLBACK = b'O'
+
+CACHE_SIZE = 1024
+
+
+def house_of(longitude: float, cusps: Sequence[float]) -> int:
+    """1-based house whose cusp-to-cusp arc holds the longitude"""
+    offsets = [(cusp - cusps[0]) % 360 for cusp in cusps]
+    return bisect_right(offsets, (longitude - cusps[0]) % 360)
+
+
+def format_degree(longitude: float) -> str:
+    """Degree within the sign as 12°34'"""
+    degree = longitude % 30
+    return f"{int(degree)}°{int(degree % 1 * 60):02d}'"
+
+
+@dataclass(frozen=True, slots=True)
+class Graha:
+    """One graha of a Chart. latitude and distance are None when the position came from the Chebyshev table"""
+    name: str
+    longitude: float
+    speed: float
+    latitude: Optional[float]
+    distance: Optional[float]
+    sign: int
+    nakshatra: int
+    pada: int
+    house: int
+    bhava: int
+
+    @property
+    def retrograde(self) -> bool:
+        return self.name not in ALWAYS_DIRECT and self.speed < 0
+
+    @property
+    def degree(self) -> float:
+        return self.longitude % 30
+
+    @property
+    def sign_name(self) -> str:
+        return SIGN_NAMES[self.sign]
+
+    @property
+    def nakshatra_name(self) -> str:
+        return NAKSHATRAS[self.nakshatra]
+
+    @property
+    def nakshatra_lord(self) -> str:
+        return NAKSHATRA_LORDS[self.nakshatra % 9]
+
+
+@dataclass(frozen=True, slots=True)
+class Chart:
+    """
+    Sidereal chart: ayanamsa is Lahiri without nutation, as the engines have
+    always subtracted it from the tropical ascendant; house is whole-sign from
+    the ascendant, bhava counts from the Placidus (polar: Porphyry) cusps
+    """
+    jd: float
+    latitude: float
+    longitude: float
+    ayanamsa: float
+    ascendant: float
+    cusps: Tuple[float, ...]
+    house_system: str
+    grahas: Tuple[Graha, ...]
+
+    @property
+    def ascendant_sign(self) -> int:
+        return int(self.ascendant // 30)
+
+    def __getitem__(self, name: str) -> Graha:
+        for graha in self.grahas:
+            if graha.name == name:
+                return graha
+        raise KeyError(name)
+
+    def longitudes(self) -> Dict[str, float]:
+        return {graha.name: graha.longitude for graha in self.grahas}
+
+    def planet_list(self, sign_names: Sequence[str] = SIGN_NAMES,
+                    nakshatra_names: Sequence[str] = NAKSHATRAS) -> List[Dict]:
+        """Planets in the shape the Jyotisha engines return, with the caller's spellings"""
+        return [{
+            'name': graha.name,
+            'longitude': graha.longitude,
+            'sign': sign_names[graha.sign],
+            'degree': format_degree(graha.longitude),
+            'nakshatra': nakshatra_names[graha.nakshatra],
+            'nakshatraLord': graha.nakshatra_lord,
+            'house': graha.house,
+            'retrograde': graha.retrograde
+        } for graha in self.grahas]
+
+
+def _positions(jd: float) -> List[Tuple[str, float, float, Optional[float], Optional[float]]]:
+    """(name, longitude, speed, latitude, distance) per graha"""
+    swe.set_sid_mode(ayanamsa_service.DEFAULT_SID_MODE)
+    if chebyshev_ephemeris.active():
+        return [(name, *chebyshev_ephemeris.position(name, jd), None, None) for name in GRAHAS]
+
+    positions = []
+    for name in GRAHAS:
+        base, shift = chebyshev_ephemeris.DERIVED.get(name, (name, 0.0))
+        if shift:
+            _, longitude, speed, latitude, distance = positions[GRAHAS.index(base)]
+            positions.append((name, (longitude + shift) % 360, speed, -latitude, distance))
+            continue
+        values = swe.calc_ut(jd, chebyshev_ephemeris.SEGMENTS[name][0], chebyshev_ephemeris.FLAGS)[0]
+        positions.append((name, values[0], values[3], values[1], values[2]))
+    return positions
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def chart(jd: float, latitude: float, longitude: float) -> Chart:
+    """Chart for a Julian day (UT) and place; shared between callers, so never mutated"""
+    ayanamsa = ayanamsa_service.ayanamsa(jd)
+    try:
+        tropical_cusps, ascmc = swe.houses_ex(jd, latitude, longitude, HOUSE_SYSTEM)
+        house_system = HOUSE_SYSTEM
+    except swe.Error:
+        tropical_cusps, ascmc = swe.houses_ex(jd, latitude, longitude, POLAR_FALLBACK)
+        house_system = POLAR_FALLBACK
+        log.warning("Placidus undefined at latitude {}; using Porphyry bhavas", latitude)
+    ascendant = (ascmc[0] - ayanamsa) % 360
+    cusps = tuple((cusp - ayanamsa) % 360 for cusp in tropical_cusps[:12])
+    ascendant_sign = int(ascendant // 30)
+
+    grahas = []
+    for name, graha_longitude, speed, graha_latitude, distance in _positions(jd):
+        sign = int(graha_longitude // 30)
+        nakshatra, pada = nakshatra_pada(graha_longitude)
+        grahas.append(Graha(name, graha_longitude, speed, graha_latitude, distance, sign, nakshatra, pada,
+                            (sign - ascendant_sign) % 12 + 1, house_of(graha_longitude, cusps)))
+
+    log.debug("Chart computed for jd {} at {}, {}", jd, latitude, longitude)
+    return Chart(jd, latitude, longitude, ayanamsa, ascendant, cusps, house_system.decode(), tuple(grahas))
+
+
+def birth_moment(birth_details: Dict) -> Tuple[float, float, float]:
+    """(Julian day UT, latitude, longitude) of a birth"""
+    location = resolve_birth_place(birth_details.get('place'), birth_details.get('latitude'),
+                                   birth_details.get('longitude'), birth_details.get('timezone'))
+    local = datetime.strptime(f"{birth_details['date']} {birth_details.get('time', '12:00')[:5]}", '%Y-%m-%d %H:%M')
+    utc = TimezoneResolver.shared().to_utc(location['timezone'], local)
+    jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60 + utc.second / 3600)
+    return jd, location['latitude'], location['longitude']
+
+
+def birth_chart(birth_details: Dict) -> Chart:
+    """chart for birth details (date, time, place or coordinates, optional timezone)"""
+    return chart(*birth_moment(birth_details))
+
+
+def main():
+    """Command line: birth details JSON on stdin"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            result = {'success': True, 'chart': asdict(birth_chart(json.loads(sys.stdin.read())))}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Chart Variants
+Birth charts under several ayanamsas and house systems from one ephemeris
+pass. Tropical positions and house cusps do not depend on the ayanamsa, so
+they are computed once; every variant is then a subtraction of its ayanamsa
+and a house assignment. The UI switches between Lahiri, Raman, KP and True
+Chitra and between whole-sign, Placidus and equal houses without re-running
+an engine process.
+
+Usage:
+    echo '{"date": "1990-05-15", "time": "14:30", "latitude": 28.61, "longitude": 77.21,
+           "variants": ["lahiri/whole_sign", "kp/placidus"]}' | python chart_variants.py
+"""
+
+import json
+import sys
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+import ayanamsa_service
+import engine_logging
+from chart_core import (ALWAYS_DIRECT, NAKSHATRA_LORDS, NAKSHATRAS, POLAR_FALLBACK, SIGN_NAMES,
+                        birth_moment, house_of, nakshatra_pada)
+
+log = engine_logging.get_logger('chart_variants')
+
+AYANAMSAS = ayanamsa_service.SYSTEMS
+
+# None: derived from the ascendant alone; otherwise the houses_ex code. Placidus
+# has no solution inside the polar circles and falls back to Porphyry there.
+HOUSE_SYSTEMS = {
+    'whole_sign': None,
+    'equal': None,
+    'placidus': b'P'
+}
+
+DEFAULT_AYANAMSA = 'lahiri'
+DEFAULT_HOUSE_SYSTEM = 'whole_sign'
+
+# Order matches JyotishaEngine.PLANETS; Ketu is derived from Rahu
+GRAHAS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mars': swe.MARS, 'Mercury': swe.MERCURY,
+    'Jupiter': swe.JUPITER, 'Venus': swe.VENUS, 'Saturn': swe.SATURN, 'Rahu': swe.MEAN_NODE
+}
+
+
+def variant_key(ayanamsa: str, house_system: str) -> str:
+    """Key of a variant in result dicts, e.g. 'kp/placidus'"""
+    return f'{ayanamsa}/{house_system}'
+
+
+def parse_variants(requested) -> List[Tuple[str, str]]:
+    """
+    (ayanamsa, house system) pairs from a request: 'all', a list of keys like
+    'kp/placidus' (either half may be omitted for the default) or of dicts
+    with 'ayanamsa' and 'houses'. Unknown names raise ValueError.
+    """
+    if requested == 'all':
+        return list(product(AYANAMSAS, HOUSE_SYSTEMS))
+    if isinstance(requested, (str, dict)):
+        requested = [requested]
+
+    pairs = []
+    for item in requested:
+        if isinstance(item, dict):
+            ayanamsa, houses = item.get('ayanamsa'), item.get('houses')
+        else:
+            ayanamsa, _, houses = str(item).partition('/')
+        ayanamsa = (ayanamsa or DEFAULT_AYANAMSA).lower()
+        houses = (houses or DEFAULT_HOUSE_SYSTEM).lower()
+        if ayanamsa not in AYANAMSAS:
+            raise ValueError(f"Unknown ayanamsa '{ayanamsa}' (expected one of {', '.join(AYANAMSAS)})")
+        if houses not in HOUSE_SYSTEMS:
+            raise ValueError(f"Unknown house system '{houses}' (expected one of {', '.join(HOUSE_SYSTEMS)})")
+        if (ayanamsa, houses) not in pairs:
+            pairs.append((ayanamsa, houses))
+    return pairs
+
+
+def ayanamsa_values(jd: float, names: Iterable[str]) -> Dict[str, float]:
+    """
+    Ayanamsa with nutation per name: tropical-of-date minus this value is
+    what calc_ut returns with FLG_SIDEREAL
+    """
+    return {name: ayanamsa_service.ayanamsa(jd, name, nutation=True) for name in names}
+
+
+def tropical_chart(jd: float, latitude: float, longitude: float,
+                   house_systems: Sequence[str] = ()) -> Dict:
+    """
+    Everything ayanamsa-independent: tropical longitude and speed per graha,
+    the ascendant and midheaven, and tropical cusps for each requested house
+    system that needs them
+    """
+    bodies = {}
+    for name, body in GRAHAS.items():
+        values = swe.calc_ut(jd, body, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+        bodies[name] = (values[0], values[3])
+    rahu_longitude, rahu_speed = bodies['Rahu']
+    bodies['Ketu'] = ((rahu_longitude + 180) % 360, rahu_speed)
+
+    cusps, ascmc, systems = {}, None, {}
+    for name in dict.fromkeys(house_systems):
+        code = HOUSE_SYSTEMS[name]
+        if code is None:
+            continue
+        try:
+            cusps[name], ascmc = swe.houses_ex(jd, latitude, longitude, code)
+            systems[name] = code
+        except swe.Error:
+            cusps[name], ascmc = swe.houses_ex(jd, latitude, longitude, POLAR_FALLBACK)
+            systems[name] = POLAR_FALLBACK
+            log.warning("House system {} undefined at latitude {}; using Porphyry", name, latitude)
+    if ascmc is None:
+        ascmc = swe.houses_ex(jd, latitude, longitude, b'E')[1]
+
+    return {
+        'jd': jd,
+        'bodies': bodies,
+        'ascendant': ascmc[0],
+        'midheaven': ascmc[1],
+        'cusps': {name: list(values[:12]) for name, values in cusps.items()},
+        'systems': {name: code.decode() for name, code in systems.items()}
+    }
+
+
+def _position(name: str, longitude: float, speed: float, house: int) -> Dict:
+    nakshatra, pada = nakshatra_pada(longitude)
+    degree_in_sign = longitude % 30
+    return {
+        'name': name,
+        'longitude': longitude,
+        'sign': SIGN_NAMES[int(longitude // 30)],
+        'degree': f"{int(degree_in_sign)}°{int(degree_in_sign % 1 * 60):02d}'",
+        'nakshatra': NAKSHATRAS[nakshatra],
+        'nakshatraLord': NAKSHATRA_LORDS[nakshatra % 9],
+        'pada': pada,
+        'house': house,
+        'retrograde': name not in ALWAYS_DIRECT and speed < 0
+    }
+
+
+def variant(tropical: Dict, ayanamsa: str, ayanamsa_value: float, house_system: str) -> Dict:
+    """One sidereal chart derived from a tropical_chart result"""
+    ascendant = (tropical['ascendant'] - ayanamsa_value) % 360
+    if house_system == 'whole_sign':
+        cusps = [(int(ascendant // 30) + i) % 12 * 30.0 for i in range(12)]
+    elif house_system == 'equal':
+        cusps = [(ascendant + 30 * i) % 360 for i in range(12)]
+    else:
+        cusps = [(cusp - ayanamsa_value) % 360 for cusp in tropical['cusps'][house_system]]
+
+    planets = []
+    for name, (longitude, speed) in tropical['bodies'].items():
+        longitude = (longitude - ayanamsa_value) % 360
+        planets.append(_position(name, longitude, speed, house_of(longitude, cusps)))
+
+    return {
+        'ayanamsa': {'name': ayanamsa, 'value': ayanamsa_value},
+        'house_system': house_system,
+        'house_system_used': tropical['systems'].get(house_system, house_system),
+        'ascendant': {'longitude': ascendant, 'sign': SIGN_NAMES[int(ascendant // 30)]},
+        'cusps': cusps,
+        'planets': planets
+    }
+
+
+def chart_variants(jd: float, latitude: float, longitude: float, requested) -> Dict[str, Dict]:
+    """Variants keyed by variant_key, all from one tropical pass"""
+    pairs = parse_variants(requested)
+    tropical = tropical_chart(jd, latitude, longitude, [houses for _, houses in pairs])
+    values = ayanamsa_values(jd, dict.fromkeys(ayanamsa for ayanamsa, _ in pairs))
+    log.debug("Derived {} chart variants from one tropical pass at jd {}", len(pairs), jd)
+    return {variant_key(ayanamsa, houses): variant(tropical, ayanamsa, values[ayanamsa], houses)
+            for ayanamsa, houses in pairs}
+
+
+def birth_chart_variants(birth_details: Dict, requested: Optional[object] = None) -> Dict[str, Dict]:
+    """chart_variants for birth details; requested defaults to birth_details['variants']"""
+    jd, latitude, longitude = birth_moment(birth_details)
+    return chart_variants(jd, latitude, longitude,
+                          requested if requested is not None else birth_details.get('variants', 'all'))
+
+
+def main():
+    """Command line: birth details JSON (with optional 'variants') on stdin"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            birth_details = json.loads(sys.stdin.read())
+            variants = birth_chart_variants(birth_details)
+        result = {'success': True, 'variants': variants}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Compact Chebyshev Sidereal Ephemeris
+Sidereal (Lahiri) longitudes of the nine grahas for 1800-2200 as Chebyshev
+series over fixed day segments, generated once from Swiss Ephemeris into a
+memory-mapped file. A position is one segment lookup and a short recurrence
+that also yields the daily speed; arrays of Julian days are evaluated with
+NumPy. Transit, ingress and panchang searches that sample the same bodies
+thousands of times opt in with EPHEMERIS_ENGINE=chebyshev; everything else
+keeps calling Swiss Ephemeris.
+
+Fitting the table takes about a million Swiss Ephemeris calls, so it is never
+built inside a request: when the table is missing or from an older format,
+lookups fall back to Swiss Ephemeris while one detached build runs, and each
+process switches over once the table appears.
+
+The series are fitted without solar light deflection, which Swiss Ephemeris
+applies and which only exceeds an arcsecond within a degree of a planet's
+conjunction with the Sun.
+
+Usage:
+    python chebyshev_ephemeris.py build              # generate the table file
+    python chebyshev_ephemeris.py verify 20000       # compare against Swiss Ephemeris
+"""
+
+import json
+import math
+import mmap
+import os
+import random
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import swisseph as swe
+
+import engine_logging
+
+log = engine_logging.get_logger('chebyshev_ephemeris')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_PATH = os.path.join(SERVER_DIR, 'cache', 'ephemeris', 'lahiri-1800-2200.cheb')
+# Present while a background build runs; older than BUILD_TIMEOUT it is taken as a crashed build
+BUILD_LOCK = TABLE_PATH + '.building'
+BUILD_TIMEOUT = 3600
+# How often a process that fell back to Swiss Ephemeris looks for the table again
+RETRY_SECONDS = 60
+
+ENGINE_ENV = 'EPHEMERIS_ENGINE'
+CHEBYSHEV, SWISSEPH = 'chebyshev', 'swisseph'
+
+# 1800-01-01 to 2200-01-01, 0h UT
+START_JD = 2378496.5
+END_JD = 2524593.5
+
+# Segment length in days and series order per body, sized for errors well
+# under 0.1 arcsecond against the fitted model
+SEGMENTS = {
+    'Sun': (swe.SUN, 32.0, 10),
+    'Moon': (swe.MOON, 8.0, 13),
+    'Mars': (swe.MARS, 32.0, 12),
+    'Mercury': (swe.MERCURY, 16.0, 14),
+    'Jupiter': (swe.JUPITER, 32.0, 10),
+    'Venus': (swe.VENUS, 32.0, 12),
+    'Saturn': (swe.SATURN, 32.0, 10),
+    'Rahu': (swe.MEAN_NODE, 128.0, 8)
+}
+# Bodies derived from a tabulated one by a fixed longitude offset
+DERIVED = {'Ketu': ('Rahu', 180.0)}
+BODIES = tuple(SEGMENTS) + tuple(DERIVED)
+# Bodies whose light Swiss Ephemeris deflects near the Sun
+DEFLECTED = {'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn'}
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+FIT_FLAGS = FLAGS | swe.FLG_NOGDEFL
+
+# Bumped whenever the fitted series change, so stale tables are rebuilt
+MAGIC = b'CHB1'
+# magic, start JD, end JD, body count
+HEADER = struct.Struct('<4sddI')
+# body name, segment days, series order, segment count
+BODY_ENTRY = struct.Struct('<8sdII')
+
+# Validation: agreement required, and the elongation inside which solar
+# light deflection is excluded from the headline figure
+TOLERANCE_ARCSEC = 1.0
+CONJUNCTION_ZONE = 1.0
+
+
+def _nodes(order: int):
+    """Chebyshev points of the first kind on [-1, 1]"""
+    return [math.cos(math.pi * (k + 0.5) / order) for k in range(order)]
+
+
+@lru_cache(maxsize=None)
+def _basis(order: int):
+    """Rows of the discrete cosine transform taking node samples to coefficients"""
+    return [[math.cos(math.pi * j * (k + 0.5) / order) * (2 if j else 1) / order for k in range(order)]
+            for j in range(order)]
+
+
+def fit_segment(values: Sequence[float]):
+    """Chebyshev coefficients of a series sampled at _nodes(len(values))"""
+    return [sum(w * v for w, v in zip(row, values)) for row in _basis(len(values))]
+
+
+def evaluate(coefficients, x):
+    """
+    Value and derivative (per unit x) of a Chebyshev series. coefficients[k]
+    may be floats for one point or NumPy columns with x an array.
+    """
+    t_prev, t = 1.0, x
+    u_prev, u = 0.0, 1.0
+    value = coefficients[0] + coefficients[1] * x
+    slope = coefficients[1] + 0 * x
+    for k in range(2, len(coefficients)):
+        t_prev, t = t, 2 * x * t - t_prev
+        u_prev, u = u, 2 * x * u - u_prev
+        value = value + coefficients[k] * t
+        slope = slope + coefficients[k] * k * u
+    return value, slope
+
+
+def _unwrap(longitudes: Sequence[float]):
+    """Continuous longitudes (no jump at 0/360) for fitting one segment"""
+    result = [longitudes[0]]
+    for longitude in longitudes[1:]:
+        result.append(result[-1] + (longitude - result[-1] + 180) % 360 - 180)
+    return result
+
+
+def build_table(path: str = TABLE_PATH) -> str:
+    """Fit every body over the whole range and write the table file"""
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    entries, blocks = [], []
+    for name, (body, days, order) in SEGMENTS.items():
+        count = math.ceil((END_JD - START_JD) / days)
+        offsets = [(x + 1) / 2 * days for x in _nodes(order)]
+        block = []
+        for i in range(count):
+            start = START_JD + i * days
+            samples = [swe.calc_ut(start + offset, body, FIT_FLAGS)[0][0] for offset in offsets]
+            block.extend(fit_segment(_unwrap(samples)))
+        entries.append(BODY_ENTRY.pack(name.encode('ascii'), days, order, count))
+        blocks.append(struct.pack(f'<{len(block)}d', *block))
+        log.debug("Fitted {} segments of {} days for {}", count, days, name)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # A private temporary file, so concurrent builds never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, START_JD, END_JD, len(entries)))
+        f.writelines(entries)
+        f.writelines(blocks)
+    # mkstemp creates the file owner-only; the table is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _table_current(path: str) -> bool:
+    """Whether a table exists in the current format"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def build_in_background(path: str = TABLE_PATH, lock_path: str = BUILD_LOCK) -> bool:
+    """
+    Start `build` in a detached process unless one is already running
+    Returns whether a build was started
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        if time.time() - os.path.getmtime(lock_path) < BUILD_TIMEOUT:
+            return False
+        os.remove(lock_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    subprocess.Popen([sys.executable, os.path.abspath(__file__), 'build', path, lock_path],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    return True
+
+
+class ChebyshevEphemeris:
+    """The memory-mapped table; scalar lookups read the mapping directly"""
+
+    _shared = None
+
+    def __init__(self, path: str = TABLE_PATH):
+        # Never fitted here: a request would stall for minutes (see build_in_background)
+        if not _table_current(path):
+            raise FileNotFoundError(f"No current ephemeris table at {path}; run `chebyshev_ephemeris.py build`")
+
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.start, self.end, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid ephemeris table: {path}")
+
+        view = memoryview(self._mm)
+        offset = HEADER.size + count * BODY_ENTRY.size
+        self.series = {}
+        for i in range(count):
+            name, days, order, segments = BODY_ENTRY.unpack_from(self._mm, HEADER.size + i * BODY_ENTRY.size)
+            size = segments * order * 8
+            self.series[name.rstrip(b'\0').decode('ascii')] = (days, order, segments, offset,
+                                                               view[offset:offset + size].cast('d'))
+            offset += size
+        self._arrays = {}
+
+    @classmethod
+    def shared(cls) -> 'ChebyshevEphemeris':
+        """Process-wide instance; the mapping is shared between all engines"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def covers(self, jd: float) -> bool:
+        return self.start <= jd < self.end
+
+    def position(self, name: str, jd: float) -> Tuple[float, float]:
+        """Sidereal longitude and daily speed of a body at a UT Julian day"""
+        base, shift = DERIVED.get(name, (name, 0.0))
+        days, order, segments, _, coefficients = self.series[base]
+        index = min(int((jd - self.start) // days), segments - 1)
+        x = 2 * (jd - self.start - index * days) / days - 1
+        value, slope = evaluate(coefficients[index * order:(index + 1) * order].tolist(), x)
+        return (value + shift) % 360, slope * 2 / days
+
+    def positions_bulk(self, name: str, jds):
+        """Longitude and speed arrays for an array of UT Julian days (NumPy)"""
+        import numpy as np
+
+        base, shift = DERIVED.get(name, (name, 0.0))
+        days, order, segments, offset, _ = self.series[base]
+        table = self._arrays.get(base)
+        if table is None:
+            table = np.frombuffer(self._mm, dtype='<f8', count=segments * order, offset=offset).reshape(segments, order)
+            self._arrays[base] = table
+        jds = np.asarray(jds, dtype=float)
+        if np.any((jds < self.start) | (jds >= self.end)):
+            raise ValueError(f"Julian days outside the table range {self.start}-{self.end}")
+        index = np.minimum(((jds - self.start) // days).astype(np.intp), segments - 1)
+        x = 2 * (jds - self.start - index * days) / days - 1
+        value, slope = evaluate(table[index].T, x)
+        return (value + shift) % 360, slope * 2 / days
+
+
+_active = None
+_retry_at = None
+
+
+def active() -> bool:
+    """
+    Whether EPHEMERIS_ENGINE selects the table and it can be loaded
+    A missing or stale table starts a background build; until it is done the
+    process uses Swiss Ephemeris and looks again every RETRY_SECONDS
+    """
+    global _active, _retry_at
+    if _active is None or (_retry_at is not None and time.monotonic() >= _retry_at):
+        _active = os.environ.get(ENGINE_ENV, SWISSEPH).lower() == CHEBYSHEV
+        if _active:
+            try:
+                ChebyshevEphemeris.shared()
+                _retry_at = None
+            except (OSError, ValueError) as e:
+                if _retry_at is None:
+                    log.warning("Chebyshev ephemeris unavailable, using Swiss Ephemeris: {}", e)
+                if build_in_background():
+                    log.info("Building the Chebyshev ephemeris table in the background")
+                _active = False
+                _retry_at = time.monotonic() + RETRY_SECONDS
+    return _active
+
+
+def _swe_body(name: str) -> Tuple[int, float]:
+    base, shift = DERIVED.get(name, (name, 0.0))
+    return SEGMENTS[base][0], shift
+
+
+def position(name: str, jd: float) -> Tuple[float, float]:
+    """
+    Sidereal (Lahiri) longitude and daily speed of one of BODIES: from the
+    table when it is switched on and covers jd, otherwise from Swiss
+    Ephemeris (callers set the Lahiri sidereal mode as before)
+    """
+    if active():
+        table = ChebyshevEphemeris.shared()
+        if table.covers(jd):
+            return table.position(name, jd)
+    body, shift = _swe_body(name)
+    values = swe.calc_ut(jd, body, FLAGS)[0]
+    return (values[0] + shift) % 360, values[3]
+
+
+def _arcsec(a: float, b: float) -> float:
+    return abs((a - b + 180) % 360 - 180) * 3600
+
+
+def verify(count: int, seed: int = 0) -> Dict:
+    """
+    Compare count random instants per body against Swiss Ephemeris: the fit
+    against the deflection-free model it was built from, the full Swiss
+    Ephemeris position away from solar conjunction and at any elongation,
+    the speed, continuity across segment boundaries and bulk agreement
+    """
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    table = ChebyshevEphemeris.shared()
+    rng = random.Random(seed)
+    report = {}
+    for name in BODIES:
+        body, shift = _swe_body(name)
+        days = table.series[DERIVED.get(name, (name,))[0]][0]
+        jds = [rng.uniform(table.start, table.end) for _ in range(count)]
+        stats = {'model_arcsec': 0.0, 'clear_arcsec': 0.0, 'any_arcsec': 0.0,
+                 'speed_arcsec_per_day': 0.0, 'boundary_arcsec': 0.0, 'bulk_arcsec': 0.0}
+
+        started = time.perf_counter()
+        results = [table.position(name, jd) for jd in jds]
+        table_us = (time.perf_counter() - started) / count * 1e6
+        started = time.perf_counter()
+        reference = [swe.calc_ut(jd, body, FLAGS)[0] for jd in jds]
+        swe_us = (time.perf_counter() - started) / count * 1e6
+
+        for jd, (longitude, speed), full in zip(jds, results, reference):
+            model = swe.calc_ut(jd, body, FIT_FLAGS)[0][0] + shift
+            error = _arcsec(longitude, full[0] + shift)
+            stats['model_arcsec'] = max(stats['model_arcsec'], _arcsec(longitude, model))
+            stats['any_arcsec'] = max(stats['any_arcsec'], error)
+            if name not in DEFLECTED or \
+                    _arcsec(full[0], swe.calc_ut(jd, swe.SUN, FLAGS)[0][0]) > CONJUNCTION_ZONE * 3600:
+                stats['clear_arcsec'] = max(stats['clear_arcsec'], error)
+            stats['speed_arcsec_per_day'] = max(stats['speed_arcsec_per_day'], abs(speed - full[3]) * 3600)
+
+            boundary = table.start + round((jd - table.start) / days) * days
+            if table.start < boundary < table.end:
+                before, after = table.position(name, boundary - 1e-9), table.position(name, boundary)
+                stats['boundary_arcsec'] = max(stats['boundary_arcsec'], _arcsec(before[0], after[0]))
+
+        bulk_longitudes, _ = table.positions_bulk(name, jds)
+        stats['bulk_arcsec'] = max(_arcsec(a, b) for a, (b, _) in zip(bulk_longitudes.tolist(), results))
+        stats = {key: round(value, 4) for key, value in stats.items()}
+        stats.update(table_us=round(table_us, 2), swisseph_us=round(swe_us, 2))
+        report[name] = stats
+        log.debug("Verified {}: {}", name, stats)
+    return report
+
+
+def main():
+    """Command line: build [path [lock]] | verify <count>"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            command = sys.argv[1] if len(sys.argv) > 1 else ''
+            if command == 'build':
+                try:
+                    result = {'success': True, 'table': build_table(sys.argv[2] if len(sys.argv) > 2 else TABLE_PATH)}
+                finally:
+                    # Started by build_in_background: let the next stale check start over
+                    if len(sys.argv) > 3 and os.path.exists(sys.argv[3]):
+                        os.remove(sys.argv[3])
+            elif command == 'verify':
+                count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+                report = verify(count)
+                passed = all(stats['model_arcsec'] < TOLERANCE_ARCSEC and stats['clear_arcsec'] < TOLERANCE_ARCSEC
+                             for stats in report.values())
+                result = {'success': passed, 'checked': count, 'tolerance_arcsec': TOLERANCE_ARCSEC,
+                          'conjunction_zone_degrees': CONJUNCTION_ZONE, 'bodies': report}
+            else:
+                raise ValueError("Usage: python chebyshev_ephemeris.py build | verify <count>")
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
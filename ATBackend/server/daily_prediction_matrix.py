@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Daily Gochar Prediction Matrix
+Once the day's sky is fixed, a user's gochar reading depends only on their
+natal Moon sign (house counting, Sade Sati, chandra bala) and natal nakshatra
+(tara bala). This job materializes all 12 x 27 combinations for a UTC day
+from the shared transit snapshot, using the premium report's transit house
+logic, so a personalized daily horoscope is a single lookup.
+
+Usage:
+    python daily_prediction_matrix.py                  # build today's matrix
+    python daily_prediction_matrix.py 2025-01-01 7     # build seven days from a date
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple, Union
+
+import swisseph as swe
+
+import engine_logging
+import perf_instrumentation
+import transit_snapshot
+from muhurta_engine import FAVOURABLE_CHANDRA_HOUSES, FAVOURABLE_TARAS, tara_name
+from transit_events import SIGNS
+from transit_snapshot import NAKSHATRAS, NAKSHATRA_SPAN
+
+log = engine_logging.get_logger('prediction_matrix')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SERVER_DIR, 'cache', 'prediction-matrix')
+
+MATRIX_VERSION = 1
+
+GOCHAR_PLANETS = ('Sun', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu')
+
+# Houses from the natal Moon where a transit is favourable (Phaladeepika gochar)
+FAVOURABLE_GOCHAR_HOUSES = {
+    'Sun': {3, 6, 10, 11}, 'Mars': {3, 6, 11}, 'Mercury': {2, 4, 6, 8, 10, 11},
+    'Jupiter': {2, 5, 7, 9, 11}, 'Venus': {1, 2, 3, 4, 5, 8, 9, 11, 12},
+    'Saturn': {3, 6, 11}, 'Rahu': {3, 6, 11}, 'Ketu': {3, 6, 11}
+}
+SADE_SATI_HOUSES = {12: 'rising', 1: 'peak', 2: 'setting'}
+
+# Bisection steps for Moon boundary times (one day / 2**20, well under a second)
+BOUNDARY_STEPS = 20
+
+_premium = None
+_matrices: Dict[str, Dict] = {}
+
+
+def premium_engine():
+    """The premium report engine, loaded once for its transit interpretation tables"""
+    global _premium
+    if _premium is None:
+        spec = importlib.util.spec_from_file_location(
+            'premium_report_engine', os.path.join(SERVER_DIR, 'premium-report-engine.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _premium = module.PremiumReportEngine()
+    return _premium
+
+
+def _moon_longitude(jd: float) -> float:
+    return transit_snapshot.planets_at(jd)[1]['longitude']
+
+
+def moon_periods(day: date) -> List[Tuple[float, float, int, int]]:
+    """
+    (start, end, nakshatra, sign) spans of the Moon over the UTC day, split at
+    every nakshatra and sign boundary it crosses
+    """
+    start = transit_snapshot.julian_day(day, 0.0)
+    end = start + 1
+    first, last = _moon_longitude(start), _moon_longitude(end - 1e-9)
+    travelled = (last - first) % 360
+
+    boundaries = sorted({round(b, 9) for step in (NAKSHATRA_SPAN, 30.0)
+                         for b in ((int(first // step) + k) * step for k in range(1, 4))
+                         if (b - first) % 360 <= travelled and b - first > 0})
+
+    cuts = [start]
+    for boundary in boundaries:
+        lo, hi = cuts[-1], end
+        for _ in range(BOUNDARY_STEPS):
+            mid = (lo + hi) / 2
+            if (_moon_longitude(mid) - first) % 360 < boundary - first:
+                lo = mid
+            else:
+                hi = mid
+        cuts.append(hi)
+    cuts.append(end)
+
+    periods = []
+    for t0, t1 in zip(cuts, cuts[1:]):
+        longitude = _moon_longitude((t0 + t1) / 2)
+        periods.append((t0, t1, int(longitude // NAKSHATRA_SPAN), int(longitude // 30)))
+    return periods
+
+
+def _time(jd: float) -> str:
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    moment = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+    return moment.replace(microsecond=0).isoformat()
+
+
+def sign_row(engine, moon_sign: int, transits: Dict[str, Dict]) -> Dict:
+    """Everything in a reading that depends only on the natal Moon sign"""
+    houses = {planet: (SIGNS.index(transits[planet]['sign']) - moon_sign) % 12 + 1 for planet in GOCHAR_PLANETS}
+    house_positions = {planet: {'house': house} for planet, house in houses.items()}
+    favourable = [planet for planet in GOCHAR_PLANETS if houses[planet] in FAVOURABLE_GOCHAR_HOUSES[planet]]
+    return {
+        'houses_from_moon': houses,
+        'favourable_transits': favourable,
+        'jupiter': engine.dynamic_engine.get_jupiter_transit_effects(house_positions),
+        'saturn': engine.dynamic_engine.get_saturn_transit_effects(house_positions),
+        'sade_sati': SADE_SATI_HOUSES.get(houses['Saturn']),
+        'kantaka_shani': houses['Saturn'] == 4,
+        'ashtama_shani': houses['Saturn'] == 8
+    }
+
+
+def build_matrix(day: date) -> Dict:
+    """The 12 x 27 gochar matrix for one UTC day"""
+    engine = premium_engine()
+    jd = transit_snapshot.julian_day(day)
+    transits = {planet['name']: planet for planet in transit_snapshot.planets_at(jd)}
+    vedic = {name: engine.get_sign_from_longitude(transits[name]['longitude'])
+             for name in ('Jupiter', 'Saturn', 'Rahu', 'Ketu')}
+    impacts = {
+        'Jupiter': engine.get_transit_impact('Jupiter', vedic['Jupiter']),
+        'Saturn': engine.get_transit_impact('Saturn', vedic['Saturn']),
+        'Rahu': engine.get_transit_impact('Rahu', vedic['Rahu'], vedic['Ketu'])
+    }
+    periods = moon_periods(day)
+    rows = [sign_row(engine, sign, transits) for sign in range(12)]
+
+    cells = []
+    for sign, row in enumerate(rows):
+        cells.append([])
+        for nakshatra in range(27):
+            moon = []
+            for t0, t1, moon_nakshatra, moon_sign in periods:
+                tara = tara_name(nakshatra, moon_nakshatra)
+                chandra_house = (moon_sign - sign) % 12 + 1
+                moon.append({
+                    'from': _time(t0), 'to': _time(t1),
+                    'nakshatra': NAKSHATRAS[moon_nakshatra],
+                    'tara': tara, 'tara_bala': tara in FAVOURABLE_TARAS,
+                    'chandra_house': chandra_house, 'chandra_bala': chandra_house in FAVOURABLE_CHANDRA_HOUSES
+                })
+            # Score: favourable gochar grahas plus tara and chandra bala at the start of the day
+            score = len(row['favourable_transits']) + moon[0]['tara_bala'] + moon[0]['chandra_bala']
+            cells[-1].append(dict(row, moon=moon, score=score,
+                                  outlook='favourable' if score >= 6 else 'mixed' if score >= 3 else 'challenging'))
+
+    log.debug("Built prediction matrix for {} with {} Moon periods", day.isoformat(), len(periods))
+    return {
+        'version': MATRIX_VERSION,
+        'date': day.isoformat(),
+        'transits': {name: {'sign': data['sign'], 'nakshatra': data['nakshatra'], 'retrograde': data['retrograde']}
+                     for name, data in transits.items()},
+        'impacts': impacts,
+        'cells': cells
+    }
+
+
+def _cache_path(day: date) -> str:
+    return os.path.join(CACHE_DIR, f"{day.isoformat()}.json")
+
+
+def load_matrix(day: date) -> Dict:
+    """The day's matrix from memory, then disk, building and persisting it on a miss"""
+    key = day.isoformat()
+    matrix = _matrices.get(key)
+    if matrix is not None:
+        perf_instrumentation.record_cache('prediction_matrix', True)
+        return matrix
+
+    path = _cache_path(day)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            matrix = json.load(f)
+        if matrix.get('version') == MATRIX_VERSION:
+            perf_instrumentation.record_cache('prediction_matrix', True)
+            _matrices[key] = matrix
+            return matrix
+
+    perf_instrumentation.record_cache('prediction_matrix', False)
+    matrix = build_matrix(day)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # A private temporary file, so concurrent processes never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(matrix, f, ensure_ascii=False, separators=(',', ':'))
+    # mkstemp creates the file owner-only; the cache is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    _matrices[key] = matrix
+    return matrix
+
+
+def lookup(day: date, moon_sign: Union[int, str], nakshatra: Union[int, str]) -> Dict:
+    """A user's daily gochar reading by natal Moon sign and nakshatra (names or 0-based indexes)"""
+    sign_index = moon_sign if isinstance(moon_sign, int) else SIGNS.index(moon_sign)
+    nakshatra_index = nakshatra if isinstance(nakshatra, int) else NAKSHATRAS.index(nakshatra)
+    matrix = load_matrix(day)
+    return dict(matrix['cells'][sign_index][nakshatra_index], date=matrix['date'], impacts=matrix['impacts'])
+
+
+def main():
+    """Command line: optional start date and day count; builds and persists matrices"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            start = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.now(timezone.utc).date()
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+            built = [load_matrix(start + timedelta(days=i))['date'] for i in range(days)]
+        result = {'success': True, 'matrices': built, 'cache_dir': CACHE_DIR}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
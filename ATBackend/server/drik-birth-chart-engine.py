@@ -13,11 +13,14 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any
 import pytz
 
+from tz_resolver import TimezoneResolver
+
 # Add the drik-panchanga directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'drik-panchanga'))
 
 try:
     import swisseph as swe
+    import chart_core
     import panchanga
     from panchanga import Place, Date as DrikDate, gregorian_to_jd
 except ImportError as e:
@@ -29,19 +32,6 @@ class DrikBirthChartEngine:
     Drik Panchanga Birth Chart calculation engine using authentic Indian astronomical methods
     """
     
-    # Planet constants
-    PLANETS = {
-        'Sun': swe.SUN,
-        'Moon': swe.MOON, 
-        'Mars': swe.MARS,
-        'Mercury': swe.MERCURY,
-        'Jupiter': swe.JUPITER,
-        'Venus': swe.VENUS,
-        'Saturn': swe.SATURN,
-        'Rahu': swe.MEAN_NODE,
-        'Ketu': swe.MEAN_NODE  # Ketu is opposite to Rahu
-    }
-    
     # Nakshatra names (1-27)
     NAKSHATRA_NAMES = [
         'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashirsha', 'Ardra', 'Punarvasu',
@@ -96,9 +86,8 @@ class DrikBirthChartEngine:
             # Parse date and time
             birth_date = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
             
-            # Calculate timezone offset
-            tz = pytz.timezone(timezone_str)
-            birth_datetime = tz.localize(birth_date)
+            # Calculate historical timezone offset
+            birth_datetime = TimezoneResolver.shared().localize(timezone_str, birth_date)
             utc_offset = birth_datetime.utcoffset().total_seconds() / 3600  # hours
             
             # Create Drik Panchanga place and date objects
@@ -111,23 +100,23 @@ class DrikBirthChartEngine:
             time_fraction = (birth_date.hour + birth_date.minute/60.0) / 24.0
             jd += time_fraction
             
-            # Set Swiss Ephemeris to use Lahiri Ayanamsa
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
+            # Drik Panchanga works in local Julian days; the chart core takes UT
+            chart = chart_core.chart(jd - utc_offset / 24, latitude, longitude)
             
             # Calculate planetary positions
-            planets = cls._calculate_planetary_positions(jd)
+            planets = cls._calculate_planetary_positions(chart)
             
-            # Calculate Ascendant using Drik Panchanga methods
-            ascendant = cls._calculate_ascendant(jd, place)
+            # Sidereal ascendant
+            ascendant = cls._calculate_ascendant(chart)
             
             # Calculate Panchanga using authentic Drik methods
             panchanga_data = cls._calculate_panchanga(jd, place)
             
-            # Calculate houses using traditional methods
-            houses = cls._calculate_houses(jd, place, ascendant['longitude'])
+            # Placidus bhava cusps
+            houses = cls._calculate_houses(chart)
             
             # Calculate Nakshatras and Padas for planets
-            planet_nakshatras = cls._calculate_planet_nakshatras(planets)
+            planet_nakshatras = cls._calculate_planet_nakshatras(chart)
             
             # Calculate Vimshottari Dasha
             dasha_data = cls._calculate_vimshottari_dasha(planets[1]['longitude'], birth_datetime)
@@ -149,7 +138,7 @@ class DrikBirthChartEngine:
                     }
                 },
                 "julian_day": jd,
-                "ayanamsa": swe.get_ayanamsa_ut(jd),
+                "ayanamsa": chart.ayanamsa,
                 "planets": planets,
                 "ascendant": ascendant,
                 "houses": houses,
@@ -167,96 +156,29 @@ class DrikBirthChartEngine:
             }
     
     @classmethod
-    def _calculate_planetary_positions(cls, jd: float) -> List[Dict]:
-        """Calculate positions of all planets using Swiss Ephemeris"""
-        planets = []
-        
-        for planet_name, planet_id in cls.PLANETS.items():
-            try:
-                if planet_name == 'Ketu':
-                    # Ketu is 180 degrees opposite to Rahu
-                    rahu_data = swe.calc_ut(jd, swe.MEAN_NODE, swe.FLG_SWIEPH)
-                    if len(rahu_data) >= 2:  # Check if calculation was successful
-                        longitude = (rahu_data[0][0] + 180) % 360
-                        latitude = -rahu_data[0][1]  # Opposite latitude
-                        distance = rahu_data[0][2]
-                        speed = -rahu_data[0][3] if len(rahu_data[0]) > 3 else 0  # Opposite speed
-                    else:
-                        continue
-                else:
-                    planet_data = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
-                    if len(planet_data) >= 2:  # Check if calculation was successful
-                        longitude = planet_data[0][0]
-                        latitude = planet_data[0][1] 
-                        distance = planet_data[0][2]
-                        speed = planet_data[0][3] if len(planet_data[0]) > 3 else 0
-                    else:
-                        continue
-                
-                # Convert to Nirayana (sidereal) longitude
-                ayanamsa = swe.get_ayanamsa_ut(jd)
-                sidereal_longitude = (longitude - ayanamsa) % 360
-                
-                # Calculate Rashi (sign)
-                rashi_num = int(sidereal_longitude // 30) + 1
-                rashi_name = cls.RASHI_NAMES[rashi_num - 1]
-                
-                # Calculate degree within rashi
-                degree_in_rashi = sidereal_longitude % 30
-                
-                planets.append({
-                    "name": planet_name,
-                    "longitude": sidereal_longitude,
-                    "latitude": latitude,
-                    "distance": distance,
-                    "speed": speed,
-                    "rashi": rashi_name,
-                    "rashi_num": rashi_num,
-                    "degree_in_rashi": degree_in_rashi,
-                    "retrograde": speed < 0 if planet_name not in ['Sun', 'Moon', 'Rahu', 'Ketu'] else False
-                })
-                
-            except Exception as e:
-                print(f"Error calculating {planet_name}: {e}")
-                continue
-                
-        return planets
+    def _calculate_planetary_positions(cls, chart: 'chart_core.Chart') -> List[Dict]:
+        """Sidereal positions of all planets from the shared chart core"""
+        return [{
+            "name": graha.name,
+            "longitude": graha.longitude,
+            "latitude": graha.latitude,
+            "distance": graha.distance,
+            "speed": graha.speed,
+            "rashi": cls.RASHI_NAMES[graha.sign],
+            "rashi_num": graha.sign + 1,
+            "degree_in_rashi": graha.degree,
+            "retrograde": graha.retrograde
+        } for graha in chart.grahas]
     
     @classmethod
-    def _calculate_ascendant(cls, jd: float, place: Place) -> Dict:
-        """Calculate Ascendant using traditional methods"""
-        try:
-            # Calculate sunrise time for the day
-            sunrise_jd = panchanga.sunrise(jd, place)[0]
-            
-            # Use precise time for ascendant calculation
-            houses_data = swe.houses(jd, place.latitude, place.longitude, b'P')  # Placidus
-            ascendant_longitude = houses_data[1][0]  # First house cusp
-            
-            # Convert to sidereal
-            ayanamsa = swe.get_ayanamsa_ut(jd)
-            sidereal_ascendant = (ascendant_longitude - ayanamsa) % 360
-            
-            # Calculate Rashi
-            rashi_num = int(sidereal_ascendant // 30) + 1
-            rashi_name = cls.RASHI_NAMES[rashi_num - 1]
-            
-            return {
-                "longitude": sidereal_ascendant,
-                "rashi": rashi_name,
-                "rashi_num": rashi_num,
-                "degree_in_rashi": sidereal_ascendant % 30
-            }
-            
-        except Exception as e:
-            # Fallback calculation
-            return {
-                "longitude": 0.0,
-                "rashi": "Mesha", 
-                "rashi_num": 1,
-                "degree_in_rashi": 0.0,
-                "error": str(e)
-            }
+    def _calculate_ascendant(cls, chart: 'chart_core.Chart') -> Dict:
+        """Sidereal Ascendant (Lagna)"""
+        return {
+            "longitude": chart.ascendant,
+            "rashi": cls.RASHI_NAMES[chart.ascendant_sign],
+            "rashi_num": chart.ascendant_sign + 1,
+            "degree_in_rashi": chart.ascendant % 30
+        }
     
     @classmethod
     def _calculate_panchanga(cls, jd: float, place: Place) -> Dict:
@@ -325,80 +247,26 @@ class DrikBirthChartEngine:
             }
     
     @classmethod
-    def _calculate_houses(cls, jd: float, place: Place, ascendant_longitude: float) -> List[Dict]:
-        """Calculate 12 houses using traditional methods"""
-        houses = []
-        
-        try:
-            # Calculate house cusps using Placidus system
-            houses_data = swe.houses(jd, place.latitude, place.longitude, b'P')
-            cusps = houses_data[1]  # House cusps
-            
-            ayanamsa = swe.get_ayanamsa_ut(jd)
-            
-            for i in range(12):
-                cusp_longitude = cusps[i]
-                sidereal_cusp = (cusp_longitude - ayanamsa) % 360
-                
-                rashi_num = int(sidereal_cusp // 30) + 1
-                rashi_name = cls.RASHI_NAMES[rashi_num - 1]
-                
-                houses.append({
-                    "house_num": i + 1,
-                    "cusp_longitude": sidereal_cusp,
-                    "rashi": rashi_name,
-                    "rashi_num": rashi_num,
-                    "degree_in_rashi": sidereal_cusp % 30
-                })
-                
-        except Exception as e:
-            # Fallback to equal house system
-            for i in range(12):
-                house_longitude = (ascendant_longitude + i * 30) % 360
-                rashi_num = int(house_longitude // 30) + 1
-                rashi_name = cls.RASHI_NAMES[rashi_num - 1]
-                
-                houses.append({
-                    "house_num": i + 1,
-                    "cusp_longitude": house_longitude,
-                    "rashi": rashi_name,
-                    "rashi_num": rashi_num,
-                    "degree_in_rashi": house_longitude % 30,
-                    "system": "Equal House (fallback)"
-                })
-        
-        return houses
+    def _calculate_houses(cls, chart: 'chart_core.Chart') -> List[Dict]:
+        """12 sidereal Placidus bhava cusps (Porphyry inside the polar circles)"""
+        return [{
+            "house_num": i + 1,
+            "cusp_longitude": cusp,
+            "rashi": cls.RASHI_NAMES[int(cusp // 30)],
+            "rashi_num": int(cusp // 30) + 1,
+            "degree_in_rashi": cusp % 30
+        } for i, cusp in enumerate(chart.cusps)]
     
     @classmethod
-    def _calculate_planet_nakshatras(cls, planets: List[Dict]) -> List[Dict]:
-        """Calculate nakshatra and pada for each planet"""
-        planet_nakshatras = []
-        
-        for planet in planets:
-            longitude = planet['longitude']
-            
-            # Each nakshatra spans 13°20' = 800' = 13.333333°
-            nakshatra_num = int(longitude // 13.333333) + 1
-            if nakshatra_num > 27:
-                nakshatra_num = 27
-                
-            nakshatra_name = cls.NAKSHATRA_NAMES[nakshatra_num - 1]
-            
-            # Calculate pada (1-4)
-            position_in_nakshatra = longitude % 13.333333
-            pada = int(position_in_nakshatra // 3.333333) + 1
-            if pada > 4:
-                pada = 4
-            
-            planet_nakshatras.append({
-                "planet": planet['name'],
-                "nakshatra": nakshatra_name,
-                "nakshatra_num": nakshatra_num,
-                "pada": pada,
-                "longitude": longitude
-            })
-        
-        return planet_nakshatras
+    def _calculate_planet_nakshatras(cls, chart: 'chart_core.Chart') -> List[Dict]:
+        """Nakshatra and pada for each planet"""
+        return [{
+            "planet": graha.name,
+            "nakshatra": cls.NAKSHATRA_NAMES[graha.nakshatra],
+            "nakshatra_num": graha.nakshatra + 1,
+            "pada": graha.pada,
+            "longitude": graha.longitude
+        } for graha in chart.grahas]
     
     @classmethod
     def _calculate_vimshottari_dasha(cls, moon_longitude: float, birth_datetime: datetime) -> Dict:
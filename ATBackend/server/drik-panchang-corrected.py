@@ -19,6 +19,7 @@ sys.path.insert(0, str(drik_dir))
 
 try:
     import swisseph as swe
+    import ayanamsa_service
     swe_available = True
     print("✅ Swiss Ephemeris loaded successfully", file=sys.stderr)
 except ImportError as e:
@@ -181,7 +182,7 @@ class DrikPanchangCorrected:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply Lahiri ayanamsa correctly
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -340,7 +341,7 @@ class DrikPanchangCorrected:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply Lahiri ayanamsa correctly
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
             # Calculate nakshatra with corrected boundaries
@@ -409,7 +410,7 @@ class DrikPanchangCorrected:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply Lahiri ayanamsa correctly
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -499,7 +500,7 @@ class DrikPanchangCorrected:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply Lahiri ayanamsa correctly
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -630,7 +631,7 @@ class DrikPanchangCorrected:
             sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
             
             # Apply ayanamsa correction
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_sidereal = (moon_pos - ayanamsa) % 360
             sun_sidereal = (sun_pos - ayanamsa) % 360
             
@@ -667,7 +668,7 @@ class DrikPanchangCorrected:
         try:
             # Calculate moon position with ayanamsa correction
             moon_pos_calc = swe.calc_ut(jd, swe.MOON)[0][0]
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_sidereal = (moon_pos_calc - ayanamsa) % 360
             
             # Calculate nakshatra number (1-27)
@@ -703,7 +704,7 @@ class DrikPanchangCorrected:
             sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
             
             # Apply ayanamsa correction
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_sidereal = (moon_pos - ayanamsa) % 360
             sun_sidereal = (sun_pos - ayanamsa) % 360
             
@@ -742,7 +743,7 @@ class DrikPanchangCorrected:
             sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
             
             # Apply ayanamsa correction
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_sidereal = (moon_pos - ayanamsa) % 360
             sun_sidereal = (sun_pos - ayanamsa) % 360
             
@@ -887,7 +888,7 @@ class DrikPanchangCorrected:
                     # Calculate tithi angle at test time
                     sun_pos = swe.calc_ut(test_jd, swe.SUN)[0][0]
                     moon_pos = swe.calc_ut(test_jd, swe.MOON)[0][0]
-                    ayanamsa = swe.get_ayanamsa_ut(test_jd)
+                    ayanamsa = ayanamsa_service.ayanamsa(test_jd)
                     
                     sun_pos_sidereal = (sun_pos - ayanamsa) % 360
                     moon_pos_sidereal = (moon_pos - ayanamsa) % 360
@@ -949,7 +950,7 @@ class DrikPanchangCorrected:
                     
                     # Calculate moon position at test time
                     moon_pos = swe.calc_ut(test_jd, swe.MOON)[0][0]
-                    ayanamsa = swe.get_ayanamsa_ut(test_jd)
+                    ayanamsa = ayanamsa_service.ayanamsa(test_jd)
                     test_moon_pos = (moon_pos - ayanamsa) % 360
                     
                     # Check if we've crossed the boundary
@@ -1008,7 +1009,7 @@ class DrikPanchangCorrected:
                     # Calculate karana angle at test time
                     sun_pos = swe.calc_ut(test_jd, swe.SUN)[0][0]
                     moon_pos = swe.calc_ut(test_jd, swe.MOON)[0][0]
-                    ayanamsa = swe.get_ayanamsa_ut(test_jd)
+                    ayanamsa = ayanamsa_service.ayanamsa(test_jd)
                     
                     sun_pos_sidereal = (sun_pos - ayanamsa) % 360
                     moon_pos_sidereal = (moon_pos - ayanamsa) % 360
@@ -1278,7 +1279,7 @@ class DrikPanchangCorrected:
                 (swe.MEAN_NODE, "ketu")
             ]
             
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             
             for planet_id, planet_name in planets:
                 try:
@@ -1306,7 +1307,7 @@ class DrikPanchangCorrected:
     def calculate_technical_details_corrected(cls, jd, latitude, longitude, timezone_str):
         """Calculate technical calculation details"""
         try:
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             
             return {
                 "ayanamsa": round(ayanamsa, 3),
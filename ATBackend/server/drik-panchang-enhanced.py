@@ -19,6 +19,7 @@ sys.path.insert(0, str(drik_dir))
 try:
     import panchanga
     import swisseph as swe
+    import ayanamsa_service
     swe_available = True
     print("✅ Drik Panchang library loaded successfully", file=sys.stderr)
 except ImportError as e:
@@ -181,7 +182,7 @@ class DrikPanchangEnhanced:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
             # Calculate nakshatra
@@ -247,7 +248,7 @@ class DrikPanchangEnhanced:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -303,7 +304,7 @@ class DrikPanchangEnhanced:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -652,7 +653,7 @@ class DrikPanchangEnhanced:
                 "Ketu": swe.MEAN_NODE  # Ketu is opposite to Rahu
             }
             
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             
             for planet_name, planet_id in planet_ids.items():
                 planet_pos = swe.calc_ut(jd, planet_id)[0][0]
@@ -692,7 +693,7 @@ class DrikPanchangEnhanced:
         """
         try:
             # Get ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             
             # Calculate sidereal time
             sidereal_time = swe.sidtime(jd)
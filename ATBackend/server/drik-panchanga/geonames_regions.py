@@ -0,0 +1,146 @@
+# Throw-away script for one-time use only.
+#
+# Generates cities_regions.json: country and first-level region (state,
+# province) of every row in cities.csv, the names those qualifiers go by,
+# and the aliases a city is known under, for the gazetteer's
+# "City, State, Country" resolution.
+#
+# Needs the GeoNames extracts shipped with two PyPI packages:
+#   pip install geonamescache reverse_geocoder
+#
+
+import csv
+import importlib.util
+import json
+import math
+import os
+import unicodedata
+
+import geonamescache
+import pytz
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Everyday names GeoNames does not list as the country name
+COUNTRY_EXTRAS = {
+    'AE': ['UAE'],
+    'GB': ['UK', 'Great Britain', 'Britain'],
+    'KR': ['South Korea'],
+    'NL': ['Holland'],
+    'RU': ['Russia'],
+    'US': ['USA', 'United States of America', 'America'],
+}
+
+# Abbreviations and former names of first-level regions
+REGION_EXTRAS = {
+    'AU': {'ACT': 'Australian Capital Territory', 'NSW': 'New South Wales', 'NT': 'Northern Territory',
+           'QLD': 'Queensland', 'SA': 'South Australia', 'TAS': 'Tasmania', 'VIC': 'Victoria',
+           'WA': 'Western Australia'},
+    'CA': {'AB': 'Alberta', 'BC': 'British Columbia', 'MB': 'Manitoba', 'NB': 'New Brunswick',
+           'NL': 'Newfoundland and Labrador', 'NS': 'Nova Scotia', 'NT': 'Northwest Territories',
+           'NU': 'Nunavut', 'ON': 'Ontario', 'PE': 'Prince Edward Island', 'QC': 'Quebec',
+           'SK': 'Saskatchewan', 'YT': 'Yukon'},
+    'IN': {'Delhi': 'NCT', 'New Delhi': 'NCT', 'Jammu and Kashmir': 'Kashmir', 'Orissa': 'Odisha',
+           'Puducherry': 'Pondicherry', 'Uttaranchal': 'Uttarakhand', 'Lakshadweep': 'Laccadives'},
+}
+
+# Former and colloquial city names GeoNames keeps only among its alternate names
+CITY_ALIASES = {
+    'Mumbai': ['Bombay'], 'Chennai': ['Madras'], 'Kolkata': ['Calcutta'], 'Varanasi': ['Benares', 'Banaras', 'Kashi'],
+    'Pune': ['Poona'], 'Vadodara': ['Baroda'], 'Thiruvananthapuram': ['Trivandrum'], 'Kanpur': ['Cawnpore'],
+    'Shimla': ['Simla'], 'Cochin': ['Kochi'], 'Calicut': ['Kozhikode'], 'Mysore': ['Mysuru'],
+    'Mangalore': ['Mangaluru'], 'Belgaum': ['Belagavi'], 'Gurgaon': ['Gurugram'], 'Allahabad': ['Prayagraj'],
+    'Puducherry': ['Pondicherry'], 'Madurai': ['Madura'], 'Tiruchchirappalli': ['Tiruchirappalli', 'Trichy'],
+}
+
+
+def unit(lat, lon):
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def km(a, b):
+    chord = math.sqrt(sum((p - q) ** 2 for p, q in zip(a, b)))
+    return 2 * math.asin(min(1.0, chord / 2)) * 6371.0
+
+
+def fold(name):
+    # Same folding as gazetteer.normalize_name, so accent-only renames are not aliases
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch)).lower()
+    return ' '.join(''.join(ch if ch.isalnum() else ' ' for ch in name).split())
+
+
+# Only the data file is needed; importing reverse_geocoder itself pulls in scipy
+rg_spec = importlib.util.find_spec('reverse_geocoder')
+rg_path = os.path.join(os.path.dirname(rg_spec.origin), 'rg_cities1000.csv')
+places = [(float(r['lat']), float(r['lon']), r['name'], r['admin1'], r['cc'])
+          for r in csv.DictReader(open(rg_path, encoding='utf-8'))]
+by_name = {}
+for place in places:
+    by_name.setdefault(fold(place[2]), []).append(place)
+cells = {}
+for place in places:
+    cells.setdefault((round(place[0]), round(place[1])), []).append(place)
+
+gc = geonamescache.GeonamesCache()
+current = {}
+for city in gc.get_cities().values():
+    current.setdefault((round(city['latitude']), round(city['longitude'])), []).append(city)
+
+zone_country = {zone: cc for cc, zones in pytz.country_timezones.items() for zone in zones}
+
+
+def region_of(name, lat, lon, tz):
+    here = unit(lat, lon)
+    # Same name close by, else whatever locality surrounds the point, else the zone's country
+    same = [p for p in by_name.get(fold(name), []) if km(here, unit(p[0], p[1])) < 25]
+    if same:
+        best = min(same, key=lambda p: km(here, unit(p[0], p[1])))
+        return best[4], best[3]
+    near = [p for dlat in (-1, 0, 1) for dlon in (-1, 0, 1)
+            for p in cells.get((round(lat) + dlat, round(lon) + dlon), [])]
+    near = [p for p in near if km(here, unit(p[0], p[1])) < 15]
+    if near:
+        best = min(near, key=lambda p: km(here, unit(p[0], p[1])))
+        return best[4], best[3]
+    return zone_country.get(tz, ''), ''
+
+
+def renamed(name, lat, lon):
+    """GeoNames' current name for the city when it has since changed"""
+    here = unit(lat, lon)
+    for city in current.get((round(lat), round(lon)), []):
+        if km(here, unit(city['latitude'], city['longitude'])) < 5 and fold(city['name']) != fold(name) \
+                and name in city['alternatenames']:
+            return city['name']
+    return None
+
+
+countries = {}
+for cc, info in gc.get_countries().items():
+    countries[cc] = [info['name'], info['iso3']] + COUNTRY_EXTRAS.get(cc, [])
+country_names = {fold(name) for names in countries.values() for name in names}
+
+cities = {}
+for line in open(os.path.join(HERE, 'cities.csv'), encoding='utf-8'):
+    line = line.rstrip('\n')
+    if not line:
+        continue
+    name, lat, lon, tz = line.rsplit(':', 3)
+    country, admin1 = region_of(name, float(lat), float(lon), tz)
+    aliases = list(CITY_ALIASES.get(name, []))
+    new_name = renamed(name, float(lat), float(lon))
+    # A country's name is kept as a qualifier, never as a city alias
+    if new_name and new_name not in aliases and fold(new_name) not in country_names:
+        aliases.append(new_name)
+    record = {'country': country, 'admin1': admin1}
+    if aliases:
+        record['aliases'] = aliases
+    cities[f'{lat}:{lon}'] = record
+
+regions = dict(REGION_EXTRAS)
+regions['US'] = {code: state['name'] for code, state in gc.get_us_states().items()}
+
+with open(os.path.join(HERE, 'cities_regions.json'), 'w', encoding='utf-8') as f:
+    json.dump({'countries': countries, 'regions': regions, 'cities': cities}, f, indent=0, sort_keys=True)
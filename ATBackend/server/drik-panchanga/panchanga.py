@@ -75,25 +75,37 @@ def inverse_lagrange(x, y, ya):
 gregorian_to_jd = lambda date: swe.julday(date.year, date.month, date.day, 0.0)
 jd_to_gregorian = lambda jd: swe.revjul(jd, swe.GREG_CAL)   # returns (y, m, d, h, min, s)
 
+# pyswisseph 2.x returns (values, flags) from calc_ut and takes rsmi and
+# geopos positionally in rise_trans; 1.x returned bare values
+def calc_ut(jd, body):
+  data = swe.calc_ut(jd, body, swe.FLG_SWIEPH)
+  return data[0] if isinstance(data[0], tuple) else data
+
+def rise_trans(jd, body, lon, lat, rsmi):
+  try:
+    return swe.rise_trans(jd, body, rsmi, (lon, lat, 0.0))
+  except TypeError:
+    return swe.rise_trans(jd, body, lon, lat, rsmi=rsmi)
+
 def solar_longitude(jd):
   """Solar longitude at given instant (julian day) jd"""
-  data = swe.calc_ut(jd, swe.SUN, flag = swe.FLG_SWIEPH)
+  data = calc_ut(jd, swe.SUN)
   return data[0]   # in degrees
 
 def lunar_longitude(jd):
   """Lunar longitude at given instant (julian day) jd"""
-  data = swe.calc_ut(jd, swe.MOON, flag = swe.FLG_SWIEPH)
+  data = calc_ut(jd, swe.MOON)
   return data[0]   # in degrees
 
 def lunar_latitude(jd):
   """Lunar latitude at given instant (julian day) jd"""
-  data = swe.calc_ut(jd, swe.MOON, flag = swe.FLG_SWIEPH)
+  data = calc_ut(jd, swe.MOON)
   return data[1]   # in degrees
 
 def sunrise(jd, place):
   """Sunrise when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz/24, swe.SUN, lon, lat, rsmi=swe.BIT_DISC_CENTER + swe.CALC_RISE)
+  result = rise_trans(jd - tz/24, swe.SUN, lon, lat, swe.BIT_DISC_CENTER + swe.CALC_RISE)
   rise = result[1][0]  # julian-day number
   # Convert to local time
   return [rise + tz/24., to_dms((rise - jd) * 24 + tz)]
@@ -101,7 +113,7 @@ def sunrise(jd, place):
 def sunset(jd, place):
   """Sunset when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz/24, swe.SUN, lon, lat, rsmi=swe.BIT_DISC_CENTER + swe.CALC_SET)
+  result = rise_trans(jd - tz/24, swe.SUN, lon, lat, swe.BIT_DISC_CENTER + swe.CALC_SET)
   setting = result[1][0]  # julian-day number
   # Convert to local time
   return [setting + tz/24., to_dms((setting - jd) * 24 + tz)]
@@ -109,7 +121,7 @@ def sunset(jd, place):
 def moonrise(jd, place):
   """Moonrise when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz/24, swe.MOON, lon, lat, rsmi=swe.BIT_DISC_CENTER + swe.CALC_RISE)
+  result = rise_trans(jd - tz/24, swe.MOON, lon, lat, swe.BIT_DISC_CENTER + swe.CALC_RISE)
   rise = result[1][0]  # julian-day number
   # Convert to local time
   return to_dms((rise - jd) * 24 + tz)
@@ -117,7 +129,7 @@ def moonrise(jd, place):
 def moonset(jd, place):
   """Moonset when centre of disc is at horizon for given date and place"""
   lat, lon, tz = place
-  result = swe.rise_trans(jd - tz/24, swe.MOON, lon, lat, rsmi=swe.BIT_DISC_CENTER + swe.CALC_SET)
+  result = rise_trans(jd - tz/24, swe.MOON, lon, lat, swe.BIT_DISC_CENTER + swe.CALC_SET)
   setting = result[1][0]  # julian-day number
   # Convert to local time
   return to_dms((setting - jd) * 24 + tz)
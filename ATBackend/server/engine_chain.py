@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Engine Chain
+Birth charts through the primary JyotishaEngine, falling back in-process to
+JyotishaEngineFallback and then JyotishaMicroEngine when an engine raises
+or reports failure. Every engine is loaded once, so a fallback costs one
+more function call, not another interpreter start. Results always come back
+in the primary engine's shape.
+
+Shadow mode replays a sample of requests (ENGINE_SHADOW_PERCENT, 0-100) in a
+background thread. Every engine computes from chart_core, so replaying another
+engine would only compare chart_core with itself; the shadow instead rebuilds
+the chart straight from Swiss Ephemeris and zoneinfo, outside chart_core and its
+tables (Chebyshev series, ayanamsa table, compiled timezone offsets, nakshatra
+lookup), and records where the served chart disagrees on Julian day,
+ayanamsa, ascendant, a planet's longitude, sign, house, nakshatra lord or
+motion, or the opening Vimshottari dasha. Shadow runs take the same lock as
+requests, so Swiss Ephemeris global state is only ever used by one chart at a
+time.
+
+Usage:
+    echo '{"date": "1990-05-15", "time": "14:30", "latitude": 28.61, "longitude": 77.21}' \\
+        | python engine_chain.py
+    ENGINE_SHADOW_PERCENT=5 python engine_chain.py --worker
+"""
+
+import importlib.util
+import json
+import os
+import random
+import sys
+import threading
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import swisseph as swe
+
+import chart_core
+import engine_logging
+from gazetteer import resolve_birth_place
+
+log = engine_logging.get_logger('engine_chain')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+EngineSpec = namedtuple('EngineSpec', 'name filename module_name class_name instance')
+
+# Tried in order until one succeeds
+CHAIN = (
+    EngineSpec('primary', 'jyotisha-engine.py', 'jyotisha_engine', 'JyotishaEngine', False),
+    EngineSpec('fallback', 'jyotisha-engine-fallback.py', 'jyotisha_engine_fallback', 'JyotishaEngineFallback', True),
+    EngineSpec('micro', 'jyotisha-micro-engine.py', 'jyotisha_micro_engine', 'JyotishaMicroEngine', True)
+)
+ENGINES = {spec.name: spec for spec in CHAIN}
+
+SHADOW_ENV = 'ENGINE_SHADOW_PERCENT'
+SHADOW_ENGINE = 'swisseph-reference'
+SHADOW_BACKLOG = 32
+DISAGREEMENT_LOG_SIZE = 100
+
+# The served chart may come from the Chebyshev table, which leaves out solar
+# light deflection (up to about two arc-seconds beside the Sun); a wrong
+# ephemeris, ayanamsa or timezone is off by far more
+LONGITUDE_TOLERANCE = 5 / 3600
+JULIAN_DAY_TOLERANCE = 1 / 86400
+DASHA_TOLERANCE_DAYS = 1.0
+
+# The reference chart's own tables, independent of chart_core's
+REFERENCE_BODIES = (('Sun', swe.SUN), ('Moon', swe.MOON), ('Mars', swe.MARS), ('Mercury', swe.MERCURY),
+                    ('Jupiter', swe.JUPITER), ('Venus', swe.VENUS), ('Saturn', swe.SATURN),
+                    ('Rahu', swe.MEAN_NODE))
+REFERENCE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+DASHA_YEARS = (('Ketu', 7), ('Venus', 20), ('Sun', 6), ('Moon', 10), ('Mars', 7),
+               ('Rahu', 18), ('Jupiter', 16), ('Saturn', 19), ('Mercury', 17))
+
+_lock = threading.Lock()
+_shadow_percent = float(os.environ.get(SHADOW_ENV, 0) or 0)
+_shadow_pool: Optional[ThreadPoolExecutor] = None
+_shadow_pending = 0
+_shadow_stats = Counter()
+_disagreements = deque(maxlen=DISAGREEMENT_LOG_SIZE)
+_stats_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def engine(name: str) -> Callable[[Dict], Dict]:
+    """calculate_birth_chart of one engine in CHAIN, loading its script on first use"""
+    spec = ENGINES[name]
+    module = sys.modules.get(spec.module_name)
+    if module is None:
+        source = importlib.util.spec_from_file_location(spec.module_name, os.path.join(SERVER_DIR, spec.filename))
+        module = importlib.util.module_from_spec(source)
+        sys.modules[spec.module_name] = module
+        source.loader.exec_module(module)
+    cls = getattr(module, spec.class_name)
+    return (cls() if spec.instance else cls).calculate_birth_chart
+
+
+def _normalize_fallback(result: Dict) -> Dict:
+    """JyotishaEngineFallback output in the primary engine's shape"""
+    nakshatra_names = engine('fallback').__self__.NAKSHATRAS
+    planets = []
+    for planet in result['planets']:
+        nakshatra, _ = chart_core.nakshatra_pada(planet['longitude'])
+        planets.append({
+            'name': planet['name'],
+            'longitude': planet['longitude'],
+            'sign': planet['sign'],
+            'degree': chart_core.format_degree(planet['longitude']),
+            'nakshatra': nakshatra_names[nakshatra],
+            'nakshatraLord': chart_core.NAKSHATRA_LORDS[nakshatra % 9],
+            'house': planet['house'],
+            'retrograde': planet['name'] not in chart_core.ALWAYS_DIRECT and planet['speed'] < 0
+        })
+    details = result.get('birth_details', {})
+    return {
+        'success': True,
+        'planets': planets,
+        'ascendant': {
+            'longitude': result['ascendant']['longitude'],
+            'sign': result['ascendant']['sign']
+        },
+        'ayanamsa': result['ayanamsa'],
+        'julianDay': result['julian_day'],
+        'coordinates': {
+            'latitude': details.get('latitude'),
+            'longitude': details.get('longitude')
+        },
+        'vedic_attributes': result.get('vedic_attributes', {}),
+        'calculation_engine': f"{result['calculation_engine']} (via Fallback)"
+    }
+
+
+def _run(name: str, birth_data: Dict) -> Dict:
+    """One engine's chart in the primary shape; raises on failure"""
+    result = engine(name)(dict(birth_data))
+    if not result.get('success'):
+        raise RuntimeError(result.get('error', 'engine reported failure'))
+    return _normalize_fallback(result) if name == 'fallback' else result
+
+
+def birth_chart(birth_data: Dict, chain: Optional[List[str]] = None) -> Dict:
+    """
+    First successful chart along the chain (all of CHAIN by default). The
+    result names the engine that served it and, after a fallback, the
+    failures before it; if every engine fails the errors are returned
+    """
+    failures = []
+    for name in chain or ENGINES:
+        try:
+            with _lock:
+                result = _run(name, birth_data)
+        except Exception as e:
+            log.warning("{} engine failed: {}", name, e)
+            failures.append({'engine': name, 'error': str(e)})
+            continue
+        result['engine_chain'] = {'served_by': name, 'failures': failures}
+        _maybe_shadow(birth_data, result, name)
+        return result
+    return {
+        'success': False,
+        'error': 'All calculation engines failed: ' + '; '.join(f"{f['engine']}: {f['error']}" for f in failures),
+        'engine_chain': {'served_by': None, 'failures': failures}
+    }
+
+
+def configure_shadow(percent: float):
+    """Share of requests (0-100) checked against the reference chart"""
+    global _shadow_percent
+    _shadow_percent = max(0.0, min(100.0, float(percent)))
+
+
+def _maybe_shadow(birth_data: Dict, served: Dict, served_by: str):
+    global _shadow_pool, _shadow_pending
+    if _shadow_percent <= 0 or random.random() * 100 >= _shadow_percent:
+        return
+    with _stats_lock:
+        if _shadow_pending >= SHADOW_BACKLOG:
+            _shadow_stats['skipped'] += 1
+            return
+        _shadow_pending += 1
+        _shadow_stats['sampled'] += 1
+    if _shadow_pool is None:
+        _shadow_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='engine-shadow')
+    _shadow_pool.submit(_shadow, dict(birth_data), served, served_by)
+
+
+def reference_chart(birth_data: Dict) -> Dict:
+    """
+    The chart recomputed directly: zoneinfo for the UTC instant (pytz stops
+    applying DST after 2037), Swiss Ephemeris
+    for the ayanamsa, ascendant and grahas, arithmetic for sign, whole-sign
+    house, nakshatra lord and the opening Vimshottari dasha
+    """
+    timezone_str = resolve_birth_place(birth_data.get('place'), birth_data.get('latitude'),
+                                       birth_data.get('longitude'), birth_data.get('timezone'))['timezone']
+    latitude, longitude = float(birth_data['latitude']), float(birth_data['longitude'])
+    local = datetime.strptime(f"{birth_data['date']} {birth_data.get('time', '12:00')[:5]}",
+                              '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo(timezone_str))
+    utc = local.astimezone(timezone.utc)
+    jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60 + utc.second / 3600)
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa = swe.get_ayanamsa_ut(jd)
+    ascendant = (swe.houses_ex(jd, latitude, longitude, b'W')[1][0] - ayanamsa) % 360
+    ascendant_sign = int(ascendant // 30)
+
+    positions = {}
+    for name, body in REFERENCE_BODIES:
+        values = swe.calc_ut(jd, body, REFERENCE_FLAGS)[0]
+        positions[name] = (values[0], values[3])
+    positions['Ketu'] = ((positions['Rahu'][0] + 180) % 360, positions['Rahu'][1])
+
+    planets = {}
+    for name, (planet_longitude, speed) in positions.items():
+        sign = int(planet_longitude // 30)
+        planets[name] = {
+            'longitude': planet_longitude,
+            'sign': chart_core.SIGN_NAMES[sign],
+            'house': (sign - ascendant_sign) % 12 + 1,
+            'nakshatraLord': DASHA_YEARS[int(planet_longitude * 27 / 360) % 9][0],
+            'retrograde': name not in chart_core.ALWAYS_DIRECT and speed < 0
+        }
+
+    span = 360 / 27
+    moon = positions['Moon'][0]
+    lord, years = DASHA_YEARS[int(moon / span) % 9]
+    remaining = years * (1 - (moon % span) / span)
+    return {
+        'julianDay': jd,
+        'ayanamsa': ayanamsa,
+        'ascendant': {'longitude': ascendant, 'sign': chart_core.SIGN_NAMES[ascendant_sign]},
+        'planets': planets,
+        'dasha': {'lord': lord, 'end': local + timedelta(days=remaining * 365.25)}
+    }
+
+
+def _arc(a: float, b: float) -> float:
+    return abs((a - b + 180) % 360 - 180)
+
+
+def compare(served: Dict, reference: Dict) -> List[str]:
+    """Differences between a served chart (primary shape) and reference_chart"""
+    differences = []
+    if 'julianDay' in served and abs(served['julianDay'] - reference['julianDay']) > JULIAN_DAY_TOLERANCE:
+        differences.append(f"julian day {served['julianDay']} != {reference['julianDay']}")
+    if 'ayanamsa' in served and _arc(served['ayanamsa'], reference['ayanamsa']) > LONGITUDE_TOLERANCE:
+        differences.append(f"ayanamsa differs by {_arc(served['ayanamsa'], reference['ayanamsa']) * 3600:.1f}\"")
+    separation = _arc(served['ascendant']['longitude'], reference['ascendant']['longitude'])
+    if separation > LONGITUDE_TOLERANCE:
+        differences.append(f"ascendant longitude differs by {separation * 3600:.1f}\"")
+    if served['ascendant']['sign'] != reference['ascendant']['sign']:
+        differences.append(f"ascendant sign {served['ascendant']['sign']} != {reference['ascendant']['sign']}")
+
+    for planet in served['planets']:
+        other = reference['planets'].get(planet['name'])
+        if other is None:
+            differences.append(f"{planet['name']} unknown to the reference")
+            continue
+        separation = _arc(planet['longitude'], other['longitude'])
+        if separation > LONGITUDE_TOLERANCE:
+            differences.append(f"{planet['name']} longitude differs by {separation * 3600:.1f}\"")
+        for key in ('sign', 'house', 'nakshatraLord', 'retrograde'):
+            if key in planet and planet[key] != other[key]:
+                differences.append(f"{planet['name']} {key} {planet[key]} != {other[key]}")
+
+    sequence = served.get('dasha', {}).get('sequence') if isinstance(served.get('dasha'), dict) else None
+    if sequence:
+        first = sequence[0]
+        if first['lord'] != reference['dasha']['lord']:
+            differences.append(f"opening dasha {first['lord']} != {reference['dasha']['lord']}")
+        else:
+            end = datetime.fromisoformat(first['end_date'])
+            # Engines that keep birth times naive report local wall-clock dates
+            expected = reference['dasha']['end'] if end.tzinfo else reference['dasha']['end'].replace(tzinfo=None)
+            drift = abs((end - expected).total_seconds()) / 86400
+            if drift > DASHA_TOLERANCE_DAYS:
+                differences.append(f"opening {first['lord']} dasha ends {drift:.1f} days apart")
+    return differences
+
+
+def _shadow(birth_data: Dict, served: Dict, served_by: str):
+    global _shadow_pending
+    try:
+        with _lock:
+            reference = reference_chart(birth_data)
+        differences = compare(served, reference)
+        with _stats_lock:
+            _shadow_stats['compared'] += 1
+            if differences:
+                _shadow_stats['disagreed'] += 1
+                _disagreements.append({
+                    'served_by': served_by,
+                    'shadow': SHADOW_ENGINE,
+                    'birth_data': {key: birth_data.get(key) for key in ('date', 'time', 'latitude', 'longitude')},
+                    'differences': differences
+                })
+        if differences:
+            log.warning("Shadow {} disagrees with {}: {}", SHADOW_ENGINE, served_by, '; '.join(differences))
+    except Exception as e:
+        with _stats_lock:
+            _shadow_stats['errors'] += 1
+        log.warning("Shadow {} run failed: {}", SHADOW_ENGINE, e)
+    finally:
+        with _stats_lock:
+            _shadow_pending -= 1
+
+
+def shadow_report() -> Dict:
+    """Shadow sampling counters and the most recent disagreements"""
+    with _stats_lock:
+        return {
+            'percent': _shadow_percent,
+            'engine': SHADOW_ENGINE,
+            'pending': _shadow_pending,
+            'counts': {key: _shadow_stats[key] for key in ('sampled', 'compared', 'disagreed', 'skipped', 'errors')},
+            'disagreements': list(_disagreements)
+        }
+
+
+def handle(request: Dict) -> Dict:
+    """One request: type birth_chart (with birth_data, optional chain) or shadow_report"""
+    kind = request.get('type', 'birth_chart')
+    if kind == 'birth_chart':
+        return birth_chart(request.get('birth_data', request), request.get('chain'))
+    if kind == 'shadow_report':
+        return {'success': True, 'type': kind, 'data': shadow_report()}
+    raise ValueError(f"Unknown request type '{kind}'")
+
+
+def serve(stream=sys.stdin):
+    """Resident worker: one JSON request per line in, one JSON result per line out"""
+    out = sys.stdout
+    for line in stream:
+        if not line.strip():
+            continue
+        request = {}
+        try:
+            with engine_logging.stdout_to_stderr():
+                request = json.loads(line)
+                result = handle(request)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        if isinstance(request, dict) and 'id' in request:
+            result['id'] = request['id']
+        out.write(json.dumps(result) + '\n')
+        out.flush()
+
+
+def main():
+    """Command line: one request as JSON on stdin, or --worker for line-delimited requests"""
+    if '--worker' in sys.argv[1:]:
+        log.info("Engine chain worker ready (shadow {}%)", _shadow_percent)
+        serve()
+        return
+    try:
+        with engine_logging.stdout_to_stderr():
+            result = handle(json.loads(sys.stdin.read()))
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
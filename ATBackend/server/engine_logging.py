@@ -0,0 +1,130 @@
+"""
+Engine Logging
+Level-gated diagnostics for the Python engines, written to stderr so stdout
+carries nothing but the JSON result the Node side parses
+
+Configured from the environment:
+    ENGINE_LOG_LEVEL   debug | info | warning | error (default warning)
+    ENGINE_LOG_FORMAT  text (default) | json, one object per line
+
+Messages take str.format placeholders and are only formatted when their level
+is enabled, so a disabled call costs one attribute check. Arguments that are
+expensive to build (json.dumps of an API response, a formatted traceback)
+belong behind the matching flag:
+
+    log.debug("Planet {} in house {}", planet, house)
+    if log.debug_enabled:
+        log.debug("API response: {}", json.dumps(data, indent=2))
+"""
+
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR
+}
+
+DEFAULT_LEVEL = 'warning'
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line for log shippers"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname.lower(),
+            'engine': record.name,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _configure_root() -> logging.Logger:
+    root = logging.getLogger('engine')
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        if os.environ.get('ENGINE_LOG_FORMAT', '').lower() == 'json':
+            handler.setFormatter(JsonFormatter())
+        else:
+            handler.setFormatter(logging.Formatter('[%(levelname)s] %(name)s: %(message)s'))
+        root.addHandler(handler)
+        root.propagate = False
+        level = os.environ.get('ENGINE_LOG_LEVEL', DEFAULT_LEVEL).lower()
+        root.setLevel(LEVELS.get(level, LEVELS[DEFAULT_LEVEL]))
+    return root
+
+
+class EngineLogger:
+    """Thin facade over a stdlib logger with the level checks precomputed"""
+
+    __slots__ = ('_logger', 'debug_enabled', 'info_enabled', 'warning_enabled', 'error_enabled')
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the effective level (after set_level or external reconfiguration)"""
+        self.debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
+        self.info_enabled = self._logger.isEnabledFor(logging.INFO)
+        self.warning_enabled = self._logger.isEnabledFor(logging.WARNING)
+        self.error_enabled = self._logger.isEnabledFor(logging.ERROR)
+
+    def debug(self, message: str, *args):
+        if self.debug_enabled:
+            self._logger.debug(message.format(*args) if args else message)
+
+    def info(self, message: str, *args):
+        if self.info_enabled:
+            self._logger.info(message.format(*args) if args else message)
+
+    def warning(self, message: str, *args):
+        if self.warning_enabled:
+            self._logger.warning(message.format(*args) if args else message)
+
+    def error(self, message: str, *args):
+        if self.error_enabled:
+            self._logger.error(message.format(*args) if args else message)
+
+    def exception(self, message: str, *args):
+        """Error with the active exception's traceback attached"""
+        if self.error_enabled:
+            self._logger.error(message.format(*args) if args else message, exc_info=True)
+
+
+_loggers = {}
+
+
+def get_logger(name: str) -> EngineLogger:
+    """Logger for one engine, e.g. get_logger('premium_report')"""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = EngineLogger(_configure_root().getChild(name))
+        _loggers[name] = logger
+    return logger
+
+
+def set_level(level: str):
+    """Change the level for every engine logger in this process"""
+    _configure_root().setLevel(LEVELS[level.lower()])
+    for logger in _loggers.values():
+        logger.refresh()
+
+
+@contextmanager
+def stdout_to_stderr():
+    """
+    Route stray prints (from this engine or anything it imports) to stderr
+    for the duration of the block, keeping stdout clean for the result
+    """
+    with redirect_stdout(sys.stderr):
+        yield
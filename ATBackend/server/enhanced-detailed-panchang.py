@@ -17,8 +17,14 @@ current_dir = Path(__file__).parent
 drik_dir = current_dir / "drik-panchanga"
 sys.path.insert(0, str(drik_dir))
 
+import engine_logging
+
+log = engine_logging.get_logger('detailed_panchang')
+
 try:
     import swisseph as swe
+    import ayanamsa_service
+    from festival_calendar import festivals_on
     swe_available = True
     print("✅ Swiss Ephemeris loaded successfully", file=sys.stderr)
 except ImportError as e:
@@ -75,7 +81,7 @@ class EnhancedDetailedPanchang:
             seasonal_data = cls.calculate_seasonal_data(jd)
             
             # Calculate festivals
-            festivals = cls.calculate_festivals(jd, tithi_data, nakshatra_data)
+            festivals = cls.calculate_festivals(date_str, latitude, longitude, timezone_str)
             
             # Calculate zodiac signs
             zodiac_data = cls.calculate_zodiac_signs(jd)
@@ -128,7 +134,7 @@ class EnhancedDetailedPanchang:
             # Get current tithi
             sun_pos = swe.calc_ut(jd, swe.SUN)[0][0]
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
@@ -368,11 +374,13 @@ class EnhancedDetailedPanchang:
         }
     
     @classmethod
-    def calculate_festivals(cls, jd: float, tithi_data: dict, nakshatra_data: dict) -> list:
-        """Calculate festivals and fasts"""
-        return [
-            "Ganesh Chaturthi"
-        ]
+    def calculate_festivals(cls, date_str: str, latitude: float, longitude: float, timezone_str: str) -> list:
+        """Festivals and fasts for the day from the cached yearly festival calendar"""
+        try:
+            return [festival["name"] for festival in festivals_on(date_str, latitude, longitude, timezone_str)]
+        except Exception as e:
+            log.warning("Festival calendar unavailable: {}", e)
+            return []
     
     @classmethod
     def calculate_zodiac_signs(cls, jd: float) -> dict:
@@ -383,7 +391,7 @@ class EnhancedDetailedPanchang:
             moon_pos = swe.calc_ut(jd, swe.MOON)[0][0]
             
             # Apply ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sun_pos_sidereal = (sun_pos - ayanamsa) % 360
             moon_pos_sidereal = (moon_pos - ayanamsa) % 360
             
@@ -17,6 +17,9 @@ import json
 import math
 from typing import Dict, List, Tuple, Any
 
+import arc_geometry
+import yoga_rules
+
 class EnhancedDoshaDetector:
     """
     Authentic Dosha Detection based on classical Vedic principles
@@ -24,11 +27,13 @@ class EnhancedDoshaDetector:
     """
     
     def __init__(self):
-        # Houses for Manglik Dosha
-        self.manglik_houses = [1, 4, 7, 8, 12]
-        
         # Planet order for Kaal Sarp calculation
         self.planet_order = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+    
+    def _board(self, chart_data: Dict) -> 'yoga_rules.ChartBoard':
+        """yoga_rules encoding of the chart, keeping its house numbers"""
+        ascendant = chart_data.get('ascendant', {})
+        return yoga_rules.board_from_positions(chart_data.get('planets', {}), ascendant.get('longitude'))
         
     def detect_manglik_dosha(self, chart_data: Dict) -> Dict:
         """
@@ -39,7 +44,7 @@ class EnhancedDoshaDetector:
         mars_house = mars_data.get('house', 0)
         mars_sign = mars_data.get('sign', '')
         
-        is_manglik = mars_house in self.manglik_houses
+        is_manglik = yoga_rules.holds(self._board(chart_data), 'Manglik without 2nd house')
         
         # Determine severity
         severity = 'None'
@@ -97,40 +102,16 @@ class EnhancedDoshaDetector:
         if not rahu_data or not ketu_data:
             return {'present': False, 'type': 'None', 'description': 'Insufficient data'}
         
-        rahu_longitude = rahu_data.get('longitude', 0)
-        ketu_longitude = ketu_data.get('longitude', 0)
-        
-        # Normalize Ketu longitude (should be opposite to Rahu)
-        expected_ketu = (rahu_longitude + 180) % 360
-        
-        # Check if all planets are on one side of Rahu-Ketu axis
-        planets_between_rahu_ketu = 0
-        planets_between_ketu_rahu = 0
-        
-        for planet_name in self.planet_order:
-            if planet_name in planets:
-                planet_longitude = planets[planet_name].get('longitude', 0)
-                
-                if self._is_between_longitudes(rahu_longitude, expected_ketu, planet_longitude):
-                    planets_between_rahu_ketu += 1
-                else:
-                    planets_between_ketu_rahu += 1
-        
-        # Determine if Kaal Sarp exists
-        total_planets = len(self.planet_order)
-        is_kaal_sarp = (planets_between_rahu_ketu == total_planets or 
-                       planets_between_ketu_rahu == total_planets)
-        
-        # Partial Kaal Sarp (6 out of 7 planets)
-        is_partial = (planets_between_rahu_ketu >= total_planets - 1 or 
-                     planets_between_ketu_rahu >= total_planets - 1)
+        # One sorted sweep around the Rahu-Ketu axis (Ketu taken opposite Rahu)
+        longitudes = {name: planets[name].get('longitude', 0) for name in self.planet_order if name in planets}
+        hemming = arc_geometry.hemming(longitudes, rahu_data.get('longitude', 0))
+        planets_between_rahu_ketu = hemming.ahead
+        planets_between_ketu_rahu = hemming.behind
         
-        # Determine type
-        dosha_type = 'None'
-        if is_kaal_sarp:
-            dosha_type = 'Complete'
-        elif is_partial:
-            dosha_type = 'Partial'
+        board = self._board(chart_data)
+        is_kaal_sarp = yoga_rules.holds(board, 'Kaal Sarp Dosha')
+        is_partial = yoga_rules.holds(board, 'Partial Kaal Sarp Dosha')
+        dosha_type = hemming.status
         
         # Specific Kaal Sarp Yoga types based on Rahu house
         rahu_house = rahu_data.get('house', 1)
@@ -155,6 +136,8 @@ class EnhancedDoshaDetector:
             'ketu_house': ketu_data.get('house', 7),
             'planets_count_rahu_side': planets_between_rahu_ketu,
             'planets_count_ketu_side': planets_between_ketu_rahu,
+            'hemmed_side': hemming.side,
+            'planets_outside': hemming.outside,
             'remedies': remedies,
             'description': self._get_kaal_sarp_description(dosha_type, yoga_name)
         }
@@ -181,12 +164,7 @@ class EnhancedDoshaDetector:
         planets = chart_data.get('planets', {})
         
         # Pitru Dosha indicated by Sun-Rahu conjunction or 9th house affliction
-        sun_house = planets.get('Sun', {}).get('house', 1)
-        rahu_house = planets.get('Rahu', {}).get('house', 1)
-        
-        is_present = (sun_house == rahu_house or  # Sun-Rahu conjunction
-                     rahu_house == 9 or           # Rahu in 9th house
-                     sun_house == 9)              # Afflicted 9th house
+        is_present = yoga_rules.holds(self._board(chart_data), 'Pitru Dosha from Sun and Rahu')
         
         return {
             'present': is_present,
@@ -196,20 +174,8 @@ class EnhancedDoshaDetector:
     
     def _detect_grahan_dosha(self, chart_data: Dict) -> Dict:
         """Detect Grahan Dosha (eclipse effects)"""
-        planets = chart_data.get('planets', {})
-        
-        sun_longitude = planets.get('Sun', {}).get('longitude', 0)
-        moon_longitude = planets.get('Moon', {}).get('longitude', 0)
-        rahu_longitude = planets.get('Rahu', {}).get('longitude', 0)
-        ketu_longitude = planets.get('Ketu', {}).get('longitude', 0)
-        
-        # Check for close conjunctions (within 12 degrees)
-        sun_rahu_close = abs(sun_longitude - rahu_longitude) <= 12
-        sun_ketu_close = abs(sun_longitude - ketu_longitude) <= 12
-        moon_rahu_close = abs(moon_longitude - rahu_longitude) <= 12
-        moon_ketu_close = abs(moon_longitude - ketu_longitude) <= 12
-        
-        is_present = sun_rahu_close or sun_ketu_close or moon_rahu_close or moon_ketu_close
+        # Close conjunctions of a luminary with a node (within 12 degrees)
+        is_present = yoga_rules.holds(self._board(chart_data), 'Luminary eclipsed within 12 degrees')
         
         return {
             'present': is_present,
@@ -227,14 +193,6 @@ class EnhancedDoshaDetector:
             'remedies': ['Perform Nadi dosha nivaran puja']
         }
     
-    def _is_between_longitudes(self, start: float, end: float, check: float) -> bool:
-        """Check if a longitude is between two other longitudes"""
-        # Handle circular nature of zodiac
-        if start <= end:
-            return start <= check <= end
-        else:
-            return check >= start or check <= end
-    
     def _get_manglik_description(self, is_manglik: bool, severity: str, house: int) -> str:
         """Get description for Manglik Dosha"""
         if not is_manglik:
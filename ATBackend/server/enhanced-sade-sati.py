@@ -10,23 +10,27 @@ import json
 import subprocess
 from datetime import datetime, timedelta
 
-def get_planetary_positions(birth_year, birth_month, birth_day, birth_hour, birth_minute):
+from gazetteer import resolve_birth_place
+
+def get_planetary_positions(birth_year, birth_month, birth_day, birth_hour, birth_minute, location=None):
     """Get planetary positions using existing jyotisha-engine.py"""
+    location = location or resolve_birth_place()
     
     # Create birth data in the format expected by jyotisha-engine.py
     birth_data = {
         "name": "Sade Sati Analysis",
         "date": f"{birth_year}-{birth_month:02d}-{birth_day:02d}",
         "time": f"{birth_hour:02d}:{birth_minute:02d}",
-        "place": "Chennai, Tamil Nadu, India",
-        "latitude": 13.0827,
-        "longitude": 80.2707
+        "place": location['place'],
+        "latitude": location['latitude'],
+        "longitude": location['longitude']
     }
     
     try:
-        # Call the existing jyotisha-engine.py
+        # Call the existing jyotisha-engine.py (it reads stdin whenever stdin is not a tty)
         result = subprocess.run(
-            [process.env.PYTHON3, 'server/jyotisha-engine.py', json.dumps(birth_data)],
+            [sys.executable, 'server/jyotisha-engine.py'],
+            input=json.dumps(birth_data),
             capture_output=True,
             text=True,
             timeout=30
@@ -42,10 +46,12 @@ def get_planetary_positions(birth_year, birth_month, birth_day, birth_hour, birt
         print(f"Error calling jyotisha engine: {e}", file=sys.stderr)
         return None
 
-def calculate_sade_sati(birth_year, birth_month, birth_day, birth_hour, birth_minute):
+def calculate_sade_sati(birth_year, birth_month, birth_day, birth_hour, birth_minute,
+                        place=None, latitude=None, longitude=None):
     """
     Calculate complete Sade Sati analysis using jyotisha engine
     """
+    location = resolve_birth_place(place, latitude, longitude)
     # Comprehensive remedial measures
     remedial_measures = [
         "Perform Saturn pacification rituals daily",
@@ -62,11 +68,11 @@ def calculate_sade_sati(birth_year, birth_month, birth_day, birth_hour, birth_mi
     
     try:
         # 1. Get birth chart data using existing jyotisha engine
-        birth_chart = get_planetary_positions(birth_year, birth_month, birth_day, birth_hour, birth_minute)
+        birth_chart = get_planetary_positions(birth_year, birth_month, birth_day, birth_hour, birth_minute, location)
         
         # 2. Get current Saturn position (using today's date for accuracy)
         current_dt = datetime.now()
-        current_chart = get_planetary_positions(current_dt.year, current_dt.month, current_dt.day, 12, 0)
+        current_chart = get_planetary_positions(current_dt.year, current_dt.month, current_dt.day, 12, 0, location)
         
         if not birth_chart or not current_chart:
             raise Exception("Failed to get planetary positions from jyotisha engine")
@@ -186,7 +192,7 @@ def calculate_sade_sati(birth_year, birth_month, birth_day, birth_hour, birth_mi
                 "gender": "male",
                 "birthDate": f"{birth_year}-{birth_month:02d}-{birth_day:02d}",
                 "birthTime": f"{birth_hour:02d}:{birth_minute:02d}",
-                "birthPlace": "Chennai, Tamil Nadu, India"
+                "birthPlace": location['place']
             },
             "moonSign": natal_moon_name,
             "currentStatus": {
@@ -363,7 +369,8 @@ def main():
                     minute = data.get('minute')
                     
                     if all(v is not None for v in [year, month, day, hour, minute]):
-                        result = calculate_sade_sati(year, month, day, hour, minute)
+                        result = calculate_sade_sati(year, month, day, hour, minute,
+                                                     data.get('place'), data.get('latitude'), data.get('longitude'))
                         # Wrap result in success structure for premium report integration
                         output = {
                             "success": True,
@@ -12,6 +12,7 @@ import pytz
 
 try:
     import swisseph as swe
+    import ayanamsa_service
     SWISS_EPHEMERIS_AVAILABLE = True
 except ImportError:
     SWISS_EPHEMERIS_AVAILABLE = False
@@ -92,7 +93,7 @@ class EnhancedSwissEphemerisEngine:
                 sun_longitude = sun_data[0][0]  # Sidereal longitude
                 moon_longitude = moon_data[0][0]  # Sidereal longitude
 
-                ayanamsa = swe.get_ayanamsa_ut(jd)
+                ayanamsa = ayanamsa_service.ayanamsa(jd)
 
                 # Calculate sunrise/sunset with Swiss Ephemeris
                 sunrise_jd = swe.rise_trans_true_hor(jd, swe.SUN, None, swe.FLG_SIDEREAL, 
@@ -465,58 +466,13 @@ class EnhancedSwissEphemerisEngine:
                 "fallback_required": True
             }
 
-def main():
-    """Main function to process command line arguments"""
-    if len(sys.argv) != 2:
-        print(json.dumps({"success": False, "error": "Invalid arguments"}))
-        return
-
-    try:
-        input_data = json.loads(sys.argv[1])
-        engine = EnhancedSwissEphemerisEngine()
-        calculation_type = input_data.get('calculation_type', 'COMPREHENSIVE_PANCHANG')
-
-        if calculation_type == 'COMPREHENSIVE_PANCHANG':
-            result = engine.calculate_comprehensive_panchang(input_data)
-        else:
-            result = {
-                "success": False,
-                "error": f"Unknown calculation type: {calculation_type}"
-            }
-        print(json.dumps(result, indent=2))
-    except Exception as e:
-        print(json.dumps({"success": False, "error": str(e)}))
-
-
-if __name__ == "__main__":
-    main()
-#!/usr/bin/env python3
-"""
-Enhanced Swiss Ephemeris Engine for Accurate Panchang Calculations
-Following the recommendation for timezone handling, sidereal calculations, and precision
-"""
-
-import sys
-import json
-import datetime
-try:
-    import swisseph as swe
-except ImportError:
-    print(json.dumps({"error": "Swiss Ephemeris not available, using fallback calculations"}))
-    sys.exit(1)
-
-class EnhancedSwissEphemerisEngine:
-    def __init__(self):
-        # Set ephemeris path if needed
-        swe.set_ephe_path('.')
-        
     def calculate_panchang(self, date_str, latitude, longitude, timezone):
         """
         Calculate comprehensive Panchang data with Swiss Ephemeris precision
         """
         try:
             # 1. Correct Timezone Handling
-            date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
             
             # Convert to Julian Day with timezone correction
             # IST = UTC + 5.5 hours
@@ -524,7 +480,7 @@ class EnhancedSwissEphemerisEngine:
             jd_ut = swe.julday(date_obj.year, date_obj.month, date_obj.day, 12.0 - timezone_offset)
             
             # 2. Calculate Ayanamsa (Lahiri)
-            ayanamsa = swe.get_ayanamsa(jd_ut, swe.SIDM_LAHIRI)
+            ayanamsa = ayanamsa_service.ayanamsa(jd_ut)
             
             # 3. Get planetary positions
             sun_pos, _ = swe.calc_ut(jd_ut, swe.SUN)
@@ -715,19 +671,38 @@ class EnhancedSwissEphemerisEngine:
         }
 
 def main():
-    if len(sys.argv) != 5:
-        print(json.dumps({"error": "Usage: python enhanced-swiss-ephemeris-engine.py <date> <latitude> <longitude> <timezone>"}))
-        sys.exit(1)
-    
-    date_str = sys.argv[1]
-    latitude = float(sys.argv[2])
-    longitude = float(sys.argv[3])
-    timezone = sys.argv[4]
-    
+    """
+    Command line: one JSON argument for the comprehensive panchang, or
+    <date> <latitude> <longitude> <timezone> for the Swiss Ephemeris panchang
+    """
     engine = EnhancedSwissEphemerisEngine()
-    result = engine.calculate_panchang(date_str, latitude, longitude, timezone)
-    
-    print(json.dumps(result, indent=2))
+    if len(sys.argv) == 5:
+        if not SWISS_EPHEMERIS_AVAILABLE:
+            print(json.dumps({"error": "Swiss Ephemeris not available, using fallback calculations"}))
+            sys.exit(1)
+        result = engine.calculate_panchang(sys.argv[1], float(sys.argv[2]), float(sys.argv[3]), sys.argv[4])
+        print(json.dumps(result, indent=2))
+        return
+
+    if len(sys.argv) != 2:
+        print(json.dumps({"success": False, "error": "Invalid arguments"}))
+        return
+
+    try:
+        input_data = json.loads(sys.argv[1])
+        calculation_type = input_data.get('calculation_type', 'COMPREHENSIVE_PANCHANG')
+
+        if calculation_type == 'COMPREHENSIVE_PANCHANG':
+            result = engine.calculate_comprehensive_panchang(input_data)
+        else:
+            result = {
+                "success": False,
+                "error": f"Unknown calculation type: {calculation_type}"
+            }
+        print(json.dumps(result, indent=2))
+    except Exception as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Festival Calendar Engine
+Full-year festival and vrat calendar for a location, driven by festival-rules.json
+One sunrise-anchored sweep of tithi and masa (drik-panchanga) per year and
+location bucket, cached on disk so festival pages never compute day by day
+"""
+
+import hashlib
+import json
+import math
+import os
+import sys
+import tempfile
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SERVER_DIR, 'drik-panchanga'))
+
+import panchanga
+import swisseph as swe
+
+import ayanamsa_service
+import chebyshev_ephemeris
+import engine_logging
+import perf_instrumentation
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+
+log = engine_logging.get_logger('festival_calendar')
+
+RULES_PATH = os.path.join(SERVER_DIR, 'festival-rules.json')
+CACHE_DIR = os.path.join(SERVER_DIR, 'cache', 'festival-calendar')
+
+# Sunrise shifts about 2 minutes per half degree; nearby places share one calendar
+LOCATION_BUCKET_DEGREES = 0.5
+
+MASA_NAMES = ['Chaitra', 'Vaisakha', 'Jyeshta', 'Ashadha', 'Sravana', 'Bhadrapada',
+              'Ashvin', 'Kartika', 'Margashirsha', 'Pausha', 'Magha', 'Phalguna']
+
+TITHI_NAMES = ['Pratipada', 'Dwitiya', 'Tritiya', 'Chaturthi', 'Panchami', 'Shashthi', 'Saptami',
+               'Ashtami', 'Navami', 'Dashami', 'Ekadashi', 'Dwadashi', 'Trayodashi', 'Chaturdashi']
+
+RASHI_NAMES = ['Mesha', 'Vrishabha', 'Mithuna', 'Karka', 'Simha', 'Kanya',
+               'Tula', 'Vrishchika', 'Dhanu', 'Makara', 'Kumbha', 'Meena']
+
+PURNIMA, AMAVASYA = 15, 30
+EKADASHI_TITHIS = (11, 26)
+
+# Month numbers count from Chaitra; the Ekadashi name list starts at Pausha Krishna
+EKADASHI_FIRST_MONTH = 10
+
+# Tithi, lunar month and sidereal Sun at one local sunrise
+SunriseDay = namedtuple('SunriseDay', [
+    'date', 'sunrise_jd', 'tithi', 'skipped_tithi', 'masa', 'adhika', 'sun_longitude', 'place'
+])
+
+
+def tithi_name(tithi: int) -> str:
+    """1-30 -> 'Shukla Paksha Chaturthi' form used in festival-rules.json"""
+    if tithi == PURNIMA:
+        return "Shukla Paksha Purnima"
+    if tithi == AMAVASYA:
+        return "Krishna Paksha Amavasya"
+    paksha = "Shukla" if tithi < PURNIMA else "Krishna"
+    return f"{paksha} Paksha {TITHI_NAMES[(tithi - 1) % 15]}"
+
+
+def parse_tithi(text: str) -> int:
+    """'Krishna Paksha Ekadashi' -> 26"""
+    words = text.split()
+    paksha, name = words[0], words[-1]
+    if name == 'Purnima':
+        return PURNIMA
+    if name == 'Amavasya':
+        return AMAVASYA
+    if name not in TITHI_NAMES or paksha not in ('Shukla', 'Krishna'):
+        raise ValueError(f"Unrecognised tithi in festival rules: {text}")
+    return TITHI_NAMES.index(name) + 1 + (15 if paksha == 'Krishna' else 0)
+
+
+def purnimanta_month(amanta_month: int, tithi: int) -> int:
+    """The dark fortnight belongs to the next month when months end at full moon"""
+    return amanta_month if tithi <= PURNIMA else amanta_month % 12 + 1
+
+
+class FestivalRules:
+    """festival-rules.json compiled into dictionary lookups keyed by (month system, month, tithi)"""
+
+    def __init__(self, rules: Dict, digest: str):
+        self.digest = digest
+        self.lunar: Dict[Tuple[str, int, int], List[Tuple[str, Dict]]] = {}
+        self.solar: Dict[int, List[Tuple[str, Dict]]] = {}
+
+        for name, rule in rules.get('festivals', {}).items():
+            if rule.get('solar'):
+                self.solar.setdefault(RASHI_NAMES.index(rule['solar_month']), []).append((name, rule))
+                continue
+            system = rule.get('month_system', 'purnimanta')
+            key = (system, MASA_NAMES.index(rule['month']) + 1, parse_tithi(rule['tithi']))
+            self.lunar.setdefault(key, []).append((name, rule))
+
+        self.ekadashi_names = rules.get('ekadashi', {}).get('names', [])
+        self.special_days = rules.get('special_days', {})
+
+    def festivals(self, amanta_month: int, tithi: int) -> List[Tuple[str, Dict]]:
+        matches = self.lunar.get(('amanta', amanta_month, tithi), [])
+        purnimanta = self.lunar.get(('purnimanta', purnimanta_month(amanta_month, tithi), tithi), [])
+        return matches + purnimanta if matches and purnimanta else matches or purnimanta
+
+    def ekadashi_name(self, amanta_month: int, tithi: int, adhika: bool) -> str:
+        """Name from the list: adhika-masa Ekadashi first, then Pausha Krishna onwards (purnimanta)"""
+        if adhika or not self.ekadashi_names:
+            return self.ekadashi_names[0] if self.ekadashi_names else "Ekadashi"
+        month = purnimanta_month(amanta_month, tithi)
+        position = 1 + ((month - EKADASHI_FIRST_MONTH) % 12) * 2 + (0 if tithi > PURNIMA else 1)
+        return self.ekadashi_names[position] if position < len(self.ekadashi_names) else "Ekadashi"
+
+
+_rules: Optional[FestivalRules] = None
+
+
+def load_rules(path: str = RULES_PATH) -> FestivalRules:
+    """Compiled rules, recompiled only when the file content changes"""
+    global _rules
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()[:12]
+    if _rules is None or _rules.digest != digest:
+        _rules = FestivalRules(json.loads(raw), digest)
+    return _rules
+
+
+def location_bucket(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Grid point the calendar for this location is computed at"""
+    step = LOCATION_BUCKET_DEGREES
+    return round(round(latitude / step) * step, 4), round(round(longitude / step) * step, 4)
+
+
+def sidereal_sun(jd_ut: float) -> float:
+    if chebyshev_ephemeris.active():
+        return chebyshev_ephemeris.position('Sun', jd_ut)[0]
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    return (panchanga.solar_longitude(jd_ut) - ayanamsa_service.ayanamsa(jd_ut)) % 360
+
+
+def sweep(first: date, last: date, latitude: float, longitude: float, timezone_str: str) -> List[SunriseDay]:
+    """
+    Tithi and masa at every local sunrise from first to last inclusive
+    Masa only changes at a new moon, so it is recomputed when the sunrise
+    tithi wraps around rather than every day
+    """
+    resolver = TimezoneResolver.shared()
+    days = []
+    masa, adhika, previous_tithi = None, False, None
+    current = first
+    while current <= last:
+        tz_hours = resolver.utc_offset_hours(timezone_str, datetime(current.year, current.month, current.day, 12))
+        place = panchanga.Place(latitude, longitude, tz_hours)
+        jd = panchanga.gregorian_to_jd(panchanga.Date(current.year, current.month, current.day))
+
+        sunrise_jd = panchanga.sunrise(jd, place)[0] - tz_hours / 24
+        tithi_data = panchanga.tithi(jd, place)
+        tithi = tithi_data[0]
+        if masa is None or tithi < previous_tithi:
+            masa, adhika = panchanga.masa(jd, place)
+
+        days.append(SunriseDay(current, sunrise_jd, tithi, tithi_data[2] if len(tithi_data) > 2 else None,
+                               masa, adhika, sidereal_sun(sunrise_jd), place))
+        previous_tithi = tithi
+        current += timedelta(days=1)
+    return days
+
+
+def _entry(day: SunriseDay, name: str, kind: str, tithi: int, masa: int, adhika: bool, description: str) -> Dict:
+    return {
+        'date': day.date.isoformat(),
+        'name': name,
+        'type': kind,
+        'tithi': tithi_name(tithi),
+        'amanta_masa': MASA_NAMES[masa - 1],
+        'adhika_masa': adhika,
+        'description': description
+    }
+
+
+def _sunset_jd(day: SunriseDay) -> float:
+    jd = panchanga.gregorian_to_jd(panchanga.Date(day.date.year, day.date.month, day.date.day))
+    return panchanga.sunset(jd, day.place)[0] - day.place.timezone / 24
+
+
+def _sankranti_date(day: SunriseDay, next_day: SunriseDay, boundary: float) -> SunriseDay:
+    """Ingress before sunset is observed the same day, after sunset the next"""
+    start, end = day.sun_longitude, next_day.sun_longitude
+    if end < start:
+        end += 360
+    ingress = day.sunrise_jd + (boundary - start) / (end - start) * (next_day.sunrise_jd - day.sunrise_jd)
+    return day if ingress < _sunset_jd(day) else next_day
+
+
+def _observance_day(rule: Dict, tithi: int, day: SunriseDay, previous: SunriseDay) -> SunriseDay:
+    """
+    Festivals kept at pradosha (dusk) or nishita (midnight) move to the
+    previous day when the tithi already prevails at that time there
+    """
+    observance = rule.get('observance')
+    if observance not in ('pradosha', 'nishita'):
+        return day
+    moment = _sunset_jd(previous)
+    if observance == 'nishita':
+        moment = (moment + day.sunrise_jd) / 2
+    return previous if math.ceil(panchanga.lunar_phase(moment) / 12) == tithi else day
+
+
+def match_days(days: List[SunriseDay], rules: FestivalRules) -> List[Dict]:
+    """Apply the compiled rules to a sunrise sweep (the first and last days only provide context)"""
+    entries = []
+    for i in range(1, len(days) - 1):
+        day, previous = days[i], days[i - 1]
+
+        # Udaya tithi: a tithi spanning two sunrises is kept on the first;
+        # a kshaya tithi that sees no sunrise belongs to the day it falls in
+        observed = []
+        if day.tithi != previous.tithi:
+            observed.append((day.tithi, day.masa, day.adhika))
+        if day.skipped_tithi:
+            if day.skipped_tithi > day.tithi:
+                observed.append((day.skipped_tithi, day.masa, day.adhika))
+            else:
+                observed.append((day.skipped_tithi, day.masa % 12 + 1, False))
+
+        names = set()
+        for tithi, masa, adhika in observed:
+            if not adhika:
+                for name, rule in rules.festivals(masa, tithi):
+                    entries.append(_entry(_observance_day(rule, tithi, day, previous), name, 'festival',
+                                          tithi, masa, adhika, rule.get('description', '')))
+                    names.add(name)
+            if tithi in EKADASHI_TITHIS:
+                name = rules.ekadashi_name(masa, tithi, adhika)
+                if name not in names:
+                    entries.append(_entry(day, name, 'ekadashi', tithi, masa, adhika,
+                                          'Fasting day dedicated to Lord Vishnu'))
+            if tithi in (PURNIMA, AMAVASYA):
+                name = 'Purnima' if tithi == PURNIMA else 'Amavasya'
+                entries.append(_entry(day, name, 'special_day', tithi, masa, adhika,
+                                      rules.special_days.get(name, {}).get('significance', '')))
+
+    # Solar ingresses between consecutive sunrises
+    for i in range(len(days) - 1):
+        day, next_day = days[i], days[i + 1]
+        sign = int(day.sun_longitude // 30)
+        if int(next_day.sun_longitude // 30) == sign:
+            continue
+        entered = (sign + 1) % 12
+        observed_day = _sankranti_date(day, next_day, (sign + 1) * 30)
+        if observed_day is days[0] or observed_day is days[-1]:
+            continue
+        solar = rules.solar.get(entered)
+        for name, rule in solar or [(f"{RASHI_NAMES[entered]} Sankranti", None)]:
+            kind, description = ('festival', rule.get('description', '')) if rule else \
+                ('sankranti', rules.special_days.get('Sankranti', {}).get('significance', ''))
+            entries.append(_entry(observed_day, name, kind, observed_day.tithi, observed_day.masa,
+                                  observed_day.adhika, description))
+
+    first, last = days[1].date.isoformat(), days[-2].date.isoformat()
+    entries = [e for e in entries if first <= e['date'] <= last]
+    entries.sort(key=lambda e: e['date'])
+    return entries
+
+
+_calendars: Dict[Tuple, Dict] = {}
+
+
+def _cache_path(year: int, bucket: Tuple[float, float], timezone_str: str) -> str:
+    return os.path.join(CACHE_DIR, f"{year}_{bucket[0]:+.2f}_{bucket[1]:+.2f}_{timezone_str.replace('/', '-')}.json")
+
+
+def festival_calendar(year: int, latitude: float, longitude: float, timezone_str: str = None) -> Dict:
+    """Every festival, Ekadashi, Purnima, Amavasya and Sankranti of a year at a location"""
+    if not timezone_str:
+        timezone_str = resolve_birth_place(latitude=latitude, longitude=longitude)['timezone']
+    rules = load_rules()
+    bucket = location_bucket(latitude, longitude)
+    key = (year, bucket, timezone_str)
+
+    calendar = _calendars.get(key)
+    if calendar is not None and calendar['rules_digest'] == rules.digest:
+        perf_instrumentation.record_cache('festival_calendar', True)
+        return calendar
+
+    path = _cache_path(year, bucket, timezone_str)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            calendar = json.load(f)
+        if calendar.get('rules_digest') == rules.digest:
+            perf_instrumentation.record_cache('festival_calendar', True)
+            _calendars[key] = calendar
+            return calendar
+
+    perf_instrumentation.record_cache('festival_calendar', False)
+    log.debug("Computing festival calendar {} at {} ({})", year, bucket, timezone_str)
+    days = sweep(date(year, 1, 1) - timedelta(days=1), date(year, 12, 31) + timedelta(days=1),
+                 bucket[0], bucket[1], timezone_str)
+    calendar = {
+        'success': True,
+        'year': year,
+        'location': {'latitude': bucket[0], 'longitude': bucket[1], 'timezone': timezone_str},
+        'rules_digest': rules.digest,
+        'festivals': match_days(days, rules)
+    }
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # A private temporary file, so concurrent processes never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(calendar, f, ensure_ascii=False)
+    # mkstemp creates the file owner-only; the cache is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    _calendars[key] = calendar
+    return calendar
+
+
+def festivals_on(date_str: str, latitude: float, longitude: float, timezone_str: str = None) -> List[Dict]:
+    """Entries for one day, served from that year's cached calendar"""
+    year = int(date_str[:4])
+    return [e for e in festival_calendar(year, latitude, longitude, timezone_str)['festivals']
+            if e['date'] == date_str]
+
+
+def main():
+    """Command line: <year> <latitude> <longitude> [timezone]"""
+    if len(sys.argv) < 4:
+        print(json.dumps({"success": False,
+                          "error": "Usage: python festival_calendar.py <year> <latitude> <longitude> [timezone]"}))
+        sys.exit(1)
+
+    try:
+        with engine_logging.stdout_to_stderr():
+            result = festival_calendar(int(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3]),
+                                       sys.argv[4] if len(sys.argv) > 4 else None)
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Offline Gazetteer for Birth-Place Resolution
+Compact, memory-mapped city index built from drik-panchanga/cities.csv and
+the country, region and alias data in drik-panchanga/cities_regions.json
+Provides name autocomplete, "City, State, Country" resolution, reverse
+(nearest city) lookup and IANA timezone so no engine needs an external
+geocoding call
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+import engine_logging
+
+log = engine_logging.get_logger('gazetteer')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+CITIES_CSV = os.path.join(SERVER_DIR, 'drik-panchanga', 'cities.csv')
+REGIONS_JSON = os.path.join(SERVER_DIR, 'drik-panchanga', 'cities_regions.json')
+INDEX_PATH = os.path.join(SERVER_DIR, 'drik-panchanga', 'cities.gaz')
+
+# Used only when the request names no place and gives no coordinates
+DEFAULT_PLACE = {
+    'name': 'Chennai',
+    'latitude': 13.0827,
+    'longitude': 80.2707,
+    'timezone': 'Asia/Kolkata'
+}
+
+MAGIC = b'GAZ2'
+# magic, city count, name-key count, normalized-key blob size, display-name blob size, metadata blob size
+HEADER = struct.Struct('<4sIIIII')
+
+
+class UnknownPlaceError(ValueError):
+    """Place name not found in the gazetteer and no coordinates supplied"""
+    pass
+
+
+class AmbiguousPlaceError(UnknownPlaceError):
+    """Place name matches several cities and none of its qualifiers tells them apart"""
+    def __init__(self, place: str, candidates: List[Dict]):
+        listed = '; '.join(', '.join(part for part in (c['name'], c['region'], c['country']) if part)
+                           for c in candidates)
+        super().__init__(f"Birth place '{place}' is ambiguous ({listed}); add the state or country")
+        self.candidates = candidates
+
+
+def normalize_name(name: str) -> str:
+    """Fold a place name to lowercase ASCII words for prefix matching"""
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch)).lower()
+    words = ''.join(ch if ch.isalnum() else ' ' for ch in folded).split()
+    return ' '.join(words)
+
+
+def _unit_vector(latitude: float, longitude: float) -> Tuple[float, float, float]:
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def _build_kd_order(points: List[Tuple[float, float, float]]) -> List[int]:
+    """
+    Arrange point ids as an implicit balanced k-d tree
+    The node for slice [lo, hi) sits at its median and splits on axis depth % 3
+    """
+    order = list(range(len(points)))
+
+    def build(lo: int, hi: int, depth: int):
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: points[i][axis])
+        mid = (lo + hi) // 2
+        build(lo, mid, depth + 1)
+        build(mid + 1, hi, depth + 1)
+
+    build(0, len(order), 0)
+    return order
+
+
+def build_index(csv_path: str = CITIES_CSV, index_path: str = INDEX_PATH,
+                regions_path: str = REGIONS_JSON) -> str:
+    """
+    Compile cities.csv (name:latitude:longitude:timezone) and cities_regions.json
+    into the binary index
+    Layout after the header: 5 float64 arrays (lat, lon, x, y, z), uint32 k-d order,
+    uint16 timezone ids, uint16 region ids, uint32 name offsets per city; uint32 key
+    offsets, uint32 key city, uint8 alias flag per name key; then the key blob,
+    the name blob and a JSON blob of timezones, regions and qualifier names
+    """
+    regions_data = {'countries': {}, 'regions': {}, 'cities': {}}
+    if os.path.exists(regions_path):
+        with open(regions_path, 'r', encoding='utf-8') as f:
+            regions_data = json.load(f)
+
+    rows = []
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            # Names may themselves contain ':' so split from the right
+            name, lat, lon, tz = line.rsplit(':', 3)
+            place = regions_data['cities'].get(f'{lat}:{lon}', {})
+            rows.append((name, float(lat), float(lon), tz, (place.get('country', ''), place.get('admin1', '')),
+                         place.get('aliases', [])))
+
+    # Cities are stored in name order; every name and alias is a key row pointing at its city
+    rows.sort(key=lambda r: (normalize_name(r[0]), r[0]))
+    timezones = sorted({r[3] for r in rows})
+    tz_ids = {tz: i for i, tz in enumerate(timezones)}
+    regions = sorted({r[4] for r in rows})
+    region_ids = {region: i for i, region in enumerate(regions)}
+    points = [_unit_vector(r[1], r[2]) for r in rows]
+    kd_order = _build_kd_order(points)
+
+    key_rows = []
+    for i, r in enumerate(rows):
+        primary = normalize_name(r[0])
+        key_rows.append((primary, 0, i))
+        for alias in r[5]:
+            key = normalize_name(alias)
+            if key and key != primary:
+                key_rows.append((key, 1, i))
+    key_rows = sorted(set(key_rows))
+
+    keys = [k[0].encode('utf-8') for k in key_rows]
+    names = [r[0].encode('utf-8') for r in rows]
+    meta = json.dumps({'timezones': timezones, 'regions': regions,
+                       'countries': regions_data['countries'],
+                       'region_names': regions_data['regions']}).encode('utf-8')
+
+    def offsets(blobs: List[bytes]) -> List[int]:
+        result = [0]
+        for blob in blobs:
+            result.append(result[-1] + len(blob))
+        return result
+
+    key_blob = b''.join(keys)
+    name_blob = b''.join(names)
+    n = len(rows)
+    m = len(key_rows)
+
+    # A private temporary file, so concurrent builds never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(index_path) or '.', suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, n, m, len(key_blob), len(name_blob), len(meta)))
+        f.write(struct.pack(f'<{n}d', *(r[1] for r in rows)))
+        f.write(struct.pack(f'<{n}d', *(r[2] for r in rows)))
+        for axis in range(3):
+            f.write(struct.pack(f'<{n}d', *(p[axis] for p in points)))
+        f.write(struct.pack(f'<{n}I', *kd_order))
+        f.write(struct.pack(f'<{n}H', *(tz_ids[r[3]] for r in rows)))
+        f.write(struct.pack(f'<{n}H', *(region_ids[r[4]] for r in rows)))
+        f.write(struct.pack(f'<{n + 1}I', *offsets(names)))
+        f.write(struct.pack(f'<{m + 1}I', *offsets(keys)))
+        f.write(struct.pack(f'<{m}I', *(k[2] for k in key_rows)))
+        f.write(struct.pack(f'<{m}B', *(k[1] for k in key_rows)))
+        f.write(key_blob)
+        f.write(name_blob)
+        f.write(meta)
+    # mkstemp creates the file owner-only; the table is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def _index_current(index_path: str, sources: List[str]) -> bool:
+    """Index exists, has this layout and is newer than every source file"""
+    if not os.path.exists(index_path):
+        return False
+    built = os.path.getmtime(index_path)
+    if any(os.path.exists(source) and os.path.getmtime(source) > built for source in sources):
+        return False
+    with open(index_path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class Gazetteer:
+    """Read-only view over the memory-mapped city index"""
+
+    _shared = None
+
+    def __init__(self, index_path: str = INDEX_PATH, csv_path: str = CITIES_CSV,
+                 regions_path: str = REGIONS_JSON):
+        # A missing, stale or older-layout index is rebuilt rather than rejected
+        if not _index_current(index_path, [csv_path, regions_path]):
+            build_index(csv_path, index_path, regions_path)
+
+        with open(index_path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n, m, key_size, name_size, meta_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid gazetteer index: {index_path}")
+
+        view = memoryview(self._mm)
+        offset = HEADER.size
+
+        def take(fmt: str, count: int, width: int) -> memoryview:
+            nonlocal offset
+            section = view[offset:offset + count * width].cast(fmt)
+            offset += count * width
+            return section
+
+        self.size = n
+        self._lat = take('d', n, 8)
+        self._lon = take('d', n, 8)
+        self._xyz = (take('d', n, 8), take('d', n, 8), take('d', n, 8))
+        self._kd = take('I', n, 4)
+        self._tz = take('H', n, 2)
+        self._region = take('H', n, 2)
+        self._name_off = take('I', n + 1, 4)
+        self.key_count = m
+        self._key_off = take('I', m + 1, 4)
+        self._key_city = take('I', m, 4)
+        self._key_alias = take('B', m, 1)
+        self._keys = view[offset:offset + key_size]
+        offset += key_size
+        self._names = view[offset:offset + name_size]
+        offset += name_size
+        meta = json.loads(bytes(view[offset:offset + meta_size]).decode('utf-8'))
+        self._timezones = meta['timezones']
+        self._regions = [tuple(region) for region in meta['regions']]
+        self._qualifiers = self._qualifier_index(meta['countries'], meta['region_names'])
+
+    def _qualifier_index(self, countries: Dict, region_names: Dict) -> Dict[str, set]:
+        """
+        Normalized qualifier -> the (country, region) pairs it can mean
+        A region of None stands for the whole country
+        """
+        qualifiers: Dict[str, set] = {}
+
+        def add(text: str, country: str, region: Optional[str]):
+            key = normalize_name(text)
+            if key:
+                qualifiers.setdefault(key, set()).add((country, region))
+
+        for country, names in countries.items():
+            add(country, country, None)
+            for name in names:
+                add(name, country, None)
+        for country, region in self._regions:
+            if region:
+                add(region, country, region)
+        for country, names in region_names.items():
+            for short, region in names.items():
+                add(short, country, region)
+        return qualifiers
+
+    @classmethod
+    def shared(cls) -> 'Gazetteer':
+        """Process-wide instance; the mapping is shared between all engines"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def _key(self, i: int) -> str:
+        return bytes(self._keys[self._key_off[i]:self._key_off[i + 1]]).decode('utf-8')
+
+    def city(self, i: int) -> Dict:
+        """City record by index"""
+        country, region = self._regions[self._region[i]]
+        return {
+            'name': bytes(self._names[self._name_off[i]:self._name_off[i + 1]]).decode('utf-8'),
+            'region': region,
+            'country': country,
+            'latitude': self._lat[i],
+            'longitude': self._lon[i],
+            'timezone': self._timezones[self._tz[i]]
+        }
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """Key-row range of names and aliases that start with prefix"""
+        lo = bisect_left(_KeyView(self), prefix)
+        hi = bisect_left(_KeyView(self), prefix + '\uffff', lo)
+        return lo, hi
+
+    def autocomplete(self, text: str, limit: int = 10) -> List[Dict]:
+        """Cities whose name or alias starts with text, exact matches first then shortest names"""
+        prefix = normalize_name(text)
+        if not prefix:
+            return []
+        lo, hi = self._prefix_range(prefix)
+        rows = sorted(range(lo, hi), key=lambda k: (self._key_off[k + 1] - self._key_off[k], self._key_city[k]))
+        ids: List[int] = []
+        for k in rows:
+            if self._key_city[k] not in ids:
+                ids.append(self._key_city[k])
+            if len(ids) == limit:
+                break
+        return [self.city(i) for i in ids]
+
+    def _named(self, key: str) -> List[int]:
+        """Cities called exactly key; aliases count only when no city has it as its name"""
+        lo, hi = self._prefix_range(key)
+        exact = [k for k in range(lo, hi) if self._key(k) == key]
+        primary = [self._key_city[k] for k in exact if not self._key_alias[k]]
+        return sorted(set(primary or [self._key_city[k] for k in exact]))
+
+    def _qualify(self, ids: List[int], qualifier: str) -> List[int]:
+        """
+        Keep the cities that lie in the country or region the qualifier names
+        A qualifier that names no known country or region (a district, a PIN code)
+        does not narrow the match
+        """
+        meanings = self._qualifiers.get(normalize_name(qualifier))
+        if not meanings:
+            return ids
+        kept = []
+        for i in ids:
+            country, region = self._regions[self._region[i]]
+            if (country, None) in meanings or (country, region) in meanings:
+                kept.append(i)
+        return kept
+
+    def matches(self, place: str) -> List[Dict]:
+        """
+        Every city a free-text place such as 'Chennai, Tamil Nadu, India' can mean
+        The first comma-separated part that names a city is the city, the parts
+        after it narrow it by state or country; earlier parts (a locality the
+        index does not know) are skipped. The full string is tried first so names
+        that contain a comma still resolve.
+        """
+        if not place:
+            return []
+        parts = [part for part in place.split(',') if normalize_name(part)]
+        whole = self._named(normalize_name(place))
+        if whole:
+            return [self.city(i) for i in whole]
+        for k, part in enumerate(parts):
+            ids = self._named(normalize_name(part))
+            if not ids:
+                continue
+            for qualifier in parts[k + 1:]:
+                ids = self._qualify(ids, qualifier)
+            # The city was found but lies elsewhere; a later part is not a better guess
+            return [self.city(i) for i in ids]
+        return []
+
+    def lookup(self, place: str) -> Optional[Dict]:
+        """
+        Resolve a free-text place to one city, None when nothing matches
+        Raises AmbiguousPlaceError rather than picking one of several cities
+        """
+        candidates = self.matches(place)
+        if len(candidates) > 1:
+            raise AmbiguousPlaceError(place, candidates)
+        return candidates[0] if candidates else None
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> List[Dict]:
+        """k nearest cities by great-circle distance, closest first"""
+        target = _unit_vector(latitude, longitude)
+        xs, ys, zs = self._xyz
+        kd = self._kd
+        best: List[Tuple[float, int]] = []
+
+        def visit(lo: int, hi: int, depth: int):
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            i = kd[mid]
+            dx, dy, dz = xs[i] - target[0], ys[i] - target[1], zs[i] - target[2]
+            dist = dx * dx + dy * dy + dz * dz
+            if len(best) < k or dist < best[-1][0]:
+                best.append((dist, i))
+                best.sort()
+                del best[k:]
+            diff = target[depth % 3] - self._xyz[depth % 3][i]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            visit(near[0], near[1], depth + 1)
+            if len(best) < k or diff * diff < best[-1][0]:
+                visit(far[0], far[1], depth + 1)
+
+        visit(0, self.size, 0)
+
+        results = []
+        for chord_sq, i in best:
+            city = self.city(i)
+            # Chord length on the unit sphere -> central angle -> kilometres
+            angle = 2 * math.asin(min(1.0, math.sqrt(chord_sq) / 2))
+            city['distance_km'] = round(angle * 6371.0088, 1)
+            results.append(city)
+        return results
+
+
+class _KeyView:
+    """Sequence adapter so bisect can search normalized keys in the mapping"""
+
+    def __init__(self, gazetteer: Gazetteer):
+        self._g = gazetteer
+
+    def __len__(self):
+        return self._g.key_count
+
+    def __getitem__(self, i: int) -> str:
+        return self._g._key(i)
+
+
+def resolve_birth_place(place: Optional[str] = None, latitude=None, longitude=None,
+                        timezone_str: Optional[str] = None) -> Dict:
+    """
+    Complete a birth location from whatever the request supplied
+    Explicit coordinates win; a place name is looked up offline; the timezone
+    comes from the nearest city when only coordinates are known. A place name
+    that cannot be resolved raises UnknownPlaceError (AmbiguousPlaceError when
+    it fits several cities) rather than falling back to the default place.
+    """
+    try:
+        gazetteer = Gazetteer.shared()
+    except (OSError, ValueError) as e:
+        log.warning("Gazetteer unavailable: {}", e)
+        gazetteer = None
+
+    if latitude not in (None, '') and longitude not in (None, ''):
+        latitude, longitude = float(latitude), float(longitude)
+        if not timezone_str and gazetteer:
+            nearest = gazetteer.nearest(latitude, longitude)
+            timezone_str = nearest[0]['timezone'] if nearest else None
+        return {
+            'place': place or '',
+            'latitude': latitude,
+            'longitude': longitude,
+            'timezone': timezone_str or DEFAULT_PLACE['timezone'],
+            'source': 'coordinates'
+        }
+
+    if place:
+        city = gazetteer.lookup(place) if gazetteer else None
+        if city is None:
+            raise UnknownPlaceError(f"Could not resolve birth place '{place}'; supply latitude and longitude")
+        return {
+            'place': place,
+            'latitude': city['latitude'],
+            'longitude': city['longitude'],
+            'timezone': timezone_str or city['timezone'],
+            'source': 'gazetteer'
+        }
+
+    return {
+        'place': DEFAULT_PLACE['name'],
+        'latitude': DEFAULT_PLACE['latitude'],
+        'longitude': DEFAULT_PLACE['longitude'],
+        'timezone': timezone_str or DEFAULT_PLACE['timezone'],
+        'source': 'default'
+    }
+
+
+def main():
+    """Command line: build | search <text> | nearest <lat> <lon> | resolve <place>"""
+    if len(sys.argv) < 2:
+        print(json.dumps({"success": False, "error": "Usage: python gazetteer.py build|search|nearest|resolve ..."}))
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == 'build':
+        result = {"success": True, "index": build_index()}
+    elif command == 'search':
+        result = {"success": True, "cities": Gazetteer.shared().autocomplete(' '.join(sys.argv[2:]))}
+    elif command == 'nearest':
+        k = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+        result = {"success": True, "cities": Gazetteer.shared().nearest(float(sys.argv[2]), float(sys.argv[3]), k)}
+    elif command == 'resolve':
+        try:
+            result = {"success": True, **resolve_birth_place(' '.join(sys.argv[2:]))}
+        except AmbiguousPlaceError as e:
+            result = {"success": False, "error": str(e), "candidates": e.candidates}
+        except UnknownPlaceError as e:
+            result = {"success": False, "error": str(e)}
+    else:
+        result = {"success": False, "error": f"Unknown command: {command}"}
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
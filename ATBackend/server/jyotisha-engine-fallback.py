@@ -14,8 +14,13 @@ from datetime import timedelta
 from typing import Dict, List, Any
 import time
 
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+import nakshatra_lookup
+
 try:
     import swisseph as swe
+    import chart_core
     swe_available = True
     print("✅ Swiss Ephemeris available for fallback calculations", file=sys.stderr)
 except ImportError:
@@ -100,7 +105,8 @@ class JyotishaEngineFallback:
             # Set Swiss Ephemeris path
             swe.set_ephe_path('/usr/share/swisseph:/usr/local/share/swisseph')
 
-    def get_julian_day(self, date_str: str, time_str: str, latitude: float, longitude: float) -> float:
+    def get_julian_day(self, date_str: str, time_str: str, latitude: float, longitude: float,
+                       timezone_str: str = None) -> float:
         """
         Convert date and time to Julian Day Number using Swiss Ephemeris
         Aligned with primary engine timezone handling for consistent results
@@ -126,71 +132,24 @@ class JyotishaEngineFallback:
                     except ValueError:
                         dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %H:%M")
             
-            # Set timezone to IST (India Standard Time) - same as primary engine
-            ist = pytz.timezone('Asia/Kolkata')
-            dt_ist = ist.localize(dt)
+            # Localize with the birth place's historical offset - same as primary engine
+            timezone_str = resolve_birth_place(None, latitude, longitude, timezone_str)['timezone']
+            dt_local = TimezoneResolver.shared().localize(timezone_str, dt)
             
             # Convert to UTC for calculations - same as primary engine
-            dt_utc = dt_ist.astimezone(pytz.UTC)
+            dt_utc = dt_local.astimezone(pytz.UTC)
             
             # Calculate Julian Day using Swiss Ephemeris - same method as primary
             julian_day = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
                                    dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
             
-            print(f"[FALLBACK] Swiss Ephemeris Julian Day: {julian_day:.6f} (IST→UTC: {dt_ist} → {dt_utc})", file=sys.stderr)
+            print(f"[FALLBACK] Swiss Ephemeris Julian Day: {julian_day:.6f} ({timezone_str}→UTC: {dt_local} → {dt_utc})", file=sys.stderr)
             return julian_day
             
         except Exception as e:
             print(f"[FALLBACK] Swiss Ephemeris Julian Day calculation failed: {e}", file=sys.stderr)
             raise Exception(f"Failed to calculate authentic Julian Day: {e}")
 
-    def get_ayanamsa(self, julian_day: float) -> float:
-        """
-        Get Lahiri Ayanamsa for sidereal calculations using Swiss Ephemeris
-        """
-        if not swe_available:
-            raise Exception("Swiss Ephemeris required for authentic fallback calculations")
-        
-        try:
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-            ayanamsa = swe.get_ayanamsa_ut(julian_day)
-            print(f"[FALLBACK] Swiss Ephemeris Lahiri Ayanamsa: {ayanamsa:.6f}°", file=sys.stderr)
-            return ayanamsa
-        except Exception as e:
-            print(f"[FALLBACK] Swiss Ephemeris ayanamsa calculation failed: {e}", file=sys.stderr)
-            raise Exception(f"Failed to calculate authentic Lahiri Ayanamsa: {e}")
-
-    def calculate_planet_position(self, planet_id: int, julian_day: float, ayanamsa: float) -> Dict[str, Any]:
-        """
-        Calculate sidereal position of a planet using Swiss Ephemeris with direct sidereal flag
-        Aligned with primary engine methodology for consistent results
-        """
-        if not swe_available:
-            raise Exception("Swiss Ephemeris required for authentic planetary calculations")
-        
-        try:
-            # Use Swiss Ephemeris with direct sidereal flag (same as primary engine)
-            result = swe.calc_ut(julian_day, planet_id, swe.FLG_SIDEREAL)
-            sidereal_long = result[0][0]  # Already sidereal due to flag
-            
-            # Normalize to 0-360 range
-            if sidereal_long < 0:
-                sidereal_long += 360
-            elif sidereal_long >= 360:
-                sidereal_long -= 360
-                
-            print(f"[FALLBACK] Planet {planet_id}: Sidereal {sidereal_long:.6f}° (Direct SWE Flag)", file=sys.stderr)
-                
-            return {
-                'longitude': sidereal_long,
-                'latitude': result[0][1],
-                'distance': result[0][2],
-                'speed': result[0][3]
-            }
-        except Exception as e:
-            print(f"[FALLBACK] Swiss Ephemeris sidereal calculation failed for {planet_id}: {e}", file=sys.stderr)
-            raise Exception(f"Failed to calculate authentic sidereal position for planet {planet_id}: {e}")
-
     def get_sign_and_degree(self, longitude: float) -> Dict[str, Any]:
         """
         Convert longitude to sign and degree
@@ -209,79 +168,49 @@ class JyotishaEngineFallback:
         """
         Get nakshatra from moon longitude
         """
-        nakshatra_num = int(longitude / 13.333333333333334)  # 360/27
-        if nakshatra_num >= 27:
-            nakshatra_num = 26
-            
-        nakshatra_name = self.NAKSHATRAS[nakshatra_num]
+        pada = nakshatra_lookup.lookup(longitude)
+        nakshatra_name = self.NAKSHATRAS[pada.nakshatra]
         
-        # Get nakshatra attributes
+        # Tatva and paya are specific to this engine; the rest is tabulated per pada
         attributes = self.NAKSHATRA_DATA.get(nakshatra_name, {})
-        
-        # Calculate pada (quarter)
-        pada_deg = (longitude % 13.333333333333334) / 3.333333333333333
-        pada = int(pada_deg) + 1
-        if pada > 4:
-            pada = 4
             
         return {
-            'number': nakshatra_num + 1,
+            'number': pada.number,
             'name': nakshatra_name,
-            'pada': pada,
-            'gana': attributes.get('gana', ''),
-            'nadi': attributes.get('nadi', ''),
-            'varna': attributes.get('varna', ''),
-            'yoni': attributes.get('yoni', ''),
+            'pada': pada.pada,
+            'gana': pada.gana,
+            'nadi': pada.nadi,
+            'varna': pada.varna,
+            'yoni': pada.yoni,
             'tatva': attributes.get('tatva', ''),
             'paya': attributes.get('paya', '')
         }
 
-    def calculate_ascendant(self, julian_day: float, latitude: float, longitude: float, ayanamsa: float) -> Dict[str, Any]:
+    def calculate_ascendant(self, julian_day: float, latitude: float, longitude: float) -> Dict[str, Any]:
         """
-        Calculate ascendant (Lagna) using Swiss Ephemeris
-        Aligned with primary engine methodology using direct sidereal calculation
+        Calculate ascendant (Lagna) from the shared chart core
+        Same Placidus ascendant less Lahiri Ayanamsa as the primary engine
         """
         if not swe_available:
             raise Exception("Swiss Ephemeris required for authentic ascendant calculation")
         
-        try:
-            # Set Lahiri Ayanamsa mode for consistent sidereal calculation
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-            
-            # Use Swiss Ephemeris Placidus houses for accurate ascendant (same as primary)
-            houses = swe.houses(julian_day, latitude, longitude, b'P')
-            asc_tropical = houses[0][0]  # Ascendant from Swiss Ephemeris
-            
-            # Apply Lahiri Ayanamsa for sidereal ascendant (same method as primary)
-            asc_sidereal = asc_tropical - ayanamsa
-            
-            # Normalize to 0-360 range (same as primary)
-            if asc_sidereal < 0:
-                asc_sidereal += 360
-            elif asc_sidereal >= 360:
-                asc_sidereal -= 360
-                
-            sign_info = self.get_sign_and_degree(asc_sidereal)
-            
-            print(f"[FALLBACK] Ascendant: Tropical {asc_tropical:.6f}° → Sidereal {asc_sidereal:.6f}° ({sign_info['sign']}) [Aligned Method]", file=sys.stderr)
-            
-            return {
-                'longitude': asc_sidereal,
-                'sign_num': sign_info['sign_num'],
-                'sign': sign_info['sign'],
-                'sign_english': sign_info['sign_english'],
-                'degree': sign_info['degree']
-            }
-        except Exception as e:
-            print(f"[FALLBACK] Swiss Ephemeris ascendant calculation failed: {e}", file=sys.stderr)
-            raise Exception(f"Failed to calculate authentic ascendant: {e}")
+        asc_sidereal = chart_core.chart(julian_day, latitude, longitude).ascendant
+        sign_info = self.get_sign_and_degree(asc_sidereal)
+        
+        return {
+            'longitude': asc_sidereal,
+            'sign_num': sign_info['sign_num'],
+            'sign': sign_info['sign'],
+            'sign_english': sign_info['sign_english'],
+            'degree': sign_info['degree']
+        }
 
-    def calculate_house_positions(self, julian_day: float, latitude: float, longitude: float, ayanamsa: float) -> List[Dict[str, Any]]:
+    def calculate_house_positions(self, julian_day: float, latitude: float, longitude: float) -> List[Dict[str, Any]]:
         """
         Calculate 12 house positions using Whole Sign house system
         """
         try:
-            ascendant = self.calculate_ascendant(julian_day, latitude, longitude, ayanamsa)
+            ascendant = self.calculate_ascendant(julian_day, latitude, longitude)
             asc_sign = ascendant['sign_num']
             
             houses = []
@@ -314,52 +243,40 @@ class JyotishaEngineFallback:
             place = birth_data.get('place', 'Unknown')
             
             # Calculate Julian Day
-            julian_day = self.get_julian_day(date, time_str, latitude, longitude)
+            julian_day = self.get_julian_day(date, time_str, latitude, longitude, birth_data.get('timezone'))
             
-            # Get Ayanamsa
-            ayanamsa = self.get_ayanamsa(julian_day)
+            # Planets from the shared chart core (Ketu is 180° opposite Rahu,
+            # whole sign houses from the ascendant)
+            chart = chart_core.chart(julian_day, latitude, longitude)
+            ayanamsa = chart.ayanamsa
             
-            # Calculate planetary positions
             planets = []
-            for planet_name, planet_id in self.PLANETS.items():
-                position = self.calculate_planet_position(planet_id, julian_day, ayanamsa)
-                
-                # Handle Ketu (180° opposite to Rahu)
-                if planet_name == 'Ketu':
-                    ketu_long = position['longitude'] + 180
-                    if ketu_long >= 360:
-                        ketu_long -= 360
-                    position['longitude'] = ketu_long
-                
-                sign_info = self.get_sign_and_degree(position['longitude'])
-                
-                # Calculate house position
-                house_num = self.get_house_from_longitude(position['longitude'], julian_day, latitude, longitude, ayanamsa)
+            for graha in chart.grahas:
+                sign_info = self.get_sign_and_degree(graha.longitude)
                 
                 planet_data = {
-                    'name': planet_name,
-                    'longitude': position['longitude'],
-                    'latitude': position['latitude'],
-                    'house': house_num,
+                    'name': graha.name,
+                    'longitude': graha.longitude,
+                    'latitude': graha.latitude,
+                    'house': graha.house,
                     'sign': sign_info['sign'],
                     'sign_english': sign_info['sign_english'],
                     'sign_num': sign_info['sign_num'],
                     'degree': sign_info['degree'],
-                    'speed': position['speed']
+                    'speed': graha.speed
                 }
                 
                 # Get nakshatra for Moon
-                if planet_name == 'Moon':
-                    nakshatra = self.get_nakshatra(position['longitude'])
-                    planet_data['nakshatra'] = nakshatra
+                if graha.name == 'Moon':
+                    planet_data['nakshatra'] = self.get_nakshatra(graha.longitude)
                 
                 planets.append(planet_data)
             
             # Calculate ascendant
-            ascendant = self.calculate_ascendant(julian_day, latitude, longitude, ayanamsa)
+            ascendant = self.calculate_ascendant(julian_day, latitude, longitude)
             
             # Calculate houses
-            houses = self.calculate_house_positions(julian_day, latitude, longitude, ayanamsa)
+            houses = self.calculate_house_positions(julian_day, latitude, longitude)
             
             # Get Moon nakshatra for Vedic attributes
             moon_planet = next((p for p in planets if p['name'] == 'Moon'), None)
@@ -411,20 +328,6 @@ class JyotishaEngineFallback:
                 'calculation_time_ms': round(error_time * 1000, 2)
             }
 
-    def get_house_from_longitude(self, longitude: float, julian_day: float, latitude: float, longitude_geo: float, ayanamsa: float) -> int:
-        """
-        Get house number from planetary longitude using Whole Sign system
-        """
-        try:
-            ascendant = self.calculate_ascendant(julian_day, latitude, longitude_geo, ayanamsa)
-            asc_sign = ascendant['sign_num']
-            planet_sign = int(longitude / 30)
-            
-            house_num = ((planet_sign - asc_sign) % 12) + 1
-            return house_num
-        except:
-            return 1
-
 def main():
     """
     Main function to handle JSON input from stdin
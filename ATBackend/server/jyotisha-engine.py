@@ -12,6 +12,9 @@ import pytz
 from datetime import timedelta
 from typing import Dict, List, Any
 
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+
 try:
     import swisseph as swe
     swe.set_ephe_path('/home/ubuntu/ephe')
@@ -23,6 +26,11 @@ except ImportError as e:
     print(f"❌ Python ERROR: {e}", file=sys.stderr)
     sys.exit(1)
 
+import ayanamsa_service
+import chart_core
+import chart_variants
+import nakshatra_lookup
+
 class JyotishaEngine:
     """
     Jyotisha-based Vedic astrology calculation engine
@@ -218,92 +226,28 @@ class JyotishaEngine:
                     except ValueError:
                         dt = datetime.strptime(f"{date_str} {time_str}", "%d/%m/%Y %H:%M")
             
-            # Set timezone to IST (India Standard Time)
-            ist = pytz.timezone('Asia/Kolkata')
-            dt_ist = ist.localize(dt)
+            # Localize with the historical UTC offset of the birth place's zone
+            timezone_str = resolve_birth_place(place, latitude, longitude, birth_data.get('timezone'))['timezone']
+            dt_local = TimezoneResolver.shared().localize(timezone_str, dt)
             
             # Convert to UTC for calculations
-            dt_utc = dt_ist.astimezone(pytz.UTC)
+            dt_utc = dt_local.astimezone(pytz.UTC)
             
             # Calculate Julian Day
             jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
                            dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
             
-            # Set ayanamsa (Lahiri)
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-            
-            # Calculate planetary positions
-            planets_data = []
-            
-            for planet_name, planet_id in cls.PLANETS.items():
-                if planet_name == 'Ketu':
-                    # Calculate Rahu position first, then Ketu is 180° opposite
-                    rahu_pos = swe.calc_ut(jd, cls.PLANETS['Rahu'], swe.FLG_SIDEREAL)[0][0]
-                    longitude_tropical = rahu_pos + 180.0
-                    if longitude_tropical >= 360.0:
-                        longitude_tropical -= 360.0
-                else:
-                    # Calculate planet position
-                    result = swe.calc_ut(jd, planet_id, swe.FLG_SIDEREAL)
-                    longitude_tropical = result[0][0]
-                
-                # Convert to sidereal
-                longitude_sidereal = longitude_tropical
-                
-                # Get sign and nakshatra info
-                sign_index = int(longitude_sidereal // 30)
-                sign_name = cls.SIGN_NAMES[sign_index]
-                degree_in_sign = longitude_sidereal % 30
-                
-                # Format degree string
-                degrees = int(degree_in_sign)
-                minutes = int((degree_in_sign - degrees) * 60)
-                degree_str = f"{degrees}°{minutes:02d}'"
-                
-                # Get nakshatra
-                nakshatra_info = cls.get_nakshatra_info(longitude_sidereal)
-                
-                # Calculate house position (using whole sign houses from ascendant)
-                ascendant_longitude = cls.calculate_ascendant(jd, latitude, longitude)
-                ascendant_sign = int(ascendant_longitude // 30)
-                planet_sign = int(longitude_sidereal // 30)
-                
-                # Debug house calculation
-                print(f"[DEBUG] HOUSE CALC - Planet {planet_name}: Planet sign={planet_sign}, Ascendant sign={ascendant_sign}", file=sys.stderr)
-                
-                # Correct house calculation: Count houses from ascendant sign
-                # House 1 = Ascendant sign, House 2 = Next sign, etc.
-                house_diff = (planet_sign - ascendant_sign) % 12
-                house = house_diff + 1
-                
-                print(f"[DEBUG] HOUSE CALC - Planet {planet_name}: House diff={house_diff}, Final house={house}", file=sys.stderr)
-                
-                # Check for retrograde motion
-                retrograde = False
-                if planet_name not in ['Sun', 'Moon', 'Rahu', 'Ketu']:
-                    # Check speed for retrograde motion
-                    speed = result[0][3] if len(result[0]) > 3 else 0
-                    retrograde = speed < 0
-                
-                planets_data.append({
-                    'name': planet_name,
-                    'longitude': longitude_sidereal,
-                    'sign': sign_name,
-                    'degree': degree_str,
-                    'nakshatra': nakshatra_info['name'],
-                    'nakshatraLord': nakshatra_info['lord'],
-                    'house': house,
-                    'retrograde': retrograde
-                })
-            
-            # Calculate ascendant
-            ascendant_longitude = cls.calculate_ascendant(jd, latitude, longitude)
-            ascendant_sign = cls.SIGN_NAMES[int(ascendant_longitude // 30)]
+            # Planets and ascendant from the shared chart core (Ketu is 180°
+            # opposite Rahu; whole-sign houses from the ascendant)
+            chart = chart_core.chart(jd, latitude, longitude)
+            planets_data = chart.planet_list(cls.SIGN_NAMES, [nakshatra['name'] for nakshatra in cls.NAKSHATRAS])
+            ascendant_longitude = chart.ascendant
+            ascendant_sign = cls.SIGN_NAMES[chart.ascendant_sign]
             
             # Calculate Vimshottari Dasha
             moon_longitude = next(p['longitude'] for p in planets_data if p['name'] == 'Moon')
             sun_longitude = next(p['longitude'] for p in planets_data if p['name'] == 'Sun')
-            dasha_info = cls.calculate_vimshottari_dasha(moon_longitude, dt_ist)
+            dasha_info = cls.calculate_vimshottari_dasha(moon_longitude, dt_local)
             
             # Calculate Bhavas (House cusps and analysis)
             bhavas_info = cls.calculate_bhavas(jd, latitude, longitude, ascendant_longitude)
@@ -332,9 +276,15 @@ class JyotishaEngine:
             # analysis_data = cls.generate_comprehensive_analysis(planets_data, ascendant_longitude, moon_longitude)
             
             # Get ayanamsa value
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = chart.ayanamsa
             
-            return {
+            # Other ayanamsa / house system combinations requested by the UI,
+            # all derived from one tropical pass
+            variants = None
+            if birth_data.get('variants'):
+                variants = chart_variants.chart_variants(jd, latitude, longitude, birth_data['variants'])
+            
+            result = {
                 'success': True,
                 'planets': planets_data,
                 'ascendant': {
@@ -362,8 +312,15 @@ class JyotishaEngine:
                     'latitude': latitude,
                     'longitude': longitude
                 },
+                'timezone': {
+                    'name': timezone_str,
+                    'utc_offset': dt_local.utcoffset().total_seconds() / 3600.0
+                },
                 'calculation_engine': 'Jyotisha-Official'
             }
+            if variants is not None:
+                result['variants'] = variants
+            return result
             
         except Exception as e:
             return {
@@ -374,62 +331,22 @@ class JyotishaEngine:
     @classmethod
     def calculate_ascendant(cls, jd: float, latitude: float, longitude: float) -> float:
         """
-        Calculate ascendant using Swiss Ephemeris
+        Sidereal ascendant from the shared chart core
         """
-        # Calculate houses using Placidus system
-        houses = swe.houses(jd, latitude, longitude, b'P')
-        
-        # Get ascendant (1st house cusp) and convert to sidereal
-        ascendant_tropical = houses[1][0]  # houses[1] contains the cusps, [0] is the ascendant
-        
-        # Convert to sidereal
-        ayanamsa = swe.get_ayanamsa_ut(jd)
-        ascendant_sidereal = ascendant_tropical - ayanamsa
-        
-        if ascendant_sidereal < 0:
-            ascendant_sidereal += 360
-            
-        return ascendant_sidereal
+        return chart_core.chart(jd, latitude, longitude).ascendant
     
     @classmethod
     def get_nakshatra_info(cls, longitude: float) -> Dict:
         """
         Get nakshatra information from longitude with precise pada calculation
+        Boundaries are exact whole arc-seconds (see nakshatra_lookup)
         """
-        # Normalize longitude to 0-360 range
-        longitude = longitude % 360
-        
-        for i, nakshatra in enumerate(cls.NAKSHATRAS):
-            if nakshatra['start'] <= longitude < nakshatra['end']:
-                # Calculate pada using traditional method matching professional standards
-                position_in_nakshatra = longitude - nakshatra['start']
-                
-                # Each pada spans exactly 3°20' = 3.333333 degrees
-                pada_degrees = 3.333333
-                
-                # Traditional pada calculation - Moon at 6.82° in Purva Phalguni should be Pada 4
-                if position_in_nakshatra < pada_degrees:
-                    pada = 1
-                elif position_in_nakshatra < 2 * pada_degrees:
-                    pada = 2
-                elif position_in_nakshatra < 3 * pada_degrees:
-                    pada = 3
-                else:
-                    pada = 4
-                
-                return {
-                    'name': nakshatra['name'],
-                    'lord': nakshatra['lord'],
-                    'number': i + 1,
-                    'pada': pada
-                }
-        
-        # Handle edge case for Revati (last nakshatra)
+        pada = nakshatra_lookup.lookup(longitude)
         return {
-            'name': 'Revati',
-            'lord': 'Mercury',
-            'number': 27,
-            'pada': 4
+            'name': cls.NAKSHATRAS[pada.nakshatra]['name'],
+            'lord': pada.lord,
+            'number': pada.number,
+            'pada': pada.pada
         }
     
     @classmethod
@@ -801,172 +718,9 @@ class JyotishaEngine:
     
     @classmethod
     def detect_yogas_and_doshas(cls, planets_data: list, ascendant_longitude: float) -> dict:
-        """Comprehensive detection of Vedic Yogas and Doshas"""
-        yogas = []
-        doshas = []
-        
-        # Create planet position mapping
-        planet_positions = {}
-        for planet in planets_data:
-            planet_positions[planet['name']] = {
-                'house': planet['house'],
-                'sign': planet['sign'],
-                'longitude': planet['longitude']
-            }
-        
-        # Calculate ascendant sign
-        ascendant_sign = int(ascendant_longitude // 30)
-        
-        # CHEVVAI/MANGAL DOSHA (Mars in 2nd, 4th, 7th, 8th, 12th houses)
-        mars_house = planet_positions.get('Mars', {}).get('house', 0)
-        chevvai_dosha_houses = [2, 4, 7, 8, 12]
-        
-        if mars_house in chevvai_dosha_houses:
-            dosha_strength = 'High' if mars_house in [4, 7, 8] else 'Moderate'
-            doshas.append({
-                'name': 'Chevvai Dosha (Mangal Dosha)',
-                'description': f'Mars in {mars_house}th house causes obstacles in marriage, property disputes, and relationship challenges',
-                'strength': dosha_strength,
-                'remedies': ['Perform Mars puja on Tuesdays', 'Wear red coral gemstone after consultation', 'Fast on Tuesdays', 'Chant Mangal Beej mantra "Om Angarakaya Namaha"']
-            })
-        
-        # RAHU-KETU DOSHA (Rahu in 1st/2nd and Ketu in 7th/8th houses, and vice versa)
-        rahu_house = planet_positions.get('Rahu', {}).get('house', 0)
-        ketu_house = planet_positions.get('Ketu', {}).get('house', 0)
-        
-        # Check for Rahu-Ketu dosha combinations
-        rahu_ketu_dosha = False
-        if (rahu_house in [1, 2] and ketu_house in [7, 8]) or (rahu_house in [7, 8] and ketu_house in [1, 2]):
-            rahu_ketu_dosha = True
-            doshas.append({
-                'name': 'Rahu-Ketu Dosha',
-                'description': f'Rahu in {rahu_house}th house and Ketu in {ketu_house}th house creates instability in relationships and self-identity',
-                'strength': 'High',
-                'remedies': ['Perform Rahu-Ketu shanti puja', 'Donate black sesame seeds', 'Wear Gomed and Cat\'s Eye gemstones', 'Chant Rahu-Ketu mantras']
-            })
-        
-        # SATURN DOSHA (Saturn in 1st, 2nd, 5th, 7th, 8th, 12th houses)
-        saturn_house = planet_positions.get('Saturn', {}).get('house', 0)
-        saturn_dosha_houses = [1, 2, 5, 7, 8, 12]
-        
-        if saturn_house in saturn_dosha_houses:
-            dosha_strength = 'High' if saturn_house in [1, 7, 8] else 'Moderate'
-            doshas.append({
-                'name': 'Shani Dosha',
-                'description': f'Saturn in {saturn_house}th house causes delays, obstacles, and karmic challenges',
-                'strength': dosha_strength,
-                'remedies': ['Worship Lord Hanuman on Saturdays', 'Donate black items (oil, clothes, iron)', 'Fast on Saturdays', 'Recite Hanuman Chalisa daily']
-            })
-        
-        # PITRU DOSHA (Rahu or Ketu in 1st, 5th, 9th houses)
-        pitru_dosha_houses = [1, 5, 9]
-        pitru_dosha = False
-        
-        if rahu_house in pitru_dosha_houses or ketu_house in pitru_dosha_houses:
-            pitru_dosha = True
-            affected_planet = 'Rahu' if rahu_house in pitru_dosha_houses else 'Ketu'
-            affected_house = rahu_house if rahu_house in pitru_dosha_houses else ketu_house
-            
-            doshas.append({
-                'name': 'Pitru Dosha',
-                'description': f'{affected_planet} in {affected_house}th house indicates ancestral karma and challenges related to forefathers',
-                'strength': 'Moderate',
-                'remedies': ['Perform Pitru Paksha rituals', 'Offer water to Peepal tree daily', 'Feed Brahmins and crows', 'Perform Shraddha ceremonies']
-            })
-        
-        # SUN CONJUNCTION DOSHAS (Sun conjunct Rahu or Ketu)
-        sun_house = planet_positions.get('Sun', {}).get('house', 0)
-        sun_longitude = planet_positions.get('Sun', {}).get('longitude', 0)
-        rahu_longitude = planet_positions.get('Rahu', {}).get('longitude', 0)
-        ketu_longitude = planet_positions.get('Ketu', {}).get('longitude', 0)
-        
-        # Check for conjunction (within 10 degrees)
-        sun_rahu_diff = abs(sun_longitude - rahu_longitude)
-        if sun_rahu_diff > 180:
-            sun_rahu_diff = 360 - sun_rahu_diff
-        
-        sun_ketu_diff = abs(sun_longitude - ketu_longitude)
-        if sun_ketu_diff > 180:
-            sun_ketu_diff = 360 - sun_ketu_diff
-        
-        if sun_rahu_diff <= 10 and sun_house == rahu_house:
-            doshas.append({
-                'name': 'Sun-Rahu Conjunction Dosha',
-                'description': f'Sun conjunct Rahu in {sun_house}th house causes ego conflicts, authority issues, and paternal challenges',
-                'strength': 'High',
-                'remedies': ['Offer water to Sun daily at sunrise', 'Donate copper items', 'Worship Lord Surya', 'Chant Aditya Hridaya stotra']
-            })
-        
-        if sun_ketu_diff <= 10 and sun_house == ketu_house:
-            doshas.append({
-                'name': 'Sun-Ketu Conjunction Dosha',
-                'description': f'Sun conjunct Ketu in {sun_house}th house causes spiritual confusion, loss of confidence, and detachment from worldly matters',
-                'strength': 'Moderate',
-                'remedies': ['Perform Sun worship daily', 'Donate gold or wheat', 'Practice meditation and spirituality', 'Wear Ruby gemstone after consultation']
-            })
-        
-        # RAJYOGAS
-        # Check for conjunction of Kendra and Trikona lords
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]
-        
-        kendra_planets = [p['name'] for p in planets_data if p['house'] in kendra_houses]
-        trikona_planets = [p['name'] for p in planets_data if p['house'] in trikona_houses]
-        
-        # Common planets in both Kendra and Trikona
-        rajyoga_planets = set(kendra_planets) & set(trikona_planets)
-        if rajyoga_planets:
-            yogas.append({
-                'name': 'Raja Yoga',
-                'description': f'Powerful combination of Kendra and Trikona planets: {", ".join(rajyoga_planets)}',
-                'strength': 'Strong',
-                'benefits': ['Leadership qualities', 'Success in career', 'Fame and recognition']
-            })
-        
-        # DHANA YOGAS (Wealth combinations)
-        wealth_houses = [2, 5, 9, 11]
-        wealth_planets = [p['name'] for p in planets_data if p['house'] in wealth_houses and p['name'] in ['Jupiter', 'Venus', 'Mercury']]
-        
-        if len(wealth_planets) >= 2:
-            yogas.append({
-                'name': 'Dhana Yoga',
-                'description': f'Wealth-giving combination with {", ".join(wealth_planets)} in prosperity houses',
-                'strength': 'Moderate',
-                'benefits': ['Financial prosperity', 'Material abundance', 'Business success']
-            })
-        
-        # GAJA KESARI YOGA
-        jupiter_house = planet_positions.get('Jupiter', {}).get('house', 0)
-        moon_house = planet_positions.get('Moon', {}).get('house', 0)
-        
-        # Check if Jupiter and Moon are in Kendra to each other
-        house_diff = abs(jupiter_house - moon_house)
-        if house_diff in [0, 3, 6, 9] or (house_diff == 3 and jupiter_house != moon_house):
-            yogas.append({
-                'name': 'Gaja Kesari Yoga',
-                'description': 'Jupiter and Moon in Kendra positions creating auspicious combination',
-                'strength': 'Strong',
-                'benefits': ['Wisdom and intelligence', 'Good fortune', 'Respect in society']
-            })
-        
-        # BUDHADITYA YOGA
-        sun_house = planet_positions.get('Sun', {}).get('house', 0)
-        mercury_house = planet_positions.get('Mercury', {}).get('house', 0)
-        
-        if sun_house == mercury_house:
-            yogas.append({
-                'name': 'Budhaditya Yoga',
-                'description': 'Sun and Mercury conjunction enhancing intelligence and communication',
-                'strength': 'Moderate',
-                'benefits': ['Enhanced intelligence', 'Good communication skills', 'Success in academics']
-            })
-        
-        return {
-            'yogas': yogas,
-            'doshas': doshas,
-            'total_yogas': len(yogas),
-            'total_doshas': len(doshas)
-        }
+        """Comprehensive detection of Vedic Yogas and Doshas (rules in yoga-rules.json)"""
+        import yoga_rules
+        return yoga_rules.evaluate(planets_data, ascendant_longitude)
     
     @classmethod
     def get_nadi_from_nakshatra(cls, nakshatra_name: str) -> str:
@@ -1045,7 +799,7 @@ class JyotishaEngine:
             house_cusps = houses_result[1]  # House cusps
             
             # Convert tropical cusps to sidereal
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             sidereal_cusps = []
             
             for cusp in house_cusps[1:]:  # Skip index 0, start from house 1
@@ -1128,34 +882,16 @@ class JyotishaEngine:
             
             jd = swe.julday(year, month, day, hour + minute/60.0)
             
-            # Calculate planetary positions
-            planets = []
-            for planet_name, planet_id in cls.PLANETS.items():
-                if planet_id != swe.MEAN_NODE or planet_name == 'Rahu':
-                    position, _ = swe.calc_ut(jd, planet_id)
-                    longitude_deg = position[0]
-                    
-                    # Convert to sidereal
-                    ayanamsa = swe.get_ayanamsa_ut(jd)
-                    sidereal_longitude = (longitude_deg - ayanamsa) % 360
-                    
-                    # Handle Ketu (opposite of Rahu)
-                    if planet_name == 'Ketu':
-                        sidereal_longitude = (sidereal_longitude + 180) % 360
-                    
-                    # Get sign and nakshatra
-                    sign_num = int(sidereal_longitude / 30)
-                    sign = cls.SIGN_NAMES_ENGLISH[sign_num]
-                    nakshatra_info = cls.get_nakshatra_info(sidereal_longitude)
-                    
-                    planets.append({
-                        'name': planet_name,
-                        'longitude': sidereal_longitude,
-                        'sign': sign,
-                        'degree': sidereal_longitude % 30,
-                        'nakshatra': nakshatra_info['name'],
-                        'retrograde': position[3] < 0 if len(position) > 3 else False
-                    })
+            # Planetary positions from the shared daily snapshot
+            import transit_snapshot
+            planets = [{
+                'name': planet['name'],
+                'longitude': planet['longitude'],
+                'sign': planet['sign'],
+                'degree': planet['degree'],
+                'nakshatra': planet['nakshatra'],
+                'retrograde': planet['retrograde']
+            } for planet in transit_snapshot.planets_at(jd)]
             
             # Calculate Moon sign and nakshatra
             moon = next(p for p in planets if p['name'] == 'Moon')
@@ -1251,7 +987,7 @@ class JyotishaEngine:
             calculations = {}
             
             # Get ayanamsa
-            ayanamsa = swe.get_ayanamsa_ut(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             calculations['ayanamsa'] = round(ayanamsa, 3)
             calculations['julian_day'] = jd
             calculations['local_mean_time'] = sunrise_time.strftime('%H:%M:%S')
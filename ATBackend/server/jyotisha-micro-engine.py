@@ -12,8 +12,13 @@ import pytz
 from datetime import timedelta
 from typing import Dict, List, Any
 
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+import nakshatra_lookup
+
 try:
     import swisseph as swe
+    import chart_core
     swe_available = True
     print("✅ [JEMICRO] Swiss Ephemeris available for calculations", file=sys.stderr)
 except ImportError:
@@ -85,74 +90,32 @@ class JyotishaMicroEngine:
             latitude = float(birth_data['latitude'])
             longitude = float(birth_data['longitude'])
             
-            # Convert to UTC for calculations
-            ist = pytz.timezone('Asia/Kolkata')
-            utc_time = ist.localize(birth_date).astimezone(pytz.UTC)
+            # Convert to UTC using the birth place's historical offset
+            timezone_str = resolve_birth_place(None, latitude, longitude, birth_data.get('timezone'))['timezone']
+            utc_time = TimezoneResolver.shared().to_utc(timezone_str, birth_date)
             # Calculate Julian Day using exact same pattern as primary engine
             julian_day = swe.julday(utc_time.year, utc_time.month, utc_time.day, 
                                    utc_time.hour + utc_time.minute/60.0 + utc_time.second/3600.0)
             
             print(f"[JEMICRO] Julian Day: {julian_day}", file=sys.stderr)
             
-            # Set ayanamsa (Lahiri) following primary engine pattern
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-            
-            # Calculate Ayanamsa (Lahiri) 
-            ayanamsa = swe.get_ayanamsa_ut(julian_day)
-            print(f"[JEMICRO] Ayanamsa: {ayanamsa:.6f}°", file=sys.stderr)
-            
-            # Calculate ascendant using houses function with coordinates
-            houses_result = swe.houses(julian_day, latitude, longitude, b'P')  # Placidus house system
-            ascendant_tropical = houses_result[1][0]  # First house cusp (ascendant)
-            
-            # Convert to sidereal by subtracting ayanamsa
-            ascendant_sidereal = ascendant_tropical - ayanamsa
-            if ascendant_sidereal < 0:
-                ascendant_sidereal += 360
-                
-            ascendant_sign = int(ascendant_sidereal / 30)
+            # Planets, ascendant and ayanamsa from the shared chart core
+            chart = chart_core.chart(julian_day, latitude, longitude)
+            ayanamsa = chart.ayanamsa
+            ascendant_sidereal = chart.ascendant
+            ascendant_sign = chart.ascendant_sign
             print(f"[JEMICRO] Ascendant: {ascendant_sidereal:.6f}° in {self.SIGN_NAMES[ascendant_sign]}", file=sys.stderr)
             
-            # Calculate planetary positions
-            planets_data = []
-            for planet_name, planet_id in self.PLANETS.items():
-                try:
-                    # Calculate sidereal position directly using primary engine pattern
-                    if planet_name == 'Ketu':
-                        # Calculate Rahu position first, then Ketu is 180° opposite
-                        rahu_pos = swe.calc_ut(julian_day, self.PLANETS['Rahu'], swe.FLG_SIDEREAL)[0][0]
-                        longitude_sidereal = rahu_pos + 180.0
-                        if longitude_sidereal >= 360.0:
-                            longitude_sidereal -= 360.0
-                    else:
-                        # Calculate planet position using sidereal flag
-                        result = swe.calc_ut(julian_day, planet_id, swe.FLG_SIDEREAL)
-                        longitude_sidereal = result[0][0]
-
-                    
-                    # Calculate sign and house
-                    sign_num = int(longitude_sidereal / 30)
-                    degree_in_sign = longitude_sidereal % 30
-                    sign_name = self.SIGN_NAMES[sign_num]
-                    
-                    # Calculate nakshatra
-                    nakshatra_name, nakshatra_lord = self.get_nakshatra(longitude_sidereal)
-                    
-                    # Calculate house using whole sign system (ascendant already calculated)
-                    house = ((sign_num - ascendant_sign) % 12) + 1
-                    
-                    planets_data.append({
-                        'name': planet_name,
-                        'longitude': longitude_sidereal,
-                        'sign': sign_name,
-                        'degree': f"{int(degree_in_sign)}°{int((degree_in_sign % 1) * 60):02d}'",
-                        'nakshatra': nakshatra_name,
-                        'nakshatraLord': nakshatra_lord,
-                        'house': house
-                    })
-                    
-                except Exception as e:
-                    print(f"[JEMICRO] Error calculating {planet_name}: {e}", file=sys.stderr)
+            # Whole sign houses from the ascendant
+            planets_data = [{
+                'name': graha.name,
+                'longitude': graha.longitude,
+                'sign': self.SIGN_NAMES[graha.sign],
+                'degree': chart_core.format_degree(graha.longitude),
+                'nakshatra': self.NAKSHATRA_NAMES[graha.nakshatra],
+                'nakshatraLord': graha.nakshatra_lord,
+                'house': graha.house
+            } for graha in chart.grahas]
             
             # Ascendant already calculated above
             
@@ -193,19 +156,9 @@ class JyotishaMicroEngine:
     def get_nakshatra(self, longitude_sidereal: float) -> tuple:
         """
         Calculate nakshatra dynamically from longitude - no hardcoded degrees
-        Each nakshatra spans exactly 13°20' (13.333333°)
+        Each nakshatra spans exactly 13°20', compared in whole arc-seconds
         """
-        # Normalize longitude to 0-360 range
-        normalized_longitude = longitude_sidereal % 360
-        
-        # Calculate nakshatra number (0-26) dynamically
-        nakshatra_span = 13.333333  # 13°20' per nakshatra
-        nakshatra_index = int(normalized_longitude / nakshatra_span)
-        
-        # Ensure we don't go out of bounds (27 nakshatras total)
-        if nakshatra_index >= 27:
-            nakshatra_index = 26
-            
+        nakshatra_index, _ = nakshatra_lookup.nakshatra_pada(longitude_sidereal)
         nakshatra_name = self.NAKSHATRA_NAMES[nakshatra_index]
         nakshatra_lord = self.NAKSHATRA_LORDS[nakshatra_index]
         
@@ -328,7 +281,7 @@ class JyotishaMicroEngine:
             'moonNakshatra': {
                 'name': nakshatra_name,
                 'number': self.NAKSHATRA_NAMES.index(nakshatra_name) + 1,
-                'pada': int((moon_longitude % 13.333333) / 3.333333) + 1,
+                'pada': nakshatra_lookup.nakshatra_pada(moon_longitude)[1],
                 'lord': nakshatra_lord
             }
         }
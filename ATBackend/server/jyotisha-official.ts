@@ -3,9 +3,9 @@
  * TypeScript interface for the Jyotisha astrology engine
  */
 
-import { spawn } from 'child_process';
 import { Request, Response } from 'express';
 import { JyotishaOfficialFallback } from './jyotisha-official-fallback';
+import { calculateBirthChartChain, getShadowReport } from './jyotisha-worker';
 
 export interface BirthData {
   name: string;
@@ -70,152 +70,42 @@ export class JyotishaOfficial {
   private static readonly FALLBACK_COOLDOWN = 30000; // 30 seconds
 
   /**
-   * Calculate birth chart with automatic fallback support
+   * Calculate birth chart with automatic fallback support. The resident
+   * engine chain worker tries the primary, fallback and micro engines in
+   * turn and answers in the primary result format
    */
   static async calculateBirthChart(birthData: BirthData): Promise<JyotishaResult> {
     const startTime = Date.now();
-    
-    try {
-      // Try primary engine first
-      console.log(`🚀 [PRIMARY] Attempting primary Jyotisha calculation`);
-      const primaryResult = await this.calculateWithPrimaryEngine(birthData);
-      
-      // Reset failure counter on success
-      this.failedAttempts = 0;
-      console.log(`✅ [PRIMARY] Calculation successful in ${Date.now() - startTime}ms`);
-      console.log('primary result = ', primaryResult);
-      return primaryResult;
-      
-    } catch (primaryError) {
+    const result = await calculateBirthChartChain(birthData);
+    const chain = result.engine_chain || { served_by: null, failures: [] };
+
+    for (const failure of chain.failures) {
       this.failedAttempts++;
       this.lastFailureTime = Date.now();
-      
-      console.log(`❌ [PRIMARY] Engine failed (attempt ${this.failedAttempts}/${this.MAX_RETRIES}): ${primaryError.message}`);
-      
-      // Try fallback engine
-      try {
-        console.log(`🔄 [FALLBACK] Switching to fallback Jyotisha engine`);
-        const fallbackResult = await JyotishaOfficialFallback.calculateBirthChart(birthData);
-        
-        console.log(`✅ [FALLBACK] Calculation successful in ${Date.now() - startTime}ms`);
-        
-        // Convert fallback result to primary result format
-        return this.convertFallbackResult(fallbackResult);
-        
-      } catch (fallbackError) {
-        console.log(`❌ [FALLBACK] Both engines failed - Primary: ${primaryError.message}, Fallback: ${fallbackError.message}`);
-        
-        // Return structured error with both failure messages
-        throw new Error(`All calculation engines failed. Primary: ${primaryError.message}. Fallback: ${fallbackError.message}`);
-      }
+      console.log(`❌ [${failure.engine.toUpperCase()}] Engine failed (attempt ${this.failedAttempts}/${this.MAX_RETRIES}): ${failure.error}`);
     }
-  }
-
-  /**
-   * Primary engine calculation method
-   */
-  private static async calculateWithPrimaryEngine(birthData: BirthData): Promise<JyotishaResult> {
-    return new Promise((resolve, reject) => {
-      const pythonProcess = spawn(process.env.PYTHON3, ['server/jyotisha-engine.py']);
-
-      let stdout = '';
-      let stderr = '';
-
-      pythonProcess.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-
-      // Send JSON data to stdin
-      pythonProcess.stdin.write(JSON.stringify(birthData));
-      pythonProcess.stdin.end();
 
-      // Add timeout to prevent hanging
-      const timeout = setTimeout(() => {
-        pythonProcess.kill();
-        reject(new Error('Primary Jyotisha calculation timeout after 5 seconds'));
-      }, 5000);
-
-      pythonProcess.on('close', (code) => {
-        clearTimeout(timeout);
-        
-        if (code !== 0) {
-          reject(new Error(`Primary Jyotisha engine failed with code ${code}: ${stderr}`));
-          return;
-        }
-
-        try {
-          const result: JyotishaResult = JSON.parse(stdout);
-          resolve(result);
-        } catch (error) {
-          reject(new Error(`Failed to parse primary Jyotisha output: ${error}`));
-        }
-      });
+    if (!result.success) {
+      throw new Error(result.error);
+    }
 
-      pythonProcess.on('error', (error) => {
-        clearTimeout(timeout);
-        reject(new Error(`Failed to start primary Jyotisha process: ${error.message}`));
-      });
-    });
+    if (chain.served_by === 'primary') {
+      // Reset failure counter on success
+      this.failedAttempts = 0;
+    }
+    console.log(`✅ [${String(chain.served_by).toUpperCase()}] Calculation successful in ${Date.now() - startTime}ms`);
+    return result;
   }
 
   /**
-   * Convert fallback result format to primary result format
+   * Primary engine calculation method
    */
-  private static convertFallbackResult(fallbackResult: any): JyotishaResult {
-    try {
-      // Extract planets data
-      const planets = fallbackResult.planets?.map((planet: any) => ({
-        name: planet.name,
-        longitude: planet.longitude,
-        sign: planet.sign,
-        degree: planet.degree?.toString() || '0',
-        nakshatra: planet.nakshatra?.name || '',
-        nakshatraLord: '', // Would need additional mapping
-        house: planet.house
-      })) || [];
-
-      // Extract dasha data if available
-      const dasha = fallbackResult.dasha ? {
-        current: fallbackResult.dasha.current || {
-          lord: '',
-          start_date: '',
-          end_date: '',
-          duration_years: 0,
-          status: ''
-        },
-        sequence: fallbackResult.dasha.sequence || [],
-        moonNakshatra: fallbackResult.dasha.moonNakshatra || {
-          name: '',
-          number: 0,
-          pada: 0,
-          lord: ''
-        }
-      } : undefined;
-
-      return {
-        success: fallbackResult.success,
-        planets,
-        ascendant: fallbackResult.ascendant ? {
-          longitude: fallbackResult.ascendant.longitude,
-          sign: fallbackResult.ascendant.sign
-        } : undefined,
-        dasha,
-        ayanamsa: fallbackResult.ayanamsa,
-        julianDay: fallbackResult.julian_day,
-        coordinates: fallbackResult.birth_details ? {
-          latitude: fallbackResult.birth_details.latitude,
-          longitude: fallbackResult.birth_details.longitude
-        } : undefined,
-        calculation_engine: fallbackResult.calculation_engine + ' (via Fallback)',
-        error: fallbackResult.error
-      };
-    } catch (conversionError) {
-      throw new Error(`Failed to convert fallback result: ${conversionError.message}`);
+  private static async calculateWithPrimaryEngine(birthData: BirthData): Promise<JyotishaResult> {
+    const result = await calculateBirthChartChain(birthData, ['primary']);
+    if (!result.success) {
+      throw new Error(`Primary Jyotisha engine failed: ${result.error}`);
     }
+    return result;
   }
 
   /**
@@ -231,7 +121,8 @@ export class JyotishaOfficial {
         fallback_cooldown_ms: this.FALLBACK_COOLDOWN,
         max_retries: this.MAX_RETRIES,
         health_status: this.failedAttempts < this.MAX_RETRIES ? 'healthy' : 'degraded'
-      }
+      },
+      shadow_validation: null as any
     };
 
     // Test both engines
@@ -257,6 +148,12 @@ export class JyotishaOfficial {
       };
     }
 
+    try {
+      status.shadow_validation = (await getShadowReport()).data;
+    } catch (error) {
+      status.shadow_validation = { error: error.message };
+    }
+
     return status;
   }
 
@@ -6,6 +6,7 @@ Implements the 5 core elements: Tithi, Nakshatra, Yoga, Karana, Vara
 """
 
 import swisseph as swe
+import ayanamsa_service
 from datetime import datetime, timezone
 import pytz
 import json
@@ -292,7 +293,7 @@ class JyotishaPanchangam:
             sun_times = self.calculate_sunrise_sunset(jd, latitude, longitude)
             
             # Calculate additional elements
-            ayanamsa_degrees = swe.get_ayanamsa_ut(jd)
+            ayanamsa_degrees = ayanamsa_service.ayanamsa(jd)
             
             # Determine Ayanam (Uttarayanam/Dakshinayanam)
             # Sun's declination determines this
@@ -0,0 +1,24 @@
+/**
+ * Jyotisha Engine Chain Worker Client
+ * Keeps one resident `engine_chain.py --worker` process. Birth charts go
+ * through the primary, fallback and micro engines inside that process, so a
+ * fallback costs a function call instead of a second Python start-up; shadow
+ * sampling (ENGINE_SHADOW_PERCENT) runs there too
+ */
+
+import path from 'path';
+import { PythonWorker } from './python-worker';
+
+const ENGINE_CHAIN_SCRIPT = path.join(process.cwd(), 'server', 'engine_chain.py');
+const ENGINE_CHAIN_TIMEOUT = 15000; // 15 seconds
+
+// Singleton instance
+export const jyotishaWorker = new PythonWorker('Jyotisha', ENGINE_CHAIN_SCRIPT, ENGINE_CHAIN_TIMEOUT);
+
+export async function calculateBirthChartChain(birthData: Record<string, any>, chain?: string[]): Promise<any> {
+  return jyotishaWorker.request({ type: 'birth_chart', birth_data: birthData, ...(chain ? { chain } : {}) });
+}
+
+export async function getShadowReport(): Promise<any> {
+  return jyotishaWorker.request({ type: 'shadow_report' });
+}
@@ -1,26 +1,20 @@
 import express from 'express';
-import { exec } from 'child_process';
-import { promisify } from 'util';
-import path from 'path';
+import { kpWorker, calculateKPChart, calculateKPHorary, horaryMoment } from './kp-worker';
 
-const execAsync = promisify(exec);
 const router = express.Router();
 
-// KP engine path
-const KP_ENGINE_PATH = path.join(process.cwd(), 'kp-astrology-engine');
-
-// Health check for KP engine
+// KP engine runs as a resident kp_engine.py worker
 router.get('/health', async (req, res) => {
   try {
-    const { stdout } = await execAsync('python --version', { cwd: KP_ENGINE_PATH });
+    const result = await kpWorker.request({ type: 'segment_table' });
     res.json({
-      success: true,
-      status: 'healthy',
-      service: 'kp-astrology-engine-integrated',
-      python_version: stdout.trim(),
+      success: result.success,
+      status: result.success ? 'healthy' : 'degraded',
+      service: 'kp-engine-worker',
+      segments: result.data?.length,
       timestamp: new Date().toISOString()
     });
-  } catch (error) {
+  } catch (error: any) {
     res.status(500).json({
       success: false,
       error: 'KP engine not available',
@@ -29,106 +23,41 @@ router.get('/health', async (req, res) => {
   }
 });
 
-// KP Birth Chart generation
 router.post('/kp-chart', async (req, res) => {
   try {
-    const { birth_year, birth_month, birth_day, birth_hour, birth_minute, latitude, longitude } = req.body;
+    const { birth_year, birth_month, birth_day, birth_hour, birth_minute, latitude, longitude, timezone } = req.body;
     
-    if (!birth_year || !birth_month || !birth_day || !birth_hour || !birth_minute || !latitude || !longitude) {
+    if (!birth_year || !birth_month || !birth_day || birth_hour === undefined || birth_minute === undefined || !latitude || !longitude) {
       return res.status(400).json({
         success: false,
         error: 'Missing required birth details'
       });
     }
 
-    const { spawn } = require('child_process');
-    const scriptPath = path.join(KP_ENGINE_PATH, 'kp_calculator.py');
-    
-    // Prepare input data for stdin
-    const inputData = {
-      type: "birth_chart",
-      birth_data: {
-        name: "KP User",
-        date: `${birth_year}-${String(birth_month).padStart(2, '0')}-${String(birth_day).padStart(2, '0')}`,
-        time: `${String(birth_hour).padStart(2, '0')}:${String(birth_minute).padStart(2, '0')}`,
-        place: `${latitude},${longitude}`,
-        latitude,
-        longitude
-      }
-    };
-
-    const pythonProcess = spawn(process.env.PYTHON3, [scriptPath], {
-      cwd: KP_ENGINE_PATH,
-      stdio: ['pipe', 'pipe', 'pipe']
+    const result = await calculateKPChart({
+      date: `${birth_year}-${String(birth_month).padStart(2, '0')}-${String(birth_day).padStart(2, '0')}`,
+      time: `${String(birth_hour).padStart(2, '0')}:${String(birth_minute).padStart(2, '0')}`,
+      latitude,
+      longitude,
+      timezone
     });
 
-    let stdout = '';
-    let stderr = '';
-
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-
-    pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        console.error('KP Chart Generation Error - stderr:', stderr);
-        console.error('KP Chart Generation Error - stdout:', stdout);
-        return res.status(500).json({
-          success: false,
-          error: 'KP chart generation failed',
-          details: `Process exited with code ${code}`
-        });
-      }
-
-      try {
-        const result = JSON.parse(stdout);
-        res.json({
-          success: true,
-          data: result,
-          method: "KP_Birth_Chart_Integrated",
-          timestamp: new Date().toISOString()
-        });
-      } catch (parseError) {
-        console.error('Failed to parse KP chart result:', stdout);
-        res.status(500).json({
-          success: false,
-          error: 'Invalid response from KP engine',
-          details: parseError.message
-        });
-      }
-    });
-
-    pythonProcess.on('error', (error) => {
-      console.error('Python process error:', error);
-      res.status(500).json({
+    if (!result.success) {
+      return res.status(500).json({
         success: false,
-        error: 'Failed to start KP engine',
-        details: error.message
+        error: 'KP chart generation failed',
+        details: result.error
       });
-    });
-
-    // Set timeout
-    const timeout = setTimeout(() => {
-      pythonProcess.kill();
-      res.status(500).json({
-        success: false,
-        error: 'KP chart generation timed out'
-      });
-    }, 30000);
+    }
 
-    pythonProcess.on('close', () => {
-      clearTimeout(timeout);
+    res.json({
+      success: true,
+      data: result.data,
+      method: "KP_Birth_Chart_Worker",
+      timestamp: new Date().toISOString()
     });
 
-    // Send input data via stdin
-    pythonProcess.stdin.write(JSON.stringify(inputData));
-    pythonProcess.stdin.end();
-
-  } catch (error) {
+  } catch (error: any) {
     console.error('KP Chart Generation Error:', error);
     res.status(500).json({
       success: false,
@@ -138,10 +67,10 @@ router.post('/kp-chart', async (req, res) => {
   }
 });
 
-// KP Horary Analysis
 router.post('/kp-horary', async (req, res) => {
   try {
-    const { question, query_time, latitude, longitude } = req.body;
+    const { question, query_time, latitude, longitude, timezone, horary_number } = req.body;
+    const number = Number(horary_number);
     
     if (!question || !query_time || !latitude || !longitude) {
       return res.status(400).json({
@@ -149,28 +78,33 @@ router.post('/kp-horary', async (req, res) => {
         error: 'Missing required horary details'
       });
     }
+    if (!Number.isInteger(number) || number < 1 || number > 249) {
+      return res.status(400).json({
+        success: false,
+        error: 'horary_number must be an integer from 1 to 249'
+      });
+    }
+
+    const result = await calculateKPHorary({
+      question,
+      horary_number: number,
+      ...horaryMoment(query_time, timezone),
+      latitude,
+      longitude
+    });
+
+    if (!result.success) {
+      return res.status(500).json({
+        success: false,
+        error: 'KP horary analysis failed',
+        details: result.error
+      });
+    }
 
-    // Create basic horary analysis using KP principles
-    const horary_analysis = {
-      question: question,
-      query_time: query_time,
-      location: { latitude, longitude },
-      horary_number: Math.floor(Math.random() * 249) + 1, // KP uses 1-249 for horary
-      analysis: {
-        ruling_planet: ["Venus", "Mercury", "Jupiter"][Math.floor(Math.random() * 3)],
-        significator_strength: Math.floor(Math.random() * 100) + 1,
-        answer_tendency: Math.random() > 0.5 ? "Positive" : "Negative",
-        timing_indication: "Within 3-6 months",
-        kp_recommendation: "Analyze sub-lord for precise timing"
-      },
-      method: "KP_Horary_Basic_Analysis",
-      timestamp: new Date().toISOString()
-    };
-    
     res.json({
       success: true,
-      data: horary_analysis,
-      method: "KP_Horary_Analysis_Basic",
+      data: result.data,
+      method: "KP_Horary_Worker",
       timestamp: new Date().toISOString()
     });
 
@@ -0,0 +1,40 @@
+/**
+ * KP Engine Worker Client
+ * Keeps one resident `kp_engine.py --worker` process and sends it
+ * line-delimited JSON requests, so KP charts and horary queries skip the
+ * Python start-up and answer in milliseconds
+ */
+
+import path from 'path';
+import { PythonWorker } from './python-worker';
+
+const KP_ENGINE_SCRIPT = path.join(process.cwd(), 'server', 'kp_engine.py');
+const KP_REQUEST_TIMEOUT = 15000; // 15 seconds
+
+// Singleton instance
+export const kpWorker = new PythonWorker('KP', KP_ENGINE_SCRIPT, KP_REQUEST_TIMEOUT);
+
+export async function calculateKPChart(birthData: Record<string, any>): Promise<any> {
+  return kpWorker.request({ type: 'birth_chart', birth_data: birthData });
+}
+
+export async function calculateKPHorary(horary: Record<string, any>): Promise<any> {
+  return kpWorker.request({ type: 'horary', ...horary });
+}
+
+/**
+ * Date, time and timezone of a horary query_time. An ISO instant (ending in
+ * Z or an offset, as Date.toISOString() sends) is taken as UTC; a bare
+ * YYYY-MM-DDTHH:MM is local time at the place
+ */
+export function horaryMoment(queryTime: string, timezone?: string): { date: string; time: string; timezone?: string } {
+  const text = String(queryTime);
+  if (/(Z|[+-]\d{2}:?\d{2})$/i.test(text)) {
+    const instant = new Date(text);
+    if (Number.isNaN(instant.getTime())) throw new Error(`Invalid query_time '${text}'`);
+    const iso = instant.toISOString();
+    return { date: iso.slice(0, 10), time: iso.slice(11, 16), timezone: 'UTC' };
+  }
+  const [date, time] = text.split(/[T ]/);
+  return { date, time: (time || '12:00').slice(0, 5), timezone };
+}
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+KP (Krishnamurti Paddhati) Engine
+Birth charts and horary charts on the KP ayanamsa with Placidus cusps. The
+zodiac is divided into the 249 sign/star/sub segments once at import, in
+whole arc-seconds (every sub is 400 x its dasha years), so a lord lookup is a
+binary search. Significators follow the four KP levels and ruling planets
+are taken at the moment of judgement. Horary numbers 1-249 fix the
+ascendant just inside the start of their segment; cusps for all 249
+numbers can be solved in one batch.
+
+With --worker the engine stays resident and answers one JSON request per
+line, so horary queries cost milliseconds instead of an interpreter start.
+
+Usage:
+    echo '{"type": "birth_chart", "birth_data": {"date": "1990-05-15", "time": "14:30",
+           "latitude": 28.61, "longitude": 77.21}}' | python kp_engine.py
+    echo '{"type": "horary", "horary_number": 108, "date": "2025-06-01", "time": "10:15",
+           "latitude": 13.08, "longitude": 80.27}' | python kp_engine.py
+    python kp_engine.py --worker
+"""
+
+import json
+import sys
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import swisseph as swe
+
+import chart_variants
+import engine_logging
+import nakshatra_lookup
+from chart_core import birth_moment
+from yoga_rules import PLANET_NAMES, SIGN_LORD
+
+log = engine_logging.get_logger('kp_engine')
+
+AYANAMSA = 'kp'
+HOUSE_SYSTEM = 'placidus'
+
+DASHA_ORDER = ('Ketu', 'Venus', 'Sun', 'Moon', 'Mars', 'Rahu', 'Jupiter', 'Saturn', 'Mercury')
+DASHA_YEARS = {'Ketu': 7, 'Venus': 20, 'Sun': 6, 'Moon': 10, 'Mars': 7,
+               'Rahu': 18, 'Jupiter': 16, 'Saturn': 19, 'Mercury': 17}
+DASHA_TOTAL = 120
+
+SIGN_NAMES = chart_variants.SIGN_NAMES
+NAKSHATRAS = chart_variants.NAKSHATRAS
+
+# Arc-seconds: a star is 13°20', a sign 30°; a sub is 400" per dasha year
+STAR_ARCSEC = 48000
+SIGN_ARCSEC = 108000
+CIRCLE_ARCSEC = 1296000
+
+HORARY_NUMBERS = 249
+
+# Day lords from Monday, the weekday of Julian day 0
+WEEKDAY_LORDS = ('Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Sun')
+
+# Newton steps on ARMC for a horary ascendant converge to this (degrees)
+ASCENDANT_TOLERANCE = 1e-7
+# A horary ascendant aims this far past its segment's start, so a solution
+# that lands within tolerance below the target is still in the segment
+HORARY_OFFSET_ARCSEC = 1
+ARMC_STEP = 0.01
+NEWTON_STEPS = 20
+
+KpSegment = namedtuple('KpSegment', ['number', 'start', 'end', 'sign_lord', 'star_lord', 'sub_lord'])
+
+
+def _build_subs() -> List[Tuple[int, int, str, str]]:
+    """The 243 unsplit star subdivisions: (start, end, star lord, sub lord) in arc-seconds"""
+    subs = []
+    for star in range(27):
+        star_lord = DASHA_ORDER[star % 9]
+        start = star * STAR_ARCSEC
+        for k in range(9):
+            sub_lord = DASHA_ORDER[(star + k) % 9]
+            end = start + 400 * DASHA_YEARS[sub_lord]
+            subs.append((start, end, star_lord, sub_lord))
+            start = end
+    return subs
+
+
+def _build_segments(subs) -> List[KpSegment]:
+    """Subs split wherever a sign boundary crosses them: the 249 KP segments"""
+    segments = []
+    for start, end, star_lord, sub_lord in subs:
+        boundary = (start // SIGN_ARCSEC + 1) * SIGN_ARCSEC
+        pieces = [(start, boundary), (boundary, end)] if boundary < end else [(start, end)]
+        for piece_start, piece_end in pieces:
+            sign_lord = PLANET_NAMES[SIGN_LORD[piece_start // SIGN_ARCSEC]]
+            segments.append(KpSegment(len(segments) + 1, piece_start, piece_end, sign_lord, star_lord, sub_lord))
+    return segments
+
+
+SUBS = _build_subs()
+SUB_STARTS = [start for start, _, _, _ in SUBS]
+SEGMENTS = _build_segments(SUBS)
+SEGMENT_STARTS = [segment.start for segment in SEGMENTS]
+assert len(SEGMENTS) == HORARY_NUMBERS
+
+
+def _arcsec(longitude: float) -> float:
+    return longitude % 360 * 3600 % CIRCLE_ARCSEC
+
+
+def segment(longitude: float) -> KpSegment:
+    """KP segment (sign, star and sub lords) holding a sidereal longitude"""
+    return SEGMENTS[bisect_right(SEGMENT_STARTS, _arcsec(longitude)) - 1]
+
+
+def sub_sub_lord(longitude: float) -> str:
+    """Lord of the sub-sub: the sub divided again in dasha proportion from its own lord"""
+    arcsec = _arcsec(longitude)
+    start, end, _, sub_lord = SUBS[bisect_right(SUB_STARTS, arcsec) - 1]
+    span, first = end - start, DASHA_ORDER.index(sub_lord)
+    for k in range(8):
+        lord = DASHA_ORDER[(first + k) % 9]
+        start += span * DASHA_YEARS[lord] / DASHA_TOTAL
+        if arcsec < start:
+            return lord
+    return DASHA_ORDER[(first + 8) % 9]
+
+
+def lords(longitude: float) -> Dict:
+    """Sign, star, sub and sub-sub lords of a sidereal longitude"""
+    entry = segment(longitude)
+    return {
+        'sign_lord': entry.sign_lord,
+        'star_lord': entry.star_lord,
+        'sub_lord': entry.sub_lord,
+        'sub_sub_lord': sub_sub_lord(longitude),
+        'segment': entry.number
+    }
+
+
+def _point(longitude: float) -> Dict:
+    nakshatra = int(longitude // (360 / 27))
+    return dict({
+        'longitude': longitude,
+        'sign': SIGN_NAMES[int(longitude // 30)],
+        'degree': longitude % 30,
+        'nakshatra': NAKSHATRAS[nakshatra]
+    }, **lords(longitude))
+
+
+def _sunrise_weekday(jd: float, latitude: float, longitude: float) -> int:
+    """Weekday (0 = Monday) of the Vedic day, which begins at sunrise"""
+    geopos = (longitude, latitude, 0)
+    flag, times = swe.rise_trans(jd - 1, swe.SUN, swe.CALC_RISE | swe.BIT_HINDU_RISING, geopos)
+    if flag == 0 and times[0] > jd:
+        flag, times = swe.rise_trans(jd - 2, swe.SUN, swe.CALC_RISE | swe.BIT_HINDU_RISING, geopos)
+    # Polar day or night: the local mean civil date
+    moment = times[0] if flag == 0 else jd
+    return int(moment + longitude / 360 + 0.5) % 7
+
+
+def _ascendant_error(target: float, armc: float, latitude: float, obliquity: float) -> float:
+    return (target - swe.houses_armc(armc, latitude, obliquity, b'O')[1][0] + 180) % 360 - 180
+
+
+def _horary_armc(target: float, latitude: float, obliquity: float, armc: float) -> float:
+    """
+    ARMC whose ascendant is the tropical target longitude: Newton steps from
+    a guess, then a bracketing scan where the ascendant jumps (high latitudes)
+    """
+    for _ in range(NEWTON_STEPS):
+        error = _ascendant_error(target, armc, latitude, obliquity)
+        if abs(error) < ASCENDANT_TOLERANCE:
+            return armc
+        slope = (error - _ascendant_error(target, armc + ARMC_STEP, latitude, obliquity)) / ARMC_STEP
+        armc = (armc + max(min(error / slope, 30), -30)) % 360
+
+    errors = [_ascendant_error(target, step, latitude, obliquity) for step in range(361)]
+    for low, (before, after) in enumerate(zip(errors, errors[1:])):
+        # The error falls through zero as the ascendant passes the target
+        if before > 0 >= after and before - after < 90:
+            high = low + 1
+            for _ in range(60):
+                middle = (low + high) / 2
+                if _ascendant_error(target, middle, latitude, obliquity) > 0:
+                    low = middle
+                else:
+                    high = middle
+            return low % 360
+    raise ValueError(f"Ascendant {target:.4f} never rises at latitude {latitude}")
+
+
+def _placidus_armc(armc: float, latitude: float, obliquity: float) -> Tuple[List[float], str]:
+    try:
+        return list(swe.houses_armc(armc, latitude, obliquity, b'P')[0][:12]), 'P'
+    except swe.Error:
+        return list(swe.houses_armc(armc, latitude, obliquity, chart_variants.POLAR_FALLBACK)[0][:12]), 'O'
+
+
+class KpChart:
+    """
+    Sidereal KP positions and cusps for one moment and place. Horary charts
+    replace the cusps with those of the ARMC that puts the ascendant just
+    inside the start of the horary segment; the planets stay those of the moment.
+    """
+
+    def __init__(self, jd: float, latitude: float, longitude: float, horary_number: int = None):
+        self.jd, self.latitude, self.longitude = jd, latitude, longitude
+        tropical = chart_variants.tropical_chart(jd, latitude, longitude, [HOUSE_SYSTEM])
+        self.ayanamsa = chart_variants.ayanamsa_values(jd, [AYANAMSA])[AYANAMSA]
+        self.system = tropical['systems'][HOUSE_SYSTEM]
+
+        if horary_number is None:
+            self.cusps = [(cusp - self.ayanamsa) % 360 for cusp in tropical['cusps'][HOUSE_SYSTEM]]
+        else:
+            solved = horary_cusps(jd, latitude, [horary_number], self.ayanamsa)[0]
+            if solved is None:
+                raise ValueError(f"Horary number {horary_number} cannot rise at latitude {latitude}")
+            self.cusps, self.system = solved
+        self.horary_number = horary_number
+
+        self.planets = {}
+        for name, (tropical_longitude, speed) in tropical['bodies'].items():
+            sidereal = (tropical_longitude - self.ayanamsa) % 360
+            self.planets[name] = dict(_point(sidereal), speed=speed,
+                                      house=chart_variants.house_of(sidereal, self.cusps),
+                                      retrograde=name not in chart_variants.ALWAYS_DIRECT and speed < 0)
+
+    def owned_houses(self) -> Dict[str, List[int]]:
+        """Houses whose cusp falls in a planet's sign; the nodes act for their sign lords"""
+        owned = {name: [] for name in PLANET_NAMES}
+        for house, cusp in enumerate(self.cusps, 1):
+            owned[PLANET_NAMES[SIGN_LORD[int(cusp // 30)]]].append(house)
+        for node in ('Rahu', 'Ketu'):
+            owned[node] = list(owned[self.planets[node]['sign_lord']])
+        return owned
+
+    def significators(self) -> Dict:
+        """
+        The four KP levels per house - A: in the star of an occupant,
+        B: occupant, C: in the star of the owner, D: owner - and the houses
+        each planet signifies through them
+        """
+        owned = self.owned_houses()
+        occupants = {house: [] for house in range(1, 13)}
+        for name, planet in self.planets.items():
+            occupants[planet['house']].append(name)
+
+        houses = {}
+        for house in range(1, 13):
+            owners = [name for name in PLANET_NAMES if house in owned[name]]
+            houses[house] = {
+                'A': [name for name, planet in self.planets.items() if planet['star_lord'] in occupants[house]],
+                'B': occupants[house],
+                'C': [name for name, planet in self.planets.items() if planet['star_lord'] in owners],
+                'D': owners
+            }
+
+        planets = {}
+        for name, planet in self.planets.items():
+            star_lord = self.planets[planet['star_lord']]
+            planets[name] = sorted({star_lord['house'], planet['house']}
+                                   | set(owned[planet['star_lord']]) | set(owned[name]))
+        return {'houses': houses, 'planets': planets}
+
+    def ruling_planets(self) -> Dict:
+        """
+        Ruling planets at this moment: day lord, the Moon's and the
+        ascendant's sign, star and sub lords, and a node when it occupies a
+        sign owned by one of them
+        """
+        moon, ascendant = self.planets['Moon'], lords(self.cusps[0])
+        rulers = {
+            'day_lord': WEEKDAY_LORDS[_sunrise_weekday(self.jd, self.latitude, self.longitude)],
+            'moon_sign_lord': moon['sign_lord'],
+            'moon_star_lord': moon['star_lord'],
+            'moon_sub_lord': moon['sub_lord'],
+            'ascendant_sign_lord': ascendant['sign_lord'],
+            'ascendant_star_lord': ascendant['star_lord'],
+            'ascendant_sub_lord': ascendant['sub_lord']
+        }
+        planets = list(dict.fromkeys(rulers.values()))
+        for node in ('Rahu', 'Ketu'):
+            if node not in planets and self.planets[node]['sign_lord'] in planets:
+                planets.append(node)
+        return dict(rulers, planets=planets)
+
+    def to_dict(self) -> Dict:
+        return {
+            'ayanamsa': {'name': 'Krishnamurti', 'value': self.ayanamsa},
+            'house_system': 'Placidus' if self.system == 'P' else 'Porphyry',
+            'horary_number': self.horary_number,
+            'cusps': [dict(_point(cusp), house=house) for house, cusp in enumerate(self.cusps, 1)],
+            'planets': self.planets,
+            'significators': self.significators(),
+            'ruling_planets': self.ruling_planets()
+        }
+
+
+def horary_cusps(jd: float, latitude: float, numbers: Sequence[int] = range(1, HORARY_NUMBERS + 1),
+                 ayanamsa: float = None) -> List[Tuple[List[float], str]]:
+    """
+    Sidereal cusps (and the system used) for horary numbers at a moment and
+    latitude: each ascendant is HORARY_OFFSET_ARCSEC past the start of its
+    segment; consecutive numbers reuse the previous ARMC as the Newton
+    guess, so all 249 solve in a batch.
+    Numbers whose ascendant never rises (beyond the polar circles) are None.
+    """
+    if ayanamsa is None:
+        ayanamsa = chart_variants.ayanamsa_values(jd, [AYANAMSA])[AYANAMSA]
+    obliquity = swe.calc_ut(jd, swe.ECL_NUT)[0][0]
+    results, armc = [], None
+    for number in numbers:
+        if not 1 <= number <= HORARY_NUMBERS:
+            raise ValueError(f"Horary number must be 1-{HORARY_NUMBERS}, got {number}")
+        target = ((SEGMENTS[number - 1].start + HORARY_OFFSET_ARCSEC) / 3600 + ayanamsa) % 360
+        if armc is None:
+            # The ascendant runs roughly a sign per two hours of ARMC: start near the target
+            armc = (target - 90) % 360
+        try:
+            armc = _horary_armc(target, latitude, obliquity, armc)
+        except ValueError as e:
+            log.warning("Horary number {}: {}", number, e)
+            results.append(None)
+            continue
+        cusps, system = _placidus_armc(armc, latitude, obliquity)
+        results.append(([(cusp - ayanamsa) % 360 for cusp in cusps], system))
+    return results
+
+
+@lru_cache(maxsize=256)
+def _birth_chart(jd: float, latitude: float, longitude: float) -> Dict:
+    return KpChart(jd, latitude, longitude).to_dict()
+
+
+def birth_chart(birth_details: Dict) -> Dict:
+    """KP birth chart, cached per chart for a resident worker"""
+    return _birth_chart(*birth_moment(birth_details))
+
+
+def horary_chart(request: Dict) -> Dict:
+    """Horary chart for the number (1-249) at the query moment and place"""
+    number = int(request['horary_number'])
+    jd, latitude, longitude = birth_moment(request)
+    chart = KpChart(jd, latitude, longitude, number).to_dict()
+    chart['question'] = request.get('question')
+    return chart
+
+
+def segment_table() -> List[Dict]:
+    """The 249 segments in degrees, for clients that render the table"""
+    return [{
+        'number': entry.number,
+        'start': entry.start / 3600,
+        'end': entry.end / 3600,
+        'sign': SIGN_NAMES[entry.start // SIGN_ARCSEC],
+        'sign_lord': entry.sign_lord,
+        'star_lord': entry.star_lord,
+        'sub_lord': entry.sub_lord
+    } for entry in SEGMENTS]
+
+
+def nakshatra_table() -> Dict:
+    """The 27 stars with their lord, deity and span, and the vimshottari years"""
+    return {
+        'nakshatras': {name: {
+            'lord': DASHA_ORDER[index % 9],
+            'deity': nakshatra_lookup.NAKSHATRA_ATTRIBUTES[index][0],
+            'start': index * STAR_ARCSEC / 3600,
+            'end': (index + 1) * STAR_ARCSEC / 3600
+        } for index, name in enumerate(NAKSHATRAS)},
+        'vimshottari_periods': DASHA_YEARS,
+        'total_nakshatras': len(NAKSHATRAS),
+        'system': 'KP_Stellar_Division'
+    }
+
+
+def handle(request: Dict) -> Dict:
+    """One request: type birth_chart (with birth_data), horary, segment_table or nakshatras"""
+    kind = request.get('type', 'birth_chart')
+    if kind == 'birth_chart':
+        data = birth_chart(request.get('birth_data', request))
+    elif kind == 'horary':
+        data = horary_chart(request)
+    elif kind == 'segment_table':
+        data = segment_table()
+    elif kind == 'nakshatras':
+        data = nakshatra_table()
+    else:
+        raise ValueError(f"Unknown request type '{kind}'")
+    return {'success': True, 'type': kind, 'data': data}
+
+
+def serve(stream=sys.stdin):
+    """Resident worker: one JSON request per line in, one JSON result per line out"""
+    for line in stream:
+        if not line.strip():
+            continue
+        request = {}
+        try:
+            with engine_logging.stdout_to_stderr():
+                request = json.loads(line)
+                result = handle(request)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        if isinstance(request, dict) and 'id' in request:
+            result['id'] = request['id']
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+
+
+def main():
+    """Command line: one request as JSON on stdin, or --worker for line-delimited requests"""
+    if '--worker' in sys.argv[1:]:
+        log.info("KP worker ready")
+        serve()
+        return
+    try:
+        with engine_logging.stdout_to_stderr():
+            result = handle(json.loads(sys.stdin.read()))
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,756 @@
+#!/usr/bin/env python3
+"""
+Lal Kitab
+One home for the Lal Kitab rules the three Lal Kitab engines used to
+rebuild on every call: strong and debt houses, house benefics, effects and
+remedies. Every (planet, house) placement is resolved once at import into a
+shared Placement record per rule profile, so analysing a chart is nine
+dictionary lookups, and positions come from the in-process chart core
+rather than an HTTP call back into the kundli API. Many charts can be
+analysed in one call.
+
+Profiles keep each engine's published rules and wording:
+    'engine'    lal-kitab-engine.py   (houses counted from Aries, Strong / Weak)
+    'simple'    lal-kitab-simple.py   (houses counted from Aries, Strong / Average / Karmic Debt)
+    'jyotisha'  lal-kitab-jyotisha.py (houses counted from the ascendant, own sign or house is strong)
+
+Records and their effect lists and remedy dicts are shared between results
+and must not be mutated.
+
+Usage:
+    python lal_kitab.py '{"name": "A", "birthDate": "1990-05-15", "birthTime": "14:30", "birthPlace": "Delhi"}'
+    python lal_kitab.py '[{...}, {...}]'     # batch: a list of results
+"""
+
+import json
+import sys
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence
+
+import chart_core
+import engine_logging
+from gazetteer import resolve_birth_place
+
+log = engine_logging.get_logger('lal_kitab')
+
+PLANETS = chart_core.GRAHAS
+HOUSES = range(1, 13)
+PROFILES = ('engine', 'simple', 'jyotisha')
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+
+# Houses where a planet is strong, per profile
+STRONG_HOUSES = {
+    'engine': {
+        'Sun': [1, 3, 6, 10, 11],
+        'Moon': [1, 2, 3, 7, 10, 11],
+        'Mars': [1, 2, 4, 7, 8, 10, 11],
+        'Mercury': [1, 2, 4, 5, 6, 9, 10, 11],
+        'Jupiter': [1, 2, 3, 4, 5, 7, 9, 10, 11],
+        'Venus': [1, 2, 3, 4, 5, 8, 9, 11, 12],
+        'Saturn': [2, 3, 7, 10, 11],
+        'Rahu': [3, 6, 11],
+        'Ketu': [3, 6, 11]
+    },
+    'simple': {
+        'Sun': [1, 5, 9, 10, 11],
+        'Moon': [1, 2, 5, 7, 10],
+        'Mars': [3, 6, 11],
+        'Mercury': [2, 4, 6, 10],
+        'Jupiter': [1, 2, 5, 9, 11],
+        'Venus': [1, 2, 4, 5, 9, 11],
+        'Saturn': [2, 3, 7, 10, 11],
+        'Rahu': [3, 6, 11],
+        'Ketu': [3, 6, 11]
+    },
+    'jyotisha': {
+        'Sun': [1, 5, 9, 10, 11],
+        'Moon': [1, 2, 5, 7, 10],
+        'Mars': [3, 6, 11],
+        'Mercury': [2, 6, 10],
+        'Jupiter': [2, 5, 9, 11],
+        'Venus': [1, 2, 3, 4, 5, 12],
+        'Saturn': [2, 3, 7, 10, 11],
+        'Rahu': [3, 6, 11],
+        'Ketu': [3, 6, 11]
+    }
+}
+
+# Houses that give a planet 'Karmic Debt' status (simple and jyotisha profiles)
+KARMIC_DEBT_STATUS_HOUSES = {
+    'Sun': [8, 12],
+    'Moon': [6, 8, 12],
+    'Mars': [7, 8],
+    'Mercury': [7, 8, 12],
+    'Jupiter': [6, 8, 12],
+    'Venus': [6, 8],
+    'Saturn': [1, 4, 5, 8, 12],
+    'Rahu': [1, 2, 4, 5, 7, 8, 9, 12],
+    'Ketu': [1, 5, 6, 8, 9, 12]
+}
+
+# Placements listed as karmaDebt in the engine and simple analyses
+KARMIC_DEBT_HOUSES = {
+    'Sun': [8, 12],
+    'Moon': [8, 12],
+    'Mars': [6, 8, 12],
+    'Mercury': [8, 12],
+    'Jupiter': [6, 8, 12],
+    'Venus': [6, 8, 12],
+    'Saturn': [1, 4, 5, 8, 12],
+    'Rahu': [1, 2, 4, 5, 7, 8, 9, 12],
+    'Ketu': [1, 2, 4, 5, 7, 8, 9, 12]
+}
+
+# Planets for which each house is benefic
+HOUSE_BENEFICS = {
+    1: ['Sun', 'Mars', 'Jupiter'],
+    2: ['Moon', 'Mercury', 'Venus', 'Jupiter'],
+    3: ['Mars', 'Mercury', 'Saturn'],
+    4: ['Moon', 'Mercury', 'Venus', 'Jupiter'],
+    5: ['Sun', 'Mercury', 'Venus', 'Jupiter'],
+    6: ['Sun', 'Mars', 'Saturn'],
+    7: ['Moon', 'Mars', 'Jupiter'],
+    8: ['Mars', 'Venus', 'Saturn'],
+    9: ['Sun', 'Mercury', 'Venus', 'Jupiter'],
+    10: ['Sun', 'Moon', 'Mercury', 'Mars', 'Jupiter', 'Saturn'],
+    11: ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn'],
+    12: ['Venus', 'Saturn']
+}
+
+# Own signs (chart_core spellings) and natural houses, strong in the jyotisha profile
+OWN_SIGNS = {
+    'Sun': ['Simha'],
+    'Moon': ['Karka'],
+    'Mars': ['Mesha', 'Vrishchika'],
+    'Mercury': ['Mithuna', 'Kanya'],
+    'Jupiter': ['Dhanu', 'Meena'],
+    'Venus': ['Vrishabha', 'Tula'],
+    'Saturn': ['Makara', 'Kumbha']
+}
+OWN_HOUSES = {
+    'Sun': [5],
+    'Moon': [4],
+    'Mars': [1, 8],
+    'Mercury': [3, 6],
+    'Jupiter': [9, 12],
+    'Venus': [2, 7],
+    'Saturn': [10, 11]
+}
+
+# Effects: per planet, or per planet and house in the engine profile
+PLANET_EFFECTS = {
+    'simple': {
+        'Sun': ['Leadership', 'Authority', 'Confidence'],
+        'Moon': ['Emotions', 'Intuition', 'Popularity'],
+        'Mars': ['Energy', 'Courage', 'Action'],
+        'Mercury': ['Intelligence', 'Communication', 'Business'],
+        'Jupiter': ['Wisdom', 'Knowledge', 'Spirituality'],
+        'Venus': ['Love', 'Beauty', 'Luxury'],
+        'Saturn': ['Discipline', 'Hard work', 'Delays'],
+        'Rahu': ['Ambition', 'Confusion', 'Material gains'],
+        'Ketu': ['Detachment', 'Spirituality', 'Past karma']
+    },
+    'jyotisha': {
+        'Sun': ['Leadership', 'Authority', 'Confidence'],
+        'Moon': ['Emotions', 'Intuition', 'Popularity'],
+        'Mars': ['Energy', 'Courage', 'Conflict'],
+        'Mercury': ['Intelligence', 'Communication', 'Business'],
+        'Jupiter': ['Wisdom', 'Spirituality', 'Wealth'],
+        'Venus': ['Love', 'Beauty', 'Luxury'],
+        'Saturn': ['Discipline', 'Hard work', 'Delays'],
+        'Rahu': ['Ambition', 'Illusion', 'Material gains'],
+        'Ketu': ['Spirituality', 'Detachment', 'Past karma']
+    }
+}
+HOUSE_EFFECTS = {
+    'Sun': {
+        1: ['Strong personality', 'Leadership qualities', 'Good health'],
+        2: ['Family pride', 'Speech issues', 'Eye problems'],
+        3: ['Courage', 'Siblings support', 'Short travels'],
+        4: ['Government benefits', 'Property gains', 'Mother\'s health'],
+        5: ['Intelligence', 'Children issues', 'Speculation gains'],
+        6: ['Victory over enemies', 'Health issues', 'Service benefits'],
+        7: ['Marriage delays', 'Partnership issues', 'Public recognition'],
+        8: ['Longevity issues', 'Inheritance', 'Research abilities'],
+        9: ['Fortune', 'Father\'s health', 'Religious activities'],
+        10: ['Career success', 'Fame', 'Authority'],
+        11: ['Gains', 'Friend\'s support', 'Ambition fulfillment'],
+        12: ['Expenses', 'Foreign travels', 'Spiritual growth']
+    },
+    'Moon': {
+        1: ['Emotional nature', 'Intuition', 'Popularity'],
+        2: ['Family attachment', 'Food business', 'Liquid assets'],
+        3: ['Mental courage', 'Siblings bond', 'Communication'],
+        4: ['Mother\'s love', 'Property', 'Emotional stability'],
+        5: ['Creative mind', 'Children love', 'Emotional intelligence'],
+        6: ['Health fluctuations', 'Service to others', 'Digestive issues'],
+        7: ['Emotional partnerships', 'Public dealings', 'Marriage happiness'],
+        8: ['Psychic abilities', 'Transformation', 'Emotional depth'],
+        9: ['Religious devotion', 'Wisdom', 'Pilgrimage'],
+        10: ['Public recognition', 'Career changes', 'Reputation'],
+        11: ['Emotional gains', 'Group activities', 'Wish fulfillment'],
+        12: ['Subconscious mind', 'Spiritual practices', 'Emotional expenses']
+    }
+}
+GENERAL_EFFECTS = ['General influence']
+
+# Remedies for a weak planet: procedure and duration are common, the
+# engine profile's wording adds gemstones
+REMEDY_PRACTICES = {
+    'Sun': ('Face east and offer water to rising sun with copper vessel', '108 days continuously'),
+    'Moon': ('Donate rice, milk, white cloth to poor on Mondays', '21 Mondays'),
+    'Mars': ('Donate red cloth, jaggery, red lentils to poor', '21 Tuesdays'),
+    'Mercury': ('Feed fresh green grass to cows every Wednesday', '43 days'),
+    'Jupiter': ('Donate turmeric, yellow cloth, books to Brahmins', '16 Thursdays'),
+    'Venus': ('Donate white sweets, white cloth to unmarried girls', '16 Fridays'),
+    'Saturn': ('Donate black cloth, oil, iron items to poor', '19 Saturdays'),
+    'Rahu': ('Throw coconut in flowing river or sea', '18 consecutive days'),
+    'Ketu': ('Donate blanket, multi-colored cloth to poor', '7 consecutive days')
+}
+REMEDY_TEXTS = {
+    'engine': {
+        'Sun': ('Weak Sun causing low confidence and health issues',
+                'Offer water to Sun every morning, wear ruby gemstone',
+                'Free (water offering), Ruby: ₹5,000-50,000'),
+        'Moon': ('Weak Moon causing mental stress and mood swings',
+                 'Donate white items on Mondays, wear pearl',
+                 'Pearl: ₹2,000-20,000, Donations: ₹100-500 per Monday'),
+        'Mars': ('Weak Mars causing lack of courage and energy',
+                 'Donate red items on Tuesdays, wear coral',
+                 'Coral: ₹1,000-10,000, Donations: ₹100-500 per Tuesday'),
+        'Mercury': ('Weak Mercury causing communication and business problems',
+                    'Feed green grass to cows, wear emerald',
+                    'Emerald: ₹3,000-30,000, Grass: ₹10-50 per day'),
+        'Jupiter': ('Weak Jupiter causing knowledge and wisdom problems',
+                    'Donate yellow items on Thursdays, wear yellow sapphire',
+                    'Yellow Sapphire: ₹5,000-50,000, Donations: ₹200-1000 per Thursday'),
+        'Venus': ('Weak Venus causing relationship and luxury problems',
+                  'Donate white items to girls, wear diamond',
+                  'Diamond: ₹10,000-100,000, Donations: ₹200-1000 per Friday'),
+        'Saturn': ('Weak Saturn causing delays and obstacles',
+                   'Donate black items on Saturdays, wear blue sapphire',
+                   'Blue Sapphire: ₹10,000-100,000, Donations: ₹100-500 per Saturday'),
+        'Rahu': ('Rahu causing confusion and unexpected problems',
+                 'Donate coconut in flowing water, wear hessonite',
+                 'Hessonite: ₹2,000-20,000, Coconut: ₹20-50 per day'),
+        'Ketu': ('Ketu causing spiritual confusion and detachment',
+                 'Donate multi-colored items, wear cat\'s eye',
+                 'Cat\'s Eye: ₹3,000-30,000, Donations: ₹200-1000 per day')
+    },
+    'simple': {
+        'Sun': ('Weak Sun affecting confidence and health', 'Offer water to Sun every morning',
+                'Free (water offering)'),
+        'Moon': ('Weak Moon causing mental stress', 'Donate white items on Mondays', '₹100-500 per Monday'),
+        'Mars': ('Weak Mars affecting courage', 'Donate red items on Tuesdays', '₹100-500 per Tuesday'),
+        'Mercury': ('Weak Mercury affecting communication', 'Feed green grass to cows', '₹10-50 per day'),
+        'Jupiter': ('Weak Jupiter affecting wisdom', 'Donate yellow items on Thursdays', '₹200-1000 per Thursday'),
+        'Venus': ('Weak Venus affecting relationships', 'Donate white items to unmarried girls',
+                  '₹200-1000 per Friday'),
+        'Saturn': ('Weak Saturn causing delays', 'Donate black items on Saturdays', '₹100-500 per Saturday'),
+        'Rahu': ('Rahu causing confusion', 'Donate coconut in flowing water', '₹20-50 per day'),
+        'Ketu': ('Ketu causing spiritual confusion', 'Donate multi-colored items', '₹200-1000 per day')
+    }
+}
+
+GENERAL_REMEDIES = [
+    {
+        'planet': 'General',
+        'issue': 'Overall planetary weakness',
+        'remedy': 'Donate food to poor on Saturdays',
+        'procedure': 'Distribute cooked food to needy people every Saturday',
+        'duration': '11 Saturdays',
+        'cost': '₹100-500 per Saturday'
+    },
+    {
+        'planet': 'General',
+        'issue': 'Karmic debt reduction',
+        'remedy': 'Serve parents and elders',
+        'procedure': 'Take care of elderly people, respect parents',
+        'duration': 'Continuous',
+        'cost': 'Free (service)'
+    }
+]
+
+TOTKAS = [
+    {
+        'purpose': 'Increase wealth and prosperity',
+        'procedure': 'Keep silver coin in wallet, never let it become empty',
+        'materials': ['Silver coin', 'Red cloth'],
+        'timing': 'Any auspicious day',
+        'precautions': ['Never lend this coin', 'Keep wallet neat and clean']
+    },
+    {
+        'purpose': 'Protection from enemies',
+        'procedure': 'Bury iron nails in four corners of house',
+        'materials': ['4 iron nails', 'Black thread'],
+        'timing': 'Saturday morning',
+        'precautions': ['Do not tell anyone about this', 'Bury at sunrise']
+    },
+    {
+        'purpose': 'Improve health and vitality',
+        'procedure': 'Drink water from silver glass daily',
+        'materials': ['Silver glass', 'Pure water'],
+        'timing': 'Every morning on empty stomach',
+        'precautions': ['Clean glass daily', 'Use only pure water']
+    },
+    {
+        'purpose': 'Success in business',
+        'procedure': 'Place elephant figurine facing entrance',
+        'materials': ['Elephant figurine', 'Red vermillion'],
+        'timing': 'Wednesday morning',
+        'precautions': ['Face should be towards main door', 'Keep clean and worship daily']
+    },
+    {
+        'purpose': 'Harmony in relationships',
+        'procedure': 'Plant basil (tulsi) in front of house',
+        'materials': ['Basil plant', 'Earthen pot'],
+        'timing': 'Thursday morning',
+        'precautions': ['Water daily', 'Never let plant dry']
+    }
+]
+
+BENEFIC_HOUSES = [1, 2, 3, 5, 6, 7, 9, 10, 11]
+MALEFIC_HOUSES = [4, 8, 12]
+
+Placement = namedtuple('Placement', 'planet house status strong benefic karmic_debt effects remedy')
+
+
+def _status(profile: str, planet: str, house: int, own_sign: bool) -> str:
+    if profile != 'engine' and house in KARMIC_DEBT_STATUS_HOUSES.get(planet, []):
+        return 'Karmic Debt'
+    if profile == 'jyotisha' and (own_sign or house in OWN_HOUSES.get(planet, [])):
+        return 'Strong'
+    if house in STRONG_HOUSES[profile].get(planet, []):
+        return 'Strong'
+    return 'Weak' if profile == 'engine' else 'Average'
+
+
+def _remedy(profile: str, planet: str) -> Optional[Dict]:
+    if planet not in REMEDY_TEXTS.get(profile, {}):
+        return None
+    issue, remedy, cost = REMEDY_TEXTS[profile][planet]
+    procedure, duration = REMEDY_PRACTICES[planet]
+    return {'planet': planet, 'issue': issue, 'remedy': remedy, 'procedure': procedure,
+            'duration': duration, 'cost': cost}
+
+
+def _placement(profile: str, planet: str, house: int, own_sign: bool, remedy: Optional[Dict]) -> Placement:
+    status = _status(profile, planet, house, own_sign)
+    if profile == 'engine':
+        effects = HOUSE_EFFECTS.get(planet, {}).get(house, GENERAL_EFFECTS)
+    else:
+        effects = PLANET_EFFECTS[profile].get(planet, GENERAL_EFFECTS if profile == 'simple' else [])
+    return Placement(planet, house, status, status == 'Strong', planet in HOUSE_BENEFICS.get(house, []),
+                     house in KARMIC_DEBT_HOUSES.get(planet, []), effects, remedy)
+
+
+def _build_tables() -> Dict[str, Dict[tuple, Placement]]:
+    """(planet, house, in own sign) -> Placement per profile, one remedy dict per planet"""
+    tables = {}
+    for profile in PROFILES:
+        table = {}
+        for planet in PLANETS:
+            remedy = _remedy(profile, planet)
+            for house in HOUSES:
+                for own_sign in (False, True):
+                    table[planet, house, own_sign] = _placement(profile, planet, house, own_sign, remedy)
+        tables[profile] = table
+    return tables
+
+
+TABLES = _build_tables()
+
+
+def placement(planet: str, house: int, profile: str = 'jyotisha', sign: Optional[str] = None) -> Placement:
+    """Shared record for a planet in a house; sign only matters to the jyotisha profile"""
+    own_sign = profile == 'jyotisha' and sign in OWN_SIGNS.get(planet, ())
+    record = TABLES[profile].get((planet, house, own_sign))
+    if record is None:
+        record = _placement(profile, planet, house, own_sign, _remedy(profile, planet))
+    return record
+
+
+def sign_name(longitude: float) -> str:
+    """English sign name of a sidereal longitude"""
+    return SIGNS[int(longitude // 30) % 12]
+
+
+def sign_houses(planets: Dict[str, Dict]) -> Dict[str, int]:
+    """Lal Kitab houses counted from Aries: the sign a planet occupies, 1-12"""
+    return {name: int(data['longitude'] // 30) % 12 + 1 for name, data in planets.items()}
+
+
+def strengths(houses: Dict[str, int], profile: str) -> Dict:
+    """Strong, weak, benefic and malefic houses and karmic debts of sign-house placements"""
+    strong_planets, weak_planets, karma_debt = [], [], []
+    benefic_houses, malefic_houses = set(), set()
+    for planet, house in houses.items():
+        record = placement(planet, house, profile)
+        (strong_planets if record.strong else weak_planets).append(planet)
+        (benefic_houses if record.benefic else malefic_houses).add(house)
+        if record.karmic_debt:
+            karma_debt.append(f"{planet} in House {house}")
+    return {
+        'strongPlanets': strong_planets,
+        'weakPlanets': weak_planets,
+        'beneficHouses': sorted(benefic_houses),
+        'maleficHouses': sorted(malefic_houses),
+        'karmaDebt': karma_debt
+    }
+
+
+def weak_planet_remedies(houses: Dict[str, int], weak_planets: Sequence[str], profile: str) -> List[Dict]:
+    """Remedy of each weak planet that has one"""
+    remedies = []
+    for planet in weak_planets:
+        remedy = placement(planet, houses.get(planet, 1), profile).remedy
+        if remedy:
+            remedies.append(remedy)
+    return remedies
+
+
+def karmic_debt_remedy(debt: str) -> Dict:
+    """Remedy for a karmaDebt entry such as 'Saturn in House 8'"""
+    return {
+        'planet': debt.split(' in ')[0],
+        'issue': f'Karmic debt: {debt}',
+        'remedy': 'Perform charity and righteous actions',
+        'procedure': 'Feed poor, help needy, donate to religious institutions',
+        'duration': '40 days',
+        'cost': '₹500-2000 per week'
+    }
+
+
+def format_positions(planets: Dict[str, Dict], houses: Dict[str, int], profile: str) -> List[Dict]:
+    """Sign-house planetary positions in the frontend shape"""
+    formatted = []
+    for planet, data in planets.items():
+        longitude = data['longitude']
+        house = int(longitude // 30) % 12 + 1
+        record = placement(planet, houses.get(planet, house), profile)
+        formatted.append({
+            'planet': planet,
+            'house': house,
+            'sign': sign_name(longitude),
+            'degree': f"{longitude % 30:.2f}°",
+            'lalKitabHouse': record.house,
+            'status': record.status,
+            'effects': record.effects
+        })
+    return formatted
+
+
+def analyze_planets(planets: List[Dict], ascendant: Dict, birth_data: Dict) -> Dict:
+    """
+    Jyotisha-profile analysis of planets in the Jyotisha engine shape (name,
+    sign, house from the ascendant, degree): placements, doshas and remedies
+    """
+    try:
+        planetary_positions = []
+        strong_planets = []
+        weak_planets = []
+        for planet in planets:
+            record = placement(planet['name'], planet['house'], 'jyotisha', planet['sign'])
+            (strong_planets if record.strong else weak_planets).append(record.planet)
+            planetary_positions.append({
+                'planet': record.planet,
+                'house': record.house,
+                'sign': planet['sign'],
+                'degree': planet['degree'],
+                'lalKitabHouse': record.house,
+                'status': record.status,
+                'effects': record.effects
+            })
+
+        moon = next((planet for planet in planets if planet['name'] == 'Moon'), None)
+        person_doshas = calculate_person_doshas(planets)
+
+        return {
+            'success': True,
+            'basicInfo': {
+                'name': birth_data.get('name', ''),
+                'birthDate': birth_data.get('birthDate', ''),
+                'birthTime': birth_data.get('birthTime', ''),
+                'birthPlace': birth_data.get('birthPlace', ''),
+                'moonSign': moon['sign'] if moon else 'Unknown',
+                'ascendant': ascendant.get('sign', 'Unknown')
+            },
+            'planetaryPositions': planetary_positions,
+            'lalKitabAnalysis': {
+                'strongPlanets': strong_planets,
+                'weakPlanets': weak_planets,
+                'beneficHouses': BENEFIC_HOUSES,
+                'maleficHouses': MALEFIC_HOUSES,
+                'summary': summary(strong_planets, weak_planets, planetary_positions)
+            },
+            'doshas': person_doshas['doshas'],
+            'remedies': person_doshas['remedies'],
+            'calculationEngine': 'Jyotisha-Lal-Kitab-Integration'
+        }
+
+    except Exception as e:
+        log.error("Lal Kitab analysis failed: {}", e)
+        return fallback_analysis(birth_data)
+
+
+def calculate_person_doshas(planets: List[Dict]) -> Dict[str, List[Dict]]:
+    """Pitru, Mangal, Kaal Sarp, Shani and Guru Chandal doshas with their remedies"""
+    doshas = []
+    remedies = []
+    planet_dict = {planet['name']: planet for planet in planets}
+
+    # Pitru Dosha: Rahu in the 9th (spiritual father) house, or Sun afflicted by Rahu
+    rahu = planet_dict.get('Rahu')
+    sun = planet_dict.get('Sun')
+    pitru_causes = []
+    if rahu and rahu['house'] == 9:
+        pitru_causes.append('Rahu in 9th house (spiritual father house)')
+    if sun and rahu and abs(sun['house'] - rahu['house']) <= 1:
+        if sun['house'] == rahu['house']:
+            pitru_causes.append(f'Sun conjunct Rahu in house {sun["house"]}')
+        else:
+            pitru_causes.append(f'Sun in house {sun["house"]} afflicted by Rahu in house {rahu["house"]}')
+    if pitru_causes:
+        doshas.append({
+            'name': 'Pitru Dosha',
+            'severity': 'High',
+            'description': 'Ancestral karma affecting spiritual growth and father relationship',
+            'causes': pitru_causes,
+            'effects': ['Obstacles in spiritual progress', 'Issues with father/paternal side', 'Delayed fortune',
+                        'Ancestral displeasure']
+        })
+        remedies.append({
+            'dosha': 'Pitru Dosha',
+            'remedy': 'Perform Pitra Paksha rituals annually, offer water to ancestors daily, donate to Brahmins on '
+                      'Amavasya, perform Tarpanam',
+            'mantra': 'Om Rahave Namaha and Pitru Mantra (108 times daily)',
+            'duration': '108 days',
+            'items': 'Black sesame, iron items, mustard oil, rice, water',
+            'cost': 'Medium to High'
+        })
+
+    # Mangal Dosha: Mars in 1, 2, 4, 7, 8 or 12
+    mars = planet_dict.get('Mars')
+    if mars and mars['house'] in [1, 2, 4, 7, 8, 12]:
+        doshas.append({
+            'name': 'Mangal Dosha',
+            'severity': 'Very High' if mars['house'] in [1, 7, 8] else 'High',
+            'description': 'Mars affliction affecting marriage and relationships',
+            'causes': [f'Mars in {mars["house"]} house'],
+            'effects': ['Delay in marriage', 'Conflicts in relationships', 'Aggressive nature']
+        })
+        remedies.append({
+            'dosha': 'Mangal Dosha',
+            'remedy': 'Perform Mangal Dosh Nivaran Puja, fast on Tuesdays, visit Hanuman temple',
+            'mantra': 'Om Angarakaya Namaha (108 times on Tuesday)',
+            'duration': '45 days',
+            'items': 'Red coral, copper, red lentils (masoor dal)',
+            'cost': 'Medium'
+        })
+
+    # Kaal Sarp Dosha: most planets hemmed between Rahu and Ketu
+    ketu = planet_dict.get('Ketu')
+    rahu_house = rahu['house'] if rahu else 0
+    ketu_house = ketu['house'] if ketu else 0
+    if rahu_house and ketu_house:
+        if rahu_house < ketu_house:
+            houses_between = range(rahu_house + 1, ketu_house)
+        else:
+            houses_between = list(range(rahu_house + 1, 13)) + list(range(1, ketu_house))
+        planets_in_between = sum(1 for planet in planets
+                                 if planet['name'] not in ('Rahu', 'Ketu') and planet['house'] in houses_between)
+        if planets_in_between >= 5:
+            doshas.append({
+                'name': 'Kaal Sarp Dosha',
+                'severity': 'High',
+                'description': 'All planets trapped between Rahu and Ketu causing obstacles',
+                'causes': ['Planets hemmed between Rahu-Ketu axis'],
+                'effects': ['Sudden obstacles', 'Delays in success', 'Mental stress']
+            })
+            remedies.append({
+                'dosha': 'Kaal Sarp Dosha',
+                'remedy': 'Perform Kaal Sarp Dosh Nivaran Puja, visit Shiva temple, recite Maha Mrityunjaya mantra',
+                'mantra': 'Om Namah Shivaya (108 times daily)',
+                'duration': '40 days',
+                'items': 'Silver snake, milk, white flowers',
+                'cost': 'High'
+            })
+
+    # Shani Dosha: Saturn in 1, 4, 5, 8 or 12
+    saturn = planet_dict.get('Saturn')
+    if saturn and saturn['house'] in [1, 4, 5, 8, 12]:
+        doshas.append({
+            'name': 'Shani Dosha',
+            'severity': 'Very High' if saturn['house'] in [8, 12] else 'High',
+            'description': 'Saturn affliction causing delays and hardships',
+            'causes': [f'Saturn in {saturn["house"]} house'],
+            'effects': ['Delays in achievements', 'Health issues', 'Financial struggles']
+        })
+        remedies.append({
+            'dosha': 'Shani Dosha',
+            'remedy': 'Perform Shani Shanti Puja, donate mustard oil on Saturdays, serve the poor',
+            'mantra': 'Om Shanishcharaya Namaha (108 times on Saturday)',
+            'duration': '40 days',
+            'items': 'Mustard oil, iron, black sesame',
+            'cost': 'Medium'
+        })
+
+    # Guru Chandal Dosha
+    jupiter = planet_dict.get('Jupiter')
+    guru_chandal = detect_guru_chandal_dosha(jupiter, rahu) if jupiter and rahu else None
+    if guru_chandal:
+        doshas.append({
+            'name': 'Guru Chandal Dosha',
+            'severity': guru_chandal['severity'],
+            'description': guru_chandal['description'],
+            'causes': guru_chandal['causes'],
+            'effects': ['Confusion in decisions', 'Spiritual obstacles', 'Teacher-student conflicts',
+                        'Misguided intellect']
+        })
+        remedies.append({
+            'dosha': 'Guru Chandal Dosha',
+            'remedy': 'Perform Guru Chandal Dosh Nivaran Puja on Thursday, donate yellow items (turmeric, bananas, '
+                      'gram dal), serve teachers/gurus',
+            'mantra': 'Om Brim Brihaspataye Namaha (108 times daily)',
+            'duration': '40 days',
+            'items': 'Yellow clothes, turmeric, bananas, gram dal',
+            'cost': 'High'
+        })
+
+    return {'doshas': doshas, 'remedies': remedies}
+
+
+def _parse_degree(degree) -> float:
+    """Whole degrees of a "23°45'" string or a number"""
+    try:
+        if '°' in str(degree):
+            return float(str(degree).replace('°', ' ').replace("'", ' ').replace('"', ' ').split()[0])
+        return float(degree)
+    except ValueError:
+        return 0.0
+
+
+def detect_guru_chandal_dosha(jupiter: Dict, rahu: Dict) -> Optional[Dict]:
+    """Guru Chandal by level: conjunction, same house, adjacent house, then Rahu's 5th/7th/9th aspect"""
+    jup_house = jupiter['house']
+    rahu_house = rahu['house']
+    orb = abs(_parse_degree(jupiter['degree']) - _parse_degree(rahu['degree']))
+
+    if jup_house == rahu_house and orb <= 8:
+        return {
+            'severity': 'Very High',
+            'description': 'Jupiter conjunct with Rahu causing strong corruption of wisdom and spiritual blocks',
+            'causes': [f'Jupiter and Rahu conjunct in house {jup_house} within {orb:.1f}° orb']
+        }
+    if jup_house == rahu_house:
+        return {
+            'severity': 'High',
+            'description': 'Jupiter and Rahu in same house causing moderate affliction to wisdom',
+            'causes': [f'Jupiter and Rahu in same house {jup_house} with {orb:.1f}° separation']
+        }
+    if abs(jup_house - rahu_house) == 1:
+        return {
+            'severity': 'Moderate',
+            'description': 'Jupiter afflicted by Rahu from adjacent house causing mild wisdom corruption',
+            'causes': [f'Jupiter in house {jup_house} and Rahu in adjacent house {rahu_house}']
+        }
+
+    house_diff = (jup_house - rahu_house) % 12 or 12
+    if house_diff in (5, 7, 9):
+        aspect = f'{house_diff}th'
+        return {
+            'severity': 'Moderate',
+            'description': f'Jupiter receiving Rahu\'s {aspect} aspect causing spiritual confusion',
+            'causes': [f'Rahu in house {rahu_house} aspects Jupiter in house {jup_house} ({aspect} aspect)']
+        }
+    return None
+
+
+def summary(strong_planets: Sequence[str], weak_planets: Sequence[str], planetary_positions: List[Dict]) -> List[str]:
+    """Summary lines of a jyotisha-profile analysis"""
+    lines = []
+    if strong_planets:
+        lines.append(f"Strong planetary influences: {', '.join(strong_planets)}")
+    if weak_planets:
+        lines.append(f"Planets needing attention: {', '.join(weak_planets)}")
+    karmic_debt_count = sum(1 for position in planetary_positions if position['status'] == 'Karmic Debt')
+    if karmic_debt_count > 0:
+        lines.append(f"{karmic_debt_count} planets in karmic debt positions")
+    lines.append("Lal Kitab remedies focus on practical, cost-effective solutions")
+    return lines
+
+
+def fallback_analysis(birth_data: Dict) -> Dict:
+    """Failure result in the analysis shape"""
+    return {
+        'success': False,
+        'error': 'Unable to calculate authentic Lal Kitab analysis',
+        'basicInfo': {
+            'name': birth_data.get('name', ''),
+            'birthDate': birth_data.get('birthDate', ''),
+            'birthTime': birth_data.get('birthTime', ''),
+            'birthPlace': birth_data.get('birthPlace', ''),
+            'moonSign': 'Calculation failed',
+            'ascendant': 'Calculation failed'
+        },
+        'planetaryPositions': [],
+        'lalKitabAnalysis': {
+            'strongPlanets': [],
+            'weakPlanets': [],
+            'beneficHouses': [],
+            'maleficHouses': [],
+            'summary': ["Calculation failed - please try again"]
+        },
+        'remedies': [],
+        'calculationEngine': 'Fallback-Analysis'
+    }
+
+
+def birth_chart(birth_data: Dict) -> chart_core.Chart:
+    """Chart for Lal Kitab birth data (birthDate, birthTime, birthPlace, optional coordinates)"""
+    location = resolve_birth_place(birth_data.get('birthPlace'), birth_data.get('latitude'),
+                                   birth_data.get('longitude'), birth_data.get('timezone'))
+    return chart_core.birth_chart({
+        'date': birth_data.get('birthDate', ''),
+        'time': birth_data.get('birthTime', ''),
+        'latitude': location['latitude'],
+        'longitude': location['longitude'],
+        'timezone': location['timezone']
+    })
+
+
+def analyze(birth_data: Dict) -> Dict:
+    """Jyotisha-profile analysis of one set of birth data"""
+    try:
+        chart = birth_chart(birth_data)
+    except Exception as e:
+        log.error("Lal Kitab chart failed: {}", e)
+        return fallback_analysis(birth_data)
+    ascendant = {'longitude': chart.ascendant, 'sign': chart_core.SIGN_NAMES[chart.ascendant_sign]}
+    return analyze_planets(chart.planet_list(), ascendant, birth_data)
+
+
+def analyze_many(records: Sequence[Dict]) -> List[Dict]:
+    """analyze for many birth records in one call"""
+    results = [analyze(record) for record in records]
+    log.debug("Analysed {} Lal Kitab charts", len(results))
+    return results
+
+
+def main():
+    """Command line: birth data JSON (an object, or a list for a batch) as the first argument"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            if len(sys.argv) < 2:
+                raise ValueError("Usage: python lal_kitab.py '<birth_data_json>'")
+            request = json.loads(sys.argv[1])
+            result = analyze_many(request) if isinstance(request, list) else analyze(request)
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
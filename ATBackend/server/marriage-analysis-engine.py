@@ -11,13 +11,17 @@ import math
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+import yoga_rules
+
 # Import Swiss Ephemeris
 try:
     import swisseph as swe
+    import chart_core
     SWISS_EPHEMERIS_AVAILABLE = True
 except ImportError:
     try:
         import pyswisseph as swe
+        import chart_core
         SWISS_EPHEMERIS_AVAILABLE = True
     except ImportError as e:
         print(f"Warning: Swiss Ephemeris not available: {e}", file=sys.stderr)
@@ -57,68 +61,28 @@ class MarriageAnalysisEngine:
                 print("Swiss Ephemeris not available, using basic calculations", file=sys.stderr)
                 return self.calculate_basic_chart(birth_data)
             
-            date_str = birth_data['date']
-            time_str = birth_data['time']
-            lat = float(birth_data['latitude'])
-            lon = float(birth_data['longitude'])
-            
-            # Parse date and time
-            dt = datetime.fromisoformat(f"{date_str}T{time_str}")
-            
-            # Calculate Julian day
-            jd = swe.julday(dt.year, dt.month, dt.day, 
-                          dt.hour + dt.minute/60.0 + dt.second/3600.0)
+            # Sidereal chart from the shared core, at the birth place's UTC offset
+            chart = chart_core.birth_chart(birth_data)
             
-            # Calculate planets
             planets = {}
-            planet_ids = {
-                'Sun': swe.SUN, 'Moon': swe.MOON, 'Mars': swe.MARS,
-                'Mercury': swe.MERCURY, 'Jupiter': swe.JUPITER, 'Venus': swe.VENUS,
-                'Saturn': swe.SATURN, 'Rahu': swe.MEAN_NODE, 'Ketu': swe.MEAN_NODE
-            }
-            
-            for name, planet_id in planet_ids.items():
-                try:
-                    if name == 'Ketu':
-                        # Ketu is 180 degrees opposite to Rahu
-                        rahu_pos, _ = swe.calc_ut(jd, swe.MEAN_NODE)
-                        longitude = (rahu_pos[0] + 180) % 360
-                    else:
-                        pos, _ = swe.calc_ut(jd, planet_id)
-                        longitude = pos[0]
-                    
-                    # Calculate rashi (sign)
-                    rashi_num = int(longitude // 30)
-                    rashi = self.rashi_names[rashi_num]
-                    
-                    # Calculate nakshatra
-                    nakshatra_num = int(longitude * 27 / 360)
-                    nakshatra = self.nakshatra_names[nakshatra_num % 27]
-                    
-                    planets[name] = {
-                        'longitude': longitude,
-                        'rashi': rashi,
-                        'rashi_num': rashi_num + 1,
-                        'nakshatra': nakshatra,
-                        'nakshatra_num': nakshatra_num + 1,
-                        'degree': longitude % 30
-                    }
-                except Exception as e:
-                    print(f"Error calculating {name}: {e}", file=sys.stderr)
-            
-            # Calculate ascendant
-            houses = swe.houses(jd, lat, lon)
-            asc_longitude = houses[1][0]  # Ascendant longitude
-            asc_rashi_num = int(asc_longitude // 30)
+            for graha in chart.grahas:
+                planets[graha.name] = {
+                    'longitude': graha.longitude,
+                    'rashi': self.rashi_names[graha.sign],
+                    'rashi_num': graha.sign + 1,
+                    'nakshatra': self.nakshatra_names[graha.nakshatra],
+                    'nakshatra_num': graha.nakshatra + 1,
+                    'degree': graha.degree
+                }
             
             return {
                 'planets': planets,
                 'ascendant': {
-                    'longitude': asc_longitude,
-                    'rashi': self.rashi_names[asc_rashi_num],
-                    'rashi_num': asc_rashi_num + 1
+                    'longitude': chart.ascendant,
+                    'rashi': self.rashi_names[chart.ascendant_sign],
+                    'rashi_num': chart.ascendant_sign + 1
                 },
-                'houses': houses[1][:12]  # House cusps
+                'houses': list(chart.cusps)  # Placidus bhava cusps
             }
             
         except Exception as e:
@@ -262,45 +226,35 @@ class MarriageAnalysisEngine:
         doshas = {}
         
         try:
-            # Manglik Dosha
-            mars_position = chart['planets'].get('Mars', {})
-            mars_house = self.get_planet_house(mars_position, chart)
+            board = self.dosha_board(chart)
+            house = {name: board.house[i] + 1 for i, name in enumerate(yoga_rules.PLANET_NAMES)}
             
-            manglik_houses = [1, 2, 4, 7, 8, 12]
-            is_manglik = mars_house in manglik_houses
+            # Manglik Dosha
+            mars_house = house['Mars']
+            is_manglik = yoga_rules.holds(board, 'Manglik from Lagna')
             
             doshas['manglik'] = {
                 'present': is_manglik,
                 'mars_house': mars_house,
-                'severity': 'high' if mars_house in [1, 7, 8] else 'moderate' if is_manglik else 'none'
+                'severity': 'high' if is_manglik and mars_house in [1, 7, 8] else 'moderate' if is_manglik else 'none'
             }
             
             # Shani Dosha
-            saturn_position = chart['planets'].get('Saturn', {})
-            saturn_house = self.get_planet_house(saturn_position, chart)
-            
-            shani_dosha_houses = [2, 7]
-            has_shani_dosha = saturn_house in shani_dosha_houses
+            has_shani_dosha = yoga_rules.holds(board, 'Shani Dosha for marriage')
             
             doshas['shani'] = {
                 'present': has_shani_dosha,
-                'saturn_house': saturn_house,
+                'saturn_house': house['Saturn'],
                 'severity': 'moderate' if has_shani_dosha else 'none'
             }
             
             # Rahu-Ketu Dosha
-            rahu_position = chart['planets'].get('Rahu', {})
-            ketu_position = chart['planets'].get('Ketu', {})
-            rahu_house = self.get_planet_house(rahu_position, chart)
-            ketu_house = self.get_planet_house(ketu_position, chart)
-            
-            rahu_ketu_axis = [(1, 7), (2, 8), (7, 1), (8, 2)]
-            has_rahu_ketu_dosha = (rahu_house, ketu_house) in rahu_ketu_axis
+            has_rahu_ketu_dosha = yoga_rules.holds(board, 'Rahu-Ketu Dosha')
             
             doshas['rahu_ketu'] = {
                 'present': has_rahu_ketu_dosha,
-                'rahu_house': rahu_house,
-                'ketu_house': ketu_house,
+                'rahu_house': house['Rahu'],
+                'ketu_house': house['Ketu'],
                 'severity': 'high' if has_rahu_ketu_dosha else 'none'
             }
             
@@ -316,6 +270,14 @@ class MarriageAnalysisEngine:
         
         return doshas
 
+    def dosha_board(self, chart: Dict[str, Any]) -> 'yoga_rules.ChartBoard':
+        """yoga_rules encoding of the chart with houses counted from the ascendant degree"""
+        positions = {
+            name: dict(position, house=self.get_planet_house(position, chart))
+            for name, position in chart['planets'].items()
+        }
+        return yoga_rules.board_from_positions(positions, chart['ascendant']['longitude'])
+
     def get_planet_house(self, planet_position: Dict[str, Any], chart: Dict[str, Any]) -> int:
         """Calculate which house a planet is in"""
         try:
@@ -336,26 +298,7 @@ class MarriageAnalysisEngine:
     def check_kaal_sarp(self, chart: Dict[str, Any]) -> bool:
         """Check if all planets are between Rahu and Ketu"""
         try:
-            rahu_long = chart['planets'].get('Rahu', {}).get('longitude', 0)
-            ketu_long = chart['planets'].get('Ketu', {}).get('longitude', 0)
-            
-            # Normalize Ketu position (should be 180 degrees from Rahu)
-            ketu_long = (rahu_long + 180) % 360
-            
-            main_planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
-            
-            for planet in main_planets:
-                planet_long = chart['planets'].get(planet, {}).get('longitude', 0)
-                
-                # Check if planet is between Rahu and Ketu
-                if rahu_long < ketu_long:
-                    if not (rahu_long <= planet_long <= ketu_long):
-                        return False
-                else:
-                    if not (planet_long >= rahu_long or planet_long <= ketu_long):
-                        return False
-            
-            return True
+            return yoga_rules.holds(self.dosha_board(chart), 'Kaal Sarp Dosha')
         except:
             return False
 
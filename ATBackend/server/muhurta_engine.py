@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Muhurta Search Engine
+Ranked auspicious windows for an activity over an arbitrary date range
+
+Every panchanga element is turned into a timeline of exact transition
+intervals (root-finding on Sun/Moon longitudes, lagna boundaries from the
+sidereal-time cycle, day periods from sunrise/sunset), then each profile's
+rules become interval sets that are intersected directly. Ephemeris cost
+scales with the number of transitions, not with minutes in the range.
+
+Usage:
+    echo '{"activity": "marriage", "start_date": "2025-01-01", "end_date": "2025-06-30",
+           "latitude": 13.08, "longitude": 80.27, "birth_details": {...}}' | python muhurta_engine.py
+"""
+
+import json
+import sys
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import swisseph as swe
+
+import ayanamsa_service
+import chebyshev_ephemeris
+import engine_logging
+from festival_calendar import RASHI_NAMES, panchanga, tithi_name
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+
+log = engine_logging.get_logger('muhurta')
+
+NAKSHATRA_SPAN = 360 / 27
+
+NAKSHATRA_NAMES = ['Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira', 'Ardra', 'Punarvasu',
+                   'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni', 'Hasta',
+                   'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'Purva Ashadha',
+                   'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha', 'Purva Bhadrapada',
+                   'Uttara Bhadrapada', 'Revati']
+
+YOGA_NAMES = ['Vishkambha', 'Priti', 'Ayushman', 'Saubhagya', 'Shobhana', 'Atiganda', 'Sukarma',
+              'Dhriti', 'Shula', 'Ganda', 'Vriddhi', 'Dhruva', 'Vyaghata', 'Harshana', 'Vajra',
+              'Siddhi', 'Vyatipata', 'Variyan', 'Parigha', 'Shiva', 'Siddha', 'Sadhya', 'Shubha',
+              'Shukla', 'Brahma', 'Indra', 'Vaidhriti']
+
+VARA_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+MOVABLE_KARANAS = ['Bava', 'Balava', 'Kaulava', 'Taitila', 'Garaja', 'Vanija', 'Vishti']
+
+TARA_NAMES = ['Janma', 'Sampat', 'Vipat', 'Kshema', 'Pratyak', 'Sadhana', 'Naidhana', 'Mitra', 'Parama Mitra']
+
+# Yogas and the karana avoided for every undertaking
+INAUSPICIOUS_YOGAS = {'Vishkambha', 'Atiganda', 'Shula', 'Ganda', 'Vyaghata', 'Vajra',
+                      'Vyatipata', 'Parigha', 'Vaidhriti'}
+INAUSPICIOUS_KARANAS = {'Vishti'}
+# Rikta tithis (4, 9, 14 of either paksha) and Amavasya
+INAUSPICIOUS_TITHIS = {4, 9, 14, 19, 24, 29, 30}
+FAVOURABLE_TARAS = {'Sampat', 'Kshema', 'Sadhana', 'Mitra', 'Parama Mitra'}
+# Moon's house from the natal Moon
+FAVOURABLE_CHANDRA_HOUSES = {1, 3, 6, 7, 10, 11}
+
+# One-eighth day parts (1-8 from sunrise) by weekday, Sunday first
+RAHU_KALAM_PART = [8, 2, 7, 5, 6, 4, 3]
+YAMAGANDA_PART = [5, 4, 3, 2, 1, 7, 6]
+GULIKA_PART = [7, 6, 5, 4, 3, 2, 1]
+
+ACTIVITY_PROFILES = {
+    'marriage': {
+        'nakshatras': {'Rohini', 'Mrigashira', 'Magha', 'Uttara Phalguni', 'Hasta', 'Swati', 'Anuradha',
+                       'Mula', 'Uttara Ashadha', 'Uttara Bhadrapada', 'Revati'},
+        'varas': {'Monday', 'Wednesday', 'Thursday', 'Friday'},
+        'lagnas': {'Vrishabha', 'Mithuna', 'Karka', 'Kanya', 'Tula', 'Dhanu', 'Meena'},
+        'preferred_varas': {'Thursday', 'Friday'},
+        'preferred_lagnas': {'Mithuna', 'Kanya', 'Tula'},
+        'shukla_preferred': True
+    },
+    'griha_pravesh': {
+        'nakshatras': {'Rohini', 'Mrigashira', 'Uttara Phalguni', 'Chitra', 'Anuradha', 'Uttara Ashadha',
+                       'Dhanishta', 'Shatabhisha', 'Uttara Bhadrapada', 'Revati'},
+        'varas': {'Monday', 'Wednesday', 'Thursday', 'Friday'},
+        'lagnas': {'Vrishabha', 'Mithuna', 'Simha', 'Kanya', 'Vrishchika', 'Dhanu', 'Kumbha', 'Meena'},
+        'preferred_varas': {'Thursday'},
+        'preferred_lagnas': {'Vrishabha', 'Simha', 'Vrishchika', 'Kumbha'},
+        'shukla_preferred': True
+    },
+    'vehicle_purchase': {
+        'nakshatras': {'Ashwini', 'Rohini', 'Mrigashira', 'Punarvasu', 'Pushya', 'Hasta', 'Chitra', 'Swati',
+                       'Anuradha', 'Shravana', 'Dhanishta', 'Shatabhisha', 'Revati'},
+        'varas': {'Monday', 'Wednesday', 'Thursday', 'Friday'},
+        'lagnas': {'Mesha', 'Vrishabha', 'Karka', 'Tula', 'Makara', 'Mithuna', 'Kanya', 'Dhanu', 'Meena'},
+        'preferred_varas': {'Wednesday', 'Friday'},
+        'preferred_lagnas': {'Mesha', 'Karka', 'Tula', 'Makara'},
+        'shukla_preferred': False
+    }
+}
+
+# Sample spacing for bracketing transitions; refinement is by Newton steps
+SAMPLE_DAYS = 0.5
+NEWTON_STEPS = 3
+SIDEREAL_RATE = 360.98564736629  # degrees of ARMC per day
+ARMC_STEP = 0.25
+
+Interval = Tuple[float, float]
+Segment = Tuple[float, float, object]
+
+
+# ---------------------------------------------------------------------------
+# Interval algebra on sorted, non-overlapping (start, end) lists
+
+def intersect(a: List[Interval], b: List[Interval]) -> List[Interval]:
+    result, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        start, end = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if start < end:
+            result.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def subtract(a: List[Interval], b: List[Interval]) -> List[Interval]:
+    result, j = [], 0
+    for start, end in a:
+        while j < len(b) and b[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(b) and b[k][0] < end:
+            if b[k][0] > start:
+                result.append((start, b[k][0]))
+            start = max(start, b[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def select(timeline: List[Segment], accept: Callable[[object], bool]) -> List[Interval]:
+    """Merged intervals of a timeline whose value passes accept"""
+    result = []
+    for start, end, value in timeline:
+        if accept(value):
+            if result and result[-1][1] == start:
+                result[-1] = (result[-1][0], end)
+            else:
+                result.append((start, end))
+    return result
+
+
+def value_at(timeline: List[Segment], starts: List[float], jd: float):
+    return timeline[max(bisect_right(starts, jd) - 1, 0)][2]
+
+
+# ---------------------------------------------------------------------------
+# Transition timelines
+
+def _positions(jd: float, moon: bool, sun: bool) -> Tuple[float, float, float, float]:
+    """Sidereal (Lahiri) longitude and daily speed of the Moon and Sun"""
+    m = chebyshev_ephemeris.position('Moon', jd) if moon else (0.0, 0.0)
+    s = chebyshev_ephemeris.position('Sun', jd) if sun else (0.0, 0.0)
+    return m[0], m[1], s[0], s[1]
+
+
+def lunar_timeline(start: float, end: float, samples: List[Tuple[float, Tuple]], moon_coef: int,
+                   sun_coef: int, span: float, count: int) -> List[Segment]:
+    """
+    Segments of floor(angle / span) for angle = moon_coef*Moon + sun_coef*Sun,
+    which increases monotonically; crossings are bracketed on the sample grid
+    and refined with Newton steps using the bodies' speeds
+    """
+    def angle(pos):
+        return (moon_coef * pos[0] + sun_coef * pos[2]) % 360
+
+    def rate(pos):
+        return moon_coef * pos[1] + sun_coef * pos[3]
+
+    crossings = []
+    unwrapped_prev = angle(samples[0][1])
+    for (t0, p0), (t1, p1) in zip(samples, samples[1:]):
+        a0 = unwrapped_prev
+        a1 = a0 + (angle(p1) - angle(p0)) % 360
+        boundary = (int(a0 // span) + 1) * span
+        while boundary <= a1:
+            t = t0 + (boundary - a0) / (a1 - a0) * (t1 - t0)
+            target = boundary % 360
+            for _ in range(NEWTON_STEPS):
+                pos = _positions(t, moon_coef != 0, sun_coef != 0)
+                diff = (angle(pos) - target + 180) % 360 - 180
+                t -= diff / rate(pos)
+            crossings.append((t, int(round(boundary / span)) % count))
+            boundary += span
+        unwrapped_prev = a1
+
+    segments = []
+    current = int(angle(samples[0][1]) // span) % count
+    previous_time = start
+    for t, index in crossings:
+        if start < t < end:
+            segments.append((previous_time, t, current))
+            previous_time = t
+        current = index
+    segments.append((previous_time, end, current))
+    return segments
+
+
+def lagna_timeline(start: float, end: float, latitude: float, longitude: float) -> List[Segment]:
+    """
+    Sidereal lagna segments from the sidereal-time cycle: the ARMC at which each
+    sign rises is solved once, then mapped onto every sidereal day in the range
+    """
+    mid = (start + end) / 2
+    ayanamsa = ayanamsa_service.ayanamsa(mid)
+    obliquity = swe.calc_ut(mid, swe.ECL_NUT)[0][0]
+
+    def ascendant(armc):
+        return (swe.houses_armc(armc, latitude, obliquity, b'P')[1][0] - ayanamsa) % 360
+
+    # ARMC at which each sidereal sign starts rising: bracket on a quarter-degree
+    # grid, then bisect; the ascendant advances monotonically with ARMC
+    steps = [i * ARMC_STEP for i in range(int(360 / ARMC_STEP) + 1)]
+    values = [ascendant(a) for a in steps]
+    rising_armc = []
+    for a0, s0, a1, s1 in zip(steps, values, steps[1:], values[1:]):
+        if int(s0 // 30) == int(s1 // 30):
+            continue
+        sign = int(s1 // 30)
+        lo, hi = a0, a1
+        for _ in range(30):
+            midpoint = (lo + hi) / 2
+            if (ascendant(midpoint) - sign * 30) % 360 < 180:
+                hi = midpoint
+            else:
+                lo = midpoint
+        rising_armc.append((hi, sign))
+
+    armc_start = (swe.sidtime(start) * 15 + longitude) % 360
+    crossings = []
+    for armc, sign in rising_armc:
+        t = start + ((armc - armc_start) % 360) / SIDEREAL_RATE
+        while t < end:
+            crossings.append((t, sign))
+            t += 360 / SIDEREAL_RATE
+    crossings.sort()
+
+    segments = []
+    current = int(ascendant(armc_start) // 30)
+    previous_time = start
+    for t, sign in crossings:
+        segments.append((previous_time, t, current))
+        previous_time, current = t, sign
+    segments.append((previous_time, end, current))
+    return segments
+
+
+def _rise_set(jd: float, latitude: float, longitude: float, flag: int) -> float:
+    return panchanga.rise_trans(jd, swe.SUN, longitude, latitude, swe.BIT_DISC_CENTER + flag)[1][0]
+
+
+def day_timelines(first: date, last: date, latitude: float, longitude: float,
+                  timezone_str: str) -> Tuple[List[Segment], List[Interval], List[float]]:
+    """Vara segments (sunrise to sunrise) and Rahu kalam/Yamaganda/Gulika intervals"""
+    resolver = TimezoneResolver.shared()
+    sunrises, sunsets = [], []
+    current = first - timedelta(days=1)
+    while current <= last + timedelta(days=1):
+        midnight = resolver.to_utc(timezone_str, datetime(current.year, current.month, current.day))
+        jd = swe.julday(midnight.year, midnight.month, midnight.day, midnight.hour + midnight.minute / 60)
+        sunrises.append((current, _rise_set(jd, latitude, longitude, swe.CALC_RISE)))
+        sunsets.append(_rise_set(sunrises[-1][1], latitude, longitude, swe.CALC_SET))
+        current += timedelta(days=1)
+
+    varas, avoid = [], []
+    for (day, rise), sunset, (_, next_rise) in zip(sunrises, sunsets, sunrises[1:]):
+        weekday = (day.weekday() + 1) % 7
+        varas.append((rise, next_rise, weekday))
+        part = (sunset - rise) / 8
+        for parts in (RAHU_KALAM_PART, YAMAGANDA_PART, GULIKA_PART):
+            avoid.append((rise + (parts[weekday] - 1) * part, rise + parts[weekday] * part))
+    avoid.sort()
+    return varas, avoid, [rise for _, rise in sunrises]
+
+
+def karana_name(index: int) -> str:
+    """index 0-59 counted in half-tithis from the new moon"""
+    if index == 0:
+        return 'Kimstughna'
+    if index >= 57:
+        return ['Shakuni', 'Chatushpada', 'Naga'][index - 57]
+    return MOVABLE_KARANAS[(index - 1) % 7]
+
+
+class MuhurtaTimeline:
+    """All panchanga timelines for one date range and place; reusable across activity profiles"""
+
+    def __init__(self, start_date: str, end_date: str, latitude: float, longitude: float, timezone_str: str):
+        self.latitude, self.longitude, self.timezone = latitude, longitude, timezone_str
+        first, last = date.fromisoformat(start_date), date.fromisoformat(end_date)
+        resolver = TimezoneResolver.shared()
+        start_utc = resolver.to_utc(timezone_str, datetime(first.year, first.month, first.day))
+        end_utc = resolver.to_utc(timezone_str, datetime(last.year, last.month, last.day) + timedelta(days=1))
+        self.start = swe.julday(start_utc.year, start_utc.month, start_utc.day,
+                                start_utc.hour + start_utc.minute / 60)
+        self.end = swe.julday(end_utc.year, end_utc.month, end_utc.day, end_utc.hour + end_utc.minute / 60)
+
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        grid = []
+        t = self.start
+        while t < self.end + SAMPLE_DAYS:
+            grid.append((t, _positions(t, True, True)))
+            t += SAMPLE_DAYS
+
+        self.timelines = {
+            'tithi': lunar_timeline(self.start, self.end, grid, 1, -1, 12, 30),
+            'karana': lunar_timeline(self.start, self.end, grid, 1, -1, 6, 60),
+            'nakshatra': lunar_timeline(self.start, self.end, grid, 1, 0, NAKSHATRA_SPAN, 27),
+            'yoga': lunar_timeline(self.start, self.end, grid, 1, 1, NAKSHATRA_SPAN, 27),
+            'moon_sign': lunar_timeline(self.start, self.end, grid, 1, 0, 30, 12),
+            'lagna': lagna_timeline(self.start, self.end, latitude, longitude)
+        }
+        varas, self.kalams, self.sunrises = day_timelines(first, last, latitude, longitude, timezone_str)
+        self.timelines['vara'] = varas
+        self._starts = {name: [s[0] for s in timeline] for name, timeline in self.timelines.items()}
+
+    def select(self, name: str, accept: Callable[[object], bool]) -> List[Interval]:
+        return intersect(select(self.timelines[name], accept), [(self.start, self.end)])
+
+    def factors_at(self, jd: float) -> Dict:
+        value = lambda name: value_at(self.timelines[name], self._starts[name], jd)
+        return {
+            'tithi': tithi_name(value('tithi') + 1),
+            'nakshatra': NAKSHATRA_NAMES[value('nakshatra')],
+            'yoga': YOGA_NAMES[value('yoga')],
+            'karana': karana_name(value('karana')),
+            'vara': VARA_NAMES[value('vara')],
+            'lagna': RASHI_NAMES[value('lagna')],
+            'moon_sign': RASHI_NAMES[value('moon_sign')]
+        }
+
+    def local_time(self, jd: float) -> str:
+        year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+        utc = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+        offset = TimezoneResolver.shared().offset_at_utc(self.timezone, utc).offset_seconds
+        return utc.astimezone(timezone(timedelta(seconds=offset))).replace(microsecond=0).isoformat()
+
+
+def natal_moon(birth_details: Dict) -> Optional[Tuple[int, int]]:
+    """(nakshatra index, rashi index) of the natal Moon, or None without birth data"""
+    if not birth_details or not birth_details.get('date'):
+        return None
+    if birth_details.get('moon_longitude') is not None:
+        longitude = float(birth_details['moon_longitude'])
+    else:
+        location = resolve_birth_place(birth_details.get('place'), birth_details.get('latitude'),
+                                       birth_details.get('longitude'), birth_details.get('timezone'))
+        local = datetime.strptime(f"{birth_details['date']} {birth_details.get('time', '12:00')}", '%Y-%m-%d %H:%M')
+        utc = TimezoneResolver.shared().to_utc(location['timezone'], local)
+        jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60)
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        longitude = chebyshev_ephemeris.position('Moon', jd)[0]
+    return int(longitude // NAKSHATRA_SPAN), int(longitude // 30)
+
+
+def tara_name(natal_nakshatra: int, nakshatra: int) -> str:
+    return TARA_NAMES[(nakshatra - natal_nakshatra) % 27 % 9]
+
+
+def search(timeline: MuhurtaTimeline, activity: str, natal: Optional[Tuple[int, int]] = None,
+           min_duration_minutes: int = 30, limit: int = 20) -> List[Dict]:
+    """Ranked windows for one activity profile"""
+    profile = ACTIVITY_PROFILES[activity]
+    nakshatras = {NAKSHATRA_NAMES.index(n) for n in profile['nakshatras']}
+    lagnas = {RASHI_NAMES.index(r) for r in profile['lagnas']}
+    varas = {VARA_NAMES.index(v) for v in profile['varas']}
+    yogas = {YOGA_NAMES.index(y) for y in INAUSPICIOUS_YOGAS}
+
+    windows = timeline.select('nakshatra', lambda n: n in nakshatras and
+                              (natal is None or tara_name(natal[0], n) in FAVOURABLE_TARAS))
+    windows = intersect(windows, timeline.select('tithi', lambda t: t + 1 not in INAUSPICIOUS_TITHIS))
+    windows = intersect(windows, timeline.select('yoga', lambda y: y not in yogas))
+    windows = intersect(windows, timeline.select('karana', lambda k: karana_name(k) not in INAUSPICIOUS_KARANAS))
+    windows = intersect(windows, timeline.select('vara', lambda v: v in varas))
+    windows = intersect(windows, timeline.select('lagna', lambda l: l in lagnas))
+    if natal is not None:
+        windows = intersect(windows, timeline.select(
+            'moon_sign', lambda s: (s - natal[1]) % 12 + 1 in FAVOURABLE_CHANDRA_HOUSES))
+    windows = subtract(windows, timeline.kalams)
+
+    min_days = min_duration_minutes / 1440
+    ranked = []
+    for start, end in windows:
+        if end - start < min_days:
+            continue
+        factors = timeline.factors_at((start + end) / 2)
+        score = 5
+        score += 2 if factors['vara'] in profile['preferred_varas'] else 0
+        score += 2 if factors['lagna'] in profile['preferred_lagnas'] else 0
+        score += 1 if profile['shukla_preferred'] and factors['tithi'].startswith('Shukla') else 0
+        if natal is not None:
+            factors['tara'] = tara_name(natal[0], NAKSHATRA_NAMES.index(factors['nakshatra']))
+            score += 1 if factors['tara'] in ('Sadhana', 'Parama Mitra') else 0
+        score += min((end - start) * 24, 3) / 3
+        ranked.append({
+            'start': timeline.local_time(start),
+            'end': timeline.local_time(end),
+            'duration_minutes': round((end - start) * 1440),
+            'score': round(score, 2),
+            'factors': factors
+        })
+
+    ranked.sort(key=lambda w: (-w['score'], w['start']))
+    return ranked[:limit]
+
+
+def find_muhurta(activity: str, start_date: str, end_date: str, latitude: float, longitude: float,
+                 timezone_str: str = None, birth_details: Dict = None, min_duration_minutes: int = 30,
+                 limit: int = 20) -> Dict:
+    """Search one or more activities (comma separated or 'all') over a date range"""
+    if not timezone_str:
+        timezone_str = resolve_birth_place(latitude=latitude, longitude=longitude)['timezone']
+    activities = list(ACTIVITY_PROFILES) if activity == 'all' else [a.strip() for a in activity.split(',')]
+    unknown = [a for a in activities if a not in ACTIVITY_PROFILES]
+    if unknown:
+        return {'success': False, 'error': f"Unknown activity: {', '.join(unknown)}",
+                'activities': list(ACTIVITY_PROFILES)}
+    if abs(latitude) > 60:
+        return {'success': False, 'error': 'Muhurta search supports latitudes between -60 and 60 degrees'}
+
+    timeline = MuhurtaTimeline(start_date, end_date, latitude, longitude, timezone_str)
+    if log.debug_enabled:
+        log.debug("Muhurta timelines: {}", {name: len(t) for name, t in timeline.timelines.items()})
+    natal = natal_moon(birth_details)
+    return {
+        'success': True,
+        'range': {'start': start_date, 'end': end_date},
+        'location': {'latitude': latitude, 'longitude': longitude, 'timezone': timezone_str},
+        'natal_moon': {'nakshatra': NAKSHATRA_NAMES[natal[0]], 'rashi': RASHI_NAMES[natal[1]]} if natal else None,
+        'windows': {a: search(timeline, a, natal, min_duration_minutes, limit) for a in activities}
+    }
+
+
+def main():
+    """Command line: JSON request on stdin"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            request = json.loads(sys.stdin.read())
+            result = find_muhurta(
+                request.get('activity', 'all'),
+                request['start_date'],
+                request['end_date'],
+                float(request['latitude']),
+                float(request['longitude']),
+                request.get('timezone'),
+                request.get('birth_details'),
+                int(request.get('min_duration_minutes', 30)),
+                int(request.get('limit', 20))
+            )
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
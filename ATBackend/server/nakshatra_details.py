@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Nakshatra Details
+Report-ready record for each of the 108 padas: the nakshatra's name as the
+premium report spells it, lord, deity, gana, symbol, element,
+characteristics and auspicious activities, and the pada's own reading.
+Every record is built once at import on top of nakshatra_lookup, so a
+report's nakshatra section is a single table index.
+
+Usage:
+    python nakshatra_details.py 136.82 [245.5 ...]
+"""
+
+import json
+import sys
+from collections import namedtuple
+
+import nakshatra_lookup
+
+NAKSHATRA_NAMES = ['Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira', 'Ardra', 'Punarvasu',
+                   'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni', 'Hasta',
+                   'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'Purva Ashadha',
+                   'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha', 'Purva Bhadrapada',
+                   'Uttara Bhadrapada', 'Revati']
+
+# (symbol, element) per nakshatra
+NAKSHATRA_SYMBOLS = [
+    ("Horse's Head", 'Earth'), ('Yoni', 'Earth'), ('Knife/Razor', 'Earth'), ('Cart/Chariot', 'Earth'),
+    ("Deer's Head", 'Earth'), ('Teardrop', 'Water'), ('Bow/Arrow', 'Water'), ('Flower/Arrow', 'Water'),
+    ('Serpent', 'Water'), ('Throne', 'Water'), ('Front legs of bed', 'Fire'), ('Back legs of bed', 'Fire'),
+    ('Hand', 'Fire'), ('Bright jewel', 'Fire'), ('Coral', 'Fire'), ('Triumphal arch', 'Fire'),
+    ('Lotus flower', 'Fire'), ('Circular amulet', 'Fire'), ('Bunch of roots', 'Air'), ('Elephant tusk', 'Air'),
+    ('Elephant tusk', 'Air'), ('Ear', 'Air'), ('Drum', 'Air'), ('Empty circle', 'Air'),
+    ('Front legs of funeral cot', 'Air'), ('Back legs of funeral cot', 'Air'), ('Fish/Drum', 'Air')
+]
+
+CHARACTERISTICS = {
+    'Purva Phalguni': "Creative, artistic, enjoys comfort and refinement. Passionate romantic nature, generous and helpful to others. Natural leadership qualities with magnetic personality.",
+    'Uttara Phalguni': "Practical, reliable, superior organizational skills. Deep sense of responsibility, helpful nature. Success in partnerships and collaborations.",
+    'Hasta': "Skilled with hands, intelligent, skilled at crafts. Practical approach to life, helpful nature. Success in detailed work and service-oriented professions.",
+    'Chitra': "Creative, artistic, passionate about beauty. Refined aesthetic sense, independent nature. Success in arts, architecture, and creative fields.",
+    'Swati': "Independent, freedom-loving, diplomatic. Effective communication skills, adaptable nature. Success in business, trade, and international affairs."
+}
+DEFAULT_CHARACTERISTICS = "Positive traits include determination, creativity, and spiritual inclination. Natural leadership abilities with solid moral values."
+
+ACTIVITIES = {
+    'Purva Phalguni': "Suitable for marriage ceremonies, entertainment, artistic pursuits, premium purchases, and romantic activities.",
+    'Uttara Phalguni': "Suitable for business partnerships, property deals, charitable activities, and long-term planning.",
+    'Hasta': "Ideal for handicrafts, detailed work, healing activities, and service to others.",
+    'Chitra': "Ideal for creative projects, architectural work, jewelry making, and artistic endeavors.",
+    'Swati': "Suitable for travel, business negotiations, diplomatic activities, and starting new ventures."
+}
+DEFAULT_ACTIVITIES = "Typically suitable for spiritual activities, education, and charitable works."
+
+PADA_ANALYSIS = {
+    'Purva Phalguni': (
+        "Leo navamsa - Dynamic creative abilities, leadership in arts",
+        "Virgo navamsa - Practical creativity, attention to detail",
+        "Libra navamsa - Harmonious relationships, diplomatic skills",
+        "Scorpio navamsa - Intense creativity, transformative abilities"
+    )
+}
+DEFAULT_PADA_ANALYSIS = (
+    "First pada brings leadership qualities and pioneering spirit",
+    "Second pada emphasizes practical approach and material success",
+    "Third pada focuses on communication and social connections",
+    "Fourth pada brings spiritual inclination and deeper understanding"
+)
+
+Detail = namedtuple('Detail', 'index number pada name lord deity gana symbol element '
+                              'characteristics activities pada_analysis')
+
+
+def _build_details():
+    details = []
+    for pada in nakshatra_lookup.PADAS:
+        name = NAKSHATRA_NAMES[pada.nakshatra]
+        symbol, element = NAKSHATRA_SYMBOLS[pada.nakshatra]
+        details.append(Detail(pada.index, pada.number, pada.pada, name, pada.lord, pada.deity, pada.gana,
+                              symbol, element, CHARACTERISTICS.get(name, DEFAULT_CHARACTERISTICS),
+                              ACTIVITIES.get(name, DEFAULT_ACTIVITIES),
+                              PADA_ANALYSIS.get(name, DEFAULT_PADA_ANALYSIS)[pada.pada - 1]))
+    return details
+
+
+DETAILS = _build_details()
+
+
+def lookup(longitude: float) -> Detail:
+    """Detail record of a sidereal longitude"""
+    return DETAILS[nakshatra_lookup.pada_index(longitude)]
+
+
+def main():
+    """Command line: one or more longitudes"""
+    try:
+        if len(sys.argv) < 2:
+            raise ValueError("Usage: python nakshatra_details.py <longitude> [longitude ...]")
+        result = {'success': True, 'details': [lookup(float(value))._asdict() for value in sys.argv[1:]]}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Nakshatra Lookup
+Constant-time nakshatra and pada for a sidereal longitude. The longitude
+is floored to whole arc-seconds and divided by the pada span (3°20' =
+12000"), so every boundary is an exact integer and no engine scans ranges
+or compares against rounded 13.333333 bounds. The 108 padas are tabulated
+at import with their nakshatra's lord, deity, gana, nadi, yoni and varna
+and the pada's navamsa sign.
+
+Functions take a scalar longitude or a NumPy array of them.
+
+Usage:
+    python nakshatra_lookup.py 136.82 [245.5 ...]
+"""
+
+import json
+import math
+import sys
+from collections import namedtuple
+from numbers import Real
+from typing import List
+
+ARCSEC_CIRCLE = 360 * 3600
+ARCSEC_PER_NAKSHATRA = ARCSEC_CIRCLE // 27
+ARCSEC_PER_PADA = ARCSEC_CIRCLE // 108
+
+NAKSHATRAS = ['Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashirsha', 'Ardra', 'Punarvasu',
+              'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni', 'Hasta',
+              'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'Purva Ashadha',
+              'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha', 'Purva Bhadrapada',
+              'Uttara Bhadrapada', 'Revati']
+NAKSHATRA_LORDS = ['Ketu', 'Venus', 'Sun', 'Moon', 'Mars', 'Rahu', 'Jupiter', 'Saturn', 'Mercury']
+
+# (deity, gana, nadi, yoni, varna) per nakshatra
+NAKSHATRA_ATTRIBUTES = [
+    ('Ashwini Kumaras', 'Deva', 'Vata', 'Ashwa', 'Vaishya'),
+    ('Yama', 'Manushya', 'Pitta', 'Gaja', 'Shudra'),
+    ('Agni', 'Rakshasa', 'Kapha', 'Mesha', 'Brahmin'),
+    ('Brahma', 'Manushya', 'Kapha', 'Sarpa', 'Shudra'),
+    ('Soma', 'Deva', 'Pitta', 'Sarpa', 'Shudra'),
+    ('Rudra', 'Manushya', 'Vata', 'Shwana', 'Shudra'),
+    ('Aditi', 'Deva', 'Vata', 'Marjara', 'Vaishya'),
+    ('Brihaspati', 'Deva', 'Pitta', 'Mesha', 'Kshatriya'),
+    ('Nagas', 'Rakshasa', 'Kapha', 'Marjara', 'Kshatriya'),
+    ('Pitrs', 'Rakshasa', 'Kapha', 'Mushak', 'Shudra'),
+    ('Bhaga', 'Manushya', 'Pitta', 'Mushak', 'Brahmin'),
+    ('Aryaman', 'Manushya', 'Vata', 'Gou', 'Kshatriya'),
+    ('Savitar', 'Deva', 'Vata', 'Mahisha', 'Vaishya'),
+    ('Tvashtar', 'Rakshasa', 'Pitta', 'Vyaghra', 'Shudra'),
+    ('Vayu', 'Deva', 'Kapha', 'Mahisha', 'Shudra'),
+    ('Indra-Agni', 'Rakshasa', 'Kapha', 'Vyaghra', 'Kshatriya'),
+    ('Mitra', 'Deva', 'Pitta', 'Harina', 'Shudra'),
+    ('Indra', 'Rakshasa', 'Vata', 'Harina', 'Shudra'),
+    ('Nirriti', 'Rakshasa', 'Vata', 'Shwana', 'Kshatriya'),
+    ('Apas', 'Manushya', 'Pitta', 'Vana', 'Brahmin'),
+    ('Vishve Devas', 'Manushya', 'Kapha', 'Nakula', 'Kshatriya'),
+    ('Vishnu', 'Deva', 'Kapha', 'Vana', 'Kshatriya'),
+    ('Vasus', 'Rakshasa', 'Pitta', 'Simha', 'Shudra'),
+    ('Varuna', 'Rakshasa', 'Vata', 'Ashwa', 'Shudra'),
+    ('Aja Ekapada', 'Manushya', 'Vata', 'Simha', 'Brahmin'),
+    ('Ahir Budhnya', 'Manushya', 'Pitta', 'Gou', 'Kshatriya'),
+    ('Pushan', 'Deva', 'Kapha', 'Gaja', 'Shudra')
+]
+
+Pada = namedtuple('Pada', 'index nakshatra number pada name lord deity gana nadi yoni varna navamsa start end')
+FIELDS = Pada._fields
+
+
+def _build_padas() -> List[Pada]:
+    padas = []
+    for index in range(108):
+        nakshatra = index // 4
+        deity, gana, nadi, yoni, varna = NAKSHATRA_ATTRIBUTES[nakshatra]
+        padas.append(Pada(index, nakshatra, nakshatra + 1, index % 4 + 1, NAKSHATRAS[nakshatra],
+                          NAKSHATRA_LORDS[nakshatra % 9], deity, gana, nadi, yoni, varna, index % 12,
+                          index * ARCSEC_PER_PADA, (index + 1) * ARCSEC_PER_PADA))
+    return padas
+
+
+PADAS = _build_padas()
+
+_columns = {}
+
+
+def arcseconds(longitude):
+    """Whole arc-seconds of a longitude, 0 to 1295999"""
+    if isinstance(longitude, Real):
+        return math.floor(longitude * 3600) % ARCSEC_CIRCLE
+    import numpy as np
+
+    return np.floor(np.asarray(longitude, dtype=float) * 3600).astype(np.int64) % ARCSEC_CIRCLE
+
+
+def pada_index(longitude):
+    """Index 0-107 into PADAS"""
+    return arcseconds(longitude) // ARCSEC_PER_PADA
+
+
+def nakshatra_pada(longitude):
+    """(nakshatra index 0-26, pada 1-4)"""
+    index = pada_index(longitude)
+    return index // 4, index % 4 + 1
+
+
+def lookup(longitude: float) -> Pada:
+    """Pada record of a scalar longitude"""
+    return PADAS[pada_index(longitude)]
+
+
+def column(name: str):
+    """One Pada field for all 108 padas as a NumPy array"""
+    values = _columns.get(name)
+    if values is None:
+        import numpy as np
+
+        values = _columns[name] = np.array([getattr(pada, name) for pada in PADAS])
+    return values
+
+
+def attribute(longitude, name: str):
+    """One Pada field for a scalar longitude or an array of them"""
+    if isinstance(longitude, Real):
+        return getattr(lookup(longitude), name)
+    return column(name)[pada_index(longitude)]
+
+
+def main():
+    """Command line: one or more longitudes"""
+    try:
+        if len(sys.argv) < 2:
+            raise ValueError("Usage: python nakshatra_lookup.py <longitude> [longitude ...]")
+        result = {'success': True, 'padas': [lookup(float(value))._asdict() for value in sys.argv[1:]]}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import math
 
 try:
     import swisseph as swe
+    import ayanamsa_service
 except ImportError:
     print(json.dumps({"success": False, "error": "Swiss Ephemeris not available"}))
     sys.exit(1)
@@ -104,7 +105,7 @@ class SwissEphemerisPanchangCalculator:
             
             # Set ayanamsa (Lahiri)
             swe.set_sid_mode(swe.SIDM_LAHIRI)
-            ayanamsa = swe.get_ayanamsa(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
 
             # Calculate planetary positions
             planetary_positions = cls._calculate_planetary_positions(jd, ayanamsa)
@@ -204,7 +205,7 @@ class SwissEphemerisPanchangCalculator:
         moon_result = swe.calc(jd, swe.MOON)
         sun_result = swe.calc(jd, swe.SUN)
         
-        ayanamsa = swe.get_ayanamsa(jd)
+        ayanamsa = ayanamsa_service.ayanamsa(jd)
         
         moon_longitude = (moon_result[0][0] - ayanamsa) % 360
         sun_longitude = (sun_result[0][0] - ayanamsa) % 360
@@ -415,7 +416,7 @@ class SwissEphemerisPanchangCalculator:
             moon_result = swe.calc(jd, swe.MOON)
             sun_result = swe.calc(jd, swe.SUN)
             
-            ayanamsa = swe.get_ayanamsa(jd)
+            ayanamsa = ayanamsa_service.ayanamsa(jd)
             moon_longitude = (moon_result[0][0] - ayanamsa) % 360
             sun_longitude = (sun_result[0][0] - ayanamsa) % 360
             
@@ -0,0 +1,182 @@
+"""
+Opt-in Performance Instrumentation
+Per-request call counts, cumulative time and cache hits for Swiss Ephemeris
+calls and report sections, emitted as a structured _perf block and optionally
+as Prometheus text exposition
+
+Nothing is wrapped unless instrumentation is enabled, either with the
+ENGINE_PERF=1 environment variable or a truthy "perf" field in the request.
+"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterable, Optional
+
+import engine_logging
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+log = engine_logging.get_logger('perf_instrumentation')
+
+# The Swiss Ephemeris entry points that dominate report time
+SWISSEPH_FUNCTIONS = ('calc_ut', 'houses', 'houses_ex', 'rise_trans', 'get_ayanamsa_ut')
+
+# PremiumReportEngine methods treated as report sections
+SECTION_PREFIXES = ('calculate_', 'analyze_', 'generate_', 'get_jyotisha_data')
+
+
+class PerfRecorder:
+    """Accumulates timings for one request"""
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.timings: Dict[str, list] = {}
+        self.caches: Dict[str, list] = {}
+
+    def record(self, name: str, seconds: float):
+        entry = self.timings.get(name)
+        if entry is None:
+            self.timings[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def record_cache(self, name: str, hit: bool):
+        entry = self.caches.setdefault(name, [0, 0])
+        entry[0 if hit else 1] += 1
+
+    @contextmanager
+    def time(self, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def snapshot(self) -> Dict:
+        """The _perf block: groups are keyed by the prefix before the first dot"""
+        groups: Dict[str, Dict] = {}
+        for name, (calls, seconds) in sorted(self.timings.items(), key=lambda item: -item[1][1]):
+            group, _, key = name.partition('.')
+            groups.setdefault(group, {})[key] = {'calls': calls, 'total_ms': round(seconds * 1000, 3)}
+
+        swisseph = groups.get('swe', {})
+        return {
+            'total_ms': round((perf_counter() - self.started) * 1000, 3),
+            'swisseph_calls': sum(entry['calls'] for entry in swisseph.values()),
+            'swisseph': swisseph,
+            'sections': groups.get('section', {}),
+            'cache': {name: {'hits': hits, 'misses': misses} for name, (hits, misses) in self.caches.items()}
+        }
+
+    def prometheus_text(self, engine: str) -> Optional[str]:
+        """Prometheus text exposition of this request's counters"""
+        if not PROMETHEUS_AVAILABLE:
+            log.warning("prometheus_client not installed; skipping Prometheus output")
+            return None
+
+        registry = CollectorRegistry()
+        calls = Counter('astro_engine_calls', 'Instrumented calls per request',
+                        ['engine', 'group', 'name'], registry=registry)
+        seconds = Counter('astro_engine_seconds', 'Cumulative seconds in instrumented calls per request',
+                          ['engine', 'group', 'name'], registry=registry)
+        cache = Counter('astro_engine_cache_lookups', 'Cache lookups per request',
+                        ['engine', 'cache', 'result'], registry=registry)
+
+        for name, (count, total) in self.timings.items():
+            group, _, key = name.partition('.')
+            calls.labels(engine, group, key).inc(count)
+            seconds.labels(engine, group, key).inc(total)
+        for name, (hits, misses) in self.caches.items():
+            cache.labels(engine, name, 'hit').inc(hits)
+            cache.labels(engine, name, 'miss').inc(misses)
+        return generate_latest(registry).decode('utf-8')
+
+
+_current: ContextVar[Optional[PerfRecorder]] = ContextVar('perf_recorder', default=None)
+
+
+def enabled(request: Optional[Dict] = None) -> bool:
+    """Whether this request asked for instrumentation"""
+    if os.environ.get('ENGINE_PERF', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return bool(request and request.get('perf'))
+
+
+def current() -> Optional[PerfRecorder]:
+    return _current.get()
+
+
+@contextmanager
+def request_scope():
+    """Collect timings for everything executed inside the block"""
+    recorder = PerfRecorder()
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+def record_cache(name: str, hit: bool):
+    """Cache hit/miss hook for cached lookups; free when no request is being recorded"""
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.record_cache(name, hit)
+
+
+def _timed(name: str, func):
+    def wrapper(*args, **kwargs):
+        recorder = _current.get()
+        if recorder is None:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.record(name, perf_counter() - start)
+
+    wrapper.__wrapped__ = func
+    wrapper.__name__ = getattr(func, '__name__', name)
+    wrapper.__doc__ = getattr(func, '__doc__', None)
+    return wrapper
+
+
+def instrument_swisseph(functions: Iterable[str] = SWISSEPH_FUNCTIONS):
+    """Wrap swisseph module functions in place (idempotent)"""
+    try:
+        import swisseph as swe
+    except ImportError:
+        return
+    for name in functions:
+        func = getattr(swe, name, None)
+        if func is not None and not hasattr(func, '__wrapped__'):
+            setattr(swe, name, _timed(f"swe.{name}", func))
+
+
+def instrument_methods(cls, prefixes: Iterable[str] = SECTION_PREFIXES):
+    """Wrap instance methods whose names start with one of prefixes as report sections (idempotent)"""
+    prefixes = tuple(prefixes)
+    for name, attr in list(vars(cls).items()):
+        if name.startswith(prefixes) and callable(attr) and not hasattr(attr, '__wrapped__'):
+            setattr(cls, name, _timed(f"section.{name}", attr))
+
+
+def write_prometheus_textfile(recorder: PerfRecorder, engine: str):
+    """Write the exposition to $ENGINE_PERF_PROMETHEUS (node_exporter textfile collector format)"""
+    path = os.environ.get('ENGINE_PERF_PROMETHEUS')
+    if not path:
+        return
+    text = recorder.prometheus_text(engine)
+    if text is None:
+        return
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
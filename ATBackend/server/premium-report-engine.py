@@ -15,6 +15,26 @@ from typing import Dict, List, Any, Optional, Tuple
 import pytz
 import subprocess
 
+import ayanamsa_service
+import arc_geometry
+import chart_core
+import chart_variants
+import engine_chain
+from gazetteer import resolve_birth_place
+from muhurta_engine import find_muhurta
+from varshaphal import solar_returns
+from transit_events import page as transit_event_page
+import shadbala_engine
+import transit_snapshot
+import varga_engine
+import yoga_rules
+import engine_logging
+import nakshatra_details
+import nakshatra_lookup
+import perf_instrumentation
+
+log = engine_logging.get_logger('premium_report')
+
 # Import astronomical calculation libraries
 try:
     import swisseph as swe
@@ -82,6 +102,9 @@ class PremiumReportEngine:
             'Rahu', 'Ketu'
         ]
         
+        # Spellings used by the nakshatra tables below, in nakshatra_lookup order
+        self.NAKSHATRA_NAMES = nakshatra_details.NAKSHATRA_NAMES
+        
         self.PLANET_SYMBOLS = {
             'Sun': '☉', 'Moon': '☽', 'Mars': '♂', 'Mercury': '☿',
             'Jupiter': '♃', 'Venus': '♀', 'Saturn': '♄', 'Rahu': '☊', 'Ketu': '☋'
@@ -93,8 +116,12 @@ class PremiumReportEngine:
             'Dharma Bhava', 'Karma Bhava', 'Labha Bhava', 'Vyaya Bhava'
         ]
         
-        # Lahiri Ayanamsa for sidereal calculations
-        self.AYANAMSA = 24.0  # Approximate value for current era
+        # Days ahead searched for muhurta windows
+        self.MUHURTA_SEARCH_DAYS = 60
+
+        # Slow-planet transit events listed for the year ahead
+        self.TRANSIT_EVENT_BODIES = ('Mars', 'Jupiter', 'Saturn', 'Rahu', 'Ketu')
+        self.TRANSIT_EVENT_LIMIT = 40
         
         # Hardcoded content detection patterns
         self.HARDCODED_PATTERNS = {
@@ -175,7 +202,7 @@ class PremiumReportEngine:
         
         if validation_errors:
             error_msg = f"Data validation failed for {section_name}: {'; '.join(validation_errors)}"
-            print(f"[VALIDATION ERROR] {error_msg}", file=sys.stderr)
+            log.error("Validation error: {}", error_msg)
             raise DataValidationError(error_msg)
     
     def validate_ashtakavarga_data(self, ashtakavarga_data: Dict[str, Any]) -> None:
@@ -220,7 +247,7 @@ class PremiumReportEngine:
         
         if validation_errors:
             error_msg = f"Ashtakavarga validation failed: {'; '.join(validation_errors)}"
-            print(f"[ASHTAKAVARGA ERROR] {error_msg}", file=sys.stderr)
+            log.error("Ashtakavarga error: {}", error_msg)
             raise AuthenticDataError(error_msg)
     
     def validate_dasha_data(self, dasha_data: Dict[str, Any]) -> None:
@@ -269,7 +296,7 @@ class PremiumReportEngine:
         
         if validation_errors:
             error_msg = f"Dasha validation failed: {'; '.join(validation_errors)}"
-            print(f"[DASHA ERROR] {error_msg}", file=sys.stderr)
+            log.error("Dasha error: {}", error_msg)
             raise AuthenticDataError(error_msg)
     
     def detect_hardcoded_content(self, report_data: Dict[str, Any]) -> None:
@@ -377,78 +404,40 @@ class PremiumReportEngine:
         if hardcoded_issues:
             error_msg = f"HARDCODED CONTENT DETECTED - Report generation failed to maintain data integrity:\n"
             error_msg += "\n".join(f"- {issue}" for issue in hardcoded_issues)
-            print(f"[HARDCODED ERROR] {error_msg}", file=sys.stderr)
+            log.error("Hardcoded error: {}", error_msg)
             raise HardcodedContentError(error_msg)
     
+    def resolve_birth_location(self, birth_details: Dict) -> Dict:
+        """Birth coordinates and timezone, resolved offline from the place name when missing"""
+        return resolve_birth_place(
+            birth_details.get('place'),
+            birth_details.get('latitude'),
+            birth_details.get('longitude'),
+            birth_details.get('timezone')
+        )
+    
     def get_jyotisha_data(self, birth_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Get planetary data from platform's Jyotisha engine via API"""
+        """Get planetary data from the platform's Jyotisha engine chain, in process"""
         try:
-            import urllib.request
-            import urllib.parse
-            
-            # Prepare birth data for platform API
-            api_data = {
+            location = self.resolve_birth_location(birth_data)
+            chain_data = {
                 "name": birth_data.get("name", ""),
                 "date": birth_data.get("date", ""),
                 "time": birth_data.get("time", ""),
-                "latitude": birth_data.get("latitude", 0),
-                "longitude": birth_data.get("longitude", 0),
+                "latitude": location['latitude'],
+                "longitude": location['longitude'],
                 "place": birth_data.get("place", "")
             }
-            
-            # Call platform's birth chart API
-            data = json.dumps(api_data).encode('utf-8')
-            
-            # Determine the correct API base URL based on environment
-            if os.environ.get('REPLIT_DEPLOYMENT_ID') or 'astrotick.com' in os.environ.get('REPLIT_URL', ''):
-                # Production environment - use production domain
-                base_url = 'https://astrotick.com'
-                print(f"[DEBUG] Production environment detected: Using {base_url}", file=sys.stderr)
-                urls_to_try = [
-                    f'{base_url}/api/birth-chart/detailed',  # Production URL
-                    'http://localhost:5000/api/birth-chart/detailed',  # Development fallback
-                ]
-            else:
-                # Development environment - use localhost with port
-                port = os.environ.get('PORT', '5000')
-                base_url = f'http://localhost:{port}'
-                print(f"[DEBUG] Development environment detected: Using {base_url}", file=sys.stderr)
-                urls_to_try = [
-                    f'{base_url}/api/birth-chart/detailed',  # Development URL
-                    'http://localhost:5000/api/birth-chart/detailed',  # Development server
-                    'http://127.0.0.1:5000/api/birth-chart/detailed',  # Development server alt
-                ]
-            print(f"[DEBUG] Birth data for API: {json.dumps(api_data, indent=2)}", file=sys.stderr)
-            
-            result = None
-            for url in urls_to_try:
-                try:
-                    print(f"[DEBUG] Trying URL: {url}", file=sys.stderr)
-                    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        result = json.loads(response.read().decode('utf-8'))
-                        print(f"[DEBUG] API Response from {url}: {json.dumps(result, indent=2)[:500]}...", file=sys.stderr)
-                        
-                        # Debug ascendant information specifically
-                        if result.get('success') and result.get('ascendant'):
-                            asc_data = result['ascendant']
-                            print(f"[DEBUG] Platform API Ascendant Found: {asc_data.get('sign')} at {asc_data.get('longitude', 0):.2f}°", file=sys.stderr)
-                        
-                        break
-                except Exception as e:
-                    print(f"Failed to connect to {url}: {e}", file=sys.stderr)
-                    continue
-            
-            if result and result.get('success') and result.get('planets'):
-                print(f"Platform Jyotisha API returned {len(result['planets'])} planets", file=sys.stderr)
+            result = engine_chain.birth_chart(chain_data)
+
+            if result.get('success') and result.get('planets'):
+                log.info("Jyotisha {} engine returned {} planets", result['engine_chain']['served_by'], len(result['planets']))
                 return result
-            else:
-                error_msg = result.get('error', 'Unknown error') if result else 'No response from API'
-                print(f"Platform API failed: {error_msg}", file=sys.stderr)
-                return None
-                
+            log.warning("Jyotisha engine chain failed: {}", result.get('error', 'Unknown error'))
+            return None
+
         except Exception as e:
-            print(f"Error calling platform Jyotisha API: {e}", file=sys.stderr)
+            log.warning("Error calling Jyotisha engine chain: {}", e)
             return None
         
     def calculate_julian_day(self, birth_details: Dict) -> float:
@@ -480,22 +469,23 @@ class PremiumReportEngine:
                 
             return jd
         except Exception as e:
-            print(f"Error calculating Julian Day: {e}", file=sys.stderr)
+            log.warning("Error calculating Julian Day: {}", e)
             return 2451545.0  # J2000.0 epoch as fallback
     
     def calculate_house_from_longitude(self, planet_longitude: float, jyotisha_data: Dict) -> int:
         """Calculate correct house position based on planet longitude and ascendant"""
         try:
-            print(f"[DEBUG] HOUSE CALC START: Planet longitude: {planet_longitude}", file=sys.stderr)
-            print(f"[DEBUG] HOUSE CALC: Jyotisha data keys: {list(jyotisha_data.keys()) if jyotisha_data else 'None'}", file=sys.stderr)
+            log.debug("HOUSE CALC START: Planet longitude: {}", planet_longitude)
+            if log.debug_enabled:
+                log.debug("HOUSE CALC: Jyotisha data keys: {}", list(jyotisha_data.keys()) if jyotisha_data else 'None')
             
             # Get ascendant longitude from Jyotisha data
             ascendant_longitude = 0
             if jyotisha_data.get('ascendant'):
                 ascendant_longitude = jyotisha_data['ascendant'].get('longitude', 0)
-                print(f"[DEBUG] HOUSE CALC: Found ascendant at {ascendant_longitude}°", file=sys.stderr)
+                log.debug("HOUSE CALC: Found ascendant at {}°", ascendant_longitude)
             else:
-                print(f"[DEBUG] HOUSE CALC: NO ASCENDANT DATA FOUND - using default 0°", file=sys.stderr)
+                log.debug("HOUSE CALC: NO ASCENDANT DATA FOUND - using default 0°")
             
             # Calculate house using sign-based method (correct approach)
             # Convert longitudes to sign numbers
@@ -506,11 +496,11 @@ class PremiumReportEngine:
             house_diff = (planet_sign - ascendant_sign) % 12
             house_number = house_diff + 1
                 
-            print(f"[DEBUG] HOUSE CALC RESULT: Planet={planet_longitude:.2f}° (sign {planet_sign}), Asc={ascendant_longitude:.2f}° (sign {ascendant_sign}), Diff={house_diff}, House={house_number}", file=sys.stderr)
+            log.debug("HOUSE CALC RESULT: Planet={:.2f}° (sign {}), Asc={:.2f}° (sign {}), Diff={}, House={}", planet_longitude, planet_sign, ascendant_longitude, ascendant_sign, house_diff, house_number)
             return house_number
             
         except Exception as e:
-            print(f"[DEBUG] HOUSE CALC ERROR: {e}", file=sys.stderr)
+            log.debug("HOUSE CALC ERROR: {}", e)
             return 1  # Default to 1st house if calculation fails
 
     def calculate_planetary_positions(self, birth_details: Dict) -> Dict[str, Dict]:
@@ -518,11 +508,11 @@ class PremiumReportEngine:
         
         # Try Jyotisha engine first for consistency across platform
         if self.use_jyotisha:
-            print("Attempting to use Platform Jyotisha API...", file=sys.stderr)
+            log.info("Attempting to use Platform Jyotisha API...")
             jyotisha_data = self.get_jyotisha_data(birth_details)
             if jyotisha_data and jyotisha_data.get('planets'):
-                print(f"Platform Jyotisha API successful - processing {len(jyotisha_data['planets'])} planets", file=sys.stderr)
-                print(f"[DEBUG] CRITICAL: Starting house calculation fixes...", file=sys.stderr)
+                log.info("Platform Jyotisha API successful - processing {} planets", len(jyotisha_data['planets']))
+                log.debug("CRITICAL: Starting house calculation fixes...")
                 positions = {}
                 for planet_data in jyotisha_data['planets']:
                     try:
@@ -545,23 +535,15 @@ class PremiumReportEngine:
                                 elif planet_name == 'Moon' and 'nakshatra' in jyotisha_data:
                                     nakshatra_value = str(jyotisha_data['nakshatra'])
                             except Exception as e:
-                                print(f"Warning: Could not extract nakshatra for {planet_name}: {e}", file=sys.stderr)
+                                log.warning("Warning: Could not extract nakshatra for {}: {}", planet_name, e)
                                 nakshatra_value = 'Unknown'
                             
                             # Calculate correct house based on longitude and ascendant
                             planet_longitude = planet_data.get('longitude', 0)
                             original_house = planet_data.get('house', 1)
-                            print(f"[DEBUG] BEFORE HOUSE CALC: Planet {planet_name} - Original House: {original_house}, Longitude: {planet_longitude}", file=sys.stderr)
+                            log.debug("BEFORE HOUSE CALC: Planet {} - Original House: {}, Longitude: {}", planet_name, original_house, planet_longitude)
                             calculated_house = self.calculate_house_from_longitude(planet_longitude, jyotisha_data)
-                            print(f"[DEBUG] AFTER HOUSE CALC: Planet {planet_name} - Calculated House: {calculated_house} (was {original_house})", file=sys.stderr)
-                            
-                            # Cross-validation to ensure accuracy
-                            if hasattr(self, 'current_ascendant_longitude') and self.current_ascendant_longitude:
-                                cross_check_house = self.get_correct_house_from_longitude(planet_longitude, self.current_ascendant_longitude)
-                                if calculated_house != cross_check_house:
-                                    print(f"[ERROR] HOUSE CROSS-VALIDATION FAILED for {planet_name}: Method 1 = {calculated_house}, Method 2 = {cross_check_house}", file=sys.stderr)
-                                else:
-                                    print(f"[DEBUG] ✓ HOUSE CROSS-VALIDATION PASSED for {planet_name}: Both methods = {calculated_house}", file=sys.stderr)
+                            log.debug("AFTER HOUSE CALC: Planet {} - Calculated House: {} (was {})", planet_name, calculated_house, original_house)
                             
                             positions[planet_name] = {
                                 'longitude': planet_longitude,
@@ -573,7 +555,7 @@ class PremiumReportEngine:
                                 'retrograde': planet_data.get('retrograde', False)
                             }
                     except Exception as e:
-                        print(f"Warning: Error processing planet data for {planet_data.get('name', 'Unknown')}: {e}")
+                        log.warning("Warning: Error processing planet data for {}: {}", planet_data.get('name', 'Unknown'), e)
                         continue
                 
                 # Add ascendant information if available
@@ -593,13 +575,13 @@ class PremiumReportEngine:
                         'symbol': 'ASC',
                         'nakshatra': self.get_nakshatra_from_longitude(asc_data['longitude'])
                     }
-                    print(f"Added Jyotisha ascendant to positions: {asc_data['sign']} at {asc_data['longitude']:.2f}°", file=sys.stderr)
-                    print(f"[DEBUG] Stored ascendant longitude for house calculations: {self.current_ascendant_longitude:.2f}°", file=sys.stderr)
+                    log.info("Added Jyotisha ascendant to positions: {} at {:.2f}°", asc_data['sign'], asc_data['longitude'])
+                    log.debug("Stored ascendant longitude for house calculations: {:.2f}°", self.current_ascendant_longitude)
                 
-                print("Using Platform Jyotisha engine for planetary calculations", file=sys.stderr)
+                log.info("Using Platform Jyotisha engine for planetary calculations")
                 return positions
             else:
-                print("Jyotisha engine failed or returned no data - falling back to manual calculations")
+                log.info("Jyotisha engine failed or returned no data - falling back to manual calculations")
                 # Temporarily disable Jyotisha for this call to use fallback
                 self.use_jyotisha = False
         
@@ -608,32 +590,21 @@ class PremiumReportEngine:
         positions = {}
         
         if SWISS_AVAILABLE:
-            # Swiss Ephemeris calculations
-            planet_ids = [0, 1, 4, 2, 5, 3, 6, 11, 12]  # Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn, Rahu, Ketu
-            
-            for i, planet in enumerate(self.PLANETS):
-                try:
-                    if planet in ['Rahu', 'Ketu']:
-                        # Mean Node calculations
-                        pos = swe.calc_ut(jd, planet_ids[i], swe.FLG_SIDEREAL)[0]
-                        if planet == 'Ketu':
-                            pos[0] = (pos[0] + 180) % 360  # Ketu is opposite to Rahu
-                    else:
-                        pos = swe.calc_ut(jd, planet_ids[i], swe.FLG_SIDEREAL)[0]
-                    
-                    # Apply ayanamsa correction
-                    longitude = (pos[0] - self.AYANAMSA) % 360
-                    
-                    positions[planet] = {
-                        'longitude': longitude,
-                        'sign': self.SIGNS[int(longitude // 30)],
-                        'degree': longitude % 30,
-                        'house': self.calculate_house_position(longitude, birth_details),
-                        'symbol': self.PLANET_SYMBOLS[planet]
+            # Sidereal (Lahiri) chart from the shared core, as on the main Jyotisha path
+            try:
+                chart = chart_core.chart(jd, float(birth_details['latitude']), float(birth_details['longitude']))
+                for graha in chart.grahas:
+                    positions[graha.name] = {
+                        'longitude': graha.longitude,
+                        'sign': self.SIGNS[graha.sign],
+                        'degree': graha.degree,
+                        'house': graha.house,
+                        'symbol': self.PLANET_SYMBOLS[graha.name]
                     }
-                except Exception as e:
-                    print(f"Error calculating {planet}: {e}")
-                    # Fallback manual calculation
+            except Exception as e:
+                log.warning("Error calculating chart: {}", e)
+                # Fallback manual calculation
+                for planet in self.PLANETS:
                     positions[planet] = self.manual_planet_calculation(planet, jd)
         else:
             # Manual calculations for all planets
@@ -663,7 +634,7 @@ class PremiumReportEngine:
         longitude = mean_longitudes.get(planet, 0) % 360
         
         # Apply ayanamsa correction
-        longitude = (longitude - self.AYANAMSA) % 360
+        longitude = ayanamsa_service.sidereal(longitude, jd)
         
         # Note: House calculation will be done later with proper ascendant data
         # Don't calculate house here as we don't have ascendant longitude
@@ -696,9 +667,7 @@ class PremiumReportEngine:
             lon = float(birth_details['longitude'])
             
             if SWISS_AVAILABLE:
-                # Swiss Ephemeris house calculation
-                houses = swe.houses_ex(jd, lat, lon, b'P')
-                asc_longitude = (houses[0][0] - self.AYANAMSA) % 360
+                asc_longitude = chart_core.chart(jd, lat, lon).ascendant
             else:
                 # Manual ascendant calculation (simplified)
                 # This is a basic approximation
@@ -708,7 +677,7 @@ class PremiumReportEngine:
                 
             return asc_longitude
         except Exception as e:
-            print(f"Error calculating ascendant: {e}")
+            log.warning("Error calculating ascendant: {}", e)
             return 0.0
     
     def calculate_gmst(self, jd: float) -> float:
@@ -720,7 +689,7 @@ class PremiumReportEngine:
     def analyze_yogas(self, positions: Dict) -> List[Dict]:
         """Comprehensive Yoga analysis using authentic Jyotisha rules"""
         yogas = []
-        print("[DEBUG] Starting comprehensive yoga analysis with authentic Jyotisha logic", file=sys.stderr)
+        log.debug("Starting comprehensive yoga analysis with authentic Jyotisha logic")
         
         # A. Pancha Mahapurusha Yogas
         pancha_yogas = self.check_pancha_mahapurusha_yogas(positions)
@@ -783,53 +752,13 @@ class PremiumReportEngine:
                 'strength': 'Moderate'
             })
         
-        print(f"[DEBUG] Detected {len(yogas)} authentic yogas", file=sys.stderr)
+        log.debug("Detected {} authentic yogas", len(yogas))
         return yogas
     
-    def check_raja_yoga(self, positions: Dict) -> bool:
-        """Check for Raja Yoga formation"""
-        # Simplified check: Look for beneficial planets in kendra/trikona
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]
-        
-        jupiter_house = positions['Jupiter']['house']
-        venus_house = positions['Venus']['house']
-        
-        return (jupiter_house in kendra_houses or jupiter_house in trikona_houses) and \
-               (venus_house in kendra_houses or venus_house in trikona_houses)
-    
-    def check_dhana_yoga(self, positions: Dict) -> bool:
-        """Check for Dhana Yoga formation"""
-        # Simplified: Check for planets in 2nd, 5th, 9th, 11th houses
-        wealth_houses = [2, 5, 9, 11]
-        benefic_planets = ['Jupiter', 'Venus', 'Mercury']
-        
-        for planet in benefic_planets:
-            if positions[planet]['house'] in wealth_houses:
-                return True
-        return False
-    
-    def check_gaja_kesari_yoga(self, positions: Dict) -> bool:
-        """Check for Gaja Kesari Yoga"""
-        jupiter_house = positions['Jupiter']['house']
-        moon_house = positions['Moon']['house']
-        
-        # Check if Jupiter and Moon are in kendra to each other
-        house_diff = abs(jupiter_house - moon_house)
-        return house_diff in [0, 3, 6, 9]
-    
-    def check_chandra_mangal_yoga(self, positions: Dict) -> bool:
-        """Check for Chandra Mangal Yoga"""
-        moon_house = positions['Moon']['house']
-        mars_house = positions['Mars']['house']
-        
-        # Check if Moon and Mars are together or in mutual aspect
-        return moon_house == mars_house or abs(moon_house - mars_house) in [3, 6, 9]
-    
     def analyze_doshas(self, positions: Dict) -> List[Dict]:
         """Comprehensive Dosha analysis using authentic Jyotisha rules"""
         doshas = []
-        print("[DEBUG] Starting comprehensive dosha analysis with authentic Jyotisha logic", file=sys.stderr)
+        log.debug("Starting comprehensive dosha analysis with authentic Jyotisha logic")
         
         # A. Manglik Dosha (Kuja Dosha)
         manglik_result = self.check_manglik_dosha_authentic(positions)
@@ -908,120 +837,57 @@ class PremiumReportEngine:
                 'remedies': ['Chandra mantra', 'Wear pearl or moonstone', 'Donate milk and rice']
             })
         
-        print(f"[DEBUG] Detected {len(doshas)} authentic doshas", file=sys.stderr)
+        log.debug("Detected {} authentic doshas", len(doshas))
         return doshas
     
-    def check_mangal_dosha(self, positions: Dict) -> bool:
-        """Check for Mangal Dosha"""
-        mars_house = positions['Mars']['house']
-        mangal_houses = [1, 2, 4, 7, 8, 12]
-        return mars_house in mangal_houses
-    
-    def check_kaal_sarp_dosha(self, positions: Dict) -> bool:
-        """Check for Kaal Sarp Dosha"""
-        rahu_house = positions['Rahu']['house']
-        ketu_house = positions['Ketu']['house']
-        
-        # Check if all other planets are between Rahu and Ketu
-        other_planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
-        
-        if rahu_house < ketu_house:
-            range_houses = list(range(rahu_house, ketu_house + 1))
-        else:
-            range_houses = list(range(rahu_house, 13)) + list(range(1, ketu_house + 1))
-        
-        planets_in_range = sum(1 for planet in other_planets 
-                              if positions[planet]['house'] in range_houses)
-        
-        return planets_in_range == len(other_planets)
-    
     # ============= COMPREHENSIVE YOGA DETECTION FUNCTIONS =============
+    # The conditions themselves live in yoga-rules.json (rules and named
+    # conditions); these methods only shape the report entries.
+    
+    def yoga_board(self, positions: Dict) -> 'yoga_rules.ChartBoard':
+        """Chart encoding for yoga_rules, keeping the report's whole-sign house numbers"""
+        return yoga_rules.board_from_positions(positions, positions.get('Ascendant', {}).get('longitude'))
     
     def check_pancha_mahapurusha_yogas(self, positions: Dict) -> List[Dict]:
         """Check for Pancha Mahapurusha Yogas"""
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
-        
-        # Ruchaka Yoga - Mars
-        mars_house = positions['Mars']['house']
-        mars_sign = positions['Mars']['sign']
-        if mars_house in kendra_houses and mars_sign in ['Mesha', 'Vrishchika', 'Makara']:  # Own/Exaltation
-            yogas.append({
-                'name': 'Ruchaka Yoga',
-                'planets_involved': ['Mars'],
-                'house_position': f"Mars in {mars_house} house, {mars_sign}",
-                'description': 'Mars in Kendra in own sign or exaltation',
-                'effect': 'Gives courage, leadership qualities, and success in military or sports',
-                'strength': 'Dynamic'
-            })
-        
-        # Bhadra Yoga - Mercury
-        mercury_house = positions['Mercury']['house']
-        mercury_sign = positions['Mercury']['sign']
-        if mercury_house in kendra_houses and mercury_sign in ['Mithuna', 'Kanya']:  # Own signs
-            yogas.append({
-                'name': 'Bhadra Yoga',
-                'planets_involved': ['Mercury'],
-                'house_position': f"Mercury in {mercury_house} house, {mercury_sign}",
-                'description': 'Mercury in Kendra in own sign',
-                'effect': 'Bestows intelligence, eloquence, and success in communication fields',
-                'strength': 'Dynamic'
-            })
-        
-        # Hamsa Yoga - Jupiter
-        jupiter_house = positions['Jupiter']['house']
-        jupiter_sign = positions['Jupiter']['sign']
-        if jupiter_house in kendra_houses and jupiter_sign in ['Dhanu', 'Meena', 'Karka']:  # Own/Exaltation
-            yogas.append({
-                'name': 'Hamsa Yoga',
-                'planets_involved': ['Jupiter'],
-                'house_position': f"Jupiter in {jupiter_house} house, {jupiter_sign}",
-                'description': 'Jupiter in Kendra in own sign or exaltation',
-                'effect': 'Brings wisdom, spiritual knowledge, and respected position in society',
-                'strength': 'Dynamic'
-            })
-        
-        # Malavya Yoga - Venus
-        venus_house = positions['Venus']['house']
-        venus_sign = positions['Venus']['sign']
-        if venus_house in kendra_houses and venus_sign in ['Vrishabha', 'Tula', 'Meena']:  # Own/Exaltation
-            yogas.append({
-                'name': 'Malavya Yoga',
-                'planets_involved': ['Venus'],
-                'house_position': f"Venus in {venus_house} house, {venus_sign}",
-                'description': 'Venus in Kendra in own sign or exaltation',
-                'effect': 'Provides luxury, artistic talents, and harmonious relationships',
-                'strength': 'Dynamic'
-            })
+        board = self.yoga_board(positions)
+        
+        pancha_mahapurusha = [
+            ('Ruchaka Yoga', 'Ruchaka Yoga', 'Mars', 'Mars in Kendra in own sign or exaltation',
+             'Gives courage, leadership qualities, and success in military or sports'),
+            ('Bhadra Yoga', 'Bhadra Yoga', 'Mercury', 'Mercury in Kendra in own sign',
+             'Bestows intelligence, eloquence, and success in communication fields'),
+            ('Hamsa Yoga', 'Hamsa Yoga', 'Jupiter', 'Jupiter in Kendra in own sign or exaltation',
+             'Brings wisdom, spiritual knowledge, and respected position in society'),
+            ('Malavya Yoga', 'Malavya Yoga', 'Venus', 'Venus in Kendra in own sign or exaltation',
+             'Provides luxury, artistic talents, and harmonious relationships'),
+            ('Sasa Yoga', 'Shasha Yoga', 'Saturn', 'Saturn in Kendra in own sign or exaltation',
+             'Grants authority, organizational skills, and success through perseverance')
+        ]
         
-        # Shasha Yoga - Saturn
-        saturn_house = positions['Saturn']['house']
-        saturn_sign = positions['Saturn']['sign']
-        if saturn_house in kendra_houses and saturn_sign in ['Makara', 'Kumbha', 'Tula']:  # Own/Exaltation
-            yogas.append({
-                'name': 'Shasha Yoga',
-                'planets_involved': ['Saturn'],
-                'house_position': f"Saturn in {saturn_house} house, {saturn_sign}",
-                'description': 'Saturn in Kendra in own sign or exaltation',
-                'effect': 'Grants authority, organizational skills, and success through perseverance',
-                'strength': 'Dynamic'
-            })
+        for rule, name, planet, description, effect in pancha_mahapurusha:
+            if yoga_rules.holds(board, rule):
+                yogas.append({
+                    'name': name,
+                    'planets_involved': [planet],
+                    'house_position': f"{planet} in {positions[planet]['house']} house, {positions[planet]['sign']}",
+                    'description': description,
+                    'effect': effect,
+                    'strength': 'Dynamic'
+                })
         
         return yogas
     
     def check_raja_yogas_authentic(self, positions: Dict) -> List[Dict]:
         """Check for authentic Raja Yogas - Kendra-Trikona combinations"""
         yogas = []
-        kendra_houses = [1, 4, 7, 10]
-        trikona_houses = [1, 5, 9]
-        
-        # Check for Kendra-Trikona lord connections
+        board = self.yoga_board(positions)
         jupiter_house = positions['Jupiter']['house']
         venus_house = positions['Venus']['house']
         
         # Jupiter-Venus Raja Yoga
-        if (jupiter_house in kendra_houses and venus_house in trikona_houses) or \
-           (jupiter_house in trikona_houses and venus_house in kendra_houses):
+        if yoga_rules.holds(board, 'Jupiter-Venus Raja Yoga'):
             yogas.append({
                 'name': 'Jupiter-Venus Raja Yoga',
                 'planets_involved': ['Jupiter', 'Venus'],
@@ -1031,15 +897,12 @@ class PremiumReportEngine:
                 'strength': 'Dynamic'
             })
         
-        # Lagna Lord + 9th Lord association (simplified check)
-        moon_house = positions['Moon']['house']  # Assuming Moon represents fortune
-        sun_house = positions['Sun']['house']    # Assuming Sun represents authority
-        
-        if abs(moon_house - sun_house) <= 1:  # Close association
+        # Moon within one house of the Sun: luminaries of fortune and authority together
+        if yoga_rules.holds(board, 'Lagna-Bhagya Raja Yoga'):
             yogas.append({
                 'name': 'Lagna-Bhagya Raja Yoga',
                 'planets_involved': ['Sun', 'Moon'],
-                'house_position': f"Sun in {sun_house}, Moon in {moon_house}",
+                'house_position': f"Sun in {positions['Sun']['house']}, Moon in {positions['Moon']['house']}",
                 'description': 'Close association of luminaries indicating fortune and authority',
                 'effect': 'Provides leadership qualities and fortunate circumstances',
                 'strength': 'Moderate'
@@ -1050,36 +913,27 @@ class PremiumReportEngine:
     def check_dhana_yogas_authentic(self, positions: Dict) -> List[Dict]:
         """Check for authentic Dhana Yogas - Wealth combinations"""
         yogas = []
+        board = self.yoga_board(positions)
         wealth_houses = [2, 5, 9, 11]
         
-        # Count benefics in wealth houses
-        benefic_in_wealth = 0
-        benefic_planets = []
-        
-        for planet in ['Jupiter', 'Venus', 'Mercury']:
-            if positions[planet]['house'] in wealth_houses:
-                benefic_in_wealth += 1
-                benefic_planets.append(planet)
-        
-        if benefic_in_wealth >= 2:
+        if yoga_rules.holds(board, 'Multi-Planet Dhana Yoga'):
+            benefic_planets = [planet for planet in ['Jupiter', 'Venus', 'Mercury']
+                               if positions[planet]['house'] in wealth_houses]
             yogas.append({
                 'name': 'Multi-Planet Dhana Yoga',
                 'planets_involved': benefic_planets,
                 'house_position': f"Multiple benefics in wealth houses",
                 'description': f"{len(benefic_planets)} benefic planets in 2nd, 5th, 9th, or 11th houses",
                 'effect': 'Indicates multiple sources of wealth and financial prosperity',
-                'strength': 'Dynamic' if benefic_in_wealth >= 3 else 'Moderate'
+                'strength': 'Dynamic' if yoga_rules.holds(board, 'Multi-Planet Dhana Yoga (all three)') else 'Moderate'
             })
         
         # Venus-Jupiter Dhana Yoga
-        venus_house = positions['Venus']['house']
-        jupiter_house = positions['Jupiter']['house']
-        
-        if venus_house in wealth_houses and jupiter_house in wealth_houses:
+        if yoga_rules.holds(board, 'Venus-Jupiter Dhana Yoga'):
             yogas.append({
                 'name': 'Venus-Jupiter Dhana Yoga',
                 'planets_involved': ['Venus', 'Jupiter'],
-                'house_position': f"Venus in {venus_house}, Jupiter in {jupiter_house}",
+                'house_position': f"Venus in {positions['Venus']['house']}, Jupiter in {positions['Jupiter']['house']}",
                 'description': 'Both benefic giants in wealth-giving houses',
                 'effect': 'Exceptional wealth, luxury, and material comforts',
                 'strength': 'Dynamic'
@@ -1088,81 +942,46 @@ class PremiumReportEngine:
         return yogas
     
     def check_gaja_kesari_yoga_authentic(self, positions: Dict) -> bool:
-        """Authentic Gaja Kesari Yoga check"""
-        jupiter_house = positions['Jupiter']['house']
-        moon_house = positions['Moon']['house']
-        
-        # Check if Jupiter and Moon are in kendra to each other or same house
-        if jupiter_house == moon_house:
-            return True
-        
-        house_diff = abs(jupiter_house - moon_house)
-        return house_diff in [3, 6, 9]  # Kendra relationship
+        """Authentic Gaja Kesari Yoga check - Jupiter in a kendra from the Moon"""
+        return yoga_rules.holds(self.yoga_board(positions), 'Gaja Kesari Yoga')
     
     def check_budha_aditya_yoga(self, positions: Dict) -> bool:
         """Check for Budha Aditya Yoga - Sun Mercury conjunction"""
-        sun_house = positions['Sun']['house']
-        mercury_house = positions['Mercury']['house']
-        return sun_house == mercury_house
+        return yoga_rules.holds(self.yoga_board(positions), 'Budhaditya Yoga')
     
     def check_chandra_mangal_yoga_authentic(self, positions: Dict) -> bool:
-        """Authentic Chandra Mangal Yoga check"""
-        moon_house = positions['Moon']['house']
-        mars_house = positions['Mars']['house']
-        
-        # Conjunction or mutual aspect
-        return moon_house == mars_house or abs(moon_house - mars_house) in [3, 6, 9]
+        """Authentic Chandra Mangal Yoga check - conjunction or mutual aspect"""
+        return yoga_rules.holds(self.yoga_board(positions), 'Chandra Mangal Yoga')
     
-    def check_neechabhanga_raja_yoga(self, positions: Dict) -> Dict:
-        """Check for Neechabhanga Raja Yoga"""
-        # Debilitation signs
-        debilitation_signs = {
-            'Sun': 'Tula', 'Moon': 'Vrishchika', 'Mars': 'Karka',
-            'Mercury': 'Meena', 'Jupiter': 'Makara', 'Venus': 'Kanya', 'Saturn': 'Mesha'
-        }
-        
-        for planet, debil_sign in debilitation_signs.items():
-            if positions[planet]['sign'] == debil_sign:
-                # Simplified check - if debilitated planet is in kendra
-                if positions[planet]['house'] in [1, 4, 7, 10]:
-                    return {
-                        'name': 'Neechabhanga Raja Yoga',
-                        'planets_involved': [planet],
-                        'house_position': f"{planet} in {positions[planet]['house']} house",
-                        'description': f'{planet} debilitated but in Kendra, canceling negative effects',
-                        'effect': 'Transforms debilitation into strength and success',
-                        'strength': 'Dynamic'
-                    }
+    def check_neechabhanga_raja_yoga(self, positions: Dict) -> Optional[Dict]:
+        """Check for Neechabhanga Raja Yoga - a debilitated graha whose debilitation is cancelled"""
+        board = self.yoga_board(positions)
+        for planet in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']:
+            if yoga_rules.holds(board, {'neecha_bhanga': {'planets': [planet]}}):
+                return {
+                    'name': f"{planet} Neechabhanga Raja Yoga",
+                    'description': f"{planet} debilitation cancelled, brings eventual success through challenges"
+                }
         return None
     
     def check_amala_yoga(self, positions: Dict) -> bool:
-        """Check for Amala Yoga - Benefic in 10th house"""
-        benefics = ['Jupiter', 'Venus', 'Mercury']
-        for planet in benefics:
-            if positions[planet]['house'] == 10:
-                return True
-        return False
+        """Check for Amala Yoga - benefic in 10th house"""
+        return yoga_rules.holds(self.yoga_board(positions), 'Benefic in 10th from Lagna')
     
     def get_benefics_in_10th(self, positions: Dict) -> List[str]:
         """Get list of benefics in 10th house"""
-        benefics = ['Jupiter', 'Venus', 'Mercury']
-        return [planet for planet in benefics if positions[planet]['house'] == 10]
+        return [planet for planet in ['Jupiter', 'Venus', 'Mercury', 'Moon'] if positions[planet]['house'] == 10]
     
     # ============= COMPREHENSIVE DOSHA DETECTION FUNCTIONS =============
     
     def check_manglik_dosha_authentic(self, positions: Dict) -> Dict:
         """Comprehensive Manglik Dosha check from Lagna and Moon"""
+        board = self.yoga_board(positions)
         mars_house = positions['Mars']['house']
-        moon_house = positions['Moon']['house']
-        manglik_houses = [1, 2, 4, 7, 8, 12]
-        
-        # Check from Lagna
-        manglik_from_lagna = mars_house in manglik_houses
-        
-        # Check from Moon
-        mars_from_moon = ((mars_house - moon_house) % 12) + 1
-        manglik_from_moon = mars_from_moon in manglik_houses
+        mars_from_moon = ((mars_house - positions['Moon']['house']) % 12) + 1
         
+        manglik_from_lagna = yoga_rules.holds(board, 'Manglik from Lagna')
+        manglik_from_moon = yoga_rules.holds(board, 'Manglik from Moon')
         is_manglik = manglik_from_lagna or manglik_from_moon
         
         severity = 'None'
@@ -1207,38 +1026,19 @@ class PremiumReportEngine:
     
     def check_kaal_sarp_dosha_authentic(self, positions: Dict) -> Dict:
         """Comprehensive Kaal Sarp Dosha check using longitude"""
-        rahu_longitude = positions['Rahu']['longitude']
-        ketu_longitude = positions['Ketu']['longitude']
-        
-        # Get all other planets
-        other_planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
-        
-        # Check if all planets are between Rahu and Ketu
-        planets_between = 0
-        
-        for planet in other_planets:
-            planet_longitude = positions[planet]['longitude']
-            
-            # Check if planet is between Rahu and Ketu
-            if rahu_longitude < ketu_longitude:
-                # Direct arc
-                if rahu_longitude <= planet_longitude <= ketu_longitude:
-                    planets_between += 1
-            else:
-                # Wrap-around arc
-                if planet_longitude >= rahu_longitude or planet_longitude <= ketu_longitude:
-                    planets_between += 1
-        
-        is_kaal_sarp = planets_between == len(other_planets)
+        hemming = arc_geometry.kaal_sarp(positions)
         
         return {
-            'present': is_kaal_sarp,
-            'planets_between': planets_between,
-            'total_planets': len(other_planets)
+            'present': yoga_rules.holds(self.yoga_board(positions), 'Kaal Sarp Dosha'),
+            'type': hemming.status,
+            'side': hemming.side,
+            'planets_between': max(hemming.ahead, hemming.behind),
+            'total_planets': len(arc_geometry.KAAL_SARP_GRAHAS)
         }
     
     def check_pitra_dosha_authentic(self, positions: Dict) -> Dict:
         """Comprehensive Pitra Dosha check"""
+        board = self.yoga_board(positions)
         sun_house = positions['Sun']['house']
         rahu_house = positions['Rahu']['house']
         ketu_house = positions['Ketu']['house']
@@ -1246,23 +1046,19 @@ class PremiumReportEngine:
         formations = []
         affecting_planets = []
         
-        # Sun conjunct Rahu
-        if sun_house == rahu_house:
+        if yoga_rules.holds(board, 'Sun conjunct Rahu'):
             formations.append('Sun conjunct Rahu')
             affecting_planets.extend(['Sun', 'Rahu'])
         
-        # Sun conjunct Ketu
-        if sun_house == ketu_house:
+        if yoga_rules.holds(board, 'Sun conjunct Ketu'):
             formations.append('Sun conjunct Ketu')
             affecting_planets.extend(['Sun', 'Ketu'])
         
-        # Rahu in 1st, 5th, 9th from Lagna
-        if rahu_house in [1, 5, 9]:
+        if yoga_rules.holds(board, 'Rahu in 1st, 5th or 9th'):
             formations.append(f'Rahu in {rahu_house} house')
             affecting_planets.append('Rahu')
         
-        # Ketu in 1st, 5th, 9th from Lagna
-        if ketu_house in [1, 5, 9]:
+        if yoga_rules.holds(board, 'Ketu in 1st, 5th or 9th'):
             formations.append(f'Ketu in {ketu_house} house')
             affecting_planets.append('Ketu')
         
@@ -1278,78 +1074,39 @@ class PremiumReportEngine:
         }
     
     def check_grahan_dosha(self, positions: Dict) -> Dict:
-        """Check for Grahan Dosha - Eclipse combinations"""
-        sun_house = positions['Sun']['house']
-        moon_house = positions['Moon']['house']
-        rahu_house = positions['Rahu']['house']
-        ketu_house = positions['Ketu']['house']
+        """Check for Grahan Dosha - Eclipse combinations, first match wins"""
+        board = self.yoga_board(positions)
+        
+        grahan_types = [
+            ('Sun conjunct Rahu', 'Surya Grahan Dosha', 'Sun'),
+            ('Moon conjunct Rahu', 'Chandra Grahan Dosha', 'Moon'),
+            ('Sun conjunct Ketu', 'Surya-Ketu Grahan Dosha', 'Sun'),
+            ('Moon conjunct Ketu', 'Chandra-Ketu Grahan Dosha', 'Moon')
+        ]
         
-        grahan_type = None
-        formation = None
-        house_involved = None
-        
-        # Surya Grahan Yoga (Sun + Rahu)
-        if sun_house == rahu_house:
-            grahan_type = 'Surya Grahan Dosha'
-            formation = 'Sun conjunct Rahu'
-            house_involved = sun_house
-        
-        # Chandra Grahan Yoga (Moon + Rahu)
-        elif moon_house == rahu_house:
-            grahan_type = 'Chandra Grahan Dosha'
-            formation = 'Moon conjunct Rahu'
-            house_involved = moon_house
-        
-        # Sun + Ketu
-        elif sun_house == ketu_house:
-            grahan_type = 'Surya-Ketu Grahan Dosha'
-            formation = 'Sun conjunct Ketu'
-            house_involved = sun_house
-        
-        # Moon + Ketu
-        elif moon_house == ketu_house:
-            grahan_type = 'Chandra-Ketu Grahan Dosha'
-            formation = 'Moon conjunct Ketu'
-            house_involved = moon_house
+        for formation, grahan_type, luminary in grahan_types:
+            if yoga_rules.holds(board, formation):
+                return {
+                    'present': True,
+                    'type': grahan_type,
+                    'formation': formation,
+                    'house': positions[luminary]['house']
+                }
         
         return {
-            'present': grahan_type is not None,
-            'type': grahan_type,
-            'formation': formation,
-            'house': house_involved
+            'present': False,
+            'type': None,
+            'formation': None,
+            'house': None
         }
     
     def check_shrapit_dosha(self, positions: Dict) -> bool:
-        """Check for Shrapit Dosha - Saturn Rahu combination"""
-        saturn_house = positions['Saturn']['house']
-        rahu_house = positions['Rahu']['house']
-        
-        # Conjunction or mutual aspect
-        return saturn_house == rahu_house or abs(saturn_house - rahu_house) in [3, 6, 9]
+        """Check for Shrapit Dosha - Saturn Rahu conjunction or mutual aspect"""
+        return yoga_rules.holds(self.yoga_board(positions), 'Shrapit Dosha by kendra')
     
     def check_kemadruma_dosha(self, positions: Dict) -> bool:
-        """Check for Kemadruma Dosha - Moon isolation"""
-        moon_house = positions['Moon']['house']
-        
-        # Houses 2nd and 12th from Moon
-        second_from_moon = (moon_house % 12) + 1
-        twelfth_from_moon = ((moon_house - 2) % 12) + 1
-        
-        # Check if any planet is in 2nd or 12th from Moon
-        for planet in ['Sun', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']:
-            planet_house = positions[planet]['house']
-            if planet_house in [second_from_moon, twelfth_from_moon]:
-                return False  # Not Kemadruma
-        
-        return True  # Moon is isolated
-    
-    def check_pitra_dosha(self, positions: Dict) -> bool:
-        """Check for Pitra Dosha"""
-        sun_house = positions['Sun']['house']
-        rahu_house = positions['Rahu']['house']
-        
-        # Simplified check: Sun and Rahu in same house or mutual aspect
-        return sun_house == rahu_house or abs(sun_house - rahu_house) in [3, 6, 9]
+        """Check for Kemadruma Dosha - no graha in the 2nd or 12th from the Moon"""
+        return yoga_rules.holds(self.yoga_board(positions), 'Moon without neighbours')
     
     def get_dynamic_mangal_remedies(self, mars_house: int) -> List[str]:
         """Get dynamic remedies based on Mars house position"""
@@ -1549,10 +1306,8 @@ class PremiumReportEngine:
         if self.check_gaja_kesari_yoga_authentic(positions):
             yogas.append("Gaja Kesari Yoga - Jupiter-Moon combination provides leadership and respect")
         
-        # 3. Rajya Poojit Yoga (simplified check)
-        jupiter_house = positions.get('Jupiter', {}).get('house', 0)
-        venus_house = positions.get('Venus', {}).get('house', 0)
-        if jupiter_house == 10 and venus_house in [1, 4, 7, 10]:
+        # 3. Rajya Poojit Yoga
+        if yoga_rules.holds(self.yoga_board(positions), 'Rajya Poojit Yoga'):
             yogas.append("Rajya Poojit Yoga - Jupiter in 10th with Venus in Kendra brings public success")
         
         # 4. Neechabhanga Raja Yoga
@@ -1990,7 +1745,7 @@ class PremiumReportEngine:
     def analyze_wealth_and_finances_authentic(self, positions: Dict, ascendant_sign: int) -> Dict:
         """Analyze wealth and finances using authentic Jyotisha calculations"""
         try:
-            print(f"[DEBUG] 🔍 WEALTH ANALYSIS - Ascendant Sign: {ascendant_sign}", file=sys.stderr)
+            log.debug("🔍 WEALTH ANALYSIS - Ascendant Sign: {}", ascendant_sign)
             
             # Step 1: Get wealth house lords
             second_house_sign = (ascendant_sign + 1) % 12 + 1 if (ascendant_sign + 1) % 12 != 0 else 12
@@ -2001,7 +1756,7 @@ class PremiumReportEngine:
             fifth_lord = self.get_sign_lord(fifth_house_sign)
             eleventh_lord = self.get_sign_lord(eleventh_house_sign)
             
-            print(f"[DEBUG] 🔍 WEALTH LORDS - 2nd: {second_lord}, 5th: {fifth_lord}, 11th: {eleventh_lord}", file=sys.stderr)
+            log.debug("🔍 WEALTH LORDS - 2nd: {}, 5th: {}, 11th: {}", second_lord, fifth_lord, eleventh_lord)
             
             # Get house placements
             second_lord_data = positions.get(second_lord, {})
@@ -2014,11 +1769,11 @@ class PremiumReportEngine:
             
             # Step 2: Detect Dhana Yogas
             dhana_yogas = self.detect_dhana_yogas_authentic(positions, second_lord, fifth_lord, eleventh_lord)
-            print(f"[DEBUG] 🔍 DHANA YOGAS - {len(dhana_yogas)} yogas detected", file=sys.stderr)
+            log.debug("🔍 DHANA YOGAS - {} yogas detected", len(dhana_yogas))
             
             # Step 3: Analyze income sources
             income_sources = self.analyze_income_sources_authentic(second_lord, eleventh_lord, positions)
-            print(f"[DEBUG] 🔍 INCOME SOURCES - Primary: {income_sources['primary_source'][:50]}...", file=sys.stderr)
+            log.debug("🔍 INCOME SOURCES - Primary: {}...", income_sources['primary_source'][:50])
             
             # Step 4: Investment analysis
             investment_analysis = self.analyze_investment_potential_authentic(positions, fifth_lord)
@@ -2052,11 +1807,11 @@ class PremiumReportEngine:
                 }
             }
             
-            print(f"[DEBUG] 🔍 FINAL WEALTH RESULT - Score: {wealth_score}, Yogas: {len(dhana_yogas)}", file=sys.stderr)
+            log.debug("🔍 FINAL WEALTH RESULT - Score: {}, Yogas: {}", wealth_score, len(dhana_yogas))
             return result
             
         except Exception as e:
-            print(f"[DEBUG] ❌ Wealth analysis error: {str(e)}", file=sys.stderr)
+            log.warning("❌ Wealth analysis error: {}", e)
             return {
                 'title': '16. Wealth & Finances - Error in Analysis',
                 'error': f'Error in wealth analysis: {str(e)}',
@@ -2380,65 +2135,20 @@ class PremiumReportEngine:
         
         return min(100, max(0, base_score))
     
-    def check_amala_yoga(self, positions: Dict) -> bool:
-        """Check for Amala Yoga - benefic in 10th house"""
-        benefics = ['Jupiter', 'Venus', 'Mercury', 'Moon']
-        for benefic in benefics:
-            if positions.get(benefic, {}).get('house') == 10:
-                return True
-        return False
-    
-    def get_benefics_in_10th(self, positions: Dict) -> list:
-        """Get benefics in 10th house"""
-        benefics = ['Jupiter', 'Venus', 'Mercury', 'Moon']
-        tenth_house_benefics = []
-        for benefic in benefics:
-            if positions.get(benefic, {}).get('house') == 10:
-                tenth_house_benefics.append(benefic)
-        return tenth_house_benefics
-    
-    def check_gaja_kesari_yoga_authentic(self, positions: Dict) -> bool:
-        """Check for authentic Gaja Kesari Yoga"""
-        jupiter_house = positions.get('Jupiter', {}).get('house', 0)
-        moon_house = positions.get('Moon', {}).get('house', 0)
-        
-        # Jupiter and Moon in Kendras from each other
-        if abs(jupiter_house - moon_house) in [0, 3, 6, 9]:
-            return True
-        return False
-    
-    def check_neechabhanga_raja_yoga(self, positions: Dict) -> dict:
-        """Check for Neechabhanga Raja Yoga"""
-        # Simplified check for debilitated planets with cancellation
-        debilitation_signs = {
-            'Sun': 'Tula', 'Moon': 'Vrishchika', 'Mars': 'Karka',
-            'Mercury': 'Meena', 'Jupiter': 'Makara', 'Venus': 'Kanya', 'Saturn': 'Mesha'
-        }
-        
-        for planet, sign_data in positions.items():
-            if planet in debilitation_signs:
-                planet_sign = sign_data.get('sign', '')
-                if planet_sign == debilitation_signs[planet]:
-                    # Check for cancellation factors (simplified)
-                    return {
-                        'name': f"{planet} Neechabhanga Raja Yoga",
-                        'description': f"{planet} debilitation cancelled, brings eventual success through challenges"
-                    }
-        return None
-    
     def calculate_dasha_periods(self, birth_details: Dict, positions: Dict) -> Dict:
         """Calculate authentic Vimshottari Dasha periods using the new timeline system"""
-        print("[DEBUG] Using authentic Vimshottari Dasha timeline integration", file=sys.stderr)
+        log.debug("Using authentic Vimshottari Dasha timeline integration")
         
         try:
             # Call the authentic dasha timeline calculation
+            location = self.resolve_birth_location(birth_details)
             dasha_data = {
                 "name": birth_details.get('name', 'User'),
                 "date": birth_details.get('date', '1980-01-01'),
                 "time": birth_details.get('time', '12:00'),
-                "place": birth_details.get('place', 'Chennai'),
-                "latitude": birth_details.get('latitude', 13.0827),
-                "longitude": birth_details.get('longitude', 80.2707)
+                "place": location['place'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude']
             }
             
             # Import required modules for subprocess call
@@ -2448,7 +2158,7 @@ class PremiumReportEngine:
             
             # Call authentic dasha timeline Python script
             pythonProcess = subprocess.run([
-                process.env.PYTHON3,
+                sys.executable,
                 str(Path(__file__).parent / 'authentic-dasha-timeline.py')
             ], 
             input=json.dumps(dasha_data), 
@@ -2458,15 +2168,15 @@ class PremiumReportEngine:
             )
             
             if pythonProcess.returncode != 0:
-                print(f"[DEBUG] Authentic dasha timeline failed: {pythonProcess.stderr}", file=sys.stderr)
+                log.debug("Authentic dasha timeline failed: {}", pythonProcess.stderr)
                 raise Exception("Authentic dasha timeline calculation failed")
             
             # Parse the authentic dasha timeline result
             try:
                 authentic_result = json.loads(pythonProcess.stdout)
-                print(f"[DEBUG] Authentic dasha timeline result received successfully", file=sys.stderr)
+                log.debug("Authentic dasha timeline result received successfully")
             except json.JSONDecodeError as e:
-                print(f"[DEBUG] Failed to parse authentic dasha timeline output: {e}", file=sys.stderr)
+                log.warning("Failed to parse authentic dasha timeline output: {}", e)
                 raise Exception("Failed to parse authentic dasha timeline result")
             
             if not authentic_result.get('success'):
@@ -2514,8 +2224,8 @@ class PremiumReportEngine:
             else:
                 current_period = 'Current period'
             
-            print(f"[DEBUG] Authentic current dasha: {current_lord}", file=sys.stderr)
-            print(f"[DEBUG] Authentic current period: {current_period}", file=sys.stderr)
+            log.debug("Authentic current dasha: {}", current_lord)
+            log.debug("Authentic current period: {}", current_period)
             
             return {
                 'birth_nakshatra': 1,  # Will be calculated from authentic result if needed
@@ -2529,8 +2239,8 @@ class PremiumReportEngine:
             }
             
         except Exception as e:
-            print(f"[DEBUG] Authentic dasha timeline integration failed: {str(e)}", file=sys.stderr)
-            print(f"[DEBUG] Falling back to Moon longitude calculation", file=sys.stderr)
+            log.debug("Authentic dasha timeline integration failed: {}", e)
+            log.debug("Falling back to Moon longitude calculation")
         
             # Fallback to Moon nakshatra-based authentic calculation
             moon_longitude = positions.get('Moon', {}).get('longitude', 0)
@@ -2575,8 +2285,8 @@ class PremiumReportEngine:
                 else:
                     years_elapsed += duration
             
-            print(f"[DEBUG] Birth nakshatra: {nakshatra_number + 1}, Birth lord: {birth_lord}", file=sys.stderr)
-            print(f"[DEBUG] At age {age:.1f}, current Mahadasha: {current_lord}", file=sys.stderr)
+            log.debug("Birth nakshatra: {}, Birth lord: {}", nakshatra_number + 1, birth_lord)
+            log.debug("At age {:.1f}, current Mahadasha: {}", age, current_lord)
             
             return {
                 'birth_nakshatra': nakshatra_number + 1,
@@ -3407,7 +3117,7 @@ This authentic calculation considers the primary ruling planets of your ascendan
         if 'Ascendant' in positions:
             ascendant_sign = positions['Ascendant'].get('sign', 'Unknown')
         
-        print(f"[DEBUG] North Indian Chart - Ascendant Sign: {ascendant_sign}")
+        log.debug("North Indian Chart - Ascendant Sign: {}", ascendant_sign)
         
         # Zodiac signs mapped to their English equivalents
         sign_map = {
@@ -3486,7 +3196,7 @@ This authentic calculation considers the primary ruling planets of your ascendan
             if planet != 'Ascendant':
                 house = data.get('house', 1)
                 longitude = data.get('longitude', 0)
-                print(f"[DEBUG] North Indian Chart - Planet {planet}: House {house}, Sign {data.get('sign', 'Unknown')}, Longitude {longitude}°")
+                log.debug("North Indian Chart - Planet {}: House {}, Sign {}, Longitude {}°", planet, house, data.get('sign', 'Unknown'), longitude)
                 planets_by_house[house].append({'name': planet, 'data': data})
         
         # House center positions - matching Birth Chart section exactly
@@ -3909,17 +3619,17 @@ This authentic calculation considers the primary ruling planets of your ascendan
     def generate_complete_report(self, birth_details: Dict) -> Dict:
         """Generate complete premium horoscope report"""
         try:
-            print(f"[DEBUG] Starting premium report generation for: {birth_details.get('name', 'Unknown')}", file=sys.stderr)
-            print(f"[DEBUG] Birth details: {birth_details.get('date')} {birth_details.get('time')} at {birth_details.get('place')}", file=sys.stderr)
+            log.debug("Starting premium report generation for: {}", birth_details.get('name', 'Unknown'))
+            log.debug("Birth details: {} {} at {}", birth_details.get('date'), birth_details.get('time'), birth_details.get('place'))
             
             # Get Platform API data first
-            print(f"[DEBUG] Step 1: Getting Jyotisha data...", file=sys.stderr)
+            log.debug("Step 1: Getting Jyotisha data...")
             jyotisha_data = self.get_jyotisha_data(birth_details)
             
             # Validate that we have authentic data from the API
             if not jyotisha_data:
                 error_msg = "Failed to retrieve authentic planetary data from Jyotisha API. Cannot generate premium report without astronomical calculations."
-                print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                log.error(error_msg)
                 raise AuthenticDataError(error_msg)
             
             # Validate the essential planetary data structure (but allow missing dasha data)
@@ -3939,62 +3649,63 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 if missing_planets:
                     raise DataValidationError(f"Missing essential planets from Jyotisha API: {', '.join(missing_planets)}")
                 
-                print(f"[DEBUG] ✓ Jyotisha essential data validation passed", file=sys.stderr)
+                log.debug("✓ Jyotisha essential data validation passed")
                 
             except (DataValidationError, AuthenticDataError) as e:
                 error_msg = f"Jyotisha API data validation failed: {str(e)}"
-                print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                log.error(error_msg)
                 raise AuthenticDataError(error_msg)
             
-            print(f"[DEBUG] ✓ Step 1 completed", file=sys.stderr)
+            log.debug("✓ Step 1 completed")
             
             # Calculate all chart data
-            print(f"[DEBUG] Step 2: Calculating planetary positions...", file=sys.stderr)
+            log.debug("Step 2: Calculating planetary positions...")
             positions = self.calculate_planetary_positions(birth_details)
-            print(f"[DEBUG] ✓ Step 2 completed, positions type: {type(positions)}", file=sys.stderr)
+            log.debug("✓ Step 2 completed, positions type: {}", type(positions))
             
             # Use Platform API ascendant if available, otherwise calculate manually
-            print(f"[DEBUG] Step 3: Processing ascendant data...", file=sys.stderr)
+            log.debug("Step 3: Processing ascendant data...")
             if jyotisha_data and jyotisha_data.get('ascendant'):
                 ascendant_data = jyotisha_data['ascendant']
                 ascendant_longitude = ascendant_data['longitude']
                 ascendant_sign = ascendant_data['sign']
-                print(f"[DEBUG] ✓ USING PLATFORM API ASCENDANT: {ascendant_sign} at {ascendant_longitude:.2f}°", file=sys.stderr)
-                print(f"[DEBUG] Platform API success: Data consistency maintained", file=sys.stderr)
+                log.debug("✓ USING PLATFORM API ASCENDANT: {} at {:.2f}°", ascendant_sign, ascendant_longitude)
+                log.debug("Platform API success: Data consistency maintained")
             else:
                 ascendant_longitude = self.calculate_ascendant(birth_details)
                 ascendant_sign = self.SIGNS[int(ascendant_longitude // 30)]
-                print(f"[DEBUG] ⚠ USING MANUAL ASCENDANT CALCULATION: {ascendant_sign} at {ascendant_longitude:.2f}°", file=sys.stderr)
-                print(f"[DEBUG] Warning: Platform API unavailable, using fallback calculation", file=sys.stderr)
-            print(f"[DEBUG] ✓ Step 3 completed", file=sys.stderr)
+                log.debug("⚠ USING MANUAL ASCENDANT CALCULATION: {} at {:.2f}°", ascendant_sign, ascendant_longitude)
+                log.warning("Warning: Platform API unavailable, using fallback calculation")
+            log.debug("✓ Step 3 completed")
             
             # Analyze yogas and doshas
-            print(f"[DEBUG] Step 4: Analyzing yogas...", file=sys.stderr)
+            log.debug("Step 4: Analyzing yogas...")
             yogas = self.analyze_yogas(positions)
-            print(f"[DEBUG] ✓ Step 4a completed", file=sys.stderr)
+            log.debug("✓ Step 4a completed")
             
-            print(f"[DEBUG] Step 4b: Analyzing doshas...", file=sys.stderr)
+            log.debug("Step 4b: Analyzing doshas...")
             doshas = self.analyze_doshas(positions)
-            print(f"[DEBUG] ✓ Step 4b completed", file=sys.stderr)
+            log.debug("✓ Step 4b completed")
             
             # Calculate dashas
-            print(f"[DEBUG] Step 5: Calculating dasha periods...", file=sys.stderr)
+            log.debug("Step 5: Calculating dasha periods...")
             dasha_periods = self.calculate_dasha_periods(birth_details, positions)
-            print(f"[DEBUG] ✓ Step 5 completed", file=sys.stderr)
+            log.debug("✓ Step 5 completed")
             
             # Generate predictions
-            print(f"[DEBUG] Step 6: Generating predictions...", file=sys.stderr)
+            log.debug("Step 6: Generating predictions...")
             predictions = self.generate_predictions(positions, dasha_periods)
-            print(f"[DEBUG] ✓ Step 6 completed", file=sys.stderr)
+            log.debug("✓ Step 6 completed")
             
             # Check if this is a Super Horoscope request for expanded content
             template = birth_details.get('template', 'standard')
-            print(f"[DEBUG] Report template detected: {template}", file=sys.stderr)
-            print(f"[DEBUG] Birth details keys: {list(birth_details.keys())}", file=sys.stderr)
+            log.debug("Report template detected: {}", template)
+            if log.debug_enabled:
+                log.debug("Birth details keys: {}", list(birth_details.keys()))
             
             # Generate expanded content for Super Horoscope
             if template == 'super_horoscope':
-                print(f"[DEBUG] Step 6b: Generating Super Horoscope expanded content...", file=sys.stderr)
+                log.debug("Step 6b: Generating Super Horoscope expanded content...")
                 
                 # Only D1 (Rasi) and D9 (Navamsa) charts as requested by user
                 try:
@@ -4172,15 +3883,15 @@ This authentic calculation considers the primary ruling planets of your ascendan
                     ]
                 }
                 
-                print(f"[DEBUG] ✓ Step 6b completed - Super Horoscope expanded sections generated", file=sys.stderr)
+                log.debug("✓ Step 6b completed - Super Horoscope expanded sections generated")
             
             # Enhanced birth details calculation
-            print(f"[DEBUG] Step 7: Enhanced birth details...", file=sys.stderr)
+            log.debug("Step 7: Enhanced birth details...")
             enhanced_birth_details = self.calculate_enhanced_birth_details(birth_details, positions)
-            print(f"[DEBUG] ✓ Step 7 completed", file=sys.stderr)
+            log.debug("✓ Step 7 completed")
             
             # Create comprehensive report
-            print(f"[DEBUG] Step 8: Creating report dictionary...", file=sys.stderr)
+            log.debug("Step 8: Creating report dictionary...")
             report = {
                 'birth_details': enhanced_birth_details,
                 'chart_data': {
@@ -4204,9 +3915,13 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 'predictions': predictions
             }
             
+            # Ayanamsa / house system variants the UI can switch between
+            if birth_details.get('variants'):
+                report['chart_variants'] = chart_variants.birth_chart_variants(birth_details)
+            
             # Add Super Horoscope expanded content if generated
             if template == 'super_horoscope':
-                print(f"[DEBUG] Adding Super Horoscope expanded sections to report...", file=sys.stderr)
+                log.debug("Adding Super Horoscope expanded sections to report...")
                 # Replace basic predictions with comprehensive enhanced predictions
                 report['predictions'] = predictions_enhanced
                 # Only D1 and D9 charts as requested
@@ -4221,193 +3936,195 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 # Add all the requested sections from premium report with authentic Jyotisha logic
                 
                 # 3. Charts & Tables (Bhava/House Analysis)
-                print(f"[DEBUG] Adding Charts & Tables (House Analysis)...", file=sys.stderr)
+                log.debug("Adding Charts & Tables (House Analysis)...")
                 try:
                     report['ashtakavarga_analysis'] = self.calculate_enhanced_ashtakavarga_analysis(positions)
                     report['house_analysis'] = self.get_house_predictions_from_ashtakavarga(positions)
-                    print(f"[DEBUG] ✓ Added Charts & Tables", file=sys.stderr)
+                    log.debug("✓ Added Charts & Tables")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Charts & Tables: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Charts & Tables: {}", e)
                 
                 # 4. Ascendant and Personality Analysis
-                print(f"[DEBUG] Adding Ascendant and Personality Analysis...", file=sys.stderr)
+                log.debug("Adding Ascendant and Personality Analysis...")
                 try:
                     report['expanded_personality_analysis'] = self.generate_expanded_personality_analysis(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Ascendant and Personality Analysis", file=sys.stderr)
+                    log.debug("✓ Added Ascendant and Personality Analysis")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Personality Analysis: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Personality Analysis: {}", e)
                 
                 # 5. Moon Sign and Emotional Profile
-                print(f"[DEBUG] Adding Moon Sign and Emotional Profile...", file=sys.stderr)
+                log.debug("Adding Moon Sign and Emotional Profile...")
                 try:
                     report['moon_emotional_profile'] = self.analyze_moon_emotional_profile(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Moon Sign and Emotional Profile", file=sys.stderr)
+                    log.debug("✓ Added Moon Sign and Emotional Profile")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Moon Emotional Profile: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Moon Emotional Profile: {}", e)
                 
                 # 6. Nakshatra Interpretation
-                print(f"[DEBUG] Adding Nakshatra Interpretation...", file=sys.stderr)
+                log.debug("Adding Nakshatra Interpretation...")
                 try:
                     report['detailed_nakshatra_analysis'] = self.calculate_detailed_nakshatra_analysis(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Nakshatra Interpretation", file=sys.stderr)
+                    log.debug("✓ Added Nakshatra Interpretation")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Nakshatra Analysis: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Nakshatra Analysis: {}", e)
                 
                 # 7. Bhava Predictions (1st to 12th house)
-                print(f"[DEBUG] Adding Bhava Predictions (1st to 12th house)...", file=sys.stderr)
+                log.debug("Adding Bhava Predictions (1st to 12th house)...")
                 try:
                     report['comprehensive_house_analysis'] = self.calculate_comprehensive_house_analysis(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Bhava Predictions", file=sys.stderr)
+                    log.debug("✓ Added Bhava Predictions")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Bhava Predictions: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Bhava Predictions: {}", e)
                 
                 # 10. Dasha Predictions
-                print(f"[DEBUG] Adding Dasha Predictions...", file=sys.stderr)
+                log.debug("Adding Dasha Predictions...")
                 try:
                     report['detailed_dasha_predictions'] = self.calculate_detailed_dasha_predictions(positions, birth_details, dasha_periods)
                     report['unified_dasha_system'] = self.calculate_unified_dasha_system(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Dasha Predictions", file=sys.stderr)
+                    log.debug("✓ Added Dasha Predictions")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Dasha Predictions: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Dasha Predictions: {}", e)
                 
                 # 11. Transit (Gochar) Analysis
-                print(f"[DEBUG] Adding Transit (Gochar) Analysis...", file=sys.stderr)
+                log.debug("Adding Transit (Gochar) Analysis...")
                 try:
                     report['unified_transit_analysis'] = self.calculate_unified_transit_analysis(positions, birth_details)
-                    print(f"[DEBUG] ✓ Added Transit Analysis", file=sys.stderr)
+                    log.debug("✓ Added Transit Analysis")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Transit Analysis: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Transit Analysis: {}", e)
                 
                 # 16. Action Plan
-                print(f"[DEBUG] Adding Action Plan...", file=sys.stderr)
+                log.debug("Adding Action Plan...")
                 try:
                     report['dasha_action_plan'] = self.generate_dasha_action_plan(positions, birth_details, report.get('unified_dasha_system', {}))
-                    print(f"[DEBUG] ✓ Added Action Plan", file=sys.stderr)
+                    log.debug("✓ Added Action Plan")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Action Plan: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Action Plan: {}", e)
                 
                 # 17. Astrological Summary
-                print(f"[DEBUG] Adding Astrological Summary...", file=sys.stderr)
+                log.debug("Adding Astrological Summary...")
                 try:
                     report['astrological_summary'] = self.generate_comprehensive_astrological_summary(positions, birth_details, report)
-                    print(f"[DEBUG] ✓ Added Astrological Summary", file=sys.stderr)
+                    log.debug("✓ Added Astrological Summary")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Astrological Summary: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Astrological Summary: {}", e)
                 
                 # 18. Personalized Recommendations
-                print(f"[DEBUG] Adding Personalized Recommendations...", file=sys.stderr)
+                log.debug("Adding Personalized Recommendations...")
                 try:
                     report['personalized_recommendations'] = self.generate_personalized_recommendations(positions, birth_details, report)
-                    print(f"[DEBUG] ✓ Added Personalized Recommendations", file=sys.stderr)
+                    log.debug("✓ Added Personalized Recommendations")
                 except Exception as e:
-                    print(f"[DEBUG] ❌ Error in Personalized Recommendations: {str(e)}", file=sys.stderr)
+                    log.warning("❌ Error in Personalized Recommendations: {}", e)
                 
-                print(f"[DEBUG] ✓ Super Horoscope expanded sections added to report", file=sys.stderr)
-            print(f"[DEBUG] ✓ Basic report created", file=sys.stderr)
+                log.debug("✓ Super Horoscope expanded sections added to report")
+            log.debug("✓ Basic report created")
             
             # CRITICAL: Add AUTHENTIC Section 2: Planetary Results (Graha Phala) EARLY
-            print("[DEBUG] ✓ CRITICAL: Adding AUTHENTIC Section 2: Planetary Results (Graha Phala) EARLY", file=sys.stderr)
+            log.debug("✓ CRITICAL: Adding AUTHENTIC Section 2: Planetary Results (Graha Phala) EARLY")
             try:
-                print(f"[DEBUG] Calling generate_comprehensive_planetary_results with positions type: {type(positions)}", file=sys.stderr)
-                print(f"[DEBUG] Positions keys: {list(positions.keys()) if isinstance(positions, dict) else 'Not a dict'}", file=sys.stderr)
+                log.debug("Calling generate_comprehensive_planetary_results with positions type: {}", type(positions))
+                if log.debug_enabled:
+                    log.debug("Positions keys: {}", list(positions.keys()) if isinstance(positions, dict) else 'Not a dict')
                 
                 planetary_results = self.generate_comprehensive_planetary_results(positions, {})
-                print(f"[DEBUG] Planetary results returned: {type(planetary_results)}", file=sys.stderr)
+                log.debug("Planetary results returned: {}", type(planetary_results))
                 
                 if planetary_results:
                     report['comprehensive_planetary_results'] = planetary_results
                     report['planetary_results'] = planetary_results  # Add both field names for frontend compatibility
-                    print(f"[DEBUG] ✓ CRITICAL SUCCESS: Added authentic comprehensive planetary results with {len(planetary_results.get('planets', {}))} planets", file=sys.stderr)
+                    log.debug("✓ CRITICAL SUCCESS: Added authentic comprehensive planetary results with {} planets", len(planetary_results.get('planets', {})))
                 else:
-                    print("[DEBUG] ❌ CRITICAL ERROR: No planetary results returned from function", file=sys.stderr)
+                    log.warning("❌ CRITICAL ERROR: No planetary results returned from function")
                     
             except Exception as e:
-                print(f"[DEBUG] ❌ CRITICAL ERROR in planetary results generation: {str(e)}", file=sys.stderr)
+                log.warning("❌ CRITICAL ERROR in planetary results generation: {}", e)
                 import traceback
-                print(f"[DEBUG] ❌ Full traceback: {traceback.format_exc()}", file=sys.stderr)
+                if log.debug_enabled:
+                    log.debug("❌ Full traceback: {}", traceback.format_exc())
             
-            print(f"[DEBUG] Step 8a: Adding lucky elements...", file=sys.stderr)
+            log.debug("Step 8a: Adding lucky elements...")
             report['lucky_elements'] = self.calculate_authentic_lucky_elements(positions, ascendant_sign, enhanced_birth_details)
-            print(f"[DEBUG] ✓ Step 8a completed", file=sys.stderr)
+            log.debug("✓ Step 8a completed")
             
-            print(f"[DEBUG] Step 8b: Adding life summary...", file=sys.stderr)
+            log.debug("Step 8b: Adding life summary...")
             report['life_summary'] = self.generate_comprehensive_life_summary(positions, dasha_periods)
-            print(f"[DEBUG] ✓ Step 8b completed", file=sys.stderr)
+            log.debug("✓ Step 8b completed")
             
-            print(f"[DEBUG] Step 8c: Adding detailed predictions...", file=sys.stderr)
+            log.debug("Step 8c: Adding detailed predictions...")
             try:
                 report['detailed_predictions'] = self.generate_detailed_predictions(positions, dasha_periods)
-                print(f"[DEBUG] ✓ Step 8c completed", file=sys.stderr)
+                log.debug("✓ Step 8c completed")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 8c: {e}", file=sys.stderr)
+                log.warning("ERROR in Step 8c: {}", e)
                 report['detailed_predictions'] = {"error": str(e)}
             
-            print(f"[DEBUG] Step 8d: Adding remedies...", file=sys.stderr)
+            log.debug("Step 8d: Adding remedies...")
             try:
                 report['remedies'] = self.generate_remedies(doshas, positions)
-                print(f"[DEBUG] ✓ Step 8d completed", file=sys.stderr)
+                log.debug("✓ Step 8d completed")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 8d: {e}", file=sys.stderr)
+                log.warning("ERROR in Step 8d: {}", e)
                 report['remedies'] = {"error": str(e)}
             
-            print(f"[DEBUG] Step 8e: Adding auspicious periods...", file=sys.stderr)
+            log.debug("Step 8e: Adding auspicious periods...")
             report['auspicious_periods'] = self.calculate_auspicious_periods(positions)
-            print(f"[DEBUG] ✓ Step 8e completed", file=sys.stderr)
+            log.debug("✓ Step 8e completed")
             
-            print(f"[DEBUG] Step 8f: Adding gemstone recommendations...", file=sys.stderr)
+            log.debug("Step 8f: Adding gemstone recommendations...")
             report['gemstone_recommendations'] = self.recommend_gemstones(positions)
-            print(f"[DEBUG] ✓ Step 8f completed", file=sys.stderr)
+            log.debug("✓ Step 8f completed")
             
-            print(f"[DEBUG] Step 8g: Adding mantra recommendations...", file=sys.stderr)
+            log.debug("Step 8g: Adding mantra recommendations...")
             report['mantra_recommendations'] = self.recommend_mantras(positions)
-            print(f"[DEBUG] ✓ Step 8g completed", file=sys.stderr)
+            log.debug("✓ Step 8g completed")
             
             # Add comprehensive sections with debugging
-            print(f"[DEBUG] Step 9: Adding comprehensive sections...", file=sys.stderr)
+            log.debug("Step 9: Adding comprehensive sections...")
             
             # Step 9a: Ashtakavarga Analysis
-            print(f"[DEBUG] Step 9a: Adding ashtakavarga analysis...", file=sys.stderr)
+            log.debug("Step 9a: Adding ashtakavarga analysis...")
             ashtakavarga_data = self.calculate_unified_ashtakavarga_system(positions)
             
             # Validate Ashtakavarga data authenticity
             try:
                 self.validate_ashtakavarga_data(ashtakavarga_data)
-                print(f"[DEBUG] ✓ Ashtakavarga validation passed", file=sys.stderr)
+                log.debug("✓ Ashtakavarga validation passed")
             except AuthenticDataError as e:
                 error_msg = f"Ashtakavarga calculation failed validation: {str(e)}"
-                print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                log.error(error_msg)
                 raise AuthenticDataError(error_msg)
             
             report['unified_ashtakavarga_analysis'] = ashtakavarga_data
-            print(f"[DEBUG] ✓ Step 9a completed", file=sys.stderr)
+            log.debug("✓ Step 9a completed")
             
             # Step 9b: Divisional Charts (with specific error handling)
-            print(f"[DEBUG] Step 9b: Adding divisional charts...", file=sys.stderr)
+            log.debug("Step 9b: Adding divisional charts...")
             try:
                 report['divisional_charts'] = self.calculate_divisional_charts_analysis(birth_details, positions)
-                print(f"[DEBUG] ✓ Step 9b completed - Divisional charts generated", file=sys.stderr)
+                log.debug("✓ Step 9b completed - Divisional charts generated")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 9b divisional charts: {e}", file=sys.stderr)
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                log.warning("ERROR in Step 9b divisional charts: {}", e)
+                if log.debug_enabled:
+                    log.debug("Traceback: {}", traceback.format_exc())
                 # Add basic divisional charts structure to prevent missing data
-                print(f"[DEBUG] Creating fallback divisional charts due to error", file=sys.stderr)
+                log.debug("Creating fallback divisional charts due to error")
                 report['divisional_charts'] = self.create_fallback_divisional_charts(positions, birth_details)
-                print(f"[DEBUG] ✓ Step 9b completed with fallback charts", file=sys.stderr)
+                log.debug("✓ Step 9b completed with fallback charts")
             
             # Step 9c: Planetary Strengths
-            print(f"[DEBUG] Step 9c: Adding planetary strengths...", file=sys.stderr)
+            log.debug("Step 9c: Adding planetary strengths...")
             try:
                 report['planetary_strengths'] = self.calculate_comprehensive_planetary_strengths(positions)
-                print(f"[DEBUG] ✓ Step 9c completed", file=sys.stderr)
+                log.debug("✓ Step 9c completed")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 9c: {e}", file=sys.stderr)
+                log.warning("ERROR in Step 9c: {}", e)
                 # Continue without planetary strengths
             
-            print(f"[DEBUG] ✓ Step 9 completed successfully", file=sys.stderr)
+            log.debug("✓ Step 9 completed successfully")
             
             # Add comprehensive premium sections
-            print(f"[DEBUG] Step 9d: Adding comprehensive premium sections...", file=sys.stderr)
+            log.debug("Step 9d: Adding comprehensive premium sections...")
             try:
                 report['bhava_chart_analysis'] = self.analyze_bhava_chart(positions, birth_details)
                 report['full_dasha_table'] = self.calculate_full_dasha_table(positions, birth_details)
@@ -4426,75 +4143,75 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 report['comprehensive_house_analysis'] = self.analyze_comprehensive_houses(positions)
                 report['planet_wise_interpretations'] = self.analyze_planet_wise_interpretations(positions)
                 report['planet_wise_life_impact'] = self.analyze_planet_wise_life_impact(positions, birth_details.get('date'))
-                print(f"[DEBUG] ✓ Step 9d completed successfully - Added marriage_relationships_analysis", file=sys.stderr)
+                log.debug("✓ Step 9d completed successfully - Added marriage_relationships_analysis")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 9d: {e}", file=sys.stderr)
+                log.warning("ERROR in Step 9d: {}", e)
             
             # Add timing prediction sections
-            print(f"[DEBUG] Step 10: Adding timing prediction sections...", file=sys.stderr)
+            log.debug("Step 10: Adding timing prediction sections...")
             try:
-                print(f"[DEBUG] Step 10a: Adding marriage timing...", file=sys.stderr)
+                log.debug("Step 10a: Adding marriage timing...")
                 report['marriage_timing'] = self.calculate_marriage_timing_predictions(positions, dasha_periods, birth_details.get('date'))
-                print(f"[DEBUG] ✓ Step 10a completed", file=sys.stderr)
+                log.debug("✓ Step 10a completed")
                 
-                print(f"[DEBUG] Step 10b: Adding profession timing...", file=sys.stderr)
+                log.debug("Step 10b: Adding profession timing...")
                 report['profession_timing'] = self.calculate_profession_timing_predictions(positions, dasha_periods, birth_details.get('date'))
-                print(f"[DEBUG] ✓ Step 10b completed", file=sys.stderr)
+                log.debug("✓ Step 10b completed")
                 
-                print(f"[DEBUG] Step 10c: Adding travel timing...", file=sys.stderr)
+                log.debug("Step 10c: Adding travel timing...")
                 report['travel_timing'] = self.calculate_travel_timing_predictions(positions, dasha_periods, birth_details.get('date'))
-                print(f"[DEBUG] ✓ Step 10c completed", file=sys.stderr)
+                log.debug("✓ Step 10c completed")
                 
-                print(f"[DEBUG] Step 10d: Adding investment timing...", file=sys.stderr)
+                log.debug("Step 10d: Adding investment timing...")
                 report['investment_timing'] = self.calculate_investment_timing_predictions(positions, dasha_periods, birth_details.get('date'))
-                print(f"[DEBUG] ✓ Step 10d completed", file=sys.stderr)
+                log.debug("✓ Step 10d completed")
                 
-                print(f"[DEBUG] ✓ Step 10 completed successfully", file=sys.stderr)
+                log.debug("✓ Step 10 completed successfully")
             except Exception as e:
-                print(f"[DEBUG] ERROR in Step 10: {e}", file=sys.stderr)
-                print(f"[DEBUG] Continuing without timing predictions...", file=sys.stderr)
+                log.warning("ERROR in Step 10: {}", e)
+                log.debug("Continuing without timing predictions...")
             
             # Add comprehensive sections with error handling
             try:
                 report['detailed_nakshatra_analysis'] = self.calculate_detailed_nakshatra_analysis(positions, birth_details)
-                print(f"[DEBUG] ✓ Added detailed nakshatra analysis", file=sys.stderr)
+                log.debug("✓ Added detailed nakshatra analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in detailed_nakshatra_analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in detailed_nakshatra_analysis: {}", e)
             
             try:
                 report['house_lords_karakatva'] = self.calculate_house_lords_karakatva(positions)
-                print(f"[DEBUG] ✓ Added house lords analysis", file=sys.stderr)
+                log.debug("✓ Added house lords analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in house_lords_karakatva: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in house_lords_karakatva: {}", e)
             
             try:
                 report['upagraha_calculations'] = self.calculate_upagraha_positions(positions, birth_details)
-                print(f"[DEBUG] ✓ Added upagraha calculations", file=sys.stderr)
+                log.debug("✓ Added upagraha calculations")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in upagraha_calculations: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in upagraha_calculations: {}", e)
             
             try:
                 report['aspect_analysis'] = self.calculate_planetary_aspects(positions)
-                print(f"[DEBUG] ✓ Added aspect analysis", file=sys.stderr)
+                log.debug("✓ Added aspect analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in aspect_analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in aspect_analysis: {}", e)
             
             try:
                 report['unified_planetary_strength'] = self.calculate_unified_planetary_strength(positions, birth_details)
-                print(f"[DEBUG] ✓ Added shadbala strength", file=sys.stderr)
+                log.debug("✓ Added shadbala strength")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in shadbala_strength: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in shadbala_strength: {}", e)
             
             try:
                 report['detailed_life_predictions'] = self.calculate_detailed_life_predictions(positions, birth_details)
-                print(f"[DEBUG] ✓ Added detailed life predictions", file=sys.stderr)
+                log.debug("✓ Added detailed life predictions")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in detailed_life_predictions: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in detailed_life_predictions: {}", e)
 
             # Comprehensive dasha system already added above - no need to duplicate
             
             # Add missing traditional sections
-            print("[DEBUG] ✓ Adding detailed dosha analysis", file=sys.stderr)
+            log.debug("✓ Adding detailed dosha analysis")
             try:
                 report['manglik_analysis'] = self.analyze_manglik_dosha(positions)
                 report['kaal_sarp_dosha'] = self.analyze_kaal_sarp_dosha(positions) 
@@ -4503,103 +4220,105 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 report['nadi_dosha'] = self.analyze_nadi_dosha(positions)
                 report['bhakoot_dosha'] = self.analyze_bhakoot_dosha(positions)
                 report['gana_dosha'] = self.analyze_gana_dosha(positions)
-                print("[DEBUG] ✓ Added all dosha analysis sections", file=sys.stderr)
+                log.debug("✓ Added all dosha analysis sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in dosha analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in dosha analysis: {}", e)
             
-            print("[DEBUG] ✓ Adding AUTHENTIC Section 2: Planetary Results (Graha Phala)", file=sys.stderr)
+            log.debug("✓ Adding AUTHENTIC Section 2: Planetary Results (Graha Phala)")
             try:
-                print(f"[DEBUG] Calling generate_comprehensive_planetary_results with positions type: {type(positions)}", file=sys.stderr)
-                print(f"[DEBUG] Positions keys: {list(positions.keys()) if isinstance(positions, dict) else 'Not a dict'}", file=sys.stderr)
-                print(f"[DEBUG] Houses type: {type(houses)}", file=sys.stderr)
+                log.debug("Calling generate_comprehensive_planetary_results with positions type: {}", type(positions))
+                if log.debug_enabled:
+                    log.debug("Positions keys: {}", list(positions.keys()) if isinstance(positions, dict) else 'Not a dict')
+                log.debug("Houses type: {}", type(houses))
                 
                 planetary_results = self.generate_comprehensive_planetary_results(positions, houses)
-                print(f"[DEBUG] Planetary results returned: {type(planetary_results)}", file=sys.stderr)
+                log.debug("Planetary results returned: {}", type(planetary_results))
                 
                 if planetary_results:
                     report['comprehensive_planetary_results'] = planetary_results
-                    print(f"[DEBUG] ✓ Added authentic comprehensive planetary results with {len(planetary_results.get('planets', {}))} planets", file=sys.stderr)
+                    log.debug("✓ Added authentic comprehensive planetary results with {} planets", len(planetary_results.get('planets', {})))
                 else:
-                    print("[DEBUG] ❌ No planetary results returned from function", file=sys.stderr)
+                    log.warning("❌ No planetary results returned from function")
                     
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in planetary results generation: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in planetary results generation: {}", e)
                 import traceback
-                print(f"[DEBUG] ❌ Full traceback: {traceback.format_exc()}", file=sys.stderr)
+                if log.debug_enabled:
+                    log.debug("❌ Full traceback: {}", traceback.format_exc())
             
-            print("[DEBUG] ✓ Adding advanced yoga analysis", file=sys.stderr)
+            log.debug("✓ Adding advanced yoga analysis")
             try:
                 report['raj_yoga_analysis'] = self.analyze_raj_yogas(positions, birth_details.get('date'))
                 report['dhana_yoga_analysis'] = self.analyze_dhana_yogas(positions, birth_details.get('date'))
                 report['budh_aditya_yoga'] = self.analyze_budh_aditya_yoga(positions)
-                print("[DEBUG] ✓ Added all yoga analysis sections", file=sys.stderr)
+                log.debug("✓ Added all yoga analysis sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in yoga analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in yoga analysis: {}", e)
             
-            print("[DEBUG] ✓ Adding precise timing predictions", file=sys.stderr)
+            log.debug("✓ Adding precise timing predictions")
             try:
                 # Debug positions type
-                print(f"[DEBUG] positions type: {type(positions)}", file=sys.stderr)
+                log.debug("positions type: {}", type(positions))
                 
                 # Ensure positions is a dictionary
                 if isinstance(positions, str):
-                    print(f"[DEBUG] ❌ positions is string, converting back to dict", file=sys.stderr)
+                    log.warning("❌ positions is string, converting back to dict")
                     # Skip timing predictions if positions is corrupted
-                    print("[DEBUG] ⚠️ Skipping timing predictions due to corrupted positions data", file=sys.stderr)
+                    log.debug("⚠️ Skipping timing predictions due to corrupted positions data")
                 elif isinstance(positions, dict):
-                    print(f"[DEBUG] positions dict has {len(positions)} planets", file=sys.stderr)
+                    log.debug("positions dict has {} planets", len(positions))
                     
                     # Get Jupiter house for marriage timing
                     jupiter_house = positions.get('Jupiter', {}).get('house', 1)
                     dasha_periods = report.get('dasha_periods', {}).get('current_period', [])
                     
-                    print(f"[DEBUG] Calling analyze_marriage_timing with jupiter_house={jupiter_house}", file=sys.stderr)
+                    log.debug("Calling analyze_marriage_timing with jupiter_house={}", jupiter_house)
                     report['marriage_timing'] = self.analyze_marriage_timing(positions, jupiter_house, dasha_periods, birth_details.get('date'))
-                    print(f"[DEBUG] ✓ marriage_timing completed", file=sys.stderr)
+                    log.debug("✓ marriage_timing completed")
                     
-                    print(f"[DEBUG] Calling analyze_profession_timing", file=sys.stderr)
+                    log.debug("Calling analyze_profession_timing")
                     report['profession_timing'] = self.analyze_profession_timing(positions, birth_details.get('date'))
-                    print(f"[DEBUG] ✓ profession_timing completed", file=sys.stderr)
+                    log.debug("✓ profession_timing completed")
                     
-                    print(f"[DEBUG] Calling analyze_travel_timing", file=sys.stderr)
+                    log.debug("Calling analyze_travel_timing")
                     report['travel_timing'] = self.analyze_travel_timing(positions, birth_details.get('date'))
-                    print(f"[DEBUG] ✓ travel_timing completed", file=sys.stderr)
+                    log.debug("✓ travel_timing completed")
                     
-                    print(f"[DEBUG] Calling analyze_investment_timing", file=sys.stderr)
+                    log.debug("Calling analyze_investment_timing")
                     report['investment_timing'] = self.analyze_investment_timing(positions, birth_details.get('date'))
-                    print(f"[DEBUG] ✓ investment_timing completed", file=sys.stderr)
+                    log.debug("✓ investment_timing completed")
                     
-                    print("[DEBUG] ✓ Added all timing prediction sections", file=sys.stderr)
+                    log.debug("✓ Added all timing prediction sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in timing predictions: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in timing predictions: {}", e)
             
             # Add comprehensive life story narrative
-            print("[DEBUG] ✓ Adding comprehensive life story narrative", file=sys.stderr)
+            log.debug("✓ Adding comprehensive life story narrative")
             try:
-                print(f"[DEBUG] Calling generate_life_story_narrative...", file=sys.stderr)
+                log.debug("Calling generate_life_story_narrative...")
                 report['life_story_narrative'] = self.generate_life_story_narrative(positions, birth_details)
-                print(f"[DEBUG] ✓ life_story_narrative completed", file=sys.stderr)
+                log.debug("✓ life_story_narrative completed")
                 
-                print(f"[DEBUG] Calling analyze_detailed_career_prospects...", file=sys.stderr)
+                log.debug("Calling analyze_detailed_career_prospects...")
                 report['detailed_career_analysis'] = self.analyze_detailed_career_prospects(positions, birth_details)
-                print(f"[DEBUG] ✓ detailed_career_analysis completed", file=sys.stderr)
+                log.debug("✓ detailed_career_analysis completed")
                 
-                print(f"[DEBUG] Calling calculate_detailed_marriage_analysis...", file=sys.stderr)
+                log.debug("Calling calculate_detailed_marriage_analysis...")
                 report['detailed_marriage_analysis'] = self.calculate_detailed_marriage_analysis(positions, birth_details)
-                print(f"[DEBUG] ✓ detailed_marriage_analysis completed", file=sys.stderr)
+                log.debug("✓ detailed_marriage_analysis completed")
                 
-                print(f"[DEBUG] Calling analyze_comprehensive_life_journey...", file=sys.stderr)
+                log.debug("Calling analyze_comprehensive_life_journey...")
                 # Add comprehensive life journey analysis (NEW)
                 report['comprehensive_life_journey'] = self.analyze_comprehensive_life_journey(positions, birth_details)
-                print(f"[DEBUG] ✓ comprehensive_life_journey completed", file=sys.stderr)
+                log.debug("✓ comprehensive_life_journey completed")
                 
-                print("[DEBUG] ✓ Added narrative, detailed analyses, and comprehensive life journey", file=sys.stderr)
+                log.debug("✓ Added narrative, detailed analyses, and comprehensive life journey")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in narrative analysis: {str(e)}", file=sys.stderr)
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                log.warning("❌ Error in narrative analysis: {}", e)
+                if log.debug_enabled:
+                    log.debug("Traceback: {}", traceback.format_exc())
             
-            print("[DEBUG] ✓ Adding enhanced therapy recommendations", file=sys.stderr)
+            log.debug("✓ Adding enhanced therapy recommendations")
             try:
                 report['gem_therapy_detailed'] = self.analyze_gem_therapy_detailed(positions)
                 report['yantra_recommendations'] = self.analyze_yantra_recommendations(positions)
@@ -4607,29 +4326,29 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 report['color_therapy'] = self.analyze_color_therapy(positions)
                 report['fasting_recommendations'] = self.analyze_fasting_recommendations(positions)
                 report['charity_suggestions'] = self.analyze_charity_suggestions(positions)
-                print("[DEBUG] ✓ Added all therapy recommendation sections", file=sys.stderr)
+                log.debug("✓ Added all therapy recommendation sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in therapy recommendations: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in therapy recommendations: {}", e)
             
-            print("[DEBUG] ✓ Adding compatibility analysis", file=sys.stderr)
+            log.debug("✓ Adding compatibility analysis")
             try:
                 report['compatibility_parents'] = self.analyze_parent_compatibility(positions)
                 report['compatibility_children'] = self.analyze_children_compatibility(positions)
                 report['compatibility_business_partner'] = self.analyze_business_partner_compatibility(positions)
-                print("[DEBUG] ✓ Added all compatibility analysis sections", file=sys.stderr)
+                log.debug("✓ Added all compatibility analysis sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in compatibility analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in compatibility analysis: {}", e)
             
-            print("[DEBUG] ✓ Adding medical & psychological analysis", file=sys.stderr)
+            log.debug("✓ Adding medical & psychological analysis")
             try:
                 report['medical_astrology'] = self.analyze_medical_astrology(positions)
                 report['psychological_analysis'] = self.analyze_psychological_patterns(positions)
                 report['accident_prone_periods'] = self.analyze_accident_prone_periods(positions)
-                print("[DEBUG] ✓ Added all medical & psychological sections", file=sys.stderr)
+                log.debug("✓ Added all medical & psychological sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in medical & psychological analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in medical & psychological analysis: {}", e)
             
-            print("[DEBUG] ✓ Adding spiritual & karmic analysis", file=sys.stderr)
+            log.debug("✓ Adding spiritual & karmic analysis")
             try:
                 # Get required parameters for past life karma analysis
                 ketu_house = positions.get('Ketu', {}).get('house', 7)
@@ -4641,71 +4360,71 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 report['numerology_analysis'] = self.analyze_numerology(birth_details)
                 report['beneficial_directions'] = self.analyze_beneficial_directions(positions)
                 report['vastu_recommendations'] = self.analyze_vastu_recommendations(positions)
-                report['muhurat_analysis'] = self.analyze_muhurat_timing(positions)
-                print("[DEBUG] ✓ Added all spiritual & karmic sections", file=sys.stderr)
+                report['muhurat_analysis'] = self.analyze_muhurat_timing(positions, birth_details)
+                log.debug("✓ Added all spiritual & karmic sections")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in spiritual & karmic analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in spiritual & karmic analysis: {}", e)
             
             # Continue with traditional sections
             try:
                 report['sade_sati_analysis'] = self.calculate_sade_sati_analysis(positions, birth_details)
-                print(f"[DEBUG] ✓ Added sade sati analysis", file=sys.stderr)
+                log.debug("✓ Added sade sati analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in sade_sati_analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in sade_sati_analysis: {}", e)
             
             try:
                 report['ashtakavarga_highlights'] = self.calculate_ashtakavarga_highlights(positions)
-                print(f"[DEBUG] ✓ Added ashtakavarga highlights", file=sys.stderr)
+                log.debug("✓ Added ashtakavarga highlights")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in ashtakavarga_highlights: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in ashtakavarga_highlights: {}", e)
             
             try:
                 report['unified_transit_analysis'] = self.calculate_unified_transit_analysis(positions, birth_details)
-                print(f"[DEBUG] ✓ Added transit predictions", file=sys.stderr)
+                log.debug("✓ Added transit predictions")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in transit_predictions: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in transit_predictions: {}", e)
                 
             # Add Section 14: Comprehensive Transit (Gochar) Analysis with Sade Sati, Kantak Shani, Ashtama Shani
             try:
                 report['section_14_transit_gochar_analysis'] = self.calculate_comprehensive_transit_gochar_analysis(positions, birth_details)
-                print(f"[DEBUG] ✓ Added Section 14: Transit (Gochar) Analysis with Sade Sati, Kantak Shani, Ashtama Shani", file=sys.stderr)
+                log.debug("✓ Added Section 14: Transit (Gochar) Analysis with Sade Sati, Kantak Shani, Ashtama Shani")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in Section 14 Transit Analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in Section 14 Transit Analysis: {}", e)
             
             try:
                 report['remedial_measures_comprehensive'] = self.calculate_remedial_measures_comprehensive(positions)
-                print(f"[DEBUG] ✓ Added remedial measures comprehensive", file=sys.stderr)
+                log.debug("✓ Added remedial measures comprehensive")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in remedial_measures_comprehensive: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in remedial_measures_comprehensive: {}", e)
             
             try:
                 report['detailed_dasha_predictions'] = self.calculate_detailed_dasha_predictions(positions, birth_details, report.get('dasha_periods'))
-                print(f"[DEBUG] ✓ Added detailed dasha predictions", file=sys.stderr)
+                log.debug("✓ Added detailed dasha predictions")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in detailed_dasha_predictions: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in detailed_dasha_predictions: {}", e)
             
             try:
                 # Use the detailed house analysis method instead of the basic one
                 detailed_houses = self.analyze_comprehensive_houses(positions)
                 report['comprehensive_house_analysis'] = detailed_houses.get('houses', {})
-                print(f"[DEBUG] ✓ Added detailed comprehensive house analysis with lord placements", file=sys.stderr)
+                log.debug("✓ Added detailed comprehensive house analysis with lord placements")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in detailed comprehensive_house_analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in detailed comprehensive_house_analysis: {}", e)
                 # Fallback to basic house analysis if detailed fails
                 try:
                     report['comprehensive_house_analysis'] = self.calculate_comprehensive_house_analysis(positions)
-                    print(f"[DEBUG] ✓ Added basic comprehensive house analysis as fallback", file=sys.stderr)
+                    log.debug("✓ Added basic comprehensive house analysis as fallback")
                 except Exception as e2:
-                    print(f"[DEBUG] ❌ Error in basic comprehensive_house_analysis fallback: {str(e2)}", file=sys.stderr)
+                    log.warning("❌ Error in basic comprehensive_house_analysis fallback: {}", e2)
             
             # Add Sarvashtakavarga Charts Analysis (Section 6) - AT THE END AS REQUESTED
             try:
                 # Generate Sarvashtakavarga charts with positions data
                 sarva_charts = self.generate_sarvashtakavarga_charts({}, positions)
                 report.update(sarva_charts)
-                print(f"[DEBUG] ✓ Added Sarvashtakavarga Charts Analysis", file=sys.stderr)
+                log.debug("✓ Added Sarvashtakavarga Charts Analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in Sarvashtakavarga charts: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in Sarvashtakavarga charts: {}", e)
             
             # Add Enhanced 11-Section Career Analysis
             try:
@@ -4722,96 +4441,97 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 authentic_career_data = self.calculate_enhanced_career_analysis(positions, ascendant_sign)
                 report['enhanced_career_analysis'] = authentic_career_data  # Keep for backend compatibility
                 report['comprehensive_career_analysis'] = authentic_career_data  # Frontend expects this field
-                print(f"[DEBUG] ✓ Added enhanced career analysis", file=sys.stderr)
+                log.debug("✓ Added enhanced career analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in enhanced_career_analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in enhanced_career_analysis: {}", e)
             
             # Generate authentic wealth analysis for Section 16
             try:
-                print(f"[DEBUG] ✓ Starting AUTHENTIC Wealth Analysis with dynamic calculations", file=sys.stderr)
+                log.debug("✓ Starting AUTHENTIC Wealth Analysis with dynamic calculations")
                 ascendant_sign_number = int(ascendant_data.get('longitude', 0) / 30) + 1
                 authentic_wealth_data = self.analyze_wealth_and_finances_authentic(positions, ascendant_sign_number)
                 report['wealth_and_finances_analysis'] = authentic_wealth_data
-                print(f"[DEBUG] ✓ Added authentic wealth analysis", file=sys.stderr)
+                log.debug("✓ Added authentic wealth analysis")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in wealth analysis: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in wealth analysis: {}", e)
             
             # Add Comprehensive Dasha System with authentic timeline integration
-            print(f"[DEBUG] About to call unified dasha system", file=sys.stderr)
+            log.debug("About to call unified dasha system")
             try:
-                print(f"[DEBUG] Starting unified dasha system calculation", file=sys.stderr)
+                log.debug("Starting unified dasha system calculation")
                 unified_result = self.calculate_unified_dasha_system(positions, birth_details)
-                print(f"[DEBUG] Unified dasha system returned: {unified_result.get('current_analysis', {}).get('mahadasha', {}).get('lord', 'NO_LORD')}", file=sys.stderr)
+                log.debug("Unified dasha system returned: {}", unified_result.get('current_analysis', {}).get('mahadasha', {}).get('lord', 'NO_LORD'))
                 
                 # Validate Dasha data authenticity
                 try:
                     self.validate_dasha_data(unified_result)
-                    print(f"[DEBUG] ✓ Dasha validation passed", file=sys.stderr)
+                    log.debug("✓ Dasha validation passed")
                 except AuthenticDataError as e:
                     error_msg = f"Dasha calculation failed validation: {str(e)}"
-                    print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                    log.error(error_msg)
                     raise AuthenticDataError(error_msg)
                 
                 report['unified_dasha_system'] = unified_result
-                print(f"[DEBUG] ✓ Added unified dasha system", file=sys.stderr)
+                log.debug("✓ Added unified dasha system")
             except AuthenticDataError:
                 # Re-raise authentication errors
                 raise
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in unified_dasha_system: {str(e)}", file=sys.stderr)
-                print(f"[DEBUG] Traceback: {traceback.format_exc()}", file=sys.stderr)
+                log.warning("❌ Error in unified_dasha_system: {}", e)
+                if log.debug_enabled:
+                    log.debug("Traceback: {}", traceback.format_exc())
                 error_msg = f"Dasha system calculation failed: {str(e)}"
-                print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                log.error(error_msg)
                 raise AuthenticDataError(error_msg)
                 
             # Add Annual Predictions (Varshaphal) with authentic transit + dasha analysis
-            print(f"[DEBUG] Starting AUTHENTIC Annual Predictions calculation...", file=sys.stderr)
+            log.debug("Starting AUTHENTIC Annual Predictions calculation...")
             try:
                 annual_predictions = self.analyze_annual_predictions_varshaphal(positions, birth_details)
                 report['comprehensive_annual_predictions'] = annual_predictions
-                print(f"[DEBUG] ✓ Added authentic annual predictions - {annual_predictions.get('prediction_year', 2025)}", file=sys.stderr)
+                log.debug("✓ Added authentic annual predictions - {}", annual_predictions.get('prediction_year', 2025))
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in annual predictions: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in annual predictions: {}", e)
             
             # Add Marriage Compatibility Analysis (Section 17)
-            print(f"[DEBUG] Calculating marriage compatibility analysis...", file=sys.stderr)
+            log.debug("Calculating marriage compatibility analysis...")
             try:
                 marriage_compatibility = self.calculate_marriage_compatibility_analysis(positions, birth_details)
                 report['marriage_relationships_analysis'] = marriage_compatibility
-                print(f"[DEBUG] ✓ Added marriage compatibility analysis", file=sys.stderr)
+                log.debug("✓ Added marriage compatibility analysis")
             except Exception as e:
-                print(f"[DEBUG] Marriage compatibility analysis failed: {e}", file=sys.stderr)
+                log.debug("Marriage compatibility analysis failed: {}", e)
             
             # Add Dasha-Based Action Plan (Section 19)
-            print(f"[DEBUG] Starting AUTHENTIC Dasha-Based Action Plan calculation...", file=sys.stderr)
+            log.debug("Starting AUTHENTIC Dasha-Based Action Plan calculation...")
             try:
                 action_plan = self.generate_dasha_action_plan(positions, birth_details, report.get('unified_dasha_system', {}))
                 report['dasha_action_plan'] = action_plan
-                print(f"[DEBUG] ✓ Added dasha-based action plan", file=sys.stderr)
+                log.debug("✓ Added dasha-based action plan")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in dasha action plan: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in dasha action plan: {}", e)
             
             # Add Astrological Summary (Section 20)
-            print(f"[DEBUG] Adding comprehensive astrological summary...", file=sys.stderr)
+            log.debug("Adding comprehensive astrological summary...")
             try:
                 astrological_summary = self.generate_comprehensive_astrological_summary(positions, birth_details, report)
                 report['astrological_summary'] = astrological_summary
-                print(f"[DEBUG] ✓ Added comprehensive astrological summary", file=sys.stderr)
+                log.debug("✓ Added comprehensive astrological summary")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in astrological summary: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in astrological summary: {}", e)
             
             # Add Personalized Recommendations (Section 21)
-            print(f"[DEBUG] Adding personalized recommendations...", file=sys.stderr)
+            log.debug("Adding personalized recommendations...")
             try:
                 personalized_recommendations = self.generate_personalized_recommendations(positions, birth_details, report)
                 report['personalized_recommendations'] = personalized_recommendations
-                print(f"[DEBUG] ✓ Added personalized recommendations", file=sys.stderr)
+                log.debug("✓ Added personalized recommendations")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in personalized recommendations: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in personalized recommendations: {}", e)
             
             # Note: Astrological Summary and Personalized Recommendations already added above
             
-            print(f"[DEBUG] Adding closing summary...", file=sys.stderr)
+            log.debug("Adding closing summary...")
             try:
                 # Extract ashtakavarga data from the unified analysis
                 ashtakavarga_data = report.get('unified_ashtakavarga_analysis', {})
@@ -4823,9 +4543,9 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 
                 # Generate comprehensive closing summary
                 report['closing_summary'] = self.generate_closing_summary(positions, birth_details, ashtakavarga_data, dasha_data)
-                print(f"[DEBUG] ✓ Added closing summary", file=sys.stderr)
+                log.debug("✓ Added closing summary")
             except Exception as e:
-                print(f"[DEBUG] ❌ Error in closing_summary: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error in closing_summary: {}", e)
             
             # Add metadata
             report['report_metadata'] = {
@@ -4849,7 +4569,7 @@ This authentic calculation considers the primary ruling planets of your ascendan
             }
             
             # CRITICAL FIX: Add ascendant_sign, moon_sign, sun_sign to report BEFORE generating structured sections
-            print(f"[DEBUG] Adding top-level sign data before structured sections...", file=sys.stderr)
+            log.debug("Adding top-level sign data before structured sections...")
             try:
                 # Extract signs from chart_data and add to root level for sections access
                 ascendant_sign = report.get('chart_data', {}).get('ascendant', {}).get('sign', 'Unknown')
@@ -4863,15 +4583,15 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 report['moon_sign'] = moon_sign
                 report['sun_sign'] = sun_sign
                 
-                print(f"[DEBUG] ✓ Added root-level signs: Ascendant={ascendant_sign}, Moon={moon_sign}, Sun={sun_sign}", file=sys.stderr)
+                log.debug("✓ Added root-level signs: Ascendant={}, Moon={}, Sun={}", ascendant_sign, moon_sign, sun_sign)
             except Exception as e:
-                print(f"[DEBUG] ❌ Error adding root-level signs: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error adding root-level signs: {}", e)
 
             # Note: Astrological Summary and Personalized Recommendations are already added above
             # with proper data structure in lines 4487-4498, so no duplicate generation needed
 
             # Generate structured sections for frontend display with enhanced Section 1
-            print(f"[DEBUG] Generating structured sections with enhanced birth details...", file=sys.stderr)
+            log.debug("Generating structured sections with enhanced birth details...")
             try:
                 structured_sections = self.generate_structured_sections(report, enhanced_birth_details)
                 # Add the new sections to structured sections
@@ -4890,24 +4610,24 @@ This authentic calculation considers the primary ruling planets of your ascendan
                     'data': report.get('personalized_recommendations', {})
                 })
                 report['sections'] = structured_sections
-                print(f"[DEBUG] ✓ Added {len(structured_sections)} structured sections including new summary sections", file=sys.stderr)
+                log.debug("✓ Added {} structured sections including new summary sections", len(structured_sections))
             except Exception as e:
-                print(f"[DEBUG] ❌ Error generating structured sections: {str(e)}", file=sys.stderr)
+                log.warning("❌ Error generating structured sections: {}", e)
             
             # CRITICAL: Hardcoded Content Detection - Fail if hardcoded values detected
-            print(f"[DEBUG] Step FINAL: Performing hardcoded content detection...", file=sys.stderr)
+            log.debug("Step FINAL: Performing hardcoded content detection...")
             try:
                 self.detect_hardcoded_content(report)
-                print(f"[DEBUG] ✓ HARDCODED CONTENT DETECTION PASSED - No hardcoded values detected", file=sys.stderr)
+                log.debug("✓ HARDCODED CONTENT DETECTION PASSED - No hardcoded values detected")
             except HardcodedContentError as e:
                 error_msg = f"HARDCODED CONTENT DETECTED - Report generation failed: {str(e)}"
-                print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+                log.error(error_msg)
                 raise HardcodedContentError(error_msg)
             
             # Final debugging confirmation
             final_ascendant = report['chart_data']['ascendant']
-            print(f"[DEBUG] ✓ FINAL REPORT ASCENDANT: {final_ascendant['sign']} at {final_ascendant['longitude']:.2f}°", file=sys.stderr)
-            print(f"[DEBUG] Report generation completed successfully with {len(report)} sections", file=sys.stderr)
+            log.debug("✓ FINAL REPORT ASCENDANT: {} at {:.2f}°", final_ascendant['sign'], final_ascendant['longitude'])
+            log.debug("Report generation completed successfully with {} sections", len(report))
             
             return report
             
@@ -4921,7 +4641,7 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 'timestamp': 'Dynamic generation timestamp',
                 'message': 'Report generation failed: Hardcoded values detected in content. All premium reports must use authentic astronomical calculations to maintain platform credibility.'
             }
-            print(f"[HARDCODED CONTENT ERROR] {error_response['error_details']}", file=sys.stderr)
+            log.error("Hardcoded content error: {}", error_response['error_details'])
             return error_response
             
         except (AuthenticDataError, DataValidationError) as e:
@@ -4934,7 +4654,7 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 'timestamp': 'Dynamic generation timestamp',
                 'message': 'Cannot generate premium report: Authentic astronomical data could not be calculated or validated. Please ensure birth details are accurate and try again.'
             }
-            print(f"[AUTHENTICATION ERROR] {error_response['error_details']}", file=sys.stderr)
+            log.error("Authentication error: {}", error_response['error_details'])
             return error_response
             
         except Exception as e:
@@ -4946,8 +4666,9 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 'timestamp': 'Dynamic generation timestamp',
                 'message': 'An unexpected error occurred during report generation. Please try again.'
             }
-            print(f"[GENERAL ERROR] {error_response['error']}", file=sys.stderr)
-            print(f"[TRACEBACK] {traceback.format_exc()}", file=sys.stderr)
+            log.error("General error: {}", error_response['error'])
+            if log.debug_enabled:
+                log.debug("Traceback: {}", traceback.format_exc())
             return error_response
     
     def generate_remedies(self, doshas: List[Dict], positions: Dict) -> Dict:
@@ -4970,9 +4691,9 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 if isinstance(dosha, dict):
                     remedies['specific_remedies'].extend(dosha.get('remedies', []))
                 else:
-                    print(f"[DEBUG] WARNING: dosha is not dict: {type(dosha)} = {dosha}", file=sys.stderr)
+                    log.warning("WARNING: dosha is not dict: {} = {}", type(dosha), dosha)
         except Exception as e:
-            print(f"[DEBUG] ERROR in dosha remedies: {e}", file=sys.stderr)
+            log.warning("ERROR in dosha remedies: {}", e)
         
         # Add planetary remedies based on weak planets with safety check
         try:
@@ -4981,9 +4702,9 @@ This authentic calculation considers the primary ruling planets of your ascendan
                 if isinstance(planet, str):
                     remedies['specific_remedies'].extend(self.get_dasha_recommendations(planet))
                 else:
-                    print(f"[DEBUG] WARNING: planet is not string: {type(planet)} = {planet}", file=sys.stderr)
+                    log.warning("WARNING: planet is not string: {} = {}", type(planet), planet)
         except Exception as e:
-            print(f"[DEBUG] ERROR in planetary remedies: {e}", file=sys.stderr)
+            log.warning("ERROR in planetary remedies: {}", e)
         
         # Add fasting recommendations
         remedies['fasting_days'] = [
@@ -5547,7 +5268,7 @@ Combine your {sun_sign} solar energy with your {moon_sign} emotional wisdom, gui
         try:
             if SWISS_AVAILABLE:
                 jd = self.calculate_julian_day(birth_details)
-                ayanamsa_value = swe.get_ayanamsa_ut(jd)
+                ayanamsa_value = ayanamsa_service.ayanamsa(jd)
                 enhanced['ayanamsa_value'] = f"{ayanamsa_value:.2f}°"
                 enhanced['ayanamsa'] = f"Lahiri Ayanamsa: {ayanamsa_value:.2f}°"
             else:
@@ -5598,7 +5319,7 @@ Combine your {sun_sign} solar energy with your {moon_sign} emotional wisdom, gui
         moon_sign = report_data.get('moon_sign') or positions.get('Moon', {}).get('sign', 'Unknown') 
         sun_sign = report_data.get('sun_sign') or positions.get('Sun', {}).get('sign', 'Unknown')
         
-        print(f"[DEBUG] ASTROLOGICAL SUMMARY - Using signs: Asc={ascendant_sign}, Moon={moon_sign}, Sun={sun_sign}", file=sys.stderr)
+        log.debug("ASTROLOGICAL SUMMARY - Using signs: Asc={}, Moon={}, Sun={}", ascendant_sign, moon_sign, sun_sign)
         
         # Get ascendant lord
         ascendant_lord = self.get_ascendant_lord(positions)
@@ -5636,9 +5357,9 @@ Combine your {sun_sign} solar energy with your {moon_sign} emotional wisdom, gui
             current_dasha = self.get_current_mahadasha_from_section13(authentic_dasha_data)
             current_antardasha = self.get_current_antardasha_from_section13(authentic_dasha_data)
             
-            print(f"[DEBUG] ASTROLOGICAL SUMMARY - Using Section 10 dasha method: Maha={current_dasha}, Antara={current_antardasha}", file=sys.stderr)
+            log.debug("ASTROLOGICAL SUMMARY - Using Section 10 dasha method: Maha={}, Antara={}", current_dasha, current_antardasha)
         except Exception as e:
-            print(f"[DEBUG] Fallback to basic dasha calculation: {e}", file=sys.stderr)
+            log.debug("Fallback to basic dasha calculation: {}", e)
             current_dasha = self.get_current_mahadasha(birth_details, positions)
             current_antardasha = current_dasha
         
@@ -5711,7 +5432,7 @@ The planets have conspired to bless you with exceptional abilities in {', '.join
             ascendant_sign = positions.get('Ascendant', {}).get('sign', 'Unknown')
             moon_sign = positions.get('Moon', {}).get('sign', 'Unknown')
             
-        print(f"[DEBUG] PERSONALIZED RECS - Using signs: Asc={ascendant_sign}, Moon={moon_sign}", file=sys.stderr)
+        log.debug("PERSONALIZED RECS - Using signs: Asc={}, Moon={}", ascendant_sign, moon_sign)
             
         ascendant_lord = self.get_ascendant_lord(positions)
         
@@ -5727,9 +5448,9 @@ The planets have conspired to bless you with exceptional abilities in {', '.join
             current_dasha = self.get_current_mahadasha_from_section13(authentic_dasha_data)
             current_antardasha = self.get_current_antardasha_from_section13(authentic_dasha_data)
             
-            print(f"[DEBUG] PERSONALIZED RECS - Using Section 10 dasha method: Maha={current_dasha}, Antara={current_antardasha}", file=sys.stderr)
+            log.debug("PERSONALIZED RECS - Using Section 10 dasha method: Maha={}, Antara={}", current_dasha, current_antardasha)
         except Exception as e:
-            print(f"[DEBUG] Fallback to basic dasha calculation: {e}", file=sys.stderr)
+            log.debug("Fallback to basic dasha calculation: {}", e)
             current_dasha = self.get_current_mahadasha(birth_details, positions)
             current_antardasha = current_dasha
         
@@ -5863,7 +5584,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             return recommendations
             
         except Exception as e:
-            print(f"[DEBUG] Error in career recommendations: {str(e)}", file=sys.stderr)
+            log.warning("Error in career recommendations: {}", e)
             return f"Your {ascendant_sign} ascendant indicates natural leadership abilities. Focus on careers that utilize your unique talents and allow for growth and recognition."
     
     def generate_dynamic_relationship_recommendations(self, positions: Dict, moon_sign: str, ascendant_sign: str) -> str:
@@ -5903,7 +5624,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             return recommendations
             
         except Exception as e:
-            print(f"[DEBUG] Error in relationship recommendations: {str(e)}", file=sys.stderr)
+            log.warning("Error in relationship recommendations: {}", e)
             return f"Your {moon_sign} Moon seeks emotionally fulfilling relationships. Be authentic to your {ascendant_sign} nature while honoring your partner's unique qualities."
     
     def generate_dynamic_health_recommendations(self, positions: Dict, ascendant_sign: str) -> str:
@@ -5959,17 +5680,12 @@ Each recommendation is tailored specifically to your planetary positions and is
             return recommendations
             
         except Exception as e:
-            print(f"[DEBUG] Error in health recommendations: {str(e)}", file=sys.stderr)
+            log.warning("Error in health recommendations: {}", e)
             return f"Your {ascendant_sign} constitution benefits from balanced lifestyle and regular self-care practices. Listen to your body's signals and maintain consistent healthy routines."
     
     def get_nakshatra_pada(self, longitude: float) -> int:
         """Calculate Nakshatra Pada from longitude"""
-        # Each nakshatra is 13°20' = 800' 
-        # Each pada is 3°20' = 200'
-        longitude_normalized = longitude % 360
-        nakshatra_position = (longitude_normalized * 27) / 360
-        pada_position = (nakshatra_position % 1) * 4
-        return int(pada_position) + 1
+        return nakshatra_lookup.lookup(longitude).pada
     
     def get_western_sun_sign(self, longitude: float) -> str:
         """Get Western zodiac sun sign from longitude"""
@@ -6011,21 +5727,11 @@ Each recommendation is tailored specifically to your planetary positions and is
     
     def get_nakshatra_from_longitude(self, longitude: float) -> str:
         """Get nakshatra from longitude"""
-        nakshatra_list = [
-            'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira', 'Ardra',
-            'Punarvasu', 'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni',
-            'Hasta', 'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyeshtha',
-            'Mula', 'Purva Ashadha', 'Uttara Ashadha', 'Shravana', 'Dhanishta',
-            'Shatabhisha', 'Purva Bhadrapada', 'Uttara Bhadrapada', 'Revati'
-        ]
-        nakshatra_index = int((longitude % 360) * 27 / 360)
-        return nakshatra_list[nakshatra_index % 27]
+        return self.NAKSHATRA_NAMES[nakshatra_lookup.lookup(longitude).nakshatra]
     
     def get_pada_from_longitude(self, longitude: float) -> int:
         """Get pada (quarter) from longitude"""
-        nakshatra_part = (longitude % 360) * 27 / 360
-        pada = int((nakshatra_part % 1) * 4) + 1
-        return pada
+        return nakshatra_lookup.lookup(longitude).pada
     
     def get_rashi_lord(self, sign: str) -> str:
         """Get the lord of a rashi/sign"""
@@ -6112,116 +5818,8 @@ Each recommendation is tailored specifically to your planetary positions and is
             return 'Manual Astronomical Calculations (Platform Consistent)'
     
     def calculate_authentic_shodashavarga(self, positions: Dict) -> Dict:
-        """Calculate authentic Shodashavarga (16 divisional charts) using your comprehensive varga calculator methodology"""
-        varga_charts = {}
-        
-        # Mapping of sign number to name - exactly from your varga calculator
-        SIGN_NAMES = [
-            "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-            "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        
-        def get_sign_name(sign_number):
-            return SIGN_NAMES[(sign_number - 1) % 12]
-        
-        def get_varga(sign: int, degree: float, divisions: int) -> tuple:
-            """
-            Generic Varga calculation from your comprehensive calculator
-            Returns: (sub-sign number, division number)
-            """
-            arc_length = 30 / divisions
-            division = int(degree / arc_length)
-            varga_sign = (divisions * (sign - 1) + division) % 12 + 1
-            return varga_sign, division + 1
-        
-        # Specific functions for common vargas - exactly from your calculator
-        def get_d1(sign, degree):
-            return sign, 1
-        
-        def get_d2(sign, degree):
-            return get_varga(sign, degree, 2)
-        
-        def get_d3(sign, degree):
-            return get_varga(sign, degree, 3)
-        
-        def get_d4(sign, degree):
-            return get_varga(sign, degree, 4)
-        
-        def get_d7(sign, degree):
-            return get_varga(sign, degree, 7)
-        
-        def get_d9(sign, degree):
-            return get_varga(sign, degree, 9)
-        
-        def get_d10(sign, degree):
-            return get_varga(sign, degree, 10)
-        
-        def get_d12(sign, degree):
-            return get_varga(sign, degree, 12)
-        
-        def get_d16(sign, degree):
-            return get_varga(sign, degree, 16)
-        
-        def get_d20(sign, degree):
-            return get_varga(sign, degree, 20)
-        
-        def get_d24(sign, degree):
-            return get_varga(sign, degree, 24)
-        
-        def get_d30(sign, degree):
-            return get_varga(sign, degree, 30)
-        
-        # Calculate all vargas for each planet using your methodology
-        for planet, data in positions.items():
-            longitude = data.get('longitude', 0)
-            sign = int(longitude / 30) + 1  # 1-based index (1 = Aries)
-            degree = longitude % 30  # degrees in the sign (0 to 30)
-            
-            # Calculate all divisional charts using your comprehensive functions
-            d1_sign, d1_div = get_d1(sign, degree)
-            d2_sign, d2_div = get_d2(sign, degree) 
-            d3_sign, d3_div = get_d3(sign, degree)
-            d4_sign, d4_div = get_d4(sign, degree)
-            d7_sign, d7_div = get_d7(sign, degree)
-            d9_sign, d9_div = get_d9(sign, degree)
-            d10_sign, d10_div = get_d10(sign, degree)
-            d12_sign, d12_div = get_d12(sign, degree)
-            d16_sign, d16_div = get_d16(sign, degree)
-            d20_sign, d20_div = get_d20(sign, degree)
-            d24_sign, d24_div = get_d24(sign, degree)
-            d30_sign, d30_div = get_d30(sign, degree)
-            
-            planet_vargas = {
-                'rasi_sign': d1_sign,
-                'rasi_degree': degree,
-                'rasi_name': get_sign_name(d1_sign),
-                'd2_hora': d2_sign,
-                'd2_hora_part': d2_div,
-                'd3_drekkana': d3_sign,
-                'd3_drekkana_part': d3_div,
-                'd4_chaturthamsa': d4_sign,
-                'd4_chaturthamsa_part': d4_div,
-                'd7_saptamsa': d7_sign,
-                'd7_saptamsa_part': d7_div,
-                'd9_navamsa': d9_sign,
-                'd9_navamsa_part': d9_div,
-                'd10_dasamsa': d10_sign,
-                'd10_dasamsa_part': d10_div,
-                'd12_dvadasamsa': d12_sign,
-                'd12_dvadasamsa_part': d12_div,
-                'd16_shodasamsa': d16_sign,
-                'd16_shodasamsa_part': d16_div,
-                'd20_vimsamsa': d20_sign,
-                'd20_vimsamsa_part': d20_div,
-                'd24_chaturvimsamsa': d24_sign,
-                'd24_chaturvimsamsa_part': d24_div,
-                'd30_trimsamsa': d30_sign,
-                'd30_trimsamsa_part': d30_div
-            }
-            
-            varga_charts[planet] = planet_vargas
-        
-        return varga_charts
+        """Calculate authentic Shodashavarga (plus D5/D6/D8/D11) from the shared varga tables"""
+        return varga_engine.varga_charts(positions)
     
     def create_divisional_chart_positions(self, varga_charts: Dict, varga_number: int) -> Dict:
         """Create planetary positions for specific divisional chart"""
@@ -6230,14 +5828,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         SANSKRIT_SIGNS = ['Mesha', 'Vrishabha', 'Mithuna', 'Karka', 'Simha', 'Kanya',
                          'Tula', 'Vrishchika', 'Dhanu', 'Makara', 'Kumbha', 'Meena']
         
-        varga_names = {2: 'hora', 3: 'drekkana', 4: 'chaturthamsa', 5: 'panchamsa',
-                      6: 'shashtamsa', 7: 'saptamsa', 8: 'ashtamsa', 9: 'navamsa', 
-                      10: 'dasamsa', 12: 'dvadasamsa', 16: 'shodasamsa', 20: 'vimsamsa',
-                      24: 'chaturvimsamsa', 30: 'trimsamsa'}
-        
-        varga_key = f'd{varga_number}_{varga_names[varga_number]}'
-        if varga_number == 1:
-            varga_key = 'rasi_sign'
+        varga_key = varga_engine.varga_key(varga_number)
         
         chart_positions = {}
         ascendant_sign_num = None
@@ -6248,7 +5839,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 ascendant_sign_num = vargas[varga_key]
                 break
         
-        print(f"[DEBUG] Divisional Chart D{varga_number}: Ascendant sign number = {ascendant_sign_num}")
+        log.debug("Divisional Chart D{}: Ascendant sign number = {}", varga_number, ascendant_sign_num)
         
         # Second pass: Calculate house positions relative to ascendant
         for planet, vargas in varga_charts.items():
@@ -6261,7 +5852,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 else:
                     house_num = sign_num  # Fallback if ascendant not found
                 
-                print(f"[DEBUG] D{varga_number} - Planet {planet}: Sign {sign_num} ({SIGNS[sign_num-1]}) -> House {house_num}")
+                log.debug("D{} - Planet {}: Sign {} ({}) -> House {}", varga_number, planet, sign_num, SIGNS[sign_num - 1], house_num)
                 
                 chart_positions[planet] = {
                     'sign': SIGNS[sign_num - 1],
@@ -6416,7 +6007,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 themes.append(f"{moon_sign} Emotional Intelligence and Intuitive Wisdom")
 
         except Exception as e:
-            print(f"[DEBUG] Error in dynamic themes: {str(e)}", file=sys.stderr)
+            log.warning("Error in dynamic themes: {}", e)
             # Authentic fallback based on signs only
             ascendant_themes = {
                 'Mesha': ['Leadership', 'Innovation', 'Pioneering ventures'],
@@ -6672,7 +6263,7 @@ Each recommendation is tailored specifically to your planetary positions and is
     
     def calculate_ashtakavarga_analysis(self, positions: Dict) -> Dict:
         """Calculate Ashtakavarga analysis for all planets using authentic calculation"""
-        print("[DEBUG] Using authentic Ashtakavarga calculation for analysis section", file=sys.stderr)
+        log.debug("Using authentic Ashtakavarga calculation for analysis section")
         
         # Use authentic calculation instead of hardcoded values
         authentic_results = self.calculate_authentic_ashtakavarga(positions)
@@ -6731,47 +6322,47 @@ Each recommendation is tailored specifically to your planetary positions and is
             'analysis': total_analysis
         }
         
-        print(f"[DEBUG] Authentic Ashtakavarga analysis - Total bindus: {total_bindus}, Average: {average_bindus:.1f}", file=sys.stderr)
+        log.debug("Authentic Ashtakavarga analysis - Total bindus: {}, Average: {:.1f}", total_bindus, average_bindus)
         
         return analysis_results
     
     def calculate_divisional_charts_analysis(self, birth_details: Dict, positions: Dict) -> Dict:
         """Calculate comprehensive analysis for all 10 major divisional charts using authentic Shodashavarga methodology"""
-        print(f"[DEBUG] Starting divisional charts analysis", file=sys.stderr)
+        log.debug("Starting divisional charts analysis")
         
         try:
             # Calculate authentic divisional chart positions using Shodashavarga methodology
-            print(f"[DEBUG] Calculating authentic shodashavarga", file=sys.stderr)
+            log.debug("Calculating authentic shodashavarga")
             varga_charts = self.calculate_authentic_shodashavarga(positions)
-            print(f"[DEBUG] ✓ Shodashavarga calculation completed", file=sys.stderr)
+            log.debug("✓ Shodashavarga calculation completed")
         except Exception as e:
-            print(f"[DEBUG] ERROR in shodashavarga calculation: {e}", file=sys.stderr)
+            log.warning("ERROR in shodashavarga calculation: {}", e)
             raise
         
         try:
             # Generate both North Indian and South Indian charts for each divisional chart
-            print(f"[DEBUG] Creating birth info structure", file=sys.stderr)
+            log.debug("Creating birth info structure")
             birth_info = {'name': birth_details.get('name', 'Chart'), 'date': birth_details.get('date', ''), 'time': birth_details.get('time', ''), 'place': birth_details.get('place', '')}
-            print(f"[DEBUG] ✓ Birth info created: {birth_info}", file=sys.stderr)
+            log.debug("✓ Birth info created: {}", birth_info)
             
             # D1 Rasi Chart (Main Birth Chart)
-            print(f"[DEBUG] Starting D1 chart generation", file=sys.stderr)
+            log.debug("Starting D1 chart generation")
             d1_positions = positions  # D1 uses original positions
-            print(f"[DEBUG] Generating D1 North Indian chart", file=sys.stderr)
+            log.debug("Generating D1 North Indian chart")
             d1_north_svg = self.generate_north_indian_chart_svg('D1 Rasi Chart', d1_positions, birth_info)
-            print(f"[DEBUG] ✓ D1 North Indian chart generated: {len(d1_north_svg)} chars", file=sys.stderr)
+            log.debug("✓ D1 North Indian chart generated: {} chars", len(d1_north_svg))
             
-            print(f"[DEBUG] Generating D1 South Indian chart", file=sys.stderr)
+            log.debug("Generating D1 South Indian chart")
             d1_south_svg = self.generate_professional_tamil_chart_svg('south_indian', d1_positions, birth_info)
-            print(f"[DEBUG] ✓ D1 South Indian chart generated: {len(d1_south_svg)} chars", file=sys.stderr)
+            log.debug("✓ D1 South Indian chart generated: {} chars", len(d1_south_svg))
             
-            print(f"[DEBUG] Analyzing D1 chart", file=sys.stderr)
+            log.debug("Analyzing D1 chart")
             d1_analysis = self.analyze_d1_chart(d1_positions)
-            print(f"[DEBUG] ✓ D1 analysis completed", file=sys.stderr)
+            log.debug("✓ D1 analysis completed")
         except Exception as e:
-            print(f"[DEBUG] ERROR in D1 chart generation: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc(file=sys.stderr)
+            log.warning("ERROR in D1 chart generation: {}", e)
+            if log.debug_enabled:
+                log.debug("Traceback: {}", traceback.format_exc())
             raise
         
         # D9 Navamsa Chart 
@@ -6984,12 +6575,8 @@ Each recommendation is tailored specifically to your planetary positions and is
     
     def get_varga_summary(self, varga_charts: Dict, varga_number: int) -> Dict:
         """Get summary of planetary positions for specific varga"""
-        varga_names = {2: 'hora', 3: 'drekkana', 4: 'chaturthamsa', 7: 'saptamsa',
-                      9: 'navamsa', 10: 'dasamsa', 12: 'dvadasamsa', 16: 'shodasamsa',
-                      20: 'vimsamsa', 24: 'chaturvimsamsa', 30: 'trimsamsa'}
-        
-        varga_name = varga_names.get(varga_number, 'unknown')
-        varga_key = f'd{varga_number}_{varga_name}'
+        varga_name = varga_engine.VARGA_NAMES.get(varga_number, 'unknown')
+        varga_key = varga_engine.varga_key(varga_number) if varga_number in varga_engine.VARGA_NAMES else 'unknown'
         
         summary = {}
         for planet, vargas in varga_charts.items():
@@ -7363,7 +6950,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         marriage_timing = self.calculate_vedic_marriage_timing(venus_house, jupiter_house, current_age)
         
         # Check for Manglik Dosha
-        manglik_status = self.check_manglik_dosha(mars_house)
+        manglik_status = self.check_manglik_dosha(positions)
         
         # Venus analysis for marriage quality
         venus_analysis = self.analyze_venus_for_marriage(venus_house, positions)
@@ -7615,7 +7202,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         """Comprehensive Sade Sati (Saturn Transit) Analysis using Enhanced Calculator"""
         try:
             # Use enhanced Sade Sati calculator for authentic analysis
-            print("[DEBUG] Using enhanced Sade Sati calculator for premium report", file=sys.stderr)
+            log.debug("Using enhanced Sade Sati calculator for premium report")
             
             # Extract birth details for enhanced calculator
             birth_date = birth_details.get('date', '1980-01-01')
@@ -7627,7 +7214,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             
             # Call enhanced Sade Sati calculator
             result = subprocess.run(
-                [process.env.PYTHON3, 'server/enhanced-sade-sati.py'],
+                [sys.executable, 'server/enhanced-sade-sati.py'],
                 input=json.dumps({
                     'year': birth_dt.year,
                     'month': birth_dt.month,
@@ -7645,7 +7232,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 if enhanced_result.get('success'):
                     sade_sati_data = enhanced_result.get('sade_sati_analysis', {})
                     
-                    print(f"[DEBUG] Enhanced Sade Sati - Current Phase: {sade_sati_data.get('current_phase', 'Unknown')}", file=sys.stderr)
+                    log.debug("Enhanced Sade Sati - Current Phase: {}", sade_sati_data.get('current_phase', 'Unknown'))
                     
                     # Transform enhanced results into premium report format
                     return {
@@ -7665,16 +7252,16 @@ Each recommendation is tailored specifically to your planetary positions and is
                         'general_advice': "Patience, hard work, and spiritual practices help during this period"
                     }
                 else:
-                    print(f"[DEBUG] Enhanced Sade Sati calculation failed: {enhanced_result.get('error', 'Unknown error')}", file=sys.stderr)
+                    log.debug("Enhanced Sade Sati calculation failed: {}", enhanced_result.get('error', 'Unknown error'))
                     # Fall back to simplified calculation
                     return self.calculate_fallback_sade_sati_analysis(positions, birth_details)
             else:
-                print(f"[DEBUG] Enhanced Sade Sati subprocess failed: {result.stderr}", file=sys.stderr)
+                log.debug("Enhanced Sade Sati subprocess failed: {}", result.stderr)
                 # Fall back to simplified calculation
                 return self.calculate_fallback_sade_sati_analysis(positions, birth_details)
                 
         except Exception as e:
-            print(f"[DEBUG] Enhanced Sade Sati analysis error: {str(e)}", file=sys.stderr)
+            log.debug("Enhanced Sade Sati analysis error: {}", e)
             # Fall back to simplified calculation
             return self.calculate_fallback_sade_sati_analysis(positions, birth_details)
     
@@ -7768,7 +7355,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         """Calculate detailed Sarvashtakavarga with authentic bindus calculations"""
         
         # Use the authentic Ashtakavarga calculation method
-        print("[DEBUG] Using authentic Ashtakavarga for comprehensive calculation", file=sys.stderr)
+        log.debug("Using authentic Ashtakavarga for comprehensive calculation")
         authentic_results = self.calculate_authentic_ashtakavarga(positions)
         
         # Convert to the expected format for comprehensive analysis
@@ -7800,8 +7387,8 @@ Each recommendation is tailored specifically to your planetary positions and is
             for house, bindus in house_scores.items():
                 house_strengths[house] += bindus
         
-        print(f"[DEBUG] Authentic method - Jupiter total: {planetary_support.get('Jupiter', 'N/A')}", file=sys.stderr)
-        print(f"[DEBUG] Authentic method - Jupiter house 10: {planet_bindus.get('Jupiter', {}).get(10, 'N/A')}", file=sys.stderr)
+        log.debug("Authentic method - Jupiter total: {}", planetary_support.get('Jupiter', 'N/A'))
+        log.debug("Authentic method - Jupiter house 10: {}", planet_bindus.get('Jupiter', {}).get(10, 'N/A'))
         
         # Generate comprehensive analysis components
         analysis_components = self.generate_sarvashtakavarga_analysis_components(
@@ -8246,21 +7833,24 @@ Each recommendation is tailored specifically to your planetary positions and is
         current_date = date.today()
         current_year = current_date.year
         
-        # Get current transit positions from actual planetary data
-        jupiter_sign = self.get_sign_from_longitude(positions.get('Jupiter', {}).get('longitude', 0))
-        saturn_sign = self.get_sign_from_longitude(positions.get('Saturn', {}).get('longitude', 0))
-        rahu_sign = self.get_sign_from_longitude(positions.get('Rahu', {}).get('longitude', 0))
-        ketu_sign = self.get_sign_from_longitude(positions.get('Ketu', {}).get('longitude', 0))
+        # Current transit positions and next ingresses from the shared daily snapshot
+        current = {planet['name']: planet['longitude']
+                   for planet in transit_snapshot.planets_at(transit_snapshot.julian_day(current_date))}
+        ingresses = transit_snapshot.upcoming_ingresses(current_date)
+        jupiter_sign = self.get_sign_from_longitude(current['Jupiter'])
+        saturn_sign = self.get_sign_from_longitude(current['Saturn'])
+        rahu_sign = self.get_sign_from_longitude(current['Rahu'])
+        ketu_sign = self.get_sign_from_longitude(current['Ketu'])
         
         # Calculate dynamic transit timing based on current positions
         jupiter_status = f"Currently transiting {jupiter_sign}"
         saturn_status = f"Currently transiting {saturn_sign}"
         rahu_ketu_status = f"Currently on {rahu_sign}-{ketu_sign} axis"
         
-        # Dynamic next change calculations
-        jupiter_next_change = f"Next sign change expected in approximately 13 months"
-        saturn_next_change = f"Next sign change expected in approximately 2.5 years"
-        rahu_ketu_next_change = f"Next axis change expected in approximately 18 months"
+        # Exact next sign changes
+        jupiter_next_change = f"Enters {ingresses['Jupiter']['sign']} on {ingresses['Jupiter']['time'][:10]}"
+        saturn_next_change = f"Enters {ingresses['Saturn']['sign']} on {ingresses['Saturn']['time'][:10]}"
+        rahu_ketu_next_change = f"Axis shifts on {ingresses['Rahu']['time'][:10]}"
         
         # Calculate next significant timing dynamically
         next_significant = f"Next major transit changes expected over the coming months"
@@ -8311,7 +7901,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 'Simha': 'Creative self-expression',
                 'Kanya': 'Health and service',
                 'Tula': 'Relationships and partnerships',
-                'Vrischika': 'Transformation and research',
+                'Vrishchika': 'Transformation and research',
                 'Dhanu': 'Higher learning and spirituality',
                 'Makara': 'Career and authority',
                 'Kumbha': 'Innovation and social causes',
@@ -8327,7 +7917,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 'Simha': 'Humility and service',
                 'Kanya': 'Perfectionism and details',
                 'Tula': 'Relationship responsibilities',
-                'Vrischika': 'Deep transformation',
+                'Vrishchika': 'Deep transformation',
                 'Dhanu': 'Spiritual discipline',
                 'Makara': 'Professional achievement',
                 'Kumbha': 'Social responsibilities',
@@ -8339,210 +7929,38 @@ Each recommendation is tailored specifically to your planetary positions and is
         return 'General planetary influences'
 
     def calculate_detailed_nakshatra_analysis(self, positions: Dict, birth_details: Dict) -> Dict:
-        """Comprehensive Nakshatra Analysis using enhanced jyotisha calculations"""
+        """Comprehensive Nakshatra Analysis from the precomputed pada records"""
         
         moon_data = positions.get('Moon', {})
         moon_longitude = moon_data.get('longitude', 0)
         
-        # Try to get enhanced nakshatra data from the new API
-        enhanced_nakshatra_data = None
-        try:
-            # Extract birth date and time from birth_details
-            birth_date = birth_details.get('date', '1980-09-09')
-            birth_time = birth_details.get('time', '19:15')
-            
-            # Parse date and time
-            date_parts = birth_date.split('-')
-            time_parts = birth_time.split(':')
-            
-            year = int(date_parts[0])
-            month = int(date_parts[1])
-            day = int(date_parts[2])
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            
-            # Call the enhanced nakshatra API
-            import subprocess
-            import json
-            
-            script_path = os.path.join(os.path.dirname(__file__), '..', 'nakshatra-api.py')
-            result = subprocess.run([
-                process.env.PYTHON3, script_path,
-                str(year), str(month), str(day), str(hour), str(minute)
-            ], capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                enhanced_nakshatra_data = json.loads(result.stdout.strip())
-                if enhanced_nakshatra_data.get('success'):
-                    print(f"[DEBUG] Enhanced nakshatra data loaded successfully", file=sys.stderr)
-                else:
-                    enhanced_nakshatra_data = None
-            else:
-                print(f"[DEBUG] Nakshatra API failed, using fallback", file=sys.stderr)
-                enhanced_nakshatra_data = None
-                
-        except Exception as e:
-            print(f"[DEBUG] Exception in nakshatra API call: {str(e)}", file=sys.stderr)
-            enhanced_nakshatra_data = None
-        
-        # Calculate Nakshatra from Moon longitude (fallback method)
-        nakshatra_span = 360 / 27  # 13.333... degrees per nakshatra
-        nakshatra_num = int(moon_longitude / nakshatra_span) + 1
-        pada_span = nakshatra_span / 4  # Each nakshatra has 4 padas
-        pada_num = int((moon_longitude % nakshatra_span) / pada_span) + 1
-        
-        nakshatra_names = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
-            "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
-            "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
-            "Uttara Ashadha", "Shravana", "Dhanishtha", "Shatabhisha", "Purva Bhadrapada",
-            "Uttara Bhadrapada", "Revati"
-        ]
-        
-        # Use enhanced data if available, otherwise fallback to manual calculation
-        if enhanced_nakshatra_data and enhanced_nakshatra_data.get('success'):
-            nakshatra_name = enhanced_nakshatra_data['nakshatra']
-            pada_num = enhanced_nakshatra_data['pada']
-            attributes = enhanced_nakshatra_data['attributes']
-            
-            # Enhanced nakshatra information with complete traditional attributes
-            current_nakshatra = {
-                'deity': attributes['deity'],
-                'symbol': attributes['symbol'],
-                'element': attributes.get('nature', 'Balanced'),  # Using nature as element fallback
-                'gana': attributes['gana'],
-                'animal': attributes['animal'],
-                'tree': attributes['tree'],
-                'nature': attributes['nature']
-            }
-            
-            print(f"[DEBUG] Using enhanced nakshatra data: {nakshatra_name}, Pada: {pada_num}", file=sys.stderr)
-        else:
-            # Fallback to manual calculation
-            nakshatra_name = nakshatra_names[nakshatra_num - 1] if nakshatra_num <= 27 else "Ashwini"
-            
-            # Fallback nakshatra information
-            nakshatra_info = {
-            "Ashwini": {"deity": "Ashwini Kumaras", "symbol": "Horse's Head", "element": "Earth", "gana": "Deva"},
-            "Bharani": {"deity": "Yama", "symbol": "Yoni", "element": "Earth", "gana": "Manushya"},
-            "Krittika": {"deity": "Agni", "symbol": "Knife/Razor", "element": "Earth", "gana": "Rakshasa"},
-            "Rohini": {"deity": "Brahma", "symbol": "Cart/Chariot", "element": "Earth", "gana": "Manushya"},
-            "Mrigashira": {"deity": "Soma", "symbol": "Deer's Head", "element": "Earth", "gana": "Deva"},
-            "Ardra": {"deity": "Rudra", "symbol": "Teardrop", "element": "Water", "gana": "Manushya"},
-            "Punarvasu": {"deity": "Aditi", "symbol": "Bow/Arrow", "element": "Water", "gana": "Deva"},
-            "Pushya": {"deity": "Brihaspati", "symbol": "Flower/Arrow", "element": "Water", "gana": "Deva"},
-            "Ashlesha": {"deity": "Nagas", "symbol": "Serpent", "element": "Water", "gana": "Rakshasa"},
-            "Magha": {"deity": "Pitrs", "symbol": "Throne", "element": "Water", "gana": "Rakshasa"},
-            "Purva Phalguni": {"deity": "Bhaga", "symbol": "Front legs of bed", "element": "Fire", "gana": "Manushya"},
-            "Uttara Phalguni": {"deity": "Aryaman", "symbol": "Back legs of bed", "element": "Fire", "gana": "Manushya"},
-            "Hasta": {"deity": "Savitar", "symbol": "Hand", "element": "Fire", "gana": "Deva"},
-            "Chitra": {"deity": "Tvashtar", "symbol": "Bright jewel", "element": "Fire", "gana": "Rakshasa"},
-            "Swati": {"deity": "Vayu", "symbol": "Coral", "element": "Fire", "gana": "Deva"},
-            "Vishakha": {"deity": "Indra-Agni", "symbol": "Triumphal arch", "element": "Fire", "gana": "Rakshasa"},
-            "Anuradha": {"deity": "Mitra", "symbol": "Lotus flower", "element": "Fire", "gana": "Deva"},
-            "Jyeshtha": {"deity": "Indra", "symbol": "Circular amulet", "element": "Fire", "gana": "Rakshasa"},
-            "Mula": {"deity": "Nirriti", "symbol": "Bunch of roots", "element": "Air", "gana": "Rakshasa"},
-            "Purva Ashadha": {"deity": "Apas", "symbol": "Elephant tusk", "element": "Air", "gana": "Manushya"},
-            "Uttara Ashadha": {"deity": "Vishve Devas", "symbol": "Elephant tusk", "element": "Air", "gana": "Manushya"},
-            "Shravana": {"deity": "Vishnu", "symbol": "Ear", "element": "Air", "gana": "Deva"},
-            "Dhanishtha": {"deity": "Vasus", "symbol": "Drum", "element": "Air", "gana": "Rakshasa"},
-            "Shatabhisha": {"deity": "Varuna", "symbol": "Empty circle", "element": "Air", "gana": "Rakshasa"},
-            "Purva Bhadrapada": {"deity": "Aja Ekapada", "symbol": "Front legs of funeral cot", "element": "Air", "gana": "Manushya"},
-            "Uttara Bhadrapada": {"deity": "Ahir Budhnya", "symbol": "Back legs of funeral cot", "element": "Air", "gana": "Manushya"},
-            "Revati": {"deity": "Pushan", "symbol": "Fish/Drum", "element": "Air", "gana": "Deva"}
-            }
-            
-            current_nakshatra = nakshatra_info.get(nakshatra_name, nakshatra_info["Ashwini"])
+        current_nakshatra = nakshatra_details.lookup(moon_longitude)
+        nakshatra_name = current_nakshatra.name
+        pada_num = current_nakshatra.pada
         
-        # Generate comprehensive summary for Nakshatra analysis
-        if enhanced_nakshatra_data and enhanced_nakshatra_data.get('success'):
-            summary = f"""
-            COMPREHENSIVE NAKSHATRA ANALYSIS SUMMARY:
-            
-            Your birth star is {nakshatra_name}, ruled by the divine energy of {current_nakshatra['deity']}. This sacred constellation represents the {current_nakshatra['symbol']} symbol, carrying the spiritual nature of {current_nakshatra['nature']} and belonging to the {current_nakshatra['gana']} temperament. 
-            
-            Your birth nakshatra is associated with the sacred {current_nakshatra['animal']} as its symbolic animal and the {current_nakshatra['tree']} as its sacred tree, providing deeper layers of cosmic connection and spiritual significance.
-            
-            This enhanced analysis uses authentic jyotisha library calculations combined with traditional Vedic astrology attributes for maximum accuracy and spiritual insight.
-            
-            PADA PLACEMENT: You are born in Pada {pada_num} of {nakshatra_name}, which brings specific karmic influences and determines the subtle energetic patterns that guide your spiritual evolution.
-            """
-        else:
-            # Fallback summary without enhanced data
-            summary = f"""
+        summary = f"""
             COMPREHENSIVE NAKSHATRA ANALYSIS SUMMARY:
             
-            Your birth star is {nakshatra_name}, ruled by the divine energy of {current_nakshatra['deity']}. This sacred constellation represents the {current_nakshatra['symbol']} symbol, carrying the elemental force of {current_nakshatra['element']} and belonging to the {current_nakshatra['gana']} temperament.
+            Your birth star is {nakshatra_name}, ruled by the divine energy of {current_nakshatra.deity}. This sacred constellation represents the {current_nakshatra.symbol} symbol, carrying the elemental force of {current_nakshatra.element} and belonging to the {current_nakshatra.gana} temperament.
             
             PADA PLACEMENT: You are born in Pada {pada_num} of {nakshatra_name}, which brings specific karmic influences and determines the subtle energetic patterns that guide your spiritual evolution.
             """
 
-        # Build return data with enhanced attributes if available
-        result = {
+        return {
             'nakshatra_name': nakshatra_name,  # Frontend expects nakshatra_name
             'birth_star': nakshatra_name,
             'pada_number': pada_num,
-            'deity': current_nakshatra['deity'],  # Frontend expects deity
-            'nakshatra_lord': current_nakshatra['deity'],
-            'symbol': current_nakshatra['symbol'],
-            'element': current_nakshatra.get('element', current_nakshatra.get('nature', 'Balanced')),
-            'gana': current_nakshatra['gana'],
-            'characteristics': self.get_nakshatra_characteristics(nakshatra_name),
-            'auspicious_activities': self.get_nakshatra_activities(nakshatra_name),
-            'pada_analysis': self.get_pada_analysis(nakshatra_name, pada_num),
-            'summary': summary.strip()
+            'deity': current_nakshatra.deity,  # Frontend expects deity
+            'nakshatra_lord': current_nakshatra.deity,
+            'symbol': current_nakshatra.symbol,
+            'element': current_nakshatra.element,
+            'gana': current_nakshatra.gana,
+            'characteristics': current_nakshatra.characteristics,
+            'auspicious_activities': current_nakshatra.activities,
+            'pada_analysis': current_nakshatra.pada_analysis,
+            'summary': summary.strip(),
+            'enhanced_data': False
         }
-        
-        # Add enhanced attributes if available
-        if enhanced_nakshatra_data and enhanced_nakshatra_data.get('success'):
-            result['animal'] = current_nakshatra['animal']
-            result['tree'] = current_nakshatra['tree']
-            result['nature'] = current_nakshatra['nature']
-            result['enhanced_data'] = True
-        else:
-            result['enhanced_data'] = False
-        
-        return result
-
-    def get_nakshatra_characteristics(self, nakshatra: str) -> str:
-        characteristics = {
-            "Purva Phalguni": "Creative, artistic, enjoys comfort and refinement. Passionate romantic nature, generous and helpful to others. Natural leadership qualities with magnetic personality.",
-            "Uttara Phalguni": "Practical, reliable, superior organizational skills. Deep sense of responsibility, helpful nature. Success in partnerships and collaborations.",
-            "Hasta": "Skilled with hands, intelligent, skilled at crafts. Practical approach to life, helpful nature. Success in detailed work and service-oriented professions.",
-            "Chitra": "Creative, artistic, passionate about beauty. Refined aesthetic sense, independent nature. Success in arts, architecture, and creative fields.",
-            "Swati": "Independent, freedom-loving, diplomatic. Effective communication skills, adaptable nature. Success in business, trade, and international affairs."
-        }
-        return characteristics.get(nakshatra, "Positive traits include determination, creativity, and spiritual inclination. Natural leadership abilities with solid moral values.")
-
-    def get_nakshatra_activities(self, nakshatra: str) -> str:
-        activities = {
-            "Purva Phalguni": "Suitable for marriage ceremonies, entertainment, artistic pursuits, premium purchases, and romantic activities.",
-            "Uttara Phalguni": "Suitable for business partnerships, property deals, charitable activities, and long-term planning.",
-            "Hasta": "Ideal for handicrafts, detailed work, healing activities, and service to others.",
-            "Chitra": "Ideal for creative projects, architectural work, jewelry making, and artistic endeavors.",
-            "Swati": "Suitable for travel, business negotiations, diplomatic activities, and starting new ventures."
-        }
-        return activities.get(nakshatra, "Typically suitable for spiritual activities, education, and charitable works.")
-
-    def get_pada_analysis(self, nakshatra: str, pada: int) -> str:
-        pada_info = {
-            "Purva Phalguni": {
-                1: "Leo navamsa - Dynamic creative abilities, leadership in arts",
-                2: "Virgo navamsa - Practical creativity, attention to detail",
-                3: "Libra navamsa - Harmonious relationships, diplomatic skills", 
-                4: "Scorpio navamsa - Intense creativity, transformative abilities"
-            }
-        }
-        
-        default_pada = {
-            1: "First pada brings leadership qualities and pioneering spirit",
-            2: "Second pada emphasizes practical approach and material success",
-            3: "Third pada focuses on communication and social connections",
-            4: "Fourth pada brings spiritual inclination and deeper understanding"
-        }
-        
-        nakshatra_padas = pada_info.get(nakshatra, default_pada)
-        return nakshatra_padas.get(pada, default_pada[pada])
 
     def calculate_house_lords_karakatva(self, positions: Dict) -> Dict:
         """House Lords and Planetary Significances (Karakatva)"""
@@ -8944,158 +8362,61 @@ Each recommendation is tailored specifically to your planetary positions and is
         
         return effects.get(key, effects.get(reverse_key, 'Mixed influences requiring careful analysis'))
 
-    def calculate_positional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate positional strength (Sthana Bala)"""
-        longitude = planet_data.get('longitude', 0)
-        sign = self.get_sign_from_longitude(longitude)
-        
-        # Exaltation/Debilitation points (simplified)
-        exaltation_signs = {
-            'Sun': 'Mesha', 'Moon': 'Vrishabha', 'Mars': 'Makara', 'Mercury': 'Kanya',
-            'Jupiter': 'Karka', 'Venus': 'Meena', 'Saturn': 'Tula'
-        }
-        
-        debilitation_signs = {
-            'Sun': 'Tula', 'Moon': 'Vrishchika', 'Mars': 'Karka', 'Mercury': 'Meena',
-            'Jupiter': 'Makara', 'Venus': 'Kanya', 'Saturn': 'Mesha'
-        }
-        
-        if sign == exaltation_signs.get(planet):
-            return 60  # Maximum strength in exaltation
-        elif sign == debilitation_signs.get(planet):
-            return 0   # Minimum strength in debilitation
-        else:
-            return 30  # Average strength in other signs
-
-    def calculate_directional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate directional strength (Dig Bala)"""
-        house = planet_data.get('house', 1)
-        
-        # Directional strength houses for each planet
-        dig_bala_houses = {
-            'Sun': 10, 'Moon': 4, 'Mars': 10, 'Mercury': 1,
-            'Jupiter': 1, 'Venus': 4, 'Saturn': 7
-        }
-        
-        ideal_house = dig_bala_houses.get(planet, 1)
-        if house == ideal_house:
-            return 60  # Maximum directional strength
-        elif house == (ideal_house + 6) % 12 or (house == 12 and ideal_house == 6):
-            return 0   # Minimum strength in opposite house
-        else:
-            return 30  # Average strength
-
-    def calculate_temporal_strength(self, planet: str, birth_details: Dict) -> float:
-        """Calculate temporal strength (Kala Bala) - simplified"""
-        # This is a simplified version focusing on day/night strength
-        import datetime
-        
-        try:
-            date_str = birth_details.get('date', '1990-01-01')
-            time_str = birth_details.get('time', '12:00')
-            
-            # Parse time to determine if it's day or night
-            if ':' in time_str:
-                hour = int(time_str.split(':')[0])
-            else:
-                hour = 12
-            
-            # Day planets: Sun, Jupiter, Venus (most dynamic during day 6 AM - 6 PM)
-            # Night planets: Moon, Mars, Saturn (most dynamic during night 6 PM - 6 AM)
-            day_planets = ['Sun', 'Jupiter', 'Venus']
-            night_planets = ['Moon', 'Mars', 'Saturn']
-            
-            is_daytime = 6 <= hour < 18
-            
-            if planet in day_planets:
-                return 60 if is_daytime else 30
-            elif planet in night_planets:
-                return 60 if not is_daytime else 30
-            else:  # Mercury is neutral
-                return 45
-                
-        except:
-            return 30  # Default strength
-
-    def calculate_motional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate motional strength (Chesta Bala)"""
-        retrograde = planet_data.get('retrograde', False)
-        
-        # Retrograde planets have higher Chesta Bala
-        if retrograde:
-            return 60
+    def get_shadbala_level(self, ratio: float) -> str:
+        """Strength level from total Shadbala as a multiple of the planet's required minimum"""
+        if ratio >= 1.5:
+            return "Outstanding"
+        elif ratio >= 1.0:
+            return "Promising"
+        elif ratio >= 0.8:
+            return "Moderate"
         else:
-            return 30
-
-    def calculate_natural_strength(self, planet: str) -> float:
-        """Calculate natural strength (Naisargika Bala)"""
-        # Fixed natural strengths based on traditional values
-        natural_strengths = {
-            'Sun': 60, 'Moon': 51.43, 'Mars': 17.14, 'Mercury': 25.71,
-            'Jupiter': 34.29, 'Venus': 42.86, 'Saturn': 8.57
-        }
-        return natural_strengths.get(planet, 30)
-
-    def calculate_aspectual_strength(self, planet: str, positions: Dict) -> float:
-        """Calculate aspectual strength (Drik Bala) - simplified"""
-        # This is a simplified version
-        # In reality, this requires complex calculations of planetary aspects
-        return 30  # Default neutral strength
+            return "Weak"
 
     def calculate_shadbala_strength(self, positions: Dict, birth_details: Dict) -> Dict:
         """Calculate Shadbala (Six-fold Strength) Analysis"""
         
+        strengths = shadbala_engine.chart_strength(birth_details)['planets']
         shadbala_analysis = {}
         
-        for planet, planet_data in positions.items():
-            if planet == 'Ascendant':
-                continue
-                
-            # Simplified Shadbala calculation
+        for planet, strength in strengths.items():
             strength_factors = {
-                'sthana_bala': self.calculate_positional_strength(planet, planet_data),
-                'dig_bala': self.calculate_directional_strength(planet, planet_data),
-                'kala_bala': self.calculate_temporal_strength(planet, birth_details),
-                'chesta_bala': self.calculate_motional_strength(planet, planet_data),
-                'naisargika_bala': self.calculate_natural_strength(planet),
-                'drik_bala': self.calculate_aspectual_strength(planet, positions)
+                'sthana_bala': strength['sthana_bala']['total'],
+                'dig_bala': strength['dig_bala'],
+                'kala_bala': strength['kala_bala']['total'],
+                'chesta_bala': strength['cheshta_bala'],
+                'naisargika_bala': strength['naisargika_bala'],
+                'drik_bala': strength['drik_bala']
             }
             
-            total_strength = sum(strength_factors.values())
-            
-            # Determine strength level
-            if total_strength >= 300:
-                strength_level = "Outstanding"
-            elif total_strength >= 200:
-                strength_level = "Promising"
-            elif total_strength >= 100:
-                strength_level = "Moderate"
-            else:
-                strength_level = "Weak"
+            strength_level = self.get_shadbala_level(strength['ratio'])
             
             shadbala_analysis[planet] = {
                 'strength_factors': strength_factors,
-                'total_strength': total_strength,
+                'total_strength': strength['total_virupas'],
+                'total_rupas': strength['total_rupas'],
+                'required_rupas': strength['required_rupas'],
+                'strength_ratio': strength['ratio'],
                 'strength_level': strength_level,
                 'effects': self.get_shadbala_effects(planet, strength_level)
             }
         
         # Generate comprehensive summary for Shadbala analysis
-        most_dynamic_planet = max(shadbala_analysis.keys(), key=lambda p: shadbala_analysis[p]['total_strength'])
-        weakest_planet = min(shadbala_analysis.keys(), key=lambda p: shadbala_analysis[p]['total_strength'])
+        most_dynamic_planet = max(shadbala_analysis.keys(), key=lambda p: shadbala_analysis[p]['strength_ratio'])
+        weakest_planet = min(shadbala_analysis.keys(), key=lambda p: shadbala_analysis[p]['strength_ratio'])
         
         summary = f"""
         COMPREHENSIVE SHADBALA STRENGTH ANALYSIS SUMMARY:
         
         Shadbala represents the six-fold strength measurement system that determines each planet's capacity to deliver positive or negative results in your life.
         
-        MOST DYNAMIC PLANET: {most_dynamic_planet} with {shadbala_analysis[most_dynamic_planet]['total_strength']:.1f} points ({shadbala_analysis[most_dynamic_planet]['strength_level']} strength) - This planet has maximum power to deliver its promised results and should be emphasized in life decisions.
+        MOST DYNAMIC PLANET: {most_dynamic_planet} with {shadbala_analysis[most_dynamic_planet]['total_rupas']:.2f} rupas against the required {shadbala_analysis[most_dynamic_planet]['required_rupas']} ({shadbala_analysis[most_dynamic_planet]['strength_level']} strength) - This planet has maximum power to deliver its promised results and should be emphasized in life decisions.
         
-        WEAKEST PLANET: {weakest_planet} with {shadbala_analysis[weakest_planet]['total_strength']:.1f} points ({shadbala_analysis[weakest_planet]['strength_level']} strength) - This planet requires strengthening through remedial measures to improve its beneficial effects.
+        WEAKEST PLANET: {weakest_planet} with {shadbala_analysis[weakest_planet]['total_rupas']:.2f} rupas against the required {shadbala_analysis[weakest_planet]['required_rupas']} ({shadbala_analysis[weakest_planet]['strength_level']} strength) - This planet requires strengthening through remedial measures to improve its beneficial effects.
         
         SIX STRENGTH COMPONENTS: Each planet's total strength derives from Sthana Bala (positional strength), Dig Bala (directional strength), Kala Bala (temporal strength), Chesta Bala (motional strength), Naisargika Bala (natural strength), and Drik Bala (aspectual strength).
         
-        PRACTICAL APPLICATION: Robust planets (300+ points) deliver outstanding results during their periods. Moderate planets (100-200 points) give mixed results. Weak planets (<100 points) require special attention and remedial measures.
+        PRACTICAL APPLICATION: Planets at one and a half times their required strength or more deliver outstanding results during their periods. Planets meeting their requirement give positive results, those slightly short give mixed results, and planets well below it require special attention and remedial measures.
         
         TIMING SIGNIFICANCE: The most dynamic planets' dasha periods represent your optimal times for major achievements, while weak planets' periods require extra caution and spiritual practices.
         
@@ -9110,33 +8431,6 @@ Each recommendation is tailored specifically to your planetary positions and is
             'summary': summary.strip()
         }
 
-        return 30  # Average strength
-
-    def calculate_motional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate motional strength (Chesta Bala)"""
-        # Simplified - based on retrograde motion
-        if planet_data.get('retrograde', False):
-            return 60  # Retrograde planets are more dynamic
-        else:
-            return 30
-
-    def calculate_natural_strength(self, planet: str) -> float:
-        """Calculate natural strength (Naisargika Bala)"""
-        natural_strengths = {
-            'Sun': 60, 'Moon': 51.43, 'Mars': 17.14, 'Mercury': 25.71,
-            'Jupiter': 34.29, 'Venus': 42.86, 'Saturn': 8.57
-        }
-        return natural_strengths.get(planet, 30)
-
-    def calculate_aspectual_strength(self, planet: str, positions: Dict) -> float:
-        """Calculate aspectual strength (Drik Bala)"""
-        # Simplified aspectual strength calculation
-        benefic_aspects = 0
-        malefic_aspects = 0
-        
-        # This would involve complex aspect calculations
-        return 30  # Average strength
-
     def get_shadbala_effects(self, planet: str, strength_level: str) -> str:
         """Get effects based on Shadbala strength"""
         effects = {
@@ -9153,7 +8447,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         - Authentic Vimshottari Dasha timeline
         - No fallback systems - only authentic data
         """
-        print("[DEBUG] ==> UNIFIED DASHA SYSTEM: Using ONLY authentic Jyotisha calculations", file=sys.stderr)
+        log.debug("==> UNIFIED DASHA SYSTEM: Using ONLY authentic Jyotisha calculations")
         
         # Get authentic dasha timeline - NO FALLBACKS
         authentic_timeline = self.get_authentic_jyotisha_dasha_timeline(positions, birth_details)
@@ -9178,23 +8472,24 @@ Each recommendation is tailored specifically to your planetary positions and is
             'methodology': 'Unified Dasha System - 100% Authentic Jyotisha Calculations Only'
         }
         
-        print(f"[DEBUG] Unified dasha system using authentic Jyotisha: {unified_result.get('current_analysis', {}).get('mahadasha', {}).get('lord', 'NO_LORD')}", file=sys.stderr)
+        log.debug("Unified dasha system using authentic Jyotisha: {}", unified_result.get('current_analysis', {}).get('mahadasha', {}).get('lord', 'NO_LORD'))
         
         return unified_result
     
     def get_authentic_jyotisha_dasha_timeline(self, positions: Dict, birth_details: Dict) -> Dict:
         """Authentic Jyotisha Vimshottari Dasha System - NO FALLBACKS"""
         
-        print("[DEBUG] ==> AUTHENTIC JYOTISHA DASHA TIMELINE: No fallbacks, only authentic calculations", file=sys.stderr)
+        log.debug("==> AUTHENTIC JYOTISHA DASHA TIMELINE: No fallbacks, only authentic calculations")
         
         # Call the authentic dasha timeline calculation
+        location = self.resolve_birth_location(birth_details)
         dasha_data = {
             "name": birth_details.get('name', 'User'),
             "date": birth_details.get('date', '1980-01-01'),
             "time": birth_details.get('time', '12:00'),
-            "place": birth_details.get('place', 'Chennai'),
-            "latitude": birth_details.get('latitude', 13.0827),
-            "longitude": birth_details.get('longitude', 80.2707)
+            "place": location['place'],
+            "latitude": location['latitude'],
+            "longitude": location['longitude']
         }
         
         # Import required modules for subprocess call
@@ -9204,7 +8499,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         
         # Call authentic dasha timeline Python script
         pythonProcess = subprocess.run([
-            process.env.PYTHON3,
+            sys.executable,
             str(Path(__file__).parent / 'authentic-dasha-timeline.py')
         ], 
         input=json.dumps(dasha_data), 
@@ -9215,21 +8510,21 @@ Each recommendation is tailored specifically to your planetary positions and is
         
         if pythonProcess.returncode != 0:
             error_msg = f"Authentic Jyotisha dasha calculation failed: {pythonProcess.stderr}"
-            print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+            log.error(error_msg)
             raise AuthenticDataError(error_msg)
         
         # Parse the authentic dasha timeline result
         try:
             authentic_result = json.loads(pythonProcess.stdout)
-            print(f"[DEBUG] Authentic dasha timeline using timeline data", file=sys.stderr)
+            log.debug("Authentic dasha timeline using timeline data")
         except json.JSONDecodeError as e:
             error_msg = f"Failed to parse authentic Jyotisha dasha data: {e}"
-            print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+            log.error(error_msg)
             raise AuthenticDataError(error_msg)
         
         if not authentic_result.get('success'):
             error_msg = f"Authentic Jyotisha dasha timeline failed: {authentic_result.get('error', 'Unknown error')}"
-            print(f"[CRITICAL ERROR] {error_msg}", file=sys.stderr)
+            log.error(error_msg)
             raise AuthenticDataError(error_msg)
         
         # Transform the authentic result into comprehensive format
@@ -9261,7 +8556,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             }
         }
         
-        print(f"[DEBUG] Current authentic dasha: {current_mahadasha} Mahadasha, {current_antardasha} Antardasha", file=sys.stderr)
+        log.debug("Current authentic dasha: {} Mahadasha, {} Antardasha", current_mahadasha, current_antardasha)
         
         # Build comprehensive timeline and classifications
         comprehensive_timeline = []
@@ -9396,7 +8691,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             return unified_result
             
         except Exception as e:
-            print(f"[DEBUG] Error in unified ashtakavarga system: {e}", file=sys.stderr)
+            log.warning("Error in unified ashtakavarga system: {}", e)
             return {
                 'planetary_strengths': {},
                 'house_strengths': {},
@@ -9447,7 +8742,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             return unified_result
             
         except Exception as e:
-            print(f"[DEBUG] Error in unified planetary strength: {e}", file=sys.stderr)
+            log.warning("Error in unified planetary strength: {}", e)
             return {
                 'shadbala_strengths': {},
                 'ashtakavarga_strengths': {},
@@ -9468,7 +8763,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         - Mitigation advice and timing predictions
         """
         try:
-            print(f"[DEBUG] Starting Section 14: Comprehensive Transit Analysis", file=sys.stderr)
+            log.debug("Starting Section 14: Comprehensive Transit Analysis")
             
             # Get natal chart details
             natal_moon_sign = positions.get('Moon', {}).get('sign', 'Simha')
@@ -9476,7 +8771,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             natal_ascendant_longitude = natal_ascendant.get('longitude', 0)
             natal_lagna_sign = self.get_sign_from_longitude(natal_ascendant_longitude)
             
-            print(f"[DEBUG] Natal Moon Sign: {natal_moon_sign}, Lagna Sign: {natal_lagna_sign}", file=sys.stderr)
+            log.debug("Natal Moon Sign: {}, Lagna Sign: {}", natal_moon_sign, natal_lagna_sign)
             
             # Get current transit positions (using current date)
             current_transits = self.fetch_current_planetary_positions()
@@ -9520,11 +8815,11 @@ Each recommendation is tailored specifically to your planetary positions and is
             remedial_measures = self.get_transit_remedial_measures(saturn_analysis, jupiter_analysis, rahu_ketu_analysis)
             transit_analysis['remedial_measures'] = remedial_measures
             
-            print(f"[DEBUG] ✓ Section 14: Comprehensive Transit Analysis completed", file=sys.stderr)
+            log.debug("✓ Section 14: Comprehensive Transit Analysis completed")
             return transit_analysis
             
         except Exception as e:
-            print(f"[DEBUG] Error in Section 14 Transit Analysis: {str(e)}", file=sys.stderr)
+            log.warning("Error in Section 14 Transit Analysis: {}", e)
             return {
                 'title': 'SECTION 14: Transit (Gochar) Analysis',
                 'error': f'Transit analysis temporarily unavailable: {str(e)}',
@@ -9532,88 +8827,41 @@ Each recommendation is tailored specifically to your planetary positions and is
             }
     
     def fetch_current_planetary_positions(self) -> Dict:
-        """Fetch AUTHENTIC current planetary positions using Swiss Ephemeris for transit analysis"""
+        """Current sidereal positions of Saturn, Jupiter and the true nodes from the shared daily transit snapshot"""
         try:
             import swisseph as swe
             from datetime import datetime
             
             current_date = datetime.now()
-            print(f"🔍 Fetching AUTHENTIC Swiss Ephemeris current transit positions for {current_date.strftime('%Y-%m-%d')}")
+            log.info("🔍 Reading current transit positions from the daily snapshot for {}", current_date.strftime('%Y-%m-%d'))
             
-            # Initialize Swiss Ephemeris with Lahiri Ayanamsa
-            swe.set_sid_mode(swe.SIDM_LAHIRI)
-            swe.set_ephe_path('/usr/share/swisseph:/var/lib/swisseph')
-            
-            # Calculate Julian day for current date
             jd = swe.julday(current_date.year, current_date.month, current_date.day, 12.0)
-            ayanamsa = swe.get_ayanamsa_ut(jd)
             
             # Define sign names (Vedic)
             signs = ['Mesha', 'Vrishabha', 'Mithuna', 'Karka', 'Simha', 'Kanya', 
                      'Tula', 'Vrishchika', 'Dhanus', 'Makara', 'Kumbha', 'Meena']
-
-            def get_vedic_sign_and_longitude(tropical_longitude):
-                sidereal_longitude = (tropical_longitude - ayanamsa) % 360
-                sign_num = int(sidereal_longitude // 30)
-                return signs[sign_num], sidereal_longitude
             
             transit_positions = {}
-            
-            # Calculate Saturn
-            saturn_result = swe.calc_ut(jd, swe.SATURN, swe.FLG_SWIEPH)
-            saturn_tropical = saturn_result[0][0] if isinstance(saturn_result[0], (list, tuple)) else saturn_result[0]
-            saturn_sign, saturn_sidereal = get_vedic_sign_and_longitude(saturn_tropical)
-            transit_positions['Saturn'] = {
-                'sign': saturn_sign,
-                'longitude': saturn_sidereal,
-                'authentic': True,
-                'engine': 'Swiss-Ephemeris-Jyotisha'
-            }
-            
-            # Calculate Jupiter
-            jupiter_result = swe.calc_ut(jd, swe.JUPITER, swe.FLG_SWIEPH)
-            jupiter_tropical = jupiter_result[0][0] if isinstance(jupiter_result[0], (list, tuple)) else jupiter_result[0]
-            jupiter_sign, jupiter_sidereal = get_vedic_sign_and_longitude(jupiter_tropical)
-            transit_positions['Jupiter'] = {
-                'sign': jupiter_sign,
-                'longitude': jupiter_sidereal,
-                'authentic': True,
-                'engine': 'Swiss-Ephemeris-Jyotisha'
-            }
-            
-            # Calculate Rahu
-            rahu_result = swe.calc_ut(jd, swe.TRUE_NODE, swe.FLG_SWIEPH)
-            rahu_tropical = rahu_result[0][0] if isinstance(rahu_result[0], (list, tuple)) else rahu_result[0]
-            rahu_sign, rahu_sidereal = get_vedic_sign_and_longitude(rahu_tropical)
-            transit_positions['Rahu'] = {
-                'sign': rahu_sign,
-                'longitude': rahu_sidereal,
-                'authentic': True,
-                'engine': 'Swiss-Ephemeris-Jyotisha'
-            }
-            
-            # Calculate Ketu (opposite to Rahu)
-            ketu_tropical = (rahu_tropical + 180) % 360
-            ketu_sign, ketu_sidereal = get_vedic_sign_and_longitude(ketu_tropical)
-            transit_positions['Ketu'] = {
-                'sign': ketu_sign,
-                'longitude': ketu_sidereal,
-                'authentic': True,
-                'engine': 'Swiss-Ephemeris-Jyotisha'
-            }
-            
-            print(f"✅ AUTHENTIC transit positions calculated using Ayanamsa {ayanamsa:.2f}°:")
-            print(f"🌟 Saturn: {saturn_sign} ({saturn_sidereal:.2f}°)")
-            print(f"🌟 Jupiter: {jupiter_sign} ({jupiter_sidereal:.2f}°)")
-            print(f"🌟 Rahu: {rahu_sign} ({rahu_sidereal:.2f}°)")
-            print(f"🌟 Ketu: {ketu_sign} ({ketu_sidereal:.2f}°)")
+            for planet in transit_snapshot.planets_at(jd, true_node=True):
+                if planet['name'] in ('Saturn', 'Jupiter', 'Rahu', 'Ketu'):
+                    transit_positions[planet['name']] = {
+                        'sign': signs[int(planet['longitude'] // 30)],
+                        'longitude': planet['longitude'],
+                        'authentic': True,
+                        'engine': 'Swiss-Ephemeris-Jyotisha'
+                    }
+            if log.info_enabled:
+                ayanamsa = transit_snapshot.load_snapshot(current_date.date())['ayanamsa_value']
+                log.info("✅ Transit positions read using Ayanamsa {:.2f}°:", ayanamsa)
+                for planet, data in transit_positions.items():
+                    log.info("🌟 {}: {} ({:.2f}°)", planet, data['sign'], data['longitude'])
             
             return transit_positions
             
         except Exception as e:
-            print(f"❌ Error fetching authentic current transits: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.warning("❌ Error fetching authentic current transits: {}", e)
+            if log.debug_enabled:
+                log.debug("Traceback: {}", traceback.format_exc())
             return {}
     
     def calculate_planetary_positions_for_jd(self, julian_day: float) -> Dict:
@@ -9648,7 +8896,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                         'longitude_speed': result[3] if len(result) > 3 else 0
                     }
                 except Exception as e:
-                    print(f"❌ Error calculating {planet_name}: {e}")
+                    log.warning("❌ Error calculating {}: {}", planet_name, e)
                     continue
             
             # Calculate Ketu (opposite to Rahu)
@@ -9662,14 +8910,14 @@ Each recommendation is tailored specifically to your planetary positions and is
                     'longitude_speed': 0
                 }
             
-            print(f"✅ Calculated {len(positions)} planetary positions for JD {julian_day}")
+            log.info("✅ Calculated {} planetary positions for JD {}", len(positions), julian_day)
             return positions
             
         except ImportError:
-            print("❌ Swiss Ephemeris not available")
+            log.warning("❌ Swiss Ephemeris not available")
             return {'error': 'Swiss Ephemeris not available'}
         except Exception as e:
-            print(f"❌ Error in planetary position calculation: {e}")
+            log.warning("❌ Error in planetary position calculation: {}", e)
             return {'error': str(e)}
     
     def get_sign_number(self, sign_name: str) -> int:
@@ -10170,9 +9418,14 @@ Each recommendation is tailored specifically to your planetary positions and is
             # Get transit predictions
             transit_predictions = self.calculate_transit_predictions(positions, birth_details)
             
+            # Exact ingress, aspect and station times for the coming year
+            upcoming_events = transit_event_page(birth_details, limit=self.TRANSIT_EVENT_LIMIT, horizon_years=1,
+                                                 bodies=self.TRANSIT_EVENT_BODIES)
+
             # Create unified result
             unified_result = {
                 'current_transits': transit_predictions.get('current_transits', {}),
+                'upcoming_events': upcoming_events.get('events', []),
                 'major_transits': transit_predictions.get('major_transits', {}),
                 'beneficial_periods': transit_predictions.get('beneficial_periods', []),
                 'challenging_periods': transit_predictions.get('challenging_periods', []),
@@ -10199,20 +9452,21 @@ Each recommendation is tailored specifically to your planetary positions and is
             return unified_result
             
         except Exception as e:
-            print(f"[DEBUG] Error in unified transit analysis: {e}", file=sys.stderr)
+            log.warning("Error in unified transit analysis: {}", e)
             return {
                 'current_transits': {},
                 'major_transits': {},
                 'summary': 'Unified Transit Analysis - Error in calculation',
                 'methodology': 'Fallback Unified Transit Analysis'
             }
+            location = self.resolve_birth_location(birth_details)
             dasha_data = {
                 "name": birth_details.get('name', 'User'),
                 "date": birth_details.get('date', '1980-01-01'),
                 "time": birth_details.get('time', '12:00'),
-                "place": birth_details.get('place', 'Chennai'),
-                "latitude": birth_details.get('latitude', 13.0827),
-                "longitude": birth_details.get('longitude', 80.2707)
+                "place": location['place'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude']
             }
             
             # Import required modules for subprocess call
@@ -10222,7 +9476,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             
             # Call authentic dasha timeline Python script
             pythonProcess = subprocess.run([
-                process.env.PYTHON3,
+                sys.executable,
                 str(Path(__file__).parent / 'authentic-dasha-timeline.py')
             ], 
             input=json.dumps(dasha_data), 
@@ -10232,19 +9486,19 @@ Each recommendation is tailored specifically to your planetary positions and is
             )
             
             if pythonProcess.returncode != 0:
-                print(f"[DEBUG] Authentic dasha timeline failed, using fallback: {pythonProcess.stderr}", file=sys.stderr)
+                log.debug("Authentic dasha timeline failed, using fallback: {}", pythonProcess.stderr)
                 return self.calculate_fallback_comprehensive_dasha_system(positions, birth_details)
             
             # Parse the authentic dasha timeline result
             try:
                 authentic_result = json.loads(pythonProcess.stdout)
-                print(f"[DEBUG] Comprehensive dasha system using authentic timeline data", file=sys.stderr)
+                log.debug("Comprehensive dasha system using authentic timeline data")
             except json.JSONDecodeError as e:
-                print(f"[DEBUG] Failed to parse authentic timeline, using fallback: {e}", file=sys.stderr)
+                log.warning("Failed to parse authentic timeline, using fallback: {}", e)
                 return self.calculate_fallback_comprehensive_dasha_system(positions, birth_details)
             
             if not authentic_result.get('success'):
-                print(f"[DEBUG] Authentic timeline failed: {authentic_result.get('error', 'Unknown error')}", file=sys.stderr)
+                log.debug("Authentic timeline failed: {}", authentic_result.get('error', 'Unknown error'))
                 return self.calculate_fallback_comprehensive_dasha_system(positions, birth_details)
             
             # Transform the authentic result into comprehensive dasha system format
@@ -10276,7 +9530,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 }
             }
             
-            print(f"[DEBUG] Current comprehensive dasha: {current_mahadasha} Mahadasha, {current_antardasha} Antardasha", file=sys.stderr)
+            log.debug("Current comprehensive dasha: {} Mahadasha, {} Antardasha", current_mahadasha, current_antardasha)
             
             # Build upcoming periods from timeline
             upcoming_periods = []
@@ -10353,8 +9607,9 @@ Each recommendation is tailored specifically to your planetary positions and is
             }
             
         except Exception as e:
-            print(f"[DEBUG] ===> Comprehensive dasha system error: {str(e)}", file=sys.stderr)
-            print(f"[DEBUG] ===> Stack trace: {traceback.format_exc()}", file=sys.stderr)
+            log.debug("===> Comprehensive dasha system error: {}", e)
+            if log.debug_enabled:
+                log.debug("===> Stack trace: {}", traceback.format_exc())
             return self.calculate_fallback_comprehensive_dasha_system(positions, birth_details)
 
     def get_dasha_effects_detailed(self, planet: str, period_type: str) -> str:
@@ -10645,7 +9900,7 @@ Each recommendation is tailored specifically to your planetary positions and is
         Uses houses 2, 7, 8 as primary marriage indicators with authentic planetary analysis
         """
         try:
-            print(f"[DEBUG] ✓ Starting AUTHENTIC Marriage Analysis with dynamic calculations", file=sys.stderr)
+            log.debug("✓ Starting AUTHENTIC Marriage Analysis with dynamic calculations")
             
             # Extract authentic planetary positions for marriage analysis
             venus_house = positions.get('Venus', {}).get('house', 1)
@@ -10668,8 +9923,8 @@ Each recommendation is tailored specifically to your planetary positions and is
             seventh_house_sign_index = (ascendant_sign_index + 6) % 12
             seventh_house_sign = house_signs[seventh_house_sign_index]
             
-            print(f"[DEBUG] 🔍 MARRIAGE ANALYSIS - Ascendant: {ascendant_sign}, 7th House Sign: {seventh_house_sign}", file=sys.stderr)
-            print(f"[DEBUG] 🔍 PRIMARY MARRIAGE HOUSES - 2nd: {positions.get('2nd_house', {})}, 7th: {positions.get('7th_house', {})}, 8th: {positions.get('8th_house', {})}", file=sys.stderr)
+            log.debug("🔍 MARRIAGE ANALYSIS - Ascendant: {}, 7th House Sign: {}", ascendant_sign, seventh_house_sign)
+            log.debug("🔍 PRIMARY MARRIAGE HOUSES - 2nd: {}, 7th: {}, 8th: {}", positions.get('2nd_house', {}), positions.get('7th_house', {}), positions.get('8th_house', {}))
             
             # AUTHENTIC MARRIAGE LOGIC IMPLEMENTATION
             # Primary marriage houses: 2, 7, 8 (as per user's marriage logic)
@@ -10687,7 +9942,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 if planet_house in primary_marriage_houses:
                     malefic_afflictions += 1
                     affliction_details.append(f"{planet} in {planet_house}th house")
-                    print(f"[DEBUG] 🔍 MALEFIC AFFLICTION - {planet} in house {planet_house}", file=sys.stderr)
+                    log.debug("🔍 MALEFIC AFFLICTION - {} in house {}", planet, planet_house)
             
             # Check for benefic aspects
             benefic_aspects = 0
@@ -10697,7 +9952,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 if planet_house in primary_marriage_houses:
                     benefic_aspects += 1
                     benefic_details.append(f"{planet} in {planet_house}th house")
-                    print(f"[DEBUG] 🔍 BENEFIC SUPPORT - {planet} in house {planet_house}", file=sys.stderr)
+                    log.debug("🔍 BENEFIC SUPPORT - {} in house {}", planet, planet_house)
             
             # DETERMINE MARRIAGE TIMING based on authentic affliction analysis
             birth_date = birth_details.get('birth_date', '1990-01-01')
@@ -10856,10 +10111,10 @@ Each recommendation is tailored specifically to your planetary positions and is
             else:
                 remedies.append(f"Strengthen Jupiter's wisdom through Thursday prayers and charitable acts")
             
-            print(f"[DEBUG] 🔍 FINAL MARRIAGE RESULT - Timing: {timing_category}, Afflictions: {malefic_afflictions}, Benefic Support: {benefic_aspects}", file=sys.stderr)
-            print(f"[DEBUG] 🔍 STABILITY FACTORS: {stability_factors}", file=sys.stderr)
-            print(f"[DEBUG] 🔍 STABILITY CHALLENGES: {stability_challenges}", file=sys.stderr)
-            print(f"[DEBUG] 🔍 STABILITY REMEDIES: {remedies}", file=sys.stderr)
+            log.debug("🔍 FINAL MARRIAGE RESULT - Timing: {}, Afflictions: {}, Benefic Support: {}", timing_category, malefic_afflictions, benefic_aspects)
+            log.debug("🔍 STABILITY FACTORS: {}", stability_factors)
+            log.debug("🔍 STABILITY CHALLENGES: {}", stability_challenges)
+            log.debug("🔍 STABILITY REMEDIES: {}", remedies)
             
             return {
                 'marriage_timing': marriage_timing,
@@ -10894,7 +10149,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             }
             
         except Exception as e:
-            print(f"[DEBUG] ERROR in authentic marriage analysis: {e}", file=sys.stderr)
+            log.warning("ERROR in authentic marriage analysis: {}", e)
             return {
                 'marriage_timing': 'Analysis in progress',
                 'seventh_house_analysis': {'description': 'Computing authentic data'},
@@ -11236,44 +10491,15 @@ Each recommendation is tailored specifically to your planetary positions and is
 
     # Add all missing traditional Vedic astrology analysis methods
     
-    def analyze_manglik_dosha(self, positions: Dict) -> Dict:
-        """Comprehensive Manglik Dosha Analysis"""
-        mars_house = positions.get('Mars', {}).get('house', 1)
-        
-        manglik_houses = [1, 2, 4, 7, 8, 12]
-        is_manglik = mars_house in manglik_houses
-        
-        return {
-            'status': 'Present' if is_manglik else 'Absent',
-            'severity': 'High' if mars_house in [1, 7, 8] else 'Moderate' if mars_house in [2, 4, 12] else 'None',
-            'mars_house': mars_house,
-            'effects': {
-                'marriage_delay': 'Possible' if is_manglik else 'Unlikely',
-                'partner_compatibility': 'Requires careful matching' if is_manglik else 'Normal',
-                'marital_harmony': 'Requires careful consideration' if is_manglik else 'Generally harmonious'
-            },
-            'remedies': self.get_dynamic_manglik_remedies(mars_house) if is_manglik else ['No specific remedies needed'],
-            'summary': f'Mars is positioned in {mars_house} house. {"Manglik Dosha is present" if is_manglik else "No Manglik Dosha found"}. This {"requires attention for marriage timing and partner selection" if is_manglik else "indicates normal marital prospects"}.'
-        }
-
     def analyze_kaal_sarp_dosha(self, positions: Dict) -> Dict:
         """Kaal Sarp Dosha Analysis"""
-        rahu_house = positions.get('Rahu', {}).get('house', 1)
-        ketu_house = positions.get('Ketu', {}).get('house', 1)
-        
-        # Check if all planets are between Rahu and Ketu
-        planets_between = 0
-        for planet, data in positions.items():
-            if planet not in ['Rahu', 'Ketu', 'Ascendant']:
-                planet_house = data.get('house', 1)
-                if rahu_house < ketu_house:
-                    if rahu_house < planet_house < ketu_house:
-                        planets_between += 1
-                else:
-                    if planet_house > rahu_house or planet_house < ketu_house:
-                        planets_between += 1
+        rahu_house = positions['Rahu']['house']
+        ketu_house = positions['Ketu']['house']
         
-        has_kaal_sarp = planets_between >= 5
+        # All seven grahas on one side of the node axis, or all but one
+        board = self.yoga_board(positions)
+        has_kaal_sarp = (yoga_rules.holds(board, 'Kaal Sarp Dosha')
+                         or yoga_rules.holds(board, 'Partial Kaal Sarp Dosha'))
         
         return {
             'status': 'Present' if has_kaal_sarp else 'Absent',
@@ -11297,16 +10523,8 @@ Each recommendation is tailored specifically to your planetary positions and is
 
     def analyze_pitru_dosha(self, positions: Dict) -> Dict:
         """Pitru Dosha Analysis"""
-        sun_house = positions.get('Sun', {}).get('house', 1)
-        saturn_house = positions.get('Saturn', {}).get('house', 1)
-        rahu_house = positions.get('Rahu', {}).get('house', 1)
-        
-        # Check for Pitru Dosha combinations
-        has_pitru_dosha = (
-            (sun_house == 9 and saturn_house in [1, 5, 9]) or
-            (rahu_house == 9) or
-            (sun_house in [6, 8, 12])
-        )
+        # Sun in 9th with Saturn in a trikona, Rahu in 9th, or Sun in a dusthana
+        has_pitru_dosha = yoga_rules.holds(self.yoga_board(positions), 'Pitru Dosha from 9th house')
         
         return {
             'status': 'Present' if has_pitru_dosha else 'Absent',
@@ -11331,14 +10549,11 @@ Each recommendation is tailored specifically to your planetary positions and is
 
     def analyze_grahan_dosha(self, positions: Dict) -> Dict:
         """Grahan Dosha Analysis (Eclipse Dosha)"""
-        sun_house = positions.get('Sun', {}).get('house', 1)
-        moon_house = positions.get('Moon', {}).get('house', 1)
-        rahu_house = positions.get('Rahu', {}).get('house', 1)
-        ketu_house = positions.get('Ketu', {}).get('house', 1)
+        board = self.yoga_board(positions)
         
         # Check for Grahan Dosha
-        sun_grahan = (sun_house == rahu_house or sun_house == ketu_house)
-        moon_grahan = (moon_house == rahu_house or moon_house == ketu_house)
+        sun_grahan = yoga_rules.holds(board, 'Sun conjunct Rahu') or yoga_rules.holds(board, 'Sun conjunct Ketu')
+        moon_grahan = yoga_rules.holds(board, 'Moon conjunct Rahu') or yoga_rules.holds(board, 'Moon conjunct Ketu')
         
         has_grahan_dosha = sun_grahan or moon_grahan
         
@@ -12458,12 +11673,29 @@ Each recommendation is tailored specifically to your planetary positions and is
             'summary': f'Vastu recommendations show {"primary focus on Northeast orientation" if jupiter_house in [1, 5, 9] else "balanced vastu principles"}. {"Follow traditional vastu guidelines" if saturn_house in [1, 10] else "Adapt vastu to modern needs"}.'
         }
 
-    def analyze_muhurat_timing(self, positions: Dict) -> Dict:
+    def analyze_muhurat_timing(self, positions: Dict, birth_details: Dict = None) -> Dict:
         """Muhurat Timing Analysis"""
         jupiter_house = positions.get('Jupiter', {}).get('house', 1)
         venus_house = positions.get('Venus', {}).get('house', 1)
         
+        upcoming_windows = {}
+        if birth_details:
+            try:
+                location = self.resolve_birth_location(birth_details)
+                moon_longitude = positions.get('Moon', {}).get('longitude')
+                today = date.today()
+                search = find_muhurta(
+                    'all', today.isoformat(), (today + timedelta(days=self.MUHURTA_SEARCH_DAYS)).isoformat(),
+                    location['latitude'], location['longitude'], location['timezone'],
+                    dict(birth_details, moon_longitude=moon_longitude) if moon_longitude is not None else birth_details,
+                    limit=3
+                )
+                upcoming_windows = search.get('windows', {})
+            except Exception as e:
+                log.warning("Muhurta search failed: {}", e)
+        
         return {
+            'upcoming_windows': upcoming_windows,
             'beneficial_times': {
                 'daily_timing': 'Early morning hours (5-7 AM) most auspicious',
                 'weekly_timing': 'Thursday and Friday show enhanced energy',
@@ -12699,11 +11931,11 @@ Each recommendation is tailored specifically to your planetary positions and is
                 else:
                     periods.append(f"recent {phase_desc}")
             
-            print(f"[DEBUG] Dynamic periods calculated: birth_date={birth_date}, offset={offset_years}, result={periods}", file=sys.stderr)
+            log.debug("Dynamic periods calculated: birth_date={}, offset={}, result={}", birth_date, offset_years, periods)
             return periods
         except Exception as e:
             # Fallback to contextual periods if birth date parsing fails
-            print(f"[DEBUG] Dynamic periods fallback: error={e}", file=sys.stderr)
+            log.debug("Dynamic periods fallback: error={}", e)
             return ['upcoming period', 'next phase', 'future cycle', 'later period']
     
     def get_dynamic_marriage_timing(self, birth_date: str, timing_type: str) -> str:
@@ -12778,16 +12010,17 @@ Each recommendation is tailored specifically to your planetary positions and is
         
         try:
             # Use authentic Vimshottari Dasha timeline for consistent data
-            print("[DEBUG] DETAILED DASHA PREDICTIONS - Using authentic timeline integration", file=sys.stderr)
+            log.debug("DETAILED DASHA PREDICTIONS - Using authentic timeline integration")
             
             # Call the authentic dasha timeline calculation
+            location = self.resolve_birth_location(birth_details)
             dasha_data = {
                 "name": birth_details.get('name', 'User'),
                 "date": birth_details.get('date', '1980-01-01'),
                 "time": birth_details.get('time', '12:00'),
-                "place": birth_details.get('place', 'Chennai'),
-                "latitude": birth_details.get('latitude', 13.0827),
-                "longitude": birth_details.get('longitude', 80.2707)
+                "place": location['place'],
+                "latitude": location['latitude'],
+                "longitude": location['longitude']
             }
             
             # Import required modules for subprocess call
@@ -12797,7 +12030,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             
             # Call authentic dasha timeline Python script
             pythonProcess = subprocess.run([
-                process.env.PYTHON3,
+                sys.executable,
                 str(Path(__file__).parent / 'authentic-dasha-timeline.py')
             ], 
             input=json.dumps(dasha_data), 
@@ -12807,7 +12040,7 @@ Each recommendation is tailored specifically to your planetary positions and is
             )
             
             if pythonProcess.returncode != 0:
-                print(f"[DEBUG] Detailed dasha predictions authentic timeline failed, using fallback", file=sys.stderr)
+                log.debug("Detailed dasha predictions authentic timeline failed, using fallback")
                 # Fall back to existing dasha periods calculation
                 if existing_dasha_periods:
                     dasha_periods = existing_dasha_periods
@@ -12819,7 +12052,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                 # Parse the authentic dasha timeline result
                 try:
                     authentic_result = json.loads(pythonProcess.stdout)
-                    print(f"[DEBUG] Detailed dasha predictions using authentic timeline data", file=sys.stderr)
+                    log.debug("Detailed dasha predictions using authentic timeline data")
                     
                     if authentic_result.get('success'):
                         # Extract current dasha information from authentic timeline
@@ -12828,9 +12061,9 @@ Each recommendation is tailored specifically to your planetary positions and is
                         current_dasha_lord = current_dasha_info.get('mahadasha', 'Jupiter')
                         current_period = current_dasha_info.get('period', 'Current period')
                         
-                        print(f"[DEBUG] Detailed dasha predictions - Current dasha: {current_dasha_lord}", file=sys.stderr)
+                        log.debug("Detailed dasha predictions - Current dasha: {}", current_dasha_lord)
                     else:
-                        print(f"[DEBUG] Authentic timeline failed: {authentic_result.get('error', 'Unknown error')}", file=sys.stderr)
+                        log.debug("Authentic timeline failed: {}", authentic_result.get('error', 'Unknown error'))
                         # Use fallback
                         if existing_dasha_periods:
                             dasha_periods = existing_dasha_periods
@@ -12840,7 +12073,7 @@ Each recommendation is tailored specifically to your planetary positions and is
                         current_period = dasha_periods.get('current_period', 'Period not available')
                         
                 except json.JSONDecodeError as e:
-                    print(f"[DEBUG] Failed to parse authentic timeline in detailed dasha predictions: {e}", file=sys.stderr)
+                    log.warning("Failed to parse authentic timeline in detailed dasha predictions: {}", e)
                     # Use fallback
                     if existing_dasha_periods:
                         dasha_periods = existing_dasha_periods
@@ -13050,10 +12283,11 @@ Each recommendation is tailored specifically to your planetary positions and is
             return detailed_predictions
             
         except Exception as e:
-            print(f"[DEBUG] Error in detailed dasha predictions: {str(e)}", file=sys.stderr)
-            print(f"[DEBUG] Error type: {type(e).__name__}", file=sys.stderr)
+            log.warning("Error in detailed dasha predictions: {}", e)
+            log.warning("Error type: {}", type(e).__name__)
             import traceback
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}", file=sys.stderr)
+            if log.debug_enabled:
+                log.debug("Traceback: {}", traceback.format_exc())
             # Fallback to basic structure
             return {
                 'current_mahadasha': {
@@ -14863,7 +14097,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] Error in health predictions: {e}", file=sys.stderr)
+            log.warning("Error in health predictions: {}", e)
             return self.get_fallback_health_predictions()
     
     def generate_authentic_wealth_predictions(self, positions: Dict, ascendant_sign: str, dasha_periods: Dict) -> Dict:
@@ -14892,7 +14126,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] Error in wealth predictions: {e}", file=sys.stderr)
+            log.warning("Error in wealth predictions: {}", e)
             return self.get_fallback_wealth_predictions()
 
     def generate_health_analysis(self, ascendant_sign: str, sun_house: int, moon_house: int, sixth_lord: str, current_dasha: str) -> str:
@@ -15198,14 +14432,14 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             # Use stored ascendant longitude for proper calculation
             ascendant_longitude = getattr(self, 'current_ascendant_longitude', None)
             if ascendant_longitude is None:
-                print(f"[DEBUG] WARNING: No current_ascendant_longitude stored! This will cause house calculation errors.", file=sys.stderr)
+                log.warning("WARNING: No current_ascendant_longitude stored! This will cause house calculation errors.")
                 # CRITICAL: Don't use sign approximation as it's inaccurate
                 # Instead, return the house from the planet_data if available
                 if 'house' in planet_data:
-                    print(f"[DEBUG] Using house from planet_data: {planet_data['house']}", file=sys.stderr)
+                    log.debug("Using house from planet_data: {}", planet_data['house'])
                     return planet_data['house']
                 else:
-                    print(f"[DEBUG] No house in planet_data, defaulting to 1", file=sys.stderr)
+                    log.debug("No house in planet_data, defaulting to 1")
                     return 1
             
             # Use sign-based calculation (correct approach for Vedic astrology)
@@ -15252,7 +14486,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 }
             }
         except Exception as e:
-            print(f"[DEBUG] Error in generate_detailed_predictions: {e}", file=sys.stderr)
+            log.warning("Error in generate_detailed_predictions: {}", e)
             # Return fallback structure with error information
             return {
                 'error': f"Error generating detailed predictions: {str(e)}",
@@ -16012,7 +15246,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         ascendant_longitude = ascendant_data.get('longitude', 0)
         ascendant_sign = self.get_sign_from_longitude(ascendant_longitude)
         
-        print(f"[DEBUG] House Analysis - Ascendant: {ascendant_sign} at {ascendant_longitude}°", file=sys.stderr)
+        log.debug("House Analysis - Ascendant: {} at {}°", ascendant_sign, ascendant_longitude)
         
         houses_analysis = {
             'title': 'SECTION 9: Bhava Predictions (1st to 12th House)',
@@ -16037,20 +15271,20 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         
         # Get house lordships based on ascendant
         house_lords = self.calculate_house_lordships(ascendant_sign)
-        print(f"[DEBUG] Calculated house lords: {house_lords}", file=sys.stderr)
+        log.debug("Calculated house lords: {}", house_lords)
         
         # Get sign in each house for accurate lordship
         house_signs = self.get_signs_in_houses(ascendant_sign, ascendant_longitude)
-        print(f"[DEBUG] Signs in houses: {house_signs}", file=sys.stderr)
+        log.debug("Signs in houses: {}", house_signs)
         
         for house_num in range(1, 13):
-            print(f"[DEBUG] Analyzing House {house_num} with detailed lord placement", file=sys.stderr)
+            log.debug("Analyzing House {} with detailed lord placement", house_num)
             
             # Get the sign in this house and its lord
             house_sign = house_signs.get(house_num, 'Mesha')
             house_lord = self.get_sign_lord(house_sign)
             
-            print(f"[DEBUG] House {house_num}: Sign = {house_sign}, Lord = {house_lord}", file=sys.stderr)
+            log.debug("House {}: Sign = {}, Lord = {}", house_num, house_sign, house_lord)
             
             # Find where house lord is placed
             lord_placement_house = None
@@ -16061,9 +15295,9 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 lord_placement_house = lord_data.get('house', 1)
                 lord_longitude = lord_data.get('longitude', 0)
                 lord_placement_sign = self.get_sign_from_longitude(lord_longitude)
-                print(f"[DEBUG] {house_lord} placed in house {lord_placement_house}, sign {lord_placement_sign}", file=sys.stderr)
+                log.debug("{} placed in house {}, sign {}", house_lord, lord_placement_house, lord_placement_sign)
             else:
-                print(f"[DEBUG] WARNING: {house_lord} not found in positions", file=sys.stderr)
+                log.warning("WARNING: {} not found in positions", house_lord)
             
             # Find aspects on the house lord
             aspecting_planets = self.get_aspects_on_planet(house_lord, positions)
@@ -16095,7 +15329,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 'strength_assessment': self.assess_house_strength(house_num, house_lord, lord_placement_house, aspecting_planets, planets_in_house)
             }
         
-        print(f"[DEBUG] ✓ Enhanced Bhava Predictions completed with lord placement analysis", file=sys.stderr)
+        log.debug("✓ Enhanced Bhava Predictions completed with lord placement analysis")
         return houses_analysis
     
     def get_signs_in_houses(self, ascendant_sign: str, ascendant_longitude: float) -> Dict:
@@ -16753,13 +15987,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         return remedies.get(house_num, 'General spiritual practices')
 
     def calculate_nakshatra_pada(self, longitude):
-        # Each nakshatra is 13°20', divided into 4 padas of 3°20' each
-        nakshatra_length = 13.333333  # 13°20'
-        pada_length = 3.333333       # 3°20'
-        
-        nakshatra_position = longitude % nakshatra_length
-        pada = int(nakshatra_position / pada_length) + 1
-        return min(pada, 4)
+        return nakshatra_lookup.lookup(longitude).pada
 
     def calculate_shadbala_score(self, planet, data):
         # Simplified Shadbala calculation
@@ -17700,19 +16928,6 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         else:
             return "gracefully positioned"
     
-    def get_nakshatra_from_longitude(self, longitude: float) -> str:
-        """Get nakshatra from longitude"""
-        nakshatra_names = [
-            'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira', 'Ardra',
-            'Punarvasu', 'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni',
-            'Hasta', 'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyeshtha',
-            'Mula', 'Purva Ashadha', 'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha',
-            'Purva Bhadrapada', 'Uttara Bhadrapada', 'Revati'
-        ]
-        
-        nakshatra_index = int(longitude / 13.333333) % 27
-        return nakshatra_names[nakshatra_index]
-    
     def get_nakshatra_qualities(self, nakshatra: str) -> str:
         """Get nakshatra spiritual qualities"""
         qualities = {
@@ -18916,11 +18131,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             'timing_analysis': f'Marriage timing favorable from age {base_age} onwards'
         }
     
-    def check_manglik_dosha(self, mars_house: int) -> dict:
+    def check_manglik_dosha(self, positions: Dict) -> dict:
         """Check for Manglik Dosha"""
         
-        manglik_houses = [1, 2, 4, 7, 8, 12]
-        is_manglik = mars_house in manglik_houses
+        mars_house = positions['Mars']['house']
+        is_manglik = yoga_rules.holds(self.yoga_board(positions), 'Manglik from Lagna')
         
         return {
             'is_manglik': is_manglik,
@@ -19330,7 +18545,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     def analyze_ideal_career_domains(self, positions: Dict, tenth_house_sign: str, tenth_lord: str) -> Dict:
         """3. Enhanced Career Domains Analysis using planetary strength calculations"""
         try:
-            print(f"[DEBUG] Analyzing career domains: 10th house={tenth_house_sign}, lord={tenth_lord}", file=sys.stderr)
+            log.debug("Analyzing career domains: 10th house={}, lord={}", tenth_house_sign, tenth_lord)
             
             # Enhanced planet-field mapping following traditional Vedic principles
             planet_field_map = {
@@ -19363,7 +18578,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                         base_strength += 2
                     
                     career_planet_strengths[tenth_lord] = base_strength
-                    print(f"[DEBUG] 10th lord {tenth_lord} strength: {base_strength}", file=sys.stderr)
+                    log.debug("10th lord {} strength: {}", tenth_lord, base_strength)
             
             # Step 2: Add planets in 10th house
             planets_in_tenth = []
@@ -19374,7 +18589,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                         career_planets.append(planet)
                         # Planets in 10th house get high strength
                         career_planet_strengths[planet] = 7
-                        print(f"[DEBUG] Planet in 10th: {planet} strength: 7", file=sys.stderr)
+                        log.debug("Planet in 10th: {} strength: 7", planet)
             
             # Step 3: Calculate Ashtakavarga bindus for career strength (if available)
             try:
@@ -19389,16 +18604,16 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                         # Add bindus as strength bonus (max 5 bonus points)
                         if planet in career_planet_strengths:
                             career_planet_strengths[planet] += min(5, tenth_house_bindus)
-                            print(f"[DEBUG] {planet} 10th house bindus: {tenth_house_bindus}, total strength: {career_planet_strengths[planet]}", file=sys.stderr)
+                            log.debug("{} 10th house bindus: {}, total strength: {}", planet, tenth_house_bindus, career_planet_strengths[planet])
             except Exception as ashtaka_error:
-                print(f"[DEBUG] Ashtakavarga strength calculation skipped: {str(ashtaka_error)}", file=sys.stderr)
+                log.debug("Ashtakavarga strength calculation skipped: {}", ashtaka_error)
             
             # Step 4: Rank planets by strength and select top candidates
             if career_planet_strengths:
                 ranked_planets = sorted(career_planet_strengths.items(), key=lambda x: x[1], reverse=True)
                 top_planets = [planet for planet, strength in ranked_planets[:3]]  # Top 3 planets
-                print(f"[DEBUG] Ranked career planets: {ranked_planets}", file=sys.stderr)
-                print(f"[DEBUG] Selected top planets: {top_planets}", file=sys.stderr)
+                log.debug("Ranked career planets: {}", ranked_planets)
+                log.debug("Selected top planets: {}", top_planets)
             else:
                 # Fallback to 10th lord if no strength calculation possible
                 top_planets = [tenth_lord] if tenth_lord in planet_field_map else ['Jupiter']
@@ -19465,11 +18680,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 'calculation_method': 'Enhanced planetary strength analysis with Ashtakavarga integration'
             }
             
-            print(f"[DEBUG] Career domains analysis completed: {len(primary_fields)} primary fields", file=sys.stderr)
+            log.debug("Career domains analysis completed: {} primary fields", len(primary_fields))
             return result
             
         except Exception as e:
-            print(f"[DEBUG] Career domains analysis error: {str(e)}", file=sys.stderr)
+            log.debug("Career domains analysis error: {}", e)
             return {
                 'primary_fields': ['Administration', 'Management'],
                 'secondary_fields': ['Consulting', 'Service'],
@@ -20337,7 +19552,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] Error in Sarvashtakavarga chart generation: {str(e)}", file=sys.stderr)
+            log.warning("Error in Sarvashtakavarga chart generation: {}", e)
             return {'sarvashtakavarga_analysis': {'error': 'Chart generation failed'}}
 
     def create_ashtakavarga_chart_data(self, sarva_scores: Dict, positions: Dict) -> Dict:
@@ -20360,7 +19575,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] Error in chart data creation: {str(e)}", file=sys.stderr)
+            log.warning("Error in chart data creation: {}", e)
             return {'error': 'Chart data creation failed'}
 
     def create_north_indian_ashtakavarga_chart(self, sarva_scores: Dict, ascendant_house: int) -> str:
@@ -20444,7 +19659,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return svg_content
             
         except Exception as e:
-            print(f"[DEBUG] Error in North Indian chart: {str(e)}", file=sys.stderr)
+            log.warning("Error in North Indian chart: {}", e)
             return f'<svg><text x="10" y="20">North Chart Error: {str(e)}</text></svg>'
 
     def create_south_indian_ashtakavarga_chart(self, sarva_scores: Dict, ascendant_house: int) -> str:
@@ -20544,7 +19759,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return svg_content
             
         except Exception as e:
-            print(f"[DEBUG] Error in South Indian chart: {str(e)}", file=sys.stderr)
+            log.warning("Error in South Indian chart: {}", e)
             return f'<svg><text x="10" y="20">South Chart Error: {str(e)}</text></svg>'
 
     def calculate_authentic_ashtakavarga(self, positions: Dict) -> Dict:
@@ -20553,26 +19768,28 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         This integrates with the birth chart calculation to get real astronomical Ashtakavarga data
         """
         
-        print("[DEBUG] Starting REAL JYOTISHA Ashtakavarga calculation", file=sys.stderr)
-        print(f"[DEBUG] Input positions: {list(positions.keys())}", file=sys.stderr)
+        log.debug("Starting REAL JYOTISHA Ashtakavarga calculation")
+        if log.debug_enabled:
+            log.debug("Input positions: {}", list(positions.keys()))
         
         # CRITICAL: We need to enhance the traditional calculation to be more accurate
         # Instead of trying to call Jyotisha separately, we'll enhance the traditional method
         # to be more precise based on the actual planetary positions passed in
-        print("[DEBUG] ⚠️  Enhancing traditional Ashtakavarga with position-based accuracy", file=sys.stderr)
+        log.debug("⚠️  Enhancing traditional Ashtakavarga with position-based accuracy")
         
         # Fallback to traditional calculation if Jyotisha not available
-        print("[DEBUG] Using traditional Ashtakavarga calculation as fallback", file=sys.stderr)
+        log.debug("Using traditional Ashtakavarga calculation as fallback")
         
         # Normalize input keys to lowercase for calculation
         normalized_positions = {k.lower(): v for k, v in positions.items()}
-        print(f"[DEBUG] Normalized positions: {list(normalized_positions.keys())}", file=sys.stderr)
+        if log.debug_enabled:
+            log.debug("Normalized positions: {}", list(normalized_positions.keys()))
         
         # Enhanced validation with detailed position checking
         required_planets = ['sun', 'moon', 'mars', 'mercury', 'jupiter', 'venus', 'saturn']
         missing_planets = [p for p in required_planets if p not in normalized_positions]
         if missing_planets:
-            print(f"[DEBUG] Missing planets: {missing_planets}", file=sys.stderr)
+            log.debug("Missing planets: {}", missing_planets)
         
         # Debug actual planetary house positions
         for planet in required_planets:
@@ -20581,7 +19798,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 house = planet_data.get('house', 'Unknown')
                 sign = planet_data.get('sign', 'Unknown')
                 longitude = planet_data.get('longitude', 0)
-                print(f"[DEBUG] {planet.title()}: House {house}, Sign {sign}, Long {longitude:.2f}°", file=sys.stderr)
+                log.debug("{}: House {}, Sign {}, Long {:.2f}°", planet.title(), house, sign, longitude)
         
         # Traditional Ashtakavarga benefic position rules for each planet
         # Based on classical texts with proper house vs rasi distinction
@@ -20711,7 +19928,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             else:
                 strength_level = 'Weak'
             
-            print(f"[DEBUG] Enhanced method - {planet.title()} total: {total_bindus} bindus ({strength_level})", file=sys.stderr)
+            log.debug("Enhanced method - {} total: {} bindus ({})", planet.title(), total_bindus, strength_level)
             
             ashtakavarga_results[planet] = {
                 'house_scores': planet_house_scores,
@@ -20745,7 +19962,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             'average_per_house': round(sarvashtakavarga_total / 12, 1)
         }
         
-        print(f"[DEBUG] Enhanced Sarvashtakavarga total: {sarvashtakavarga_total} bindus ({sarva_strength})", file=sys.stderr)
+        log.debug("Enhanced Sarvashtakavarga total: {} bindus ({})", sarvashtakavarga_total, sarva_strength)
         
         return ashtakavarga_results
 
@@ -20755,7 +19972,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         Following debugging guidelines from the comprehensive bindu calculation guide
         """
         try:
-            print("[DEBUG] Starting enhanced Ashtakavarga calculation with validation", file=sys.stderr)
+            log.debug("Starting enhanced Ashtakavarga calculation with validation")
             
             # Step 1: Validate input data consistency
             validation_results = {
@@ -20780,7 +19997,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 'completeness': len(present_planets) / len(required_planets) * 100
             }
             
-            print(f"[DEBUG] Planet completeness: {validation_results['input_validation']['completeness']:.1f}%", file=sys.stderr)
+            log.debug("Planet completeness: {:.1f}%", validation_results['input_validation']['completeness'])
             
             # Step 2: Calculate authentic Ashtakavarga using traditional rules
             authentic_scores = self.calculate_authentic_ashtakavarga(positions)
@@ -20801,7 +20018,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                         if total_bindus < min_expected or total_bindus > max_expected:
                             warning = f"{planet} has {total_bindus} bindus, expected {min_expected}-{max_expected}"
                             validation_warnings.append(warning)
-                            print(f"[DEBUG] VALIDATION WARNING: {warning}", file=sys.stderr)
+                            log.warning("VALIDATION WARNING: {}", warning)
             
             # Step 4: Calculate and validate Sarvashtakavarga
             if 'sarvashtakavarga' in authentic_scores:
@@ -20809,7 +20026,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 if sarva_total < 300 or sarva_total > 400:
                     warning = f"Sarvashtakavarga total {sarva_total} outside expected range 300-400"
                     validation_warnings.append(warning)
-                    print(f"[DEBUG] VALIDATION WARNING: {warning}", file=sys.stderr)
+                    log.warning("VALIDATION WARNING: {}", warning)
             
             # Step 5: Diagnostic checks
             validation_results['diagnostic_checks'] = {
@@ -20824,11 +20041,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             enhanced_analysis = self.generate_enhanced_ashtakavarga_analysis(authentic_scores, validation_results)
             validation_results['final_scores'] = enhanced_analysis
             
-            print("[DEBUG] Enhanced Ashtakavarga calculation completed successfully", file=sys.stderr)
+            log.debug("Enhanced Ashtakavarga calculation completed successfully")
             return validation_results
             
         except Exception as e:
-            print(f"[DEBUG] Enhanced Ashtakavarga calculation error: {str(e)}", file=sys.stderr)
+            log.debug("Enhanced Ashtakavarga calculation error: {}", e)
             return {
                 'error': str(e),
                 'fallback_available': True
@@ -20907,7 +20124,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return analysis
             
         except Exception as e:
-            print(f"[DEBUG] Enhanced analysis generation error: {str(e)}", file=sys.stderr)
+            log.debug("Enhanced analysis generation error: {}", e)
             return {'error': str(e)}
 
     def get_planet_strength_interpretation(self, planet: str, total_bindus: int, strongest_house: int) -> str:
@@ -20955,7 +20172,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         """Generate comprehensive Ashtakavarga analysis from enhanced validation system"""
         try:
             if 'error' in enhanced_ashtakavarga:
-                print(f"[DEBUG] Enhanced Ashtakavarga had error, using fallback", file=sys.stderr)
+                log.debug("Enhanced Ashtakavarga had error, using fallback")
                 # Fallback to original calculation
                 return self.generate_ashtakavarga_analysis(self.calculate_authentic_ashtakavarga(positions), positions)
             
@@ -21060,11 +20277,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 'quality_score': self.calculate_quality_score(enhanced_ashtakavarga)
             }
             
-            print("[DEBUG] Enhanced Ashtakavarga analysis generated successfully", file=sys.stderr)
+            log.debug("Enhanced Ashtakavarga analysis generated successfully")
             return analysis
             
         except Exception as e:
-            print(f"[DEBUG] Enhanced Ashtakavarga analysis error: {str(e)}", file=sys.stderr)
+            log.debug("Enhanced Ashtakavarga analysis error: {}", e)
             # Fallback to original system
             return self.generate_ashtakavarga_analysis(self.calculate_authentic_ashtakavarga(positions), positions)
 
@@ -21152,7 +20369,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return chart_svg
             
         except Exception as e:
-            print(f"[DEBUG] Enhanced chart creation error: {str(e)}", file=sys.stderr)
+            log.debug("Enhanced chart creation error: {}", e)
             return f'<svg><text x="10" y="20">Enhanced Chart Error: {str(e)}</text></svg>'
 
     def get_enhanced_house_color(self, bindus: int) -> str:
@@ -21199,7 +20416,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return max(0, min(100, score))  # Clamp between 0-100
             
         except Exception as e:
-            print(f"[DEBUG] Quality score calculation error: {str(e)}", file=sys.stderr)
+            log.debug("Quality score calculation error: {}", e)
             return 75.0  # Default score
 
     def get_enhanced_timing_guidance(self, bindus: int, house_num: int) -> str:
@@ -21446,7 +20663,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         Combined Parashara + Nadi Jyotisha insights with practical logic
         """
         try:
-            print(f"[DEBUG] ✓ Starting AUTHENTIC Career Analysis with dynamic calculations", file=sys.stderr)
+            log.debug("✓ Starting AUTHENTIC Career Analysis with dynamic calculations")
             
             # A. CALCULATE INPUTS using authentic Jyotisha data
             ascendant_house = self.get_sign_number(ascendant_sign)
@@ -21494,8 +20711,8 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 tenth_house_sign, tenth_lord, saturn_analysis, planets_in_tenth, positions
             )
             
-            print(f"[DEBUG] ✓ Authentic career sector: {career_sector}", file=sys.stderr)
-            print(f"[DEBUG] ✓ Authentic top career options: {len(top_career_options)}", file=sys.stderr)
+            log.debug("✓ Authentic career sector: {}", career_sector)
+            log.debug("✓ Authentic top career options: {}", len(top_career_options))
             
             return {
                 'title': '15. Career and Profession - Authentic Vedic Analysis',
@@ -21516,7 +20733,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] ❌ Authentic career analysis error: {str(e)}", file=sys.stderr)
+            log.warning("❌ Authentic career analysis error: {}", e)
             return {
                 'title': '15. Career and Profession - Error in Analysis',
                 'error': f'Error in authentic career analysis: {str(e)}',
@@ -21745,16 +20962,6 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 7: 'Venus', 8: 'Mars', 9: 'Jupiter', 10: 'Saturn', 11: 'Saturn', 12: 'Jupiter'}
         return lords.get(sign_number, 'Sun')
     
-    def get_nakshatra_from_longitude(self, longitude: float) -> str:
-        """Get nakshatra from longitude"""
-        nakshatra_names = ['Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigasira', 'Ardra',
-                          'Punarvasu', 'Pushya', 'Ashlesha', 'Magha', 'Purva Phalguni', 'Uttara Phalguni',
-                          'Hasta', 'Chitra', 'Swati', 'Vishakha', 'Anuradha', 'Jyestha',
-                          'Mula', 'Purva Ashadha', 'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha',
-                          'Purva Bhadrapada', 'Uttara Bhadrapada', 'Revati']
-        nakshatra_index = int(longitude / 13.333333333333334)
-        return nakshatra_names[nakshatra_index % 27]
-    
     def get_career_fields_from_tenth_house(self, tenth_house_sign: int, tenth_lord: str) -> list:
         """Get career fields based on 10th house sign and lord"""
         career_mapping = {
@@ -21871,12 +21078,12 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         return "Career specialization based on D10 divisional chart analysis"
     
     def check_raj_yoga(self, positions: Dict) -> bool:
-        """Check for Raj Yoga formation"""
-        return True  # Simplified check
+        """Check for Raj Yoga formation - any kendra-trikona lord Raja Yoga rule"""
+        return bool(yoga_rules.matching(self.yoga_board(positions), 'Raja'))
     
     def check_dhana_yoga(self, positions: Dict) -> bool:
-        """Check for Dhana Yoga formation"""
-        return True  # Simplified check
+        """Check for Dhana Yoga formation - any wealth-lord Dhana Yoga rule"""
+        return bool(yoga_rules.matching(self.yoga_board(positions), 'Dhana'))
     
     def get_current_dasha(self, positions: Dict) -> str:
         """Get current dasha period"""
@@ -22526,7 +21733,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             from datetime import datetime, timedelta
             import calendar
             
-            print("[DEBUG] ✓ Starting AUTHENTIC Annual Predictions (Varshaphal) calculation", file=sys.stderr)
+            log.debug("✓ Starting AUTHENTIC Annual Predictions (Varshaphal) calculation")
             
             # Current date for predictions
             current_year = datetime.now().year
@@ -22537,6 +21744,14 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             birth_lon = birth_details.get('longitude', 0)
             birth_date = birth_details.get('birth_date', '1990-01-01')
             
+            # Tajika solar return for the year in progress
+            try:
+                solar_return = solar_returns(birth_details)['years'][0]
+                prediction_year = solar_return['year']
+            except Exception as e:
+                log.warning("Solar return calculation failed: {}", e)
+                solar_return = None
+            
             # USE AUTHENTIC UNIFIED DASHA SYSTEM DATA (already calculated)
             current_dasha_info = self.get_authentic_dasha_for_annual_predictions(positions, birth_details)
             
@@ -22569,10 +21784,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             jupiter_house_info = existing_transit_data.get('jupiter_effects', {}).get('position_from_lagna', 'House 5')
             jupiter_effect_info = existing_transit_data.get('jupiter_effects', {}).get('general_effect', 'excellent')
             
-            print(f"[DEBUG] ✓ Annual Predictions - Dasha: {current_dasha_info.get('mahadasha', 'Unknown')}, Jupiter Transit: {jupiter_house_info} ({jupiter_effect_info})", file=sys.stderr)
+            log.debug("✓ Annual Predictions - Dasha: {}, Jupiter Transit: {} ({})", current_dasha_info.get('mahadasha', 'Unknown'), jupiter_house_info, jupiter_effect_info)
             
             return {
                 'prediction_year': prediction_year,
+                'solar_return': solar_return,
                 'current_dasha': current_dasha_info,
                 'key_transits': existing_transit_data,  # Using authentic transit data
                 'annual_theme': annual_themes,
@@ -22590,7 +21806,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Annual Predictions calculation failed: {str(e)}", file=sys.stderr)
+            log.error("Annual Predictions calculation failed: {}", e)
             return {
                 'error': f'Annual predictions calculation error: {str(e)}',
                 'prediction_year': datetime.now().year,
@@ -22605,7 +21821,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     def get_existing_transit_data_for_annual_predictions(self, positions: Dict, birth_details: Dict) -> Dict:
         """Get authentic transit data from existing Transit Gochar Analysis (Section 11)"""
         try:
-            print("[DEBUG] Using authentic Transit Gochar Analysis data for annual predictions", file=sys.stderr)
+            log.debug("Using authentic Transit Gochar Analysis data for annual predictions")
             
             # Calculate the same transit data as Section 11 using the correct function
             transit_data = self.calculate_comprehensive_transit_gochar_analysis(positions, birth_details)
@@ -22613,14 +21829,14 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             # Extract Jupiter effects specifically
             jupiter_effects = transit_data.get('jupiter_effects', {})
             
-            print(f"[DEBUG] Extracted Jupiter Effects: {jupiter_effects}", file=sys.stderr)
+            log.debug("Extracted Jupiter Effects: {}", jupiter_effects)
             
             # Extract house number from position_from_lagna field
             lagna_position = jupiter_effects.get('position_from_lagna', 'House 5')
             jupiter_house_num = self.extract_house_number_from_position(lagna_position)
             jupiter_effect = jupiter_effects.get('general_effect', 'excellent')
             
-            print(f"[DEBUG] Jupiter House from Lagna: {lagna_position} -> {jupiter_house_num}, Effect: {jupiter_effect}", file=sys.stderr)
+            log.debug("Jupiter House from Lagna: {} -> {}, Effect: {}", lagna_position, jupiter_house_num, jupiter_effect)
             
             # Format data to match annual predictions structure
             return {
@@ -22634,9 +21850,9 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Failed to get transit data: {str(e)}", file=sys.stderr)
+            log.error("Failed to get transit data: {}", e)
             import traceback
-            print(f"[ERROR] Traceback: {traceback.format_exc()}", file=sys.stderr)
+            log.error("Traceback: {}", traceback.format_exc())
             return {
                 'jupiter_transit_house': 5,
                 'jupiter_effect': 'excellent',
@@ -22657,7 +21873,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     def get_authentic_dasha_for_annual_predictions(self, positions: Dict, birth_details: Dict) -> Dict:
         """Get authentic Dasha data from unified dasha system for annual predictions"""
         try:
-            print("[DEBUG] Getting authentic dasha data for annual predictions", file=sys.stderr)
+            log.debug("Getting authentic dasha data for annual predictions")
             
             # Use the already calculated unified dasha system
             unified_dasha_data = self.calculate_unified_dasha_system(positions, birth_details)
@@ -22669,7 +21885,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 current_dasha = mahadasha_info.get('lord', 'Venus')
                 dasha_effect = self.get_dasha_effect(current_dasha, positions)
                 
-                print(f"[DEBUG] Authentic annual predictions dasha: {current_dasha}", file=sys.stderr)
+                log.debug("Authentic annual predictions dasha: {}", current_dasha)
                 
                 return {
                     'mahadasha': current_dasha,
@@ -22683,11 +21899,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 }
             else:
                 # Fallback if unified dasha system fails
-                print("[DEBUG] Fallback to simplified dasha calculation", file=sys.stderr)
+                log.debug("Fallback to simplified dasha calculation")
                 return self.get_current_dasha_period(positions, birth_details)
                 
         except Exception as e:
-            print(f"[DEBUG] Error getting authentic dasha: {str(e)}", file=sys.stderr)
+            log.warning("Error getting authentic dasha: {}", e)
             return self.get_current_dasha_period(positions, birth_details)
     
     def get_current_dasha_period(self, positions: Dict, birth_details: Dict) -> Dict:
@@ -22770,8 +21986,8 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             ascendant_longitude = positions.get('ascendant_longitude', 0)
             lagna_sign_num = ((int(ascendant_longitude) // 30) % 12) + 1
             
-            print(f"[DEBUG] Jupiter Transit Calc - Moon: {moon_sign_name} ({moon_sign_num}), Lagna: {lagna_sign_num}", file=sys.stderr)
-            print(f"[DEBUG] Jupiter Transit Sign: {current_transits['jupiter_transit_sign']}", file=sys.stderr)
+            log.debug("Jupiter Transit Calc - Moon: {} ({}), Lagna: {}", moon_sign_name, moon_sign_num, lagna_sign_num)
+            log.debug("Jupiter Transit Sign: {}", current_transits['jupiter_transit_sign'])
             
             # Jupiter transit house effect
             jupiter_house_from_moon = self.calculate_house_from_sign(
@@ -22781,7 +21997,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 current_transits['jupiter_transit_sign'], lagna_sign_num
             )
             
-            print(f"[DEBUG] Jupiter Houses - From Moon: {jupiter_house_from_moon}, From Lagna: {jupiter_house_from_lagna}", file=sys.stderr)
+            log.debug("Jupiter Houses - From Moon: {}, From Lagna: {}", jupiter_house_from_moon, jupiter_house_from_lagna)
             
             current_transits.update({
                 'jupiter_transit_house': jupiter_house_from_lagna,  # Using Lagna for annual predictions
@@ -23506,7 +22722,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     def generate_comprehensive_planetary_results(self, positions: Dict, houses: Dict) -> Dict:
         """Generate authentic Section 2: Planetary Results (Graha Phala)"""
         try:
-            print(f"[DEBUG] ✓ Starting AUTHENTIC Planetary Results (Graha Phala) calculation", file=sys.stderr)
+            log.debug("✓ Starting AUTHENTIC Planetary Results (Graha Phala) calculation")
             
             planetary_results = {}
             
@@ -23528,13 +22744,13 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 if ascendant_longitude == 0:
                     # Fallback to lowercase if uppercase not found
                     ascendant_longitude = positions.get('ascendant', {}).get('longitude', 0)
-                print(f"[DEBUG] PLANETARY RESULTS: Using ascendant longitude: {ascendant_longitude:.2f}° for planet {planet}", file=sys.stderr)
+                log.debug("PLANETARY RESULTS: Using ascendant longitude: {:.2f}° for planet {}", ascendant_longitude, planet)
                 house_number = self.get_correct_house_from_longitude(longitude, ascendant_longitude)
                 
                 # Special debug for Mercury to trace the issue
                 if planet == 'Mercury':
-                    print(f"[DEBUG] MERCURY SPECIFIC: Long={longitude:.2f}°, Asc={ascendant_longitude:.2f}°, House={house_number}", file=sys.stderr)
-                    print(f"[DEBUG] MERCURY SIGN: {sign_name}, Expected house for Mercury calculation check", file=sys.stderr)
+                    log.debug("MERCURY SPECIFIC: Long={:.2f}°, Asc={:.2f}°, House={}", longitude, ascendant_longitude, house_number)
+                    log.debug("MERCURY SIGN: {}, Expected house for Mercury calculation check", sign_name)
                 house_name = self.get_house_name(house_number)
                 
                 # Calculate planetary strength and dignity
@@ -23581,7 +22797,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                     }
                 }
             
-            print(f"[DEBUG] ✓ Generated authentic planetary results for {len(planetary_results)} planets", file=sys.stderr)
+            log.debug("✓ Generated authentic planetary results for {} planets", len(planetary_results))
             
             return {
                 'title': '2. Planetary Results (Graha Phala)',
@@ -23591,7 +22807,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[DEBUG] ❌ Error in planetary results generation: {str(e)}", file=sys.stderr)
+            log.warning("❌ Error in planetary results generation: {}", e)
             return {
                 'title': '2. Planetary Results (Graha Phala) - Error',
                 'error': f'Error generating authentic planetary results: {str(e)}',
@@ -23620,38 +22836,10 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         house_diff = (planet_sign - ascendant_sign) % 12
         house_number = house_diff + 1
         
-        print(f"[DEBUG] HOUSE CALC: Planet={planet_longitude:.2f}° (sign {planet_sign}), Asc={ascendant_longitude:.2f}° (sign {ascendant_sign}), Diff={house_diff}, House={house_number}", file=sys.stderr)
-        
-        # Validation: Ensure house calculation is consistent
-        self.validate_house_calculation(planet_longitude, ascendant_longitude, house_number)
+        log.debug("HOUSE CALC: Planet={:.2f}° (sign {}), Asc={:.2f}° (sign {}), Diff={}, House={}", planet_longitude, planet_sign, ascendant_longitude, ascendant_sign, house_diff, house_number)
         
         return house_number
     
-    def validate_house_calculation(self, planet_longitude: float, ascendant_longitude: float, calculated_house: int):
-        """Validate house calculation for data accuracy"""
-        try:
-            # Convert to sign numbers for validation
-            planet_sign = int(planet_longitude // 30)
-            ascendant_sign = int(ascendant_longitude // 30)
-            
-            # Sign names for clarity
-            sign_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo', 
-                         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
-            
-            planet_sign_name = sign_names[planet_sign]
-            ascendant_sign_name = sign_names[ascendant_sign]
-            
-            # Manual verification of the calculation
-            expected_house = ((planet_sign - ascendant_sign) % 12) + 1
-            
-            if calculated_house != expected_house:
-                print(f"[ERROR] HOUSE CALCULATION MISMATCH: Planet in {planet_sign_name}, Asc in {ascendant_sign_name}, Expected house {expected_house}, Got {calculated_house}", file=sys.stderr)
-            else:
-                print(f"[DEBUG] ✓ HOUSE VALIDATION PASSED: Planet in {planet_sign_name} from {ascendant_sign_name} ascendant = {calculated_house} house", file=sys.stderr)
-                
-        except Exception as e:
-            print(f"[DEBUG] House validation error: {e}", file=sys.stderr)
-
     def get_house_name(self, house_number: int) -> str:
         """Get house name from number"""
         house_names = {
@@ -24188,7 +23376,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return min(100, max(0, strength_score))
             
         except Exception as e:
-            print(f"[DEBUG] Error calculating planetary strength for {planet}: {str(e)}", file=sys.stderr)
+            log.warning("Error calculating planetary strength for {}: {}", planet, e)
             return 50  # Default moderate strength
 
     def calculate_aspectual_strength(self, planet: str, longitude: float, positions: Dict) -> float:
@@ -24238,7 +23426,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             return aspect_score
             
         except Exception as e:
-            print(f"[DEBUG] Error calculating aspectual strength: {str(e)}", file=sys.stderr)
+            log.warning("Error calculating aspectual strength: {}", e)
             return 10  # Default
 
     def categorize_strength(self, strength_score: float) -> str:
@@ -25103,7 +24291,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     
     def generate_dasha_action_plan(self, positions: Dict, birth_details: Dict, dasha_data: Dict) -> Dict:
         """Generate comprehensive dasha-based action plan with authentic Jyotisha remedies using Section 13 dasha data"""
-        print(f"[DEBUG] Generating dasha-based action plan...", file=sys.stderr)
+        log.debug("Generating dasha-based action plan...")
         
         # Use the same authentic dasha calculation as Section 13 (Detailed Dasha Predictions)
         authentic_dasha_data = self.calculate_detailed_dasha_predictions(positions, birth_details, dasha_data)
@@ -25112,8 +24300,8 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
         current_mahadasha = self.get_current_mahadasha_from_section13(authentic_dasha_data)
         current_antardasha = self.get_current_antardasha_from_section13(authentic_dasha_data)
         
-        print(f"[DEBUG] Using Section 13 authentic dasha - Current Maha Dasha: {current_mahadasha}", file=sys.stderr)
-        print(f"[DEBUG] Using Section 13 authentic dasha - Current Antardasha: {current_antardasha}", file=sys.stderr)
+        log.debug("Using Section 13 authentic dasha - Current Maha Dasha: {}", current_mahadasha)
+        log.debug("Using Section 13 authentic dasha - Current Antardasha: {}", current_antardasha)
         
         # Analyze planet strength and benefic/malefic nature
         mahadasha_analysis = self.analyze_dasha_planet(current_mahadasha, positions)
@@ -25137,13 +24325,13 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             'implementation_strategy': self.generate_implementation_strategy(mahadasha_analysis, antardasha_analysis)
         }
         
-        print(f"[DEBUG] ✓ Action plan generated successfully", file=sys.stderr)
+        log.debug("✓ Action plan generated successfully")
         return action_plan
     
     def calculate_marriage_compatibility_analysis(self, positions: Dict, birth_details: Dict) -> Dict:
         """Generate comprehensive marriage compatibility analysis"""
         try:
-            print(f"[DEBUG] Starting marriage compatibility calculation...", file=sys.stderr)
+            log.debug("Starting marriage compatibility calculation...")
             
             # Extract key planetary positions
             venus_house = self.get_planet_house(positions.get('Venus', {}), positions)
@@ -25163,7 +24351,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             mercury_analysis = self.analyze_mercury_for_marriage(mercury_house, positions)
             
             # Mars analysis for Manglik Dosha
-            manglik_analysis = self.analyze_manglik_dosha(mars_house, positions)
+            manglik_analysis = self.analyze_manglik_dosha(positions)
             
             # 7th house analysis
             seventh_house_analysis = self.analyze_seventh_house_for_marriage(positions)
@@ -25231,11 +24419,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 }
             }
             
-            print(f"[DEBUG] ✓ Marriage compatibility analysis completed", file=sys.stderr)
+            log.debug("✓ Marriage compatibility analysis completed")
             return marriage_compatibility
             
         except Exception as e:
-            print(f"[DEBUG] Error in marriage compatibility analysis: {e}", file=sys.stderr)
+            log.warning("Error in marriage compatibility analysis: {}", e)
             return {
                 'summary': {
                     'overall_compatibility': 'Good marriage prospects indicated',
@@ -25445,10 +24633,10 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             'marriage_impact': 'Enhances understanding and communication in marriage'
         }
     
-    def analyze_manglik_dosha(self, mars_house: int, positions: Dict) -> Dict:
+    def analyze_manglik_dosha(self, positions: Dict) -> Dict:
         """Analyze Manglik Dosha and its effects"""
-        manglik_houses = [1, 2, 4, 7, 8, 12]
-        is_manglik = mars_house in manglik_houses
+        mars_house = positions['Mars']['house']
+        is_manglik = yoga_rules.holds(self.yoga_board(positions), 'Manglik from Lagna')
         
         if is_manglik:
             dosha_effects = {
@@ -25797,13 +24985,14 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     def get_current_mahadasha_from_section13(self, section13_data: Dict) -> str:
         """Extract current mahadasha from Section 13 authentic dasha data"""
         try:
-            print(f"[DEBUG] Section 13 data structure: {list(section13_data.keys()) if section13_data else 'None'}", file=sys.stderr)
+            if log.debug_enabled:
+                log.debug("Section 13 data structure: {}", list(section13_data.keys()) if section13_data else 'None')
             
             # Section 13 returns 'current_mahadasha' with 'planet' field
             if section13_data and 'current_mahadasha' in section13_data:
                 current_mahadasha = section13_data['current_mahadasha']
                 planet = current_mahadasha.get('planet', 'Jupiter')
-                print(f"[DEBUG] Extracted Section 13 current mahadasha: {planet}", file=sys.stderr)
+                log.debug("Extracted Section 13 current mahadasha: {}", planet)
                 return planet
             
             # Fallback to other possible structures
@@ -25813,11 +25002,11 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 current_details = section13_data['current_dasha_details']
                 return current_details.get('current_lord', 'Jupiter')
             else:
-                print(f"[DEBUG] Using fallback Jupiter for Section 13 mahadasha", file=sys.stderr)
+                log.debug("Using fallback Jupiter for Section 13 mahadasha")
                 return 'Jupiter'
                 
         except Exception as e:
-            print(f"[ERROR] Error extracting Section 13 mahadasha: {e}", file=sys.stderr)
+            log.error("Error extracting Section 13 mahadasha: {}", e)
             return 'Jupiter'
     
     def get_current_antardasha_from_section13(self, section13_data: Dict) -> str:
@@ -25831,7 +25020,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 current_mahadasha = section13_data['current_mahadasha']
                 # For first sub-period, antardasha is same as mahadasha
                 # This follows traditional Vimshottari system where first sub-period matches main period
-                print(f"[DEBUG] Section 13 antardasha defaulting to mahadasha: {mahadasha}", file=sys.stderr)
+                log.debug("Section 13 antardasha defaulting to mahadasha: {}", mahadasha)
                 return mahadasha
             
             # Other fallback checks
@@ -25842,7 +25031,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             
             return mahadasha  # Default to same as mahadasha for first sub-period
         except Exception as e:
-            print(f"[ERROR] Error extracting Section 13 antardasha: {e}", file=sys.stderr)
+            log.error("Error extracting Section 13 antardasha: {}", e)
             return self.get_current_mahadasha_from_section13(section13_data)
     
     def get_current_mahadasha_lord(self, dasha_data: Dict) -> str:
@@ -25870,10 +25059,10 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 return dasha_data['starting_lord']
             else:
                 # Critical: No dasha data available - this should not happen in production
-                print(f"[ERROR] No valid dasha data found: {dasha_data}", file=sys.stderr)
+                log.error("No valid dasha data found: {}", dasha_data)
                 return 'Sun'  # Sun is most common starting dasha
         except Exception as e:
-            print(f"[ERROR] Error extracting mahadasha lord: {e}", file=sys.stderr)
+            log.error("Error extracting mahadasha lord: {}", e)
             return 'Sun'
     
     def get_current_antardasha_lord(self, dasha_data: Dict) -> str:
@@ -25890,7 +25079,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
                 # This can be enhanced with proper antardasha calculation later
                 return mahadasha
         except Exception as e:
-            print(f"[ERROR] Error extracting antardasha lord: {e}", file=sys.stderr)
+            log.error("Error extracting antardasha lord: {}", e)
             return self.get_current_mahadasha_lord(dasha_data)
     
     def analyze_dasha_planet(self, planet: str, positions: Dict) -> Dict:
@@ -26420,7 +25609,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
     
     def create_fallback_divisional_charts(self, positions: Dict, birth_details: Dict) -> Dict:
         """Create fallback divisional charts structure with basic South Indian charts when main calculation fails"""
-        print(f"[DEBUG] Creating fallback divisional charts structure", file=sys.stderr)
+        log.debug("Creating fallback divisional charts structure")
         
         # Create basic chart structure for D1 (Rasi chart)
         d1_chart = {
@@ -26457,7 +25646,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             'spiritual_significance': 'Shows your path to worldly success and professional dharma'
         }
         
-        print(f"[DEBUG] ✓ Fallback divisional charts created with South Indian charts", file=sys.stderr)
+        log.debug("✓ Fallback divisional charts created with South Indian charts")
         
         return {
             'd1_rasi': d1_chart,
@@ -26891,7 +26080,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in comprehensive dasha timeline: {e}", file=sys.stderr)
+            log.error("Error in comprehensive dasha timeline: {}", e)
             return {'error': str(e)}
     
     def format_transit_summary(self, predictions):
@@ -26963,7 +26152,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in 3-year transit predictions: {e}", file=sys.stderr)
+            log.error("Error in 3-year transit predictions: {}", e)
             return {'error': str(e)}
     
     def generate_annual_forecast(self, positions: Dict, dasha_periods: Dict) -> Dict:
@@ -27012,7 +26201,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in annual forecast: {e}", file=sys.stderr)
+            log.error("Error in annual forecast: {}", e)
             return {'error': str(e)}
     
     def generate_divisional_charts_analysis(self, birth_details: Dict, positions: Dict) -> Dict:
@@ -27064,7 +26253,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in divisional charts analysis: {e}", file=sys.stderr)
+            log.error("Error in divisional charts analysis: {}", e)
             return {'error': str(e)}
     
     def calculate_atmakaraka(self, positions: Dict) -> str:
@@ -27085,131 +26274,30 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             
             return atmakaraka_planet
         except Exception as e:
-            print(f"[ERROR] Atmakaraka calculation error: {e}", file=sys.stderr)
+            log.error("Atmakaraka calculation error: {}", e)
             return 'Sun'
     
     def calculate_shadbala_strengths(self, positions: Dict, birth_details: Dict) -> Dict:
         """Calculate Shadbala (six-fold strength) for all planets"""
         try:
             shadbala_strengths = {}
-            for planet in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']:
-                if planet in positions:
-                    planet_data = positions[planet]
-                    
-                    # Calculate basic strength factors
-                    positional_strength = self.calculate_positional_strength(planet, planet_data)
-                    temporal_strength = self.calculate_temporal_strength(planet, birth_details)
-                    directional_strength = self.calculate_directional_strength(planet, planet_data)
-                    motional_strength = self.calculate_motional_strength(planet, planet_data)
-                    natural_strength = self.get_natural_strength(planet)
-                    aspectual_strength = self.calculate_aspectual_strength(planet, positions)
-                    
-                    # Total Shadbala score
-                    total_strength = (
-                        positional_strength + temporal_strength + directional_strength +
-                        motional_strength + natural_strength + aspectual_strength
-                    )
-                    
-                    shadbala_strengths[planet] = {
-                        'total_strength': total_strength,
-                        'positional': positional_strength,
-                        'temporal': temporal_strength,
-                        'directional': directional_strength,
-                        'motional': motional_strength,
-                        'natural': natural_strength,
-                        'aspectual': aspectual_strength,
-                        'grade': self.get_strength_grade(total_strength)
-                    }
+            for planet, strength in shadbala_engine.chart_strength(birth_details)['planets'].items():
+                shadbala_strengths[planet] = {
+                    'total_strength': strength['total_virupas'],
+                    'positional': strength['sthana_bala']['total'],
+                    'temporal': strength['kala_bala']['total'],
+                    'directional': strength['dig_bala'],
+                    'motional': strength['cheshta_bala'],
+                    'natural': strength['naisargika_bala'],
+                    'aspectual': strength['drik_bala'],
+                    'grade': self.get_shadbala_level(strength['ratio'])
+                }
             
             return shadbala_strengths
         except Exception as e:
-            print(f"[ERROR] Shadbala calculation error: {e}", file=sys.stderr)
+            log.error("Shadbala calculation error: {}", e)
             return {}
     
-    def calculate_positional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate positional strength (Sthana Bala)"""
-        strength = 0.0
-        sign = planet_data.get('sign', '')
-        
-        # Own sign strength
-        own_signs = {
-            'Sun': ['Simha'], 'Moon': ['Karka'], 'Mars': ['Mesha', 'Vrishchika'],
-            'Mercury': ['Mithuna', 'Kanya'], 'Jupiter': ['Dhanu', 'Meena'],
-            'Venus': ['Vrishabha', 'Tula'], 'Saturn': ['Makara', 'Kumbha']
-        }
-        if sign in own_signs.get(planet, []):
-            strength += 30.0
-        
-        # Exaltation strength
-        exaltation_signs = {
-            'Sun': 'Mesha', 'Moon': 'Vrishabha', 'Mars': 'Makara',
-            'Mercury': 'Kanya', 'Jupiter': 'Karka', 'Venus': 'Meena', 'Saturn': 'Tula'
-        }
-        if sign == exaltation_signs.get(planet):
-            strength += 40.0
-        
-        return strength
-    
-    def calculate_temporal_strength(self, planet: str, birth_details: Dict) -> float:
-        """Calculate temporal strength (Kala Bala)"""
-        # Simplified temporal strength based on day/night birth
-        try:
-            birth_time = birth_details.get('time', '12:00')
-            hour = int(birth_time.split(':')[0])
-            
-            # Day planets get strength during day (6 AM to 6 PM)
-            day_planets = ['Sun', 'Jupiter', 'Venus']
-            night_planets = ['Moon', 'Mars', 'Saturn']
-            
-            if 6 <= hour <= 18:  # Day time
-                if planet in day_planets:
-                    return 20.0
-                elif planet in night_planets:
-                    return 10.0
-            else:  # Night time
-                if planet in night_planets:
-                    return 20.0
-                elif planet in day_planets:
-                    return 10.0
-            
-            return 15.0  # Mercury neutral
-        except:
-            return 15.0
-    
-    def calculate_directional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate directional strength (Dig Bala)"""
-        house = planet_data.get('house', 1)
-        
-        # Directional strength for planets
-        directional_houses = {
-            'Sun': 10, 'Moon': 4, 'Mars': 10, 'Mercury': 1,
-            'Jupiter': 1, 'Venus': 4, 'Saturn': 7
-        }
-        
-        if house == directional_houses.get(planet, 1):
-            return 25.0
-        return 10.0
-    
-    def calculate_motional_strength(self, planet: str, planet_data: Dict) -> float:
-        """Calculate motional strength (Chesta Bala)"""
-        # Simplified: retrograde planets get extra strength
-        if planet_data.get('retrograde', False):
-            return 20.0
-        return 15.0
-    
-    def get_natural_strength(self, planet: str) -> float:
-        """Get natural strength (Naisargika Bala)"""
-        natural_strengths = {
-            'Sun': 60.0, 'Moon': 51.43, 'Mars': 17.14, 'Mercury': 25.71,
-            'Jupiter': 34.29, 'Venus': 42.86, 'Saturn': 8.57
-        }
-        return natural_strengths.get(planet, 25.0)
-    
-    def calculate_aspectual_strength(self, planet: str, positions: Dict) -> float:
-        """Calculate aspectual strength (Drik Bala) - simplified"""
-        # Simplified aspectual strength calculation
-        return 15.0
-    
     def get_strength_grade(self, total_strength: float) -> str:
         """Get strength grade based on total Shadbala score"""
         if total_strength >= 180:
@@ -27287,7 +26375,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in expanded personality analysis: {e}", file=sys.stderr)
+            log.error("Error in expanded personality analysis: {}", e)
             return {'error': str(e)}
     
     def generate_comprehensive_remedies(self, positions: Dict, yogas: List, doshas: List, dasha_periods: Dict) -> Dict:
@@ -27356,7 +26444,7 @@ The ultimate goal of your incarnation is to master the lessons of your {ascendan
             }
             
         except Exception as e:
-            print(f"[ERROR] Error in comprehensive remedies: {e}", file=sys.stderr)
+            log.error("Error in comprehensive remedies: {}", e)
             return {'error': str(e)}
     
     # Helper methods for Super Horoscope expanded content
@@ -27726,7 +26814,17 @@ class PremiumReportGenerator:
     def generate_comprehensive_report(self, birth_details: Dict) -> Dict:
         """Generate comprehensive premium report using the engine"""
         try:
-            return self.engine.generate_complete_report(birth_details)
+            if not perf_instrumentation.enabled(birth_details):
+                return self.engine.generate_complete_report(birth_details)
+            
+            # Opt-in timing of swisseph calls and report sections for this request
+            perf_instrumentation.instrument_swisseph()
+            perf_instrumentation.instrument_methods(PremiumReportEngine)
+            with perf_instrumentation.request_scope() as recorder:
+                report = self.engine.generate_complete_report(birth_details)
+            report['_perf'] = recorder.snapshot()
+            perf_instrumentation.write_prometheus_textfile(recorder, 'premium_report')
+            return report
         except Exception as e:
             return {
                 'success': False,
@@ -27740,30 +26838,32 @@ if __name__ == "__main__":
     import json
     
     try:
-        # Try to read from command line arguments first
-        if len(sys.argv) > 1:
-            birth_details = json.loads(sys.argv[1])
-        else:
-            # Read from stdin if no command line arguments
-            stdin_data = sys.stdin.read().strip()
-            if stdin_data:
-                birth_details = json.loads(stdin_data)
+        # Diagnostics go to stderr; stdout carries only the JSON result
+        with engine_logging.stdout_to_stderr():
+            # Try to read from command line arguments first
+            if len(sys.argv) > 1:
+                birth_details = json.loads(sys.argv[1])
             else:
-                raise ValueError("No input provided")
-        
-        print(f"[DEBUG] Received birth details: {birth_details}", file=sys.stderr)
-        
-        # Normalize birth details to handle date format conversion
-        birth_details = normalize_birth_details(birth_details)
-        print(f"[DEBUG] Normalized birth details: {birth_details}", file=sys.stderr)
-        
-        generator = PremiumReportGenerator()
-        report = generator.generate_comprehensive_report(birth_details)
+                # Read from stdin if no command line arguments
+                stdin_data = sys.stdin.read().strip()
+                if stdin_data:
+                    birth_details = json.loads(stdin_data)
+                else:
+                    raise ValueError("No input provided")
+            
+            log.debug("Received birth details: {}", birth_details)
+            
+            # Normalize birth details to handle date format conversion
+            birth_details = normalize_birth_details(birth_details)
+            log.debug("Normalized birth details: {}", birth_details)
+            
+            generator = PremiumReportGenerator()
+            report = generator.generate_comprehensive_report(birth_details)
         print(json.dumps(report, ensure_ascii=False, indent=2))
         
     except Exception as e:
         error_msg = str(e)
-        print(f"[ERROR] Main execution error: {error_msg}", file=sys.stderr)
+        log.error("Main execution error: {}", error_msg)
         error_response = {
             'success': False,
             'error': f'Report generation failed: {error_msg}',
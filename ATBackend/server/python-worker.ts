@@ -0,0 +1,103 @@
+/**
+ * Resident Python Worker Client
+ * Keeps one `<script> --worker` process per engine and sends it
+ * line-delimited JSON requests, matching replies to requests by id. If the
+ * process fails to start, exits, its stdin breaks (EPIPE) or a request
+ * times out, every pending request is rejected and the next request starts
+ * a fresh process
+ */
+
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
+import readline from 'readline';
+
+interface PendingRequest {
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+}
+
+export class PythonWorker {
+  private child: ChildProcessWithoutNullStreams | null = null;
+  private pending = new Map<number, PendingRequest>();
+  private nextId = 1;
+
+  constructor(
+    private readonly label: string,
+    private readonly script: string,
+    private readonly timeout: number
+  ) {}
+
+  private fail(child: ChildProcessWithoutNullStreams, error: Error) {
+    // Late events from a process already replaced must not reject the new one's requests
+    if (this.child !== child) return;
+    this.child = null;
+    for (const [id, request] of this.pending) {
+      clearTimeout(request.timer);
+      request.reject(error);
+      this.pending.delete(id);
+    }
+  }
+
+  private start(): ChildProcessWithoutNullStreams {
+    const child = spawn(process.env.PYTHON3 || 'python3', [this.script, '--worker'], {
+      cwd: process.cwd(),
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+
+    readline.createInterface({ input: child.stdout }).on('line', (line) => {
+      let result: any;
+      try {
+        result = JSON.parse(line);
+      } catch (error) {
+        console.error(`${this.label} worker returned invalid JSON:`, line);
+        return;
+      }
+      const request = this.pending.get(result.id);
+      if (!request) return;
+      clearTimeout(request.timer);
+      this.pending.delete(result.id);
+      request.resolve(result);
+    });
+
+    child.stderr.on('data', (data) => {
+      console.error(`${this.label} worker:`, data.toString().trim());
+    });
+
+    child.stdin.on('error', (error) => {
+      console.error(`${this.label} worker stdin error:`, error.message);
+      this.fail(child, new Error(`${this.label} engine worker stdin closed: ${error.message}`));
+    });
+
+    child.on('exit', (code) => {
+      console.warn(`${this.label} worker exited with code ${code}`);
+      this.fail(child, new Error(`${this.label} engine worker exited`));
+    });
+
+    child.on('error', (error) => {
+      console.error(`Failed to start ${this.label} engine worker:`, error.message);
+      this.fail(child, new Error(`${this.label} engine worker failed: ${error.message}`));
+    });
+
+    return child;
+  }
+
+  request(payload: Record<string, any>): Promise<any> {
+    if (!this.child) this.child = this.start();
+    const child = this.child;
+    const id = this.nextId++;
+
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        // The worker answers strictly in order, so a hung request would stall
+        // every later one; drop the process and let the next request respawn it
+        console.warn(`${this.label} worker request ${id} timed out, restarting worker`);
+        this.pending.delete(id);
+        reject(new Error(`${this.label} engine request timed out`));
+        this.fail(child, new Error(`${this.label} engine worker restarted after a timed out request`));
+        child.kill();
+      }, this.timeout);
+      this.pending.set(id, { resolve, reject, timer });
+      child.stdin.write(JSON.stringify({ ...payload, id }) + '\n');
+    });
+  }
+}
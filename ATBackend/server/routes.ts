@@ -30,6 +30,7 @@ import { generateArticles, getArticleStatistics } from "./article-generator";
 import { TamilAstrologyFormatter } from "./tamil-astrology";
 import { StellarAstrologyCalculator } from "./kp-system";
 import { AdvancedKPAnalyzer } from "./kp-advanced";
+import { kpWorker, calculateKPChart, calculateKPHorary, horaryMoment } from "./kp-worker";
 import nodemailer from "nodemailer";
 import puppeteer from "puppeteer";
 // Removed SendGrid - using only SMTP
@@ -8191,15 +8192,15 @@ export async function registerRoutes(app: Express): Promise<Server> {
   const performanceMonitor = new PerformanceMonitor(io);
   const memoryOptimizer = MemoryOptimizer.getInstance();
 
-  // KP Astrology Engine Integrated Routes
+  // KP Astrology Engine Integrated Routes (resident kp_engine.py worker)
   app.get('/api/kp/health', async (req, res) => {
     try {
-      const { stdout } = await execAsync('python --version', { cwd: path.join(process.cwd(), 'kp-astrology-engine') });
+      const result = await kpWorker.request({ type: 'segment_table' });
       res.json({
-        success: true,
-        status: 'healthy',
-        service: 'kp-astrology-engine-integrated',
-        python_version: stdout.trim(),
+        success: result.success,
+        status: result.success ? 'healthy' : 'degraded',
+        service: 'kp-engine-worker',
+        segments: result.data?.length,
         timestamp: new Date().toISOString()
       });
     } catch (error: any) {
@@ -8213,75 +8214,36 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.post('/api/kp/kp-chart', async (req, res) => {
     try {
-      const { birth_year, birth_month, birth_day, birth_hour, birth_minute, latitude, longitude } = req.body;
+      const { birth_year, birth_month, birth_day, birth_hour, birth_minute, latitude, longitude, timezone } = req.body;
       
-      if (!birth_year || !birth_month || !birth_day || !birth_hour || !birth_minute || !latitude || !longitude) {
+      if (!birth_year || !birth_month || !birth_day || birth_hour === undefined || birth_minute === undefined || !latitude || !longitude) {
         return res.status(400).json({
           success: false,
           error: 'Missing required birth details'
         });
       }
 
-      const KP_ENGINE_PATH = path.join(process.cwd(), 'kp-astrology-engine');
-      const scriptPath = path.join(KP_ENGINE_PATH, 'kp_calculator.py');
-      
-      // Use stdin approach instead of command line arguments
-      const childProcess = await import('child_process');
-      const pythonProcess = childProcess.spawn(process.env.PYTHON3, [scriptPath], {
-        cwd: KP_ENGINE_PATH,
-        stdio: ['pipe', 'pipe', 'pipe']
-      });
-
-      let output = '';
-      let error = '';
-
-      pythonProcess.stdout.on('data', (data) => {
-        output += data.toString();
-      });
-
-      pythonProcess.stderr.on('data', (data) => {
-        error += data.toString();
+      const result = await calculateKPChart({
+        date: `${birth_year}-${String(birth_month).padStart(2, '0')}-${String(birth_day).padStart(2, '0')}`,
+        time: `${String(birth_hour).padStart(2, '0')}:${String(birth_minute).padStart(2, '0')}`,
+        latitude,
+        longitude,
+        timezone
       });
 
-      // Send input data via stdin
-      const inputData = {
-        birth_year,
-        birth_month, 
-        birth_day,
-        birth_hour,
-        birth_minute,
-        latitude,
-        longitude
-      };
-      
-      pythonProcess.stdin.write(JSON.stringify(inputData));
-      pythonProcess.stdin.end();
+      if (!result.success) {
+        return res.status(500).json({
+          success: false,
+          error: 'KP chart generation failed',
+          details: result.error
+        });
+      }
 
-      pythonProcess.on('close', (code) => {
-        if (code === 0 && output) {
-          try {
-            const result = JSON.parse(output);
-            res.json({
-              success: true,
-              data: result,
-              method: "KP_Birth_Chart_Integrated_STDIN",
-              timestamp: new Date().toISOString()
-            });
-          } catch (parseError) {
-            console.error('KP JSON parse error:', parseError);
-            res.status(500).json({
-              success: false,
-              error: 'Failed to parse KP calculation results'
-            });
-          }
-        } else {
-          console.error('KP Chart Generation Error:', error);
-          res.status(500).json({
-            success: false,
-            error: 'KP chart generation failed',
-            details: error || 'Process failed with code ' + code
-          });
-        }
+      res.json({
+        success: true,
+        data: result.data,
+        method: "KP_Birth_Chart_Worker",
+        timestamp: new Date().toISOString()
       });
 
     } catch (error: any) {
@@ -8296,7 +8258,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.post('/api/kp/kp-horary', async (req, res) => {
     try {
-      const { question, query_time, latitude, longitude } = req.body;
+      const { question, query_time, latitude, longitude, timezone, horary_number } = req.body;
+      const number = Number(horary_number);
       
       if (!question || !query_time || !latitude || !longitude) {
         return res.status(400).json({
@@ -8304,28 +8267,33 @@ export async function registerRoutes(app: Express): Promise<Server> {
           error: 'Missing required horary details'
         });
       }
+      if (!Number.isInteger(number) || number < 1 || number > 249) {
+        return res.status(400).json({
+          success: false,
+          error: 'horary_number must be an integer from 1 to 249'
+        });
+      }
+
+      const result = await calculateKPHorary({
+        question,
+        horary_number: number,
+        ...horaryMoment(query_time, timezone),
+        latitude,
+        longitude
+      });
+
+      if (!result.success) {
+        return res.status(500).json({
+          success: false,
+          error: 'KP horary analysis failed',
+          details: result.error
+        });
+      }
 
-      // Create basic horary analysis using KP principles
-      const horary_analysis = {
-        question: question,
-        query_time: query_time,
-        location: { latitude, longitude },
-        horary_number: Math.floor(Math.random() * 249) + 1, // KP uses 1-249 for horary
-        analysis: {
-          ruling_planet: ["Venus", "Mercury", "Jupiter"][Math.floor(Math.random() * 3)],
-          significator_strength: Math.floor(Math.random() * 100) + 1,
-          answer_tendency: Math.random() > 0.5 ? "Positive" : "Negative",
-          timing_indication: "Within 3-6 months",
-          kp_recommendation: "Analyze sub-lord for precise timing"
-        },
-        method: "KP_Horary_Basic_Analysis",
-        timestamp: new Date().toISOString()
-      };
-      
       res.json({
         success: true,
-        data: horary_analysis,
-        method: "KP_Horary_Analysis_Basic",
+        data: result.data,
+        method: "KP_Horary_Worker",
         timestamp: new Date().toISOString()
       });
 
@@ -8341,35 +8309,18 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.get('/api/kp/kp-nakshatras', async (req, res) => {
     try {
-      const KP_ENGINE_PATH = path.join(process.cwd(), 'kp-astrology-engine');
-      const command = `python -c "
-import sys
-sys.path.append('${KP_ENGINE_PATH}')
-from kp_calculator import KPAstrologyEngine, NAKSHATRA_DATA, VIMSHOTTARI_PERIODS
-import json
-
-print(json.dumps({
-    'nakshatras': NAKSHATRA_DATA,
-    'vimshottari_periods': VIMSHOTTARI_PERIODS,
-    'total_nakshatras': 27,
-    'system': 'KP_Stellar_Division'
-}))
-"`;
-      
-      const { stdout, stderr } = await execAsync(command, { 
-        cwd: KP_ENGINE_PATH,
-        timeout: 15000 
-      });
-
-      if (stderr && stderr.trim()) {
-        console.warn('KP Nakshatra Warning:', stderr);
+      const result = await kpWorker.request({ type: 'nakshatras' });
+      if (!result.success) {
+        return res.status(500).json({
+          success: false,
+          error: 'KP nakshatra data retrieval failed',
+          details: result.error
+        });
       }
 
-      const result = JSON.parse(stdout);
-      
       res.json({
         success: true,
-        data: result,
+        data: result.data,
         timestamp: new Date().toISOString()
       });
 
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Shadbala Engine
+Parashari six-fold strength (Sthana, Dig, Kala, Cheshta, Naisargika and Drik
+bala) of the seven grahas and Bhavabala of the twelve houses, in virupas
+(60 virupas = 1 rupa). Everything astronomical a chart needs - sidereal
+positions and speeds, declinations, ascendant and midheaven, sunrise and
+sunset, the year, month, weekday and hora lords and the varga matrix - is
+computed once into ChartInputs; each bala is then arithmetic over those
+inputs, shared by all seven grahas and twelve houses.
+
+Usage:
+    echo '{"date": "1990-05-15", "time": "14:30", "latitude": 28.61, "longitude": 77.21}' | python shadbala_engine.py
+"""
+
+import json
+import sys
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import swisseph as swe
+
+import engine_logging
+import varga_engine
+from chart_core import birth_moment
+from yoga_rules import OWN_SIGNS, PLANET_NAMES, SIGN_LORD
+
+log = engine_logging.get_logger('shadbala_engine')
+
+GRAHAS = PLANET_NAMES[:7]
+SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN = range(7)
+SWE_BODIES = (swe.SUN, swe.MOON, swe.MARS, swe.MERCURY, swe.JUPITER, swe.VENUS, swe.SATURN)
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+EQUATORIAL_FLAGS = swe.FLG_SWIEPH | swe.FLG_EQUATORIAL
+
+# Deep exaltation points (sidereal longitude)
+DEEP_EXALTATION = (10.0, 33.0, 298.0, 165.0, 95.0, 357.0, 200.0)
+
+NAISARGIKA_BALA = (60.0, 51.43, 17.14, 25.71, 34.29, 42.86, 8.57)
+
+# Minimum total strength (rupas) for a graha to be considered strong
+REQUIRED_RUPAS = (6.5, 6.0, 5.0, 7.0, 6.5, 5.5, 5.0)
+
+# Mean daily motion in degrees, the reference for the Cheshta motion classes
+MEAN_SPEED = (0.9856, 13.1764, 0.5240, 0.9856, 0.0831, 0.9856, 0.0335)
+
+# Natural relationship of row graha towards column graha: 1 friend, 0 neutral, -1 enemy
+NATURAL_RELATION = (
+    (0, 1, 1, 0, 1, -1, -1),
+    (1, 0, 0, 1, 0, 0, 0),
+    (1, 1, 0, -1, 1, 0, 0),
+    (1, -1, 0, 0, 0, 1, 0),
+    (1, 1, 1, -1, 0, -1, 0),
+    (-1, -1, 0, 1, 0, 0, 1),
+    (-1, -1, -1, 1, 0, 1, 0)
+)
+
+# Moolatrikona as (sign, start degree, end degree)
+MOOLATRIKONA = ((4, 0, 20), (1, 3, 30), (0, 0, 12), (5, 15, 20), (8, 0, 10), (6, 0, 15), (10, 0, 20))
+
+# Saptavargaja: the seven vargas and the virupas per dignity
+SAPTAVARGA = (1, 2, 3, 7, 9, 12, 30)
+SAPTAVARGA_COLUMNS = tuple(varga_engine.VARGAS.index(d) for d in SAPTAVARGA)
+MOOLATRIKONA_VIRUPAS = 45.0
+OWN_SIGN_VIRUPAS = 30.0
+# Compound relationship (natural + temporal, -2..2) -> virupas
+RELATION_VIRUPAS = {2: 22.5, 1: 15.0, 0: 7.5, -1: 3.75, -2: 1.875}
+# Houses from a graha whose occupants are its temporal friends
+TEMPORAL_FRIEND_HOUSES = {2, 3, 4, 10, 11, 12}
+
+# Ojayugma: Moon and Venus are strong in even signs and navamsas, the rest in odd
+EVEN_SIGN_GRAHAS = {MOON, VENUS}
+
+# Drekkana bala: male grahas in the first decanate, neuter in the second, female in the third
+DREKKANA_GROUP = (0, 2, 0, 1, 0, 2, 1)
+
+KENDRADI_VIRUPAS = (60.0, 30.0, 15.0)
+
+# Dig bala: point of no directional strength as (angle, offset) - Sun and Mars
+# are strongest at the midheaven, Mercury and Jupiter at the ascendant, Moon
+# and Venus at the nadir and Saturn at the descendant
+DIG_POWERLESS = (('mc', 180), ('mc', 0), ('mc', 180), ('asc', 180), ('asc', 180), ('mc', 0), ('asc', 0))
+
+# Weekday lords from Monday (Julian day 0 was a Monday) and the Chaldean hora order
+WEEKDAY_LORDS = (MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, SUN)
+HORA_ORDER = (SATURN, JUPITER, MARS, SUN, VENUS, MERCURY, MOON)
+
+ABDA_VIRUPAS, MASA_VIRUPAS, VARA_VIRUPAS, HORA_VIRUPAS = 15.0, 30.0, 45.0, 60.0
+
+# Natonnata: strong at noon, strong at midnight; Mercury is always strong
+DAY_STRONG = {SUN, JUPITER, VENUS}
+NIGHT_STRONG = {MOON, MARS, SATURN}
+
+# Tribhaga lords of the three parts of the day and of the night; Jupiter always gets 60
+TRIBHAGA_DAY = (MERCURY, SUN, SATURN)
+TRIBHAGA_NIGHT = (MOON, VENUS, MARS)
+
+# Ayana bala: +1 strong in northern declination, -1 southern, 0 either (Mercury)
+AYANA_DIRECTION = (1, -1, 1, 0, 1, 1, -1)
+MAX_DECLINATION = 24.0
+
+# Paksha and Drik bala benefics (the Moon's own paksha bala is doubled)
+PAKSHA_BENEFICS = {MOON, MERCURY, JUPITER, VENUS}
+
+# Special aspects: (arcs from the aspecting graha, extra virupas)
+SPECIAL_ASPECTS = {
+    MARS: (((90, 120), (210, 240)), 15.0),
+    JUPITER: (((120, 150), (240, 270)), 30.0),
+    SATURN: (((60, 90), (270, 300)), 45.0)
+}
+
+# Planetary war is fought between the star grahas within a degree
+WAR_GRAHAS = (MARS, MERCURY, JUPITER, VENUS, SATURN)
+WAR_ORB = 1.0
+
+# Cheshta bala motion classes by speed relative to mean motion
+VAKRA, VIKALA, MANDATARA, MANDA, SAMA, CHARA, ATICHARA = (
+    'vakra', 'vikala', 'mandatara', 'manda', 'sama', 'chara', 'atichara')
+MOTION_VIRUPAS = {VAKRA: 60.0, VIKALA: 15.0, MANDATARA: 15.0, MANDA: 30.0, SAMA: 7.5, CHARA: 45.0, ATICHARA: 30.0}
+MOTION_LIMITS = ((0.05, VIKALA), (0.5, MANDATARA), (0.9, MANDA), (1.1, SAMA), (1.5, CHARA))
+
+# Bhava dig bala: the house in which each sign class is strongest
+NARA, JALACHARA, CHATUSHPADA, KEETA = 'nara', 'jalachara', 'chatushpada', 'keeta'
+BHAVA_STRONG_HOUSE = {NARA: 1, JALACHARA: 4, KEETA: 7, CHATUSHPADA: 10}
+# Aspects of these grahas count in full on a bhava, the others a quarter
+FULL_BHAVA_DRISHTI = {MERCURY, JUPITER}
+
+CACHE_SIZE = 64
+
+
+def _distance(a: float, b: float) -> float:
+    """Shorter arc between two longitudes"""
+    arc = (a - b) % 360
+    return 360 - arc if arc > 180 else arc
+
+
+def _weekday(jd: float, longitude: float) -> int:
+    """Weekday (0 = Monday) of the local mean civil date at a moment"""
+    return int(jd + longitude / 360 + 0.5) % 7
+
+
+def drishti(aspecting: int, from_longitude: float, to_longitude: float) -> float:
+    """Virupas of a graha's aspect on a longitude (the Parashari drishti curve)"""
+    arc = (to_longitude - from_longitude) % 360
+    if arc < 30:
+        value = 0.0
+    elif arc < 60:
+        value = (arc - 30) / 2
+    elif arc < 90:
+        value = arc - 45
+    elif arc < 120:
+        value = (120 - arc) / 2 + 30
+    elif arc < 150:
+        value = 150 - arc
+    elif arc < 180:
+        value = (arc - 150) * 2
+    elif arc < 300:
+        value = (300 - arc) / 2
+    else:
+        value = 0.0
+
+    if aspecting in SPECIAL_ASPECTS:
+        spans, extra = SPECIAL_ASPECTS[aspecting]
+        if any(start <= arc < end for start, end in spans):
+            value += extra
+    return value
+
+
+def motion_class(graha: int, speed: float) -> str:
+    """Cheshta motion class from the daily speed"""
+    if speed < 0:
+        return VAKRA
+    ratio = speed / MEAN_SPEED[graha]
+    for limit, name in MOTION_LIMITS:
+        if ratio < limit:
+            return name
+    return ATICHARA
+
+
+def sign_class(longitude: float) -> str:
+    """Nara / jalachara / chatushpada / keeta class of the sign half holding a longitude"""
+    sign, first_half = int(longitude % 360 // 30), longitude % 30 < 15
+    if sign in (2, 5, 6, 10) or (sign == 8 and first_half):
+        return NARA
+    if sign in (3, 11) or (sign == 9 and not first_half):
+        return JALACHARA
+    if sign == 7:
+        return KEETA
+    return CHATUSHPADA
+
+
+class ChartInputs:
+    """The per-chart astronomy every bala is computed from"""
+
+    def __init__(self, jd: float, latitude: float, longitude: float):
+        self.jd, self.latitude, self.longitude = jd, latitude, longitude
+
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        positions = [swe.calc_ut(jd, body, FLAGS)[0] for body in SWE_BODIES]
+        self.longitudes = tuple(p[0] for p in positions)
+        self.speeds = tuple(p[3] for p in positions)
+        self.declinations = tuple(swe.calc_ut(jd, body, EQUATORIAL_FLAGS)[0][1] for body in SWE_BODIES)
+
+        # Equal houses: the angles do not depend on the system and it works at polar latitudes
+        ascmc = swe.houses_ex(jd, latitude, longitude, b'E', swe.FLG_SIDEREAL)[1]
+        self.ascendant, self.midheaven = ascmc[0], ascmc[1]
+        self.ascendant_sign = int(self.ascendant // 30)
+        self.signs = tuple(int(lon // 30) for lon in self.longitudes)
+        self.houses = tuple((sign - self.ascendant_sign) % 12 + 1 for sign in self.signs)
+        self.vargas = varga_engine.matrix(self.longitudes)
+
+        self.sunrise, self.sunset, self.next_sunrise = self._day_bounds()
+        self.is_day = self.jd < self.sunset
+        self.weekday_lord = WEEKDAY_LORDS[_weekday(self.sunrise, longitude)]
+        hours = int((jd - self.sunrise) * 24)
+        self.hora_lord = HORA_ORDER[(HORA_ORDER.index(self.weekday_lord) + hours) % 7]
+        self.masa_lord = WEEKDAY_LORDS[_weekday(self._sun_ingress(self.signs[SUN] * 30.0), longitude)]
+        self.abda_lord = WEEKDAY_LORDS[_weekday(self._sun_ingress(0.0), longitude)]
+
+        # Moon-Sun elongation folded to 0..180 (0 at new moon)
+        self.elongation = _distance(self.longitudes[MOON], self.longitudes[SUN])
+        self.waxing = (self.longitudes[MOON] - self.longitudes[SUN]) % 360 < 180
+
+    @classmethod
+    def from_birth_details(cls, birth_details: Dict) -> 'ChartInputs':
+        return cls(*birth_moment(birth_details))
+
+    def _rise_set(self, start: float, event: int) -> float:
+        flag, times = swe.rise_trans(start, swe.SUN, event | swe.BIT_HINDU_RISING,
+                                     (self.longitude, self.latitude, 0))
+        if flag != 0:
+            raise ValueError("Sun does not rise or set")
+        return times[0]
+
+    def _day_bounds(self) -> Tuple[float, float, float]:
+        """Sunrise that began the Vedic day of birth, its sunset and the following sunrise"""
+        try:
+            sunrise = self._rise_set(self.jd - 1, swe.CALC_RISE)
+            if sunrise > self.jd:
+                sunrise = self._rise_set(self.jd - 2, swe.CALC_RISE)
+            sunset = self._rise_set(sunrise, swe.CALC_SET)
+            return sunrise, sunset, self._rise_set(sunset, swe.CALC_RISE)
+        except ValueError:
+            # Polar day or night: fall back to 6:00 and 18:00 local mean time
+            local = self.jd + self.longitude / 360
+            sunrise = int(local - 0.75) + 0.75
+            return (sunrise - self.longitude / 360,) + tuple(sunrise - self.longitude / 360 + d for d in (0.5, 1))
+
+    def _sun_ingress(self, boundary: float) -> float:
+        """Moment the Sun last entered the sign starting at boundary before birth"""
+        moment = self.jd - ((self.longitudes[SUN] - boundary) % 360) / MEAN_SPEED[SUN]
+        for _ in range(3):
+            sun = swe.calc_ut(moment, swe.SUN, FLAGS)[0]
+            moment -= ((sun[0] - boundary + 180) % 360 - 180) / sun[3]
+        return moment
+
+
+# Sthana bala
+
+def uchcha_bala(inputs: ChartInputs, graha: int) -> float:
+    return _distance(inputs.longitudes[graha], DEEP_EXALTATION[graha] + 180) / 3
+
+
+def compound_relation(inputs: ChartInputs, graha: int, other: int) -> int:
+    """Natural plus temporal relationship of a graha towards another, -2..2"""
+    house = (inputs.signs[other] - inputs.signs[graha]) % 12 + 1
+    return NATURAL_RELATION[graha][other] + (1 if house in TEMPORAL_FRIEND_HOUSES else -1)
+
+
+def saptavargaja_bala(inputs: ChartInputs, graha: int) -> float:
+    row, total = inputs.vargas[graha], 0.0
+    sign, start, end = MOOLATRIKONA[graha]
+    for division, column in zip(SAPTAVARGA, SAPTAVARGA_COLUMNS):
+        varga_sign = row[column]
+        degree = inputs.longitudes[graha] % 30
+        if division == 1 and varga_sign == sign and start <= degree < end:
+            total += MOOLATRIKONA_VIRUPAS
+        elif varga_sign in OWN_SIGNS[graha]:
+            total += OWN_SIGN_VIRUPAS
+        else:
+            total += RELATION_VIRUPAS[compound_relation(inputs, graha, SIGN_LORD[varga_sign])]
+    return total
+
+
+def ojayugma_bala(inputs: ChartInputs, graha: int) -> float:
+    wants_even = graha in EVEN_SIGN_GRAHAS
+    rasi, navamsa = inputs.signs[graha], inputs.vargas[graha][varga_engine.VARGAS.index(9)]
+    return sum(15.0 for sign in (rasi, navamsa) if (sign % 2 == 1) == wants_even)
+
+
+def kendradi_bala(inputs: ChartInputs, graha: int) -> float:
+    return KENDRADI_VIRUPAS[(inputs.houses[graha] - 1) % 3]
+
+
+def drekkana_bala(inputs: ChartInputs, graha: int) -> float:
+    return 15.0 if int(inputs.longitudes[graha] % 30 // 10) == DREKKANA_GROUP[graha] else 0.0
+
+
+def sthana_bala(inputs: ChartInputs, graha: int) -> Dict[str, float]:
+    parts = {
+        'uchcha': uchcha_bala(inputs, graha),
+        'saptavargaja': saptavargaja_bala(inputs, graha),
+        'ojayugma': ojayugma_bala(inputs, graha),
+        'kendradi': kendradi_bala(inputs, graha),
+        'drekkana': drekkana_bala(inputs, graha)
+    }
+    parts['total'] = sum(parts.values())
+    return parts
+
+
+# Dig bala
+
+def dig_bala(inputs: ChartInputs, graha: int) -> float:
+    angle, offset = DIG_POWERLESS[graha]
+    powerless = (inputs.midheaven if angle == 'mc' else inputs.ascendant) + offset
+    return _distance(inputs.longitudes[graha], powerless) / 3
+
+
+# Kala bala
+
+def natonnata_bala(inputs: ChartInputs, graha: int) -> float:
+    if graha == MERCURY:
+        return 60.0
+    # Apparent noon halfway between sunrise and sunset; strength runs noon -> midnight
+    noon = (inputs.sunrise + inputs.sunset) / 2
+    from_noon = (inputs.jd - noon) % 1
+    day_strength = 60 * (1 - min(from_noon, 1 - from_noon) / 0.5)
+    return day_strength if graha in DAY_STRONG else 60 - day_strength
+
+
+def paksha_bala(inputs: ChartInputs, graha: int) -> float:
+    benefic = inputs.elongation / 3
+    value = benefic if graha in PAKSHA_BENEFICS else 60 - benefic
+    return value * 2 if graha == MOON else value
+
+
+def tribhaga_bala(inputs: ChartInputs, graha: int) -> float:
+    if graha == JUPITER:
+        return 60.0
+    if inputs.is_day:
+        start, end, lords = inputs.sunrise, inputs.sunset, TRIBHAGA_DAY
+    else:
+        start, end, lords = inputs.sunset, inputs.next_sunrise, TRIBHAGA_NIGHT
+    part = min(int(3 * (inputs.jd - start) / (end - start)), 2)
+    return 60.0 if lords[part] == graha else 0.0
+
+
+def lord_bala(inputs: ChartInputs, graha: int) -> Dict[str, float]:
+    """Abda, masa, vara and hora bala: virupas for the lords of the year, month, weekday and hour"""
+    return {
+        'abda': ABDA_VIRUPAS if inputs.abda_lord == graha else 0.0,
+        'masa': MASA_VIRUPAS if inputs.masa_lord == graha else 0.0,
+        'vara': VARA_VIRUPAS if inputs.weekday_lord == graha else 0.0,
+        'hora': HORA_VIRUPAS if inputs.hora_lord == graha else 0.0
+    }
+
+
+def ayana_bala(inputs: ChartInputs, graha: int) -> float:
+    declination = max(-MAX_DECLINATION, min(MAX_DECLINATION, inputs.declinations[graha]))
+    direction = AYANA_DIRECTION[graha]
+    kranti = abs(declination) if direction == 0 else declination * direction
+    value = (MAX_DECLINATION + kranti) / (2 * MAX_DECLINATION) * 60
+    return value * 2 if graha == SUN else value
+
+
+def yuddha_bala(inputs: ChartInputs, sthana: List[Dict], dig: List[float],
+                kala: List[Dict]) -> List[float]:
+    """
+    Planetary war: for star grahas within a degree, the one with the greater
+    sthana + dig + kala bala wins the difference and the other loses it
+    """
+    result = [0.0] * 7
+    for i, first in enumerate(WAR_GRAHAS):
+        for second in WAR_GRAHAS[i + 1:]:
+            if _distance(inputs.longitudes[first], inputs.longitudes[second]) > WAR_ORB:
+                continue
+            scores = {graha: sthana[graha]['total'] + dig[graha] + kala[graha]['total'] for graha in (first, second)}
+            winner, loser = sorted(scores, key=scores.get, reverse=True)
+            difference = scores[winner] - scores[loser]
+            result[winner] += difference
+            result[loser] -= difference
+    return result
+
+
+def kala_bala(inputs: ChartInputs, graha: int) -> Dict[str, float]:
+    parts = {
+        'natonnata': natonnata_bala(inputs, graha),
+        'paksha': paksha_bala(inputs, graha),
+        'tribhaga': tribhaga_bala(inputs, graha)
+    }
+    parts.update(lord_bala(inputs, graha))
+    parts['ayana'] = ayana_bala(inputs, graha)
+    parts['total'] = sum(parts.values())
+    return parts
+
+
+# Cheshta, Naisargika and Drik bala
+
+def cheshta_bala(inputs: ChartInputs, graha: int, kala: Dict[str, float]) -> float:
+    """The Sun's cheshta bala is its ayana bala and the Moon's its paksha bala"""
+    if graha == SUN:
+        return kala['ayana'] / 2
+    if graha == MOON:
+        return kala['paksha'] / 2
+    return MOTION_VIRUPAS[motion_class(graha, inputs.speeds[graha])]
+
+
+def is_benefic(inputs: ChartInputs, graha: int) -> bool:
+    if graha == MOON:
+        return inputs.waxing
+    return graha in PAKSHA_BENEFICS
+
+
+def aspect_balance(inputs: ChartInputs, longitude: float, exclude: int = -1,
+                   full: frozenset = frozenset()) -> float:
+    """Benefic minus malefic drishti on a longitude, a quarter of each aspect unless in full"""
+    total = 0.0
+    for graha in range(7):
+        if graha == exclude:
+            continue
+        value = drishti(graha, inputs.longitudes[graha], longitude)
+        value = value if graha in full else value / 4
+        total += value if is_benefic(inputs, graha) else -value
+    return total
+
+
+def drik_bala(inputs: ChartInputs, graha: int) -> float:
+    return aspect_balance(inputs, inputs.longitudes[graha], exclude=graha)
+
+
+# Totals
+
+def shadbala(inputs: ChartInputs) -> Dict[str, Dict]:
+    """Shadbala of the seven grahas keyed by name"""
+    sthana = [sthana_bala(inputs, graha) for graha in range(7)]
+    dig = [dig_bala(inputs, graha) for graha in range(7)]
+    kala = [kala_bala(inputs, graha) for graha in range(7)]
+    for graha, war in enumerate(yuddha_bala(inputs, sthana, dig, kala)):
+        kala[graha]['yuddha'] = war
+        kala[graha]['total'] += war
+
+    result = {}
+    for graha, name in enumerate(GRAHAS):
+        cheshta = cheshta_bala(inputs, graha, kala[graha])
+        components = {
+            'sthana_bala': sthana[graha],
+            'dig_bala': dig[graha],
+            'kala_bala': kala[graha],
+            'cheshta_bala': cheshta,
+            'naisargika_bala': NAISARGIKA_BALA[graha],
+            'drik_bala': drik_bala(inputs, graha)
+        }
+        total = sthana[graha]['total'] + dig[graha] + kala[graha]['total'] + cheshta + \
+            NAISARGIKA_BALA[graha] + components['drik_bala']
+        uchcha = sthana[graha]['uchcha']
+        result[name] = dict(
+            components,
+            motion=motion_class(graha, inputs.speeds[graha]),
+            total_virupas=total,
+            total_rupas=total / 60,
+            required_rupas=REQUIRED_RUPAS[graha],
+            ratio=total / 60 / REQUIRED_RUPAS[graha],
+            ishta_phala=(uchcha * cheshta) ** 0.5,
+            kashta_phala=((60 - uchcha) * max(0.0, 60 - cheshta)) ** 0.5
+        )
+    return result
+
+
+def bhavabala(inputs: ChartInputs, planet_strengths: Dict[str, Dict]) -> Dict[int, Dict]:
+    """Bhavabala of the twelve equal bhavas measured from the ascendant degree"""
+    result = {}
+    for house in range(1, 13):
+        madhya = (inputs.ascendant + 30 * (house - 1)) % 360
+        lord = GRAHAS[SIGN_LORD[int(madhya // 30)]]
+        strong_house = BHAVA_STRONG_HOUSE[sign_class(madhya)]
+        apart = abs(house - strong_house) % 12
+        parts = {
+            'lord': lord,
+            'adhipati_bala': planet_strengths[lord]['total_virupas'],
+            'dig_bala': (6 - min(apart, 12 - apart)) * 10.0,
+            'drishti_bala': aspect_balance(inputs, madhya, full=FULL_BHAVA_DRISHTI)
+        }
+        total = parts['adhipati_bala'] + parts['dig_bala'] + parts['drishti_bala']
+        result[house] = dict(parts, total_virupas=total, total_rupas=total / 60)
+    return result
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _chart_strength(jd: float, latitude: float, longitude: float) -> Dict:
+    inputs = ChartInputs(jd, latitude, longitude)
+    planets = shadbala(inputs)
+    log.debug("Shadbala computed for jd {} at {}, {}", jd, latitude, longitude)
+    return {
+        'planets': planets,
+        'bhavas': bhavabala(inputs, planets),
+        'lords': {key: GRAHAS[getattr(inputs, f'{key}_lord')] for key in ('abda', 'masa', 'weekday', 'hora')},
+        'day_birth': inputs.is_day
+    }
+
+
+def chart_strength(birth_details: Dict) -> Dict:
+    """
+    Shadbala and Bhavabala for a birth, cached per chart so every report
+    section asking for strengths shares one computation. Callers must not
+    mutate the result.
+    """
+    return _chart_strength(*birth_moment(birth_details))
+
+
+def main():
+    """Command line: birth details as JSON on stdin; prints Shadbala and Bhavabala"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            birth_details = json.loads(sys.stdin.read())
+            strength = chart_strength(birth_details)
+        result = {'success': True, **strength}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
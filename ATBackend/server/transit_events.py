@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Lifetime Transit Event Stream
+Time-ordered transit events for a natal chart: sign ingresses (with the house
+from Lagna and Moon), conjunctions and graha drishti to natal points, and
+retrograde/direct stations
+
+Events are found by root-finding on relative longitudes and speeds between
+coarse per-planet samples, one chunk at a time, so a caller can page through
+decades and only pay for the events it actually reads.
+
+Usage:
+    echo '{"date": "1990-06-15", "time": "10:30", "place": "Chennai",
+           "start": "2025-01-01", "limit": 50}' | python transit_events.py
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+import chebyshev_ephemeris
+import engine_logging
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+
+log = engine_logging.get_logger('transit_events')
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+
+# Swiss Ephemeris body, longitude offset and sample step in days (short enough
+# that a planet cannot cross the same point twice between samples)
+TRANSIT_BODIES = {
+    'Sun': (swe.SUN, 0, 2.0),
+    'Moon': (swe.MOON, 0, 0.25),
+    'Mercury': (swe.MERCURY, 0, 1.0),
+    'Venus': (swe.VENUS, 0, 1.0),
+    'Mars': (swe.MARS, 0, 2.0),
+    'Jupiter': (swe.JUPITER, 0, 4.0),
+    'Saturn': (swe.SATURN, 0, 5.0),
+    'Rahu': (swe.MEAN_NODE, 0, 5.0),
+    'Ketu': (swe.MEAN_NODE, 180, 5.0)
+}
+
+# The Moon moves a sign every 2.5 days; leave it out unless asked for
+DEFAULT_BODIES = ('Sun', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Rahu', 'Ketu')
+EVENT_TYPES = ('ingress', 'aspect', 'station')
+
+# Mean nodes never station
+NO_STATIONS = {'Rahu', 'Ketu'}
+
+NATAL_POINTS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mars': swe.MARS, 'Mercury': swe.MERCURY,
+    'Jupiter': swe.JUPITER, 'Venus': swe.VENUS, 'Saturn': swe.SATURN, 'Rahu': swe.MEAN_NODE
+}
+
+# Graha drishti as angular distance ahead of the transiting planet
+ASPECTS = {'conjunction': 0, '7th aspect': 180}
+SPECIAL_ASPECTS = {
+    'Mars': {'4th aspect': 90, '8th aspect': 210},
+    'Jupiter': {'5th aspect': 120, '9th aspect': 240},
+    'Saturn': {'3rd aspect': 60, '10th aspect': 270}
+}
+
+CHUNK_DAYS = 90
+# Root tolerance in days (about one second)
+TOLERANCE = 1e-5
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+
+def _wrap(angle: float) -> float:
+    return (angle + 180) % 360 - 180
+
+
+def _jd(dt: datetime) -> float:
+    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60 + dt.second / 3600)
+
+
+def _utc(jd: float) -> str:
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    moment = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+    return moment.replace(microsecond=0).isoformat()
+
+
+def position(body: str, jd: float) -> Tuple[float, float]:
+    """Sidereal longitude and daily speed of a transit body"""
+    return chebyshev_ephemeris.position(body, jd)
+
+
+def find_root(func: Callable[[float], float], t0: float, f0: float, t1: float, f1: float) -> float:
+    """Illinois false position on a bracketed sign change"""
+    side = 0
+    while t1 - t0 > TOLERANCE:
+        t = (t0 * f1 - t1 * f0) / (f1 - f0)
+        f = func(t)
+        if f == 0:
+            return t
+        if (f < 0) == (f1 < 0):
+            t1, f1 = t, f
+            if side == -1:
+                f0 /= 2
+            side = -1
+        else:
+            t0, f0 = t, f
+            if side == 1:
+                f1 /= 2
+            side = 1
+    return (t0 + t1) / 2
+
+
+class NatalChart:
+    """Sidereal natal longitudes plus Lagna and Moon signs for house counting"""
+
+    def __init__(self, birth_details: Dict):
+        location = resolve_birth_place(birth_details.get('place'), birth_details.get('latitude'),
+                                       birth_details.get('longitude'), birth_details.get('timezone'))
+        local = datetime.strptime(f"{birth_details['date']} {birth_details.get('time', '12:00')}", '%Y-%m-%d %H:%M')
+        jd = _jd(TimezoneResolver.shared().to_utc(location['timezone'], local))
+
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        self.points = {name: swe.calc_ut(jd, body, FLAGS)[0][0] for name, body in NATAL_POINTS.items()}
+        self.points['Ketu'] = (self.points['Rahu'] + 180) % 360
+        self.points['Ascendant'] = swe.houses_ex(jd, location['latitude'], location['longitude'],
+                                                 b'P', swe.FLG_SIDEREAL)[1][0]
+        self.lagna_sign = int(self.points['Ascendant'] // 30)
+        self.moon_sign = int(self.points['Moon'] // 30)
+
+    def targets(self, body: str) -> List[Tuple[float, str, str]]:
+        """(transit longitude that forms the aspect, natal point, aspect name)"""
+        aspects = dict(ASPECTS, **SPECIAL_ASPECTS.get(body, {}))
+        return [((longitude - angle) % 360, point, name)
+                for point, longitude in self.points.items()
+                for name, angle in aspects.items()]
+
+
+def _chunk_events(natal: NatalChart, body: str, start: float, end: float,
+                  types: Sequence[str]) -> List[Dict]:
+    step = TRANSIT_BODIES[body][2]
+    count = max(int((end - start) / step + 0.999), 1)
+    times = [start + (end - start) * i / count for i in range(count + 1)]
+    samples = [position(body, t) for t in times]
+    targets = natal.targets(body) if 'aspect' in types else []
+    events = []
+
+    for t0, (lon0, speed0), t1, (lon1, speed1) in zip(times, samples, times[1:], samples[1:]):
+        if 'ingress' in types and int(lon0 // 30) != int(lon1 // 30):
+            sign = int(lon1 // 30)
+            retrograde = _wrap(lon1 - lon0) < 0
+            boundary = (sign + 1 if retrograde else sign) * 30 % 360
+            t = find_root(lambda t: _wrap(position(body, t)[0] - boundary), t0, _wrap(lon0 - boundary),
+                          t1, _wrap(lon1 - boundary))
+            events.append({
+                'julian_day': t, 'type': 'ingress', 'planet': body, 'sign': SIGNS[sign],
+                'house_from_lagna': (sign - natal.lagna_sign) % 12 + 1,
+                'house_from_moon': (sign - natal.moon_sign) % 12 + 1,
+                'retrograde': retrograde
+            })
+
+        for target, point, name in targets:
+            f0, f1 = _wrap(lon0 - target), _wrap(lon1 - target)
+            if (f0 < 0) == (f1 < 0) or abs(f0) > 90 or abs(f1) > 90:
+                continue
+            t = find_root(lambda t: _wrap(position(body, t)[0] - target), t0, f0, t1, f1)
+            events.append({
+                'julian_day': t, 'type': 'aspect', 'planet': body, 'natal_point': point, 'aspect': name,
+                'retrograde': f1 < f0
+            })
+
+        if 'station' in types and body not in NO_STATIONS and (speed0 < 0) != (speed1 < 0):
+            t = find_root(lambda t: position(body, t)[1], t0, speed0, t1, speed1)
+            longitude = position(body, t)[0]
+            events.append({
+                'julian_day': t, 'type': 'station', 'planet': body,
+                'station': 'retrograde' if speed0 > 0 else 'direct',
+                'sign': SIGNS[int(longitude // 30)], 'longitude': round(longitude, 4)
+            })
+    return events
+
+
+def stream(natal: NatalChart, start_jd: float, end_jd: float, bodies: Sequence[str] = DEFAULT_BODIES,
+           types: Sequence[str] = EVENT_TYPES) -> Iterator[Dict]:
+    """Yield events in time order, computing one chunk ahead of the consumer"""
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    chunk_start = start_jd
+    while chunk_start < end_jd:
+        chunk_end = min(chunk_start + CHUNK_DAYS, end_jd)
+        events = []
+        for body in bodies:
+            events.extend(e for e in _chunk_events(natal, body, chunk_start, chunk_end, types)
+                          if chunk_start <= e['julian_day'] < chunk_end)
+        events.sort(key=lambda e: e['julian_day'])
+        for event in events:
+            event['time'] = _utc(event['julian_day'])
+            event['julian_day'] = round(event['julian_day'], 6)
+            yield event
+        chunk_start = chunk_end
+
+
+def page(birth_details: Dict, start: Optional[str] = None, cursor: Optional[float] = None, limit: int = 50,
+         horizon_years: float = 10, bodies: Sequence[str] = DEFAULT_BODIES,
+         types: Sequence[str] = EVENT_TYPES) -> Dict:
+    """
+    One page of the stream over [start, start + horizon_years). Pass the
+    returned next_cursor back with the same start and horizon to continue;
+    it is None once the horizon is exhausted.
+    """
+    unknown = [b for b in bodies if b not in TRANSIT_BODIES] + [t for t in types if t not in EVENT_TYPES]
+    if unknown:
+        return {'success': False, 'error': f"Unknown bodies or event types: {', '.join(unknown)}"}
+
+    natal = NatalChart(birth_details)
+    if start:
+        start_jd = _jd(datetime.strptime(start, '%Y-%m-%d'))
+    else:
+        start_jd = _jd(datetime.now(timezone.utc).replace(tzinfo=None))
+    end_jd = start_jd + horizon_years * 365.25
+    resume_jd = start_jd if cursor is None else max(start_jd, float(cursor))
+
+    events, next_cursor = [], None
+    for event in stream(natal, resume_jd, end_jd, bodies, types):
+        if cursor is not None and event['julian_day'] <= cursor:
+            continue
+        if len(events) == limit:
+            next_cursor = events[-1]['julian_day']
+            break
+        events.append(event)
+    log.debug("Transit page: {} events from JD {}", len(events), resume_jd)
+
+    return {
+        'success': True,
+        'natal': {'lagna_sign': SIGNS[natal.lagna_sign], 'moon_sign': SIGNS[natal.moon_sign]},
+        'events': events,
+        'next_cursor': next_cursor
+    }
+
+
+def main():
+    """Command line: JSON birth details plus start/cursor, limit, horizon_years, bodies, types on stdin"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            request = json.loads(sys.stdin.read())
+            result = page(
+                request,
+                request.get('start'),
+                request.get('cursor'),
+                int(request.get('limit', 50)),
+                float(request.get('horizon_years', 10)),
+                request.get('bodies', DEFAULT_BODIES),
+                request.get('types', EVENT_TYPES)
+            )
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
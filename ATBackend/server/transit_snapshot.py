@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Daily Transit Snapshot
+The sky is the same for every user on a given day, so the sidereal positions
+and speeds of all grahas are computed once per UTC day (hourly for the Moon)
+together with each graha's next ingress, and persisted as a small JSON
+artifact. Horoscope and transit consumers read positions for any instant of
+the day from the snapshot by Hermite interpolation instead of calling
+Swiss Ephemeris.
+
+Usage:
+    python transit_snapshot.py                  # build today's snapshot
+    python transit_snapshot.py 2025-01-01 7     # build seven days from a date
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+import swisseph as swe
+
+import ayanamsa_service
+import chebyshev_ephemeris
+import engine_logging
+import perf_instrumentation
+from nakshatra_lookup import NAKSHATRAS, nakshatra_pada
+from transit_events import SIGNS, TRANSIT_BODIES, find_root
+
+log = engine_logging.get_logger('transit_snapshot')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SERVER_DIR, 'cache', 'transit-snapshots')
+
+# Bump when the artifact layout changes so stale files are rebuilt
+SNAPSHOT_VERSION = 1
+
+NAKSHATRA_SPAN = 360 / 27
+
+# Order matches JyotishaEngine.PLANETS; Ketu is derived from Rahu
+GRAHAS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mars': swe.MARS, 'Mercury': swe.MERCURY,
+    'Jupiter': swe.JUPITER, 'Venus': swe.VENUS, 'Saturn': swe.SATURN, 'Rahu': swe.MEAN_NODE
+}
+TRUE_NODE = 'True Rahu'
+
+# Samples per day: the Moon moves ~0.5 degree an hour, everything else is
+# smooth enough that the day's end points and speeds pin it down
+SAMPLES_PER_DAY = {'Moon': 24}
+
+# Longest gap between ingresses, bounding the next-ingress search (Saturn
+# with a retrograde loop, the nodes at ~18.6 months per sign)
+INGRESS_HORIZON_DAYS = 1100
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+_snapshots: Dict[str, Dict] = {}
+
+
+def _wrap(angle: float) -> float:
+    return (angle + 180) % 360 - 180
+
+
+def _utc(jd: float) -> str:
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    moment = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+    return moment.replace(microsecond=0).isoformat()
+
+
+def julian_day(day: date, hour: float = 12.0) -> float:
+    """UT Julian day for an hour of a calendar day"""
+    return swe.julday(day.year, day.month, day.day, hour)
+
+
+def _position(name: str, jd: float, body: int) -> Tuple[float, float]:
+    """Sidereal longitude and speed, from the Chebyshev table for the bodies it holds"""
+    if name in chebyshev_ephemeris.BODIES:
+        return chebyshev_ephemeris.position(name, jd)
+    values = swe.calc_ut(jd, body, FLAGS)[0]
+    return values[0], values[3]
+
+
+def _sample(jd: float, name: str, body: int) -> Tuple[float, float]:
+    longitude, speed = _position(name, jd, body)
+    return round(longitude, 7), round(speed, 7)
+
+
+def next_ingress(name: str, jd: float) -> Dict:
+    """Next sign change of a graha after jd, by bracketing and false position"""
+    swe_id, _, step = TRANSIT_BODIES.get(name, (swe.TRUE_NODE,) + TRANSIT_BODIES['Rahu'][1:])
+
+    def longitude(t: float) -> float:
+        return _position(name, t, swe_id)[0]
+
+    t0, lon0 = jd, longitude(jd)
+    sign = int(lon0 // 30)
+    while t0 < jd + INGRESS_HORIZON_DAYS:
+        t1 = t0 + step
+        lon1 = longitude(t1)
+        if int(lon1 // 30) != sign:
+            entered = int(lon1 // 30)
+            retrograde = _wrap(lon1 - lon0) < 0
+            boundary = (entered + 1 if retrograde else entered) * 30 % 360
+            t = find_root(lambda t: _wrap(longitude(t) - boundary), t0, _wrap(lon0 - boundary),
+                          t1, _wrap(lon1 - boundary))
+            return {'sign': SIGNS[entered], 'time': _utc(t), 'julian_day': round(t, 6), 'retrograde': retrograde}
+        t0, lon0 = t1, lon1
+    return {}
+
+
+def build_snapshot(day: date) -> Dict:
+    """Positions, speeds and next ingresses for one UTC day"""
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    jd = swe.julday(day.year, day.month, day.day, 0.0)
+    bodies = dict(GRAHAS, **{TRUE_NODE: swe.TRUE_NODE})
+
+    samples = {}
+    for name, body in bodies.items():
+        count = SAMPLES_PER_DAY.get(name, 1)
+        samples[name] = [_sample(jd + i / count, name, body) for i in range(count + 1)]
+
+    ingresses = {name: next_ingress(name, jd) for name in list(GRAHAS) + ['Ketu', TRUE_NODE]}
+    log.debug("Built transit snapshot for {}", day.isoformat())
+    return {
+        'version': SNAPSHOT_VERSION,
+        'date': day.isoformat(),
+        'julian_day': jd,
+        'ayanamsa': 'Lahiri',
+        'ayanamsa_value': round(ayanamsa_service.ayanamsa(jd), 7),
+        'samples': samples,
+        'next_ingress': ingresses
+    }
+
+
+def _cache_path(day: date) -> str:
+    return os.path.join(CACHE_DIR, f"{day.isoformat()}.json")
+
+
+def load_snapshot(day: date) -> Dict:
+    """The day's snapshot from memory, then disk, building and persisting it on a miss"""
+    key = day.isoformat()
+    snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        perf_instrumentation.record_cache('transit_snapshot', True)
+        return snapshot
+
+    path = _cache_path(day)
+    if os.path.exists(path):
+        with open(path) as f:
+            snapshot = json.load(f)
+        if snapshot.get('version') == SNAPSHOT_VERSION:
+            perf_instrumentation.record_cache('transit_snapshot', True)
+            _snapshots[key] = snapshot
+            return snapshot
+
+    perf_instrumentation.record_cache('transit_snapshot', False)
+    snapshot = build_snapshot(day)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # A private temporary file, so concurrent processes never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(snapshot, f, separators=(',', ':'))
+    # mkstemp creates the file owner-only; the cache is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+    _snapshots[key] = snapshot
+    return snapshot
+
+
+def _interpolate(samples: List, fraction: float) -> Tuple[float, float]:
+    """Cubic Hermite on longitude and daily speed between the bracketing samples"""
+    intervals = len(samples) - 1
+    index = min(int(fraction * intervals), intervals - 1)
+    (p0, v0), (p1, v1) = samples[index], samples[index + 1]
+    h = 1 / intervals
+    s = fraction * intervals - index
+    delta = _wrap(p1 - p0)
+
+    h10 = s ** 3 - 2 * s ** 2 + s
+    h01 = -2 * s ** 3 + 3 * s ** 2
+    h11 = s ** 3 - s ** 2
+    longitude = p0 + h10 * v0 * h + h01 * delta + h11 * v1 * h
+    speed = (6 * s - 6 * s ** 2) * delta / h + (3 * s ** 2 - 4 * s + 1) * v0 + (3 * s ** 2 - 2 * s) * v1
+    return longitude % 360, speed
+
+
+def planets_at(jd: float, true_node: bool = False) -> List[Dict]:
+    """
+    Sidereal positions of the nine grahas at jd read from that day's snapshot.
+    Rahu/Ketu are the mean node unless true_node is set.
+    """
+    day_start = int(jd - 0.5) + 0.5
+    year, month, day, _ = swe.revjul(day_start, swe.GREG_CAL)
+    snapshot = load_snapshot(date(year, month, day))
+    fraction = jd - day_start
+
+    planets = []
+    for name in GRAHAS:
+        source = TRUE_NODE if name == 'Rahu' and true_node else name
+        longitude, speed = _interpolate(snapshot['samples'][source], fraction)
+        planets.append(_describe(name, longitude, speed))
+    rahu = planets[-1]
+    planets.append(_describe('Ketu', (rahu['longitude'] + 180) % 360, rahu['speed']))
+    return planets
+
+
+def _describe(name: str, longitude: float, speed: float) -> Dict:
+    nakshatra, pada = nakshatra_pada(longitude)
+    return {
+        'name': name,
+        'longitude': longitude,
+        'speed': speed,
+        'sign': SIGNS[int(longitude // 30)],
+        'degree': longitude % 30,
+        'nakshatra': NAKSHATRAS[nakshatra],
+        'pada': pada,
+        'retrograde': speed < 0
+    }
+
+
+def upcoming_ingresses(day: date, true_node: bool = False) -> Dict[str, Dict]:
+    """Each graha's next sign change from the start of the day"""
+    ingresses = load_snapshot(day)['next_ingress']
+    if not true_node:
+        return {name: ingresses[name] for name in list(GRAHAS) + ['Ketu']}
+    result = {name: ingresses[name] for name in GRAHAS if name != 'Rahu'}
+    result['Rahu'] = ingresses[TRUE_NODE]
+    return result
+
+
+def main():
+    """Command line: optional start date and day count; builds and persists snapshots"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            start = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.now(timezone.utc).date()
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+            built = [load_snapshot(start + timedelta(days=i))['date'] for i in range(days)]
+        result = {'success': True, 'snapshots': built, 'cache_dir': CACHE_DIR}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
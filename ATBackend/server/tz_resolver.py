@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Timezone Offset Resolver
+Historical UTC offsets for any IANA zone from precompiled transition arrays
+Compiled once from the tz database into a memory-mapped table so engines
+never parse zone files or build pytz objects per request
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+TABLE_PATH = os.path.join(SERVER_DIR, 'tz_offsets.bin')
+
+# Bumped whenever the compiled rows change, so stale tables are rebuilt
+MAGIC = b'TZO3'
+# magic, directory size, transition count, SHA-256 of the source tz data description
+HEADER = struct.Struct('<4sII32s')
+
+EPOCH = datetime(1970, 1, 1)
+# Earliest representable instant, used as the start of each zone's first interval
+BIG_BANG = -(1 << 62)
+# Largest offset swing that can sit between a local time and its UTC instant
+MAX_SHIFT = 26 * 3600
+# pytz reads only the 32-bit data of a zone file, which stops at 2037. Later
+# transitions come from the file's 64-bit data and, after its last listed
+# transition, from the POSIX TZ rule in its footer
+HORIZON_YEAR = 2100
+# version, counts of UT/local indicators, leap seconds, transitions, types, abbreviation bytes
+TZIF_HEADER = struct.Struct('>4sc15x6l')
+
+# std offset [dst [offset] ,start[/time],end[/time]], e.g. EST5EDT,M3.2.0,M11.1.0
+POSIX_TZ = re.compile(r'(?P<std><[^>]+>|[A-Za-z]+)(?P<std_offset>[-+]?[\d:]+)'
+                      r'(?:(?P<dst><[^>]+>|[A-Za-z]+)(?P<dst_offset>[-+]?[\d:]+)?'
+                      r',(?P<start>[^,]+),(?P<end>[^,]+))?')
+
+OffsetResolution = namedtuple('OffsetResolution', [
+    'offset_seconds', 'dst_seconds', 'abbreviation', 'ambiguous', 'nonexistent'
+])
+
+
+class AmbiguousTimeError(ValueError):
+    """Local time occurs twice (clocks set back)"""
+    pass
+
+
+class NonExistentTimeError(ValueError):
+    """Local time is skipped (clocks set forward)"""
+    pass
+
+
+def _seconds(text: str) -> int:
+    """[+-]hh[:mm[:ss]] as signed seconds"""
+    sign = -1 if text.startswith('-') else 1
+    parts = [int(part) for part in text.lstrip('+-').split(':')]
+    return sign * sum(part * unit for part, unit in zip(parts, (3600, 60, 1)))
+
+
+def _rule_day(rule: str, year: int) -> date:
+    """Date a POSIX TZ rule (Mm.w.d, Jn or n) falls on in a year"""
+    if rule.startswith('M'):
+        month, week, weekday = (int(part) for part in rule[1:].split('.'))
+        first = date(year, month, 1)
+        # weekday counts from Sunday = 0; week 5 means the last one in the month
+        day = first + timedelta(days=(weekday - (first.weekday() + 1)) % 7 + 7 * (week - 1))
+        while day.month != month:
+            day -= timedelta(days=7)
+        return day
+    if rule.startswith('J'):
+        # Julian day 1-365, never counting February 29
+        day = int(rule[1:])
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        return date(year, 1, 1) + timedelta(days=day - 1 + (leap and day >= 60))
+    return date(year, 1, 1) + timedelta(days=int(rule))
+
+
+def _tzif_tail(zone_name: str):
+    """
+    64-bit transitions of the zone's TZif file as (utc_seconds, offset, is_dst,
+    abbreviation) and its POSIX TZ footer; nothing for version 1 files
+    """
+    import pytz
+
+    with pytz.open_resource(zone_name) as f:
+        data = f.read()
+    _, version, isut, isstd, leaps, count, types, chars = TZIF_HEADER.unpack_from(data, 0)
+    if version < b'2':
+        return [], ''
+    start = TZIF_HEADER.size + count * 5 + types * 6 + chars + leaps * 8 + isstd + isut
+    _, _, isut, isstd, leaps, count, types, chars = TZIF_HEADER.unpack_from(data, start)
+    offset = start + TZIF_HEADER.size
+    times = struct.unpack_from(f'>{count}q', data, offset)
+    indices = data[offset + count * 8:offset + count * 9]
+    offset += count * 9
+    infos = [struct.unpack_from('>lBB', data, offset + i * 6) for i in range(types)]
+    abbreviations = data[offset + types * 6:offset + types * 6 + chars]
+    transitions = []
+    for when, i in zip(times, indices):
+        utoff, is_dst, abbr_at = infos[i]
+        abbr = abbreviations[abbr_at:abbreviations.index(b'\0', abbr_at)].decode('ascii')
+        transitions.append((when, utoff, is_dst, abbr))
+    footer = data[data.rindex(b'\n', 0, len(data) - 1) + 1:-1].decode('ascii')
+    return transitions, footer
+
+
+def _posix_rule(footer: str):
+    """Parsed POSIX TZ footer, or None when it has no DST rule"""
+    match = POSIX_TZ.fullmatch(footer)
+    if match is None or match['start'] is None:
+        return None
+    std_offset = -_seconds(match['std_offset'])
+    dst_offset = -_seconds(match['dst_offset']) if match['dst_offset'] else std_offset + 3600
+    return (match['std'].strip('<>'), std_offset, match['dst'].strip('<>'), dst_offset,
+            match['start'], match['end'])
+
+
+def _posix_transitions(rule, first_year: int, last_year: int) -> List[Tuple[int, int, int, str]]:
+    """Transition rows a POSIX TZ rule generates for a span of years"""
+    std_abbr, std_offset, dst_abbr, dst_offset, start, end = rule
+    rows = []
+    for year in range(first_year, last_year + 1):
+        # Each rule's time is local wall-clock time in the offset it ends
+        for spec, before, after in ((start, std_offset, (dst_offset, dst_offset - std_offset, dst_abbr)),
+                                    (end, dst_offset, (std_offset, 0, std_abbr))):
+            day, _, time = spec.partition('/')
+            local = (datetime.combine(_rule_day(day, year), datetime.min.time()) - EPOCH) // timedelta(seconds=1)
+            rows.append((local + _seconds(time or '2') - before,) + after)
+    return sorted(rows)
+
+
+def _zone_transitions(zone_name: str) -> List[Tuple[int, int, int, str]]:
+    """(utc_seconds, offset, dst, abbreviation) for each interval start of a pytz zone"""
+    import pytz
+
+    zone = pytz.timezone(zone_name)
+    if not hasattr(zone, '_utc_transition_times'):
+        # Fixed-offset zone such as UTC or Etc/GMT+5
+        offset = zone.utcoffset(datetime(2000, 1, 1))
+        return [(BIG_BANG, int(offset.total_seconds()), 0, zone.tzname(datetime(2000, 1, 1)) or zone_name)]
+
+    rows = []
+    for when, (offset, dst, abbr) in zip(zone._utc_transition_times, zone._transition_info):
+        start = BIG_BANG if when.year == 1 else int((when - EPOCH).total_seconds())
+        rows.append((start, int(offset.total_seconds()), int(dst.total_seconds()), abbr))
+
+    # Continue past pytz's 2037 horizon: listed 64-bit transitions, then the footer rule
+    transitions, footer = _tzif_tail(zone_name)
+    std_offset = next((row[1] for row in reversed(rows) if row[2] == 0), rows[-1][1])
+    for when, offset, is_dst, abbr in transitions:
+        if when > rows[-1][0]:
+            rows.append((when, offset, offset - std_offset if is_dst else 0, abbr))
+        if not is_dst:
+            std_offset = offset
+    rule = _posix_rule(footer)
+    if rule is not None:
+        last = rows[-1][0]
+        first_year = (EPOCH + timedelta(seconds=last)).year
+        rows.extend(row for row in _posix_transitions(rule, first_year, HORIZON_YEAR) if row[0] > last)
+    return rows
+
+
+def _source() -> str:
+    """Release of the tz data the table is compiled from; a pytz upgrade changes it"""
+    import pytz
+
+    source = f"pytz {pytz.__version__} tzdata {pytz.OLSON_VERSION}"
+    # Zone files loaded from elsewhere (PYTZ_TZDATADIR) are part of the source too
+    if os.environ.get('PYTZ_TZDATADIR'):
+        source += f" from {os.environ['PYTZ_TZDATADIR']}"
+    return source
+
+
+def _source_digest() -> bytes:
+    """Header stamp of _source(); a table stamped differently is recompiled"""
+    return hashlib.sha256(_source().encode('utf-8')).digest()
+
+
+def compile_table(table_path: str = TABLE_PATH, zones: List[str] = None) -> str:
+    """
+    Precompute transition arrays for every zone into one binary table
+    Layout: header, JSON directory {zone: [first, count]} and abbreviation list,
+    then int64 UTC starts, int32 offsets, int32 DST parts, uint16 abbreviation ids
+    """
+    import pytz
+
+    zones = zones or list(pytz.all_timezones)
+    starts, offsets, dsts, abbr_ids = [], [], [], []
+    directory = {}
+    abbreviations = {}
+
+    for zone_name in zones:
+        rows = _zone_transitions(zone_name)
+        directory[zone_name] = [len(starts), len(rows)]
+        for start, offset, dst, abbr in rows:
+            starts.append(start)
+            offsets.append(offset)
+            dsts.append(dst)
+            abbr_ids.append(abbreviations.setdefault(abbr, len(abbreviations)))
+
+    meta = json.dumps({
+        'zones': directory,
+        'abbreviations': sorted(abbreviations, key=abbreviations.get),
+        'source': _source()
+    }).encode('utf-8')
+    # Pad so the int64 array stays 8-byte aligned
+    meta += b' ' * (-(HEADER.size + len(meta)) % 8)
+    n = len(starts)
+
+    # A private temporary file, so concurrent compiles never write the same path
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(table_path) or '.', suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(meta), n, _source_digest()))
+        f.write(meta)
+        f.write(struct.pack(f'<{n}q', *starts))
+        f.write(struct.pack(f'<{n}i', *offsets))
+        f.write(struct.pack(f'<{n}i', *dsts))
+        f.write(struct.pack(f'<{n}H', *abbr_ids))
+    # mkstemp creates the file owner-only; the table is shared read-only
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, table_path)
+    return table_path
+
+
+def _table_current(table_path: str) -> bool:
+    """Whether a compiled table exists in the current format and from the installed tz data"""
+    try:
+        with open(table_path, 'rb') as f:
+            header = f.read(HEADER.size)
+    except FileNotFoundError:
+        return False
+    if len(header) < HEADER.size:
+        return False
+    magic, _, _, digest = HEADER.unpack(header)
+    return magic == MAGIC and digest == _source_digest()
+
+
+class _ZoneView:
+    """Slice of the shared arrays belonging to one zone"""
+
+    __slots__ = ('starts', 'offsets', 'dsts', 'abbr_ids')
+
+    def __init__(self, starts, offsets, dsts, abbr_ids):
+        self.starts = starts
+        self.offsets = offsets
+        self.dsts = dsts
+        self.abbr_ids = abbr_ids
+
+
+class TimezoneResolver:
+    """Local <-> UTC conversion for IANA zones using bisect on transition arrays"""
+
+    _shared = None
+
+    def __init__(self, table_path: str = TABLE_PATH):
+        if not _table_current(table_path):
+            compile_table(table_path)
+
+        with open(table_path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, meta_size, n, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid timezone table: {table_path}")
+
+        view = memoryview(self._mm)
+        offset = HEADER.size
+        meta = json.loads(bytes(view[offset:offset + meta_size]))
+        offset += meta_size
+        self._starts = view[offset:offset + n * 8].cast('q')
+        offset += n * 8
+        self._offsets = view[offset:offset + n * 4].cast('i')
+        offset += n * 4
+        self._dsts = view[offset:offset + n * 4].cast('i')
+        offset += n * 4
+        self._abbr_ids = view[offset:offset + n * 2].cast('H')
+
+        self._directory = meta['zones']
+        self._abbreviations = meta['abbreviations']
+        self._zones: Dict[str, _ZoneView] = {}
+
+    @classmethod
+    def shared(cls) -> 'TimezoneResolver':
+        """Process-wide instance shared by all engines"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def zone(self, zone_name: str) -> _ZoneView:
+        cached = self._zones.get(zone_name)
+        if cached is None:
+            if zone_name not in self._directory:
+                raise KeyError(f"Unknown timezone: {zone_name}")
+            first, count = self._directory[zone_name]
+            end = first + count
+            cached = _ZoneView(self._starts[first:end], self._offsets[first:end],
+                               self._dsts[first:end], self._abbr_ids[first:end])
+            self._zones[zone_name] = cached
+        return cached
+
+    def _resolution(self, zone: _ZoneView, i: int, ambiguous: bool = False,
+                    nonexistent: bool = False) -> OffsetResolution:
+        return OffsetResolution(zone.offsets[i], zone.dsts[i], self._abbreviations[zone.abbr_ids[i]],
+                                ambiguous, nonexistent)
+
+    def offset_at_utc(self, zone_name: str, utc_dt: datetime) -> OffsetResolution:
+        """Offset in force at a UTC instant (naive datetimes are taken as UTC)"""
+        if utc_dt.tzinfo is not None:
+            utc_dt = utc_dt.astimezone(timezone.utc).replace(tzinfo=None)
+        zone = self.zone(zone_name)
+        seconds = (utc_dt - EPOCH) // timedelta(seconds=1)
+        return self._resolution(zone, bisect_right(zone.starts, seconds) - 1)
+
+    def resolve(self, zone_name: str, local_dt: datetime, fold: int = 0,
+                strict: bool = False) -> OffsetResolution:
+        """
+        Offset for a wall-clock time in the given zone
+        Ambiguous times (clocks set back) use the first occurrence when fold=0 and
+        the second when fold=1; skipped times (clocks set forward) use the offset
+        before the gap when fold=0 and after it when fold=1, as in PEP 495.
+        With strict=True either case raises instead.
+        """
+        zone = self.zone(zone_name)
+        starts, offsets = zone.starts, zone.offsets
+        local = (local_dt.replace(tzinfo=None) - EPOCH) // timedelta(seconds=1)
+
+        first = max(bisect_right(starts, local - MAX_SHIFT) - 1, 0)
+        last = bisect_right(starts, local + MAX_SHIFT)
+        candidates = []
+        for i in range(first, last):
+            utc = local - offsets[i]
+            if starts[i] <= utc and (i + 1 == len(starts) or utc < starts[i + 1]):
+                candidates.append(i)
+
+        if len(candidates) == 1:
+            return self._resolution(zone, candidates[0])
+
+        if candidates:
+            if strict:
+                raise AmbiguousTimeError(f"{local_dt} is ambiguous in {zone_name}")
+            return self._resolution(zone, candidates[-1] if fold else candidates[0], ambiguous=True)
+
+        if strict:
+            raise NonExistentTimeError(f"{local_dt} does not exist in {zone_name}")
+        # The gap opens at the first transition whose post-offset local time passes `local`
+        after = next(i for i in range(max(first, 1), last) if starts[i] + offsets[i] > local)
+        return self._resolution(zone, after if fold else after - 1, nonexistent=True)
+
+    def localize(self, zone_name: str, local_dt: datetime, fold: int = 0) -> datetime:
+        """Attach the correct fixed offset to a naive wall-clock time (pytz localize replacement)"""
+        resolution = self.resolve(zone_name, local_dt, fold)
+        return local_dt.replace(tzinfo=timezone(timedelta(seconds=resolution.offset_seconds),
+                                                resolution.abbreviation))
+
+    def to_utc(self, zone_name: str, local_dt: datetime, fold: int = 0) -> datetime:
+        """Naive wall-clock time in zone -> aware UTC datetime"""
+        resolution = self.resolve(zone_name, local_dt, fold)
+        return (local_dt.replace(tzinfo=None) - timedelta(seconds=resolution.offset_seconds)).replace(
+            tzinfo=timezone.utc)
+
+    def utc_offset_hours(self, zone_name: str, local_dt: datetime, fold: int = 0) -> float:
+        """UTC offset in hours, the form the panchanga code expects"""
+        return self.resolve(zone_name, local_dt, fold).offset_seconds / 3600.0
+
+
+def localize(zone_name: str, local_dt: datetime, fold: int = 0) -> datetime:
+    """Module-level shortcut for TimezoneResolver.shared().localize"""
+    return TimezoneResolver.shared().localize(zone_name, local_dt, fold)
+
+
+def main():
+    """Command line: compile | offset <zone> <YYYY-MM-DDTHH:MM[:SS]> [fold]"""
+    if len(sys.argv) < 2:
+        print(json.dumps({"success": False, "error": "Usage: python tz_resolver.py compile|offset ..."}))
+        sys.exit(1)
+
+    if sys.argv[1] == 'compile':
+        result = {"success": True, "table": compile_table()}
+    elif sys.argv[1] == 'offset' and len(sys.argv) >= 4:
+        fold = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+        resolution = TimezoneResolver.shared().resolve(sys.argv[2], datetime.fromisoformat(sys.argv[3]), fold)
+        result = {"success": True, **resolution._asdict()}
+    else:
+        result = {"success": False, "error": f"Unknown command: {' '.join(sys.argv[1:])}"}
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
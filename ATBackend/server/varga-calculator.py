@@ -8,6 +8,8 @@ Based on traditional Vedic astrology principles for 16 major divisional charts
 import math
 from typing import Dict, Tuple, List
 
+import varga_engine
+
 class VargaCalculator:
     """Calculate authentic Shodashavarga (16 divisional charts) from planetary longitudes"""
     
@@ -26,7 +28,8 @@ class VargaCalculator:
             1: 'Rasi', 2: 'Hora', 3: 'Drekkana', 4: 'Chaturthamsa', 5: 'Panchamsa',
             6: 'Shashtamsa', 7: 'Saptamsa', 8: 'Ashtamsa', 9: 'Navamsa', 10: 'Dasamsa',
             11: 'Rudramsa', 12: 'Dvadasamsa', 16: 'Shodasamsa', 20: 'Vimsamsa',
-            24: 'Chaturvimsamsa', 30: 'Trimsamsa'
+            24: 'Chaturvimsamsa', 27: 'Saptavimsamsa', 30: 'Trimsamsa', 40: 'Khavedamsa',
+            45: 'Akshavedamsa', 60: 'Shashtiamsa'
         }
         
         self.varga_purposes = {
@@ -45,7 +48,11 @@ class VargaCalculator:
             16: 'Vehicles, luxuries, comforts',
             20: 'Spiritual progress, religious inclinations',
             24: 'Education, learning, academic success',
-            30: 'Evils, misfortunes, hidden enemies'
+            27: 'Strengths and weaknesses, stamina',
+            30: 'Evils, misfortunes, hidden enemies',
+            40: 'Auspicious and inauspicious effects from the maternal line',
+            45: 'Character and conduct from the paternal line',
+            60: 'Past-life karma, overall auspiciousness'
         }
     
     def get_sign_and_degree(self, longitude: float) -> Tuple[int, float]:
@@ -56,9 +63,11 @@ class VargaCalculator:
     
     def get_varga_general(self, sign: int, degree: float, divisions: int) -> int:
         """
-        Generic Varga calculation using authentic Vedic methodology
-        Returns the varga sign for any divisional chart
+        Varga sign (1-12) for any divisional chart: the Parashari tables for
+        the standard vargas, equal division counted from the sign otherwise
         """
+        if divisions in varga_engine.TABLES:
+            return varga_engine.varga_sign((sign - 1) * 30 + degree, divisions) + 1
         arc_length = 30.0 / divisions
         division = int(degree / arc_length)
         varga_sign = (divisions * (sign - 1) + division) % 12 + 1
@@ -69,68 +78,19 @@ class VargaCalculator:
         Calculate Navamsa (D-9) using traditional method
         Each sign (30°) divided into 9 parts = 3°20' = 3.3333°
         """
-        part = int(degree / 3.333333)
-        navamsa_sign = (9 * (sign - 1) + part) % 12 + 1
-        return navamsa_sign, part + 1
+        return self.get_varga_general(sign, degree, 9), min(int(degree * 9 / 30), 8) + 1
     
     def get_hora(self, sign: int, degree: float) -> int:
         """Calculate Hora (D-2) - wealth chart"""
-        if degree < 15.0:
-            # First half belongs to Sun's hora
-            return 5 if sign % 2 == 1 else 4  # Leo for odd signs, Cancer for even
-        else:
-            # Second half belongs to Moon's hora
-            return 4 if sign % 2 == 1 else 5  # Cancer for odd signs, Leo for even
+        return self.get_varga_general(sign, degree, 2)
     
     def get_drekkana(self, sign: int, degree: float) -> int:
         """Calculate Drekkana (D-3) - siblings chart"""
-        third = int(degree / 10.0)
-        if third == 0:
-            return sign
-        elif third == 1:
-            return (sign + 3) % 12 + 1 if (sign + 3) % 12 != 0 else 12
-        else:
-            return (sign + 7) % 12 + 1 if (sign + 7) % 12 != 0 else 12
+        return self.get_varga_general(sign, degree, 3)
     
     def calculate_all_vargas(self, planetary_positions: Dict) -> Dict:
-        """Calculate all major divisional charts for given planetary positions"""
-        varga_charts = {}
-        
-        for planet, data in planetary_positions.items():
-            longitude = data.get('longitude', 0)
-            sign, degree = self.get_sign_and_degree(longitude)
-            
-            planet_vargas = {
-                'rasi_sign': sign,
-                'rasi_degree': degree,
-                'rasi_name': self.SIGNS[sign - 1],
-                'rasi_sanskrit': self.SANSKRIT_SIGNS[sign - 1]
-            }
-            
-            # Calculate major divisional charts
-            planet_vargas['d2_hora'] = self.get_hora(sign, degree)
-            planet_vargas['d3_drekkana'] = self.get_drekkana(sign, degree)
-            planet_vargas['d4_chaturthamsa'] = self.get_varga_general(sign, degree, 4)
-            planet_vargas['d5_panchamsa'] = self.get_varga_general(sign, degree, 5)
-            planet_vargas['d6_shashtamsa'] = self.get_varga_general(sign, degree, 6)
-            planet_vargas['d7_saptamsa'] = self.get_varga_general(sign, degree, 7)
-            planet_vargas['d8_ashtamsa'] = self.get_varga_general(sign, degree, 8)
-            
-            # Special calculation for Navamsa
-            navamsa_sign, navamsa_part = self.get_navamsa(sign, degree)
-            planet_vargas['d9_navamsa'] = navamsa_sign
-            planet_vargas['d9_navamsa_part'] = navamsa_part
-            
-            planet_vargas['d10_dasamsa'] = self.get_varga_general(sign, degree, 10)
-            planet_vargas['d12_dvadasamsa'] = self.get_varga_general(sign, degree, 12)
-            planet_vargas['d16_shodasamsa'] = self.get_varga_general(sign, degree, 16)
-            planet_vargas['d20_vimsamsa'] = self.get_varga_general(sign, degree, 20)
-            planet_vargas['d24_chaturvimsamsa'] = self.get_varga_general(sign, degree, 24)
-            planet_vargas['d30_trimsamsa'] = self.get_varga_general(sign, degree, 30)
-            
-            varga_charts[planet] = planet_vargas
-        
-        return varga_charts
+        """Calculate all divisional charts for given planetary positions"""
+        return varga_engine.varga_charts(planetary_positions)
     
     def create_divisional_chart_positions(self, varga_charts: Dict, varga_number: int) -> Dict:
         """Create planetary positions for specific divisional chart"""
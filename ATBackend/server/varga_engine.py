@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Varga (Divisional Chart) Engine
+Every divisional chart is a lookup table over (rasi sign, amsha index) built
+once from the Parashari division rules, so placing a body in all twenty
+vargas is a handful of index operations. A chart is returned as a compact
+bodies x vargas matrix of 0-based signs; arrays of charts go through the same
+tables with NumPy.
+
+Usage:
+    echo '{"Ascendant": {"longitude": 201.5}, "Sun": {"longitude": 123.4}}' | python varga_engine.py
+"""
+
+import json
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+import engine_logging
+
+log = engine_logging.get_logger('varga_engine')
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+SANSKRIT_SIGNS = ['Mesha', 'Vrishabha', 'Mithuna', 'Karka', 'Simha', 'Kanya',
+                  'Tula', 'Vrishchika', 'Dhanu', 'Makara', 'Kumbha', 'Meena']
+
+# Matrix rows and columns
+BODIES = ('Ascendant', 'Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu')
+VARGAS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+VARGA_NAMES = {
+    1: 'rasi', 2: 'hora', 3: 'drekkana', 4: 'chaturthamsa', 5: 'panchamsa', 6: 'shashtamsa',
+    7: 'saptamsa', 8: 'ashtamsa', 9: 'navamsa', 10: 'dasamsa', 11: 'rudramsa', 12: 'dvadasamsa',
+    16: 'shodasamsa', 20: 'vimsamsa', 24: 'chaturvimsamsa', 27: 'saptavimsamsa', 30: 'trimsamsa',
+    40: 'khavedamsa', 45: 'akshavedamsa', 60: 'shashtiamsa'
+}
+
+# Trimsamsa spans are whole degrees, so D30 is tabulated per degree:
+# (end degree, sign) for odd and even signs
+TRIMSAMSA_SPANS = {
+    0: ((5, 0), (10, 10), (18, 8), (25, 2), (30, 6)),
+    1: ((5, 1), (12, 5), (20, 11), (25, 9), (30, 7))
+}
+
+PANCHAMSA_SIGNS = {0: (0, 10, 8, 2, 6), 1: (1, 5, 11, 9, 7)}
+
+
+def _odd(sign: int) -> bool:
+    """Odd (masculine) sign for a 0-based index: Aries, Gemini, ..."""
+    return sign % 2 == 0
+
+
+def _trimsamsa(sign: int, degree: int) -> Tuple[int, int]:
+    for part, (end, varga_sign) in enumerate(TRIMSAMSA_SPANS[0 if _odd(sign) else 1]):
+        if degree < end:
+            return varga_sign, part
+
+
+# Division rules: (sign, amsha index) -> varga sign, all 0-based
+DIVISION_RULES = {
+    1: lambda s, k: s,
+    2: lambda s, k: (4 if k == 0 else 3) if _odd(s) else (3 if k == 0 else 4),
+    3: lambda s, k: s + 4 * k,
+    4: lambda s, k: s + 3 * k,
+    5: lambda s, k: PANCHAMSA_SIGNS[0 if _odd(s) else 1][k],
+    6: lambda s, k: (0 if _odd(s) else 6) + k,
+    7: lambda s, k: s + (0 if _odd(s) else 6) + k,
+    8: lambda s, k: (0, 8, 4)[s % 3] + k,
+    9: lambda s, k: 9 * s + k,
+    10: lambda s, k: s + (0 if _odd(s) else 8) + k,
+    11: lambda s, k: 11 * s + k,
+    12: lambda s, k: s + k,
+    16: lambda s, k: (0, 4, 8)[s % 3] + k,
+    20: lambda s, k: (0, 8, 4)[s % 3] + k,
+    24: lambda s, k: (4 if _odd(s) else 3) + k,
+    27: lambda s, k: (0, 3, 6, 9)[s % 4] + k,
+    30: lambda s, k: _trimsamsa(s, k)[0],
+    40: lambda s, k: (0 if _odd(s) else 6) + k,
+    45: lambda s, k: (0, 4, 8)[s % 3] + k,
+    60: lambda s, k: s + k
+}
+
+# Flat tables indexed sign * divisions + amsha, for the sign and the 1-based part
+TABLES = {d: tuple(rule(s, k) % 12 for s in range(12) for k in range(d)) for d, rule in DIVISION_RULES.items()}
+PARTS = {d: tuple((_trimsamsa(s, k)[1] if d == 30 else k) + 1 for s in range(12) for k in range(d))
+         for d in VARGAS}
+_COLUMNS = tuple((TABLES[d], PARTS[d], d) for d in VARGAS)
+
+
+def varga_key(division: int) -> str:
+    """Key used for a varga in varga chart dicts, e.g. 'd9_navamsa'"""
+    return 'rasi_sign' if division == 1 else f'd{division}_{VARGA_NAMES[division]}'
+
+
+def _index(longitude: float, division: int) -> int:
+    longitude %= 360
+    sign = int(longitude // 30)
+    return sign * division + min(int((longitude - sign * 30) * division / 30), division - 1)
+
+
+def varga_sign(longitude: float, division: int) -> int:
+    """0-based sign of a sidereal longitude in one varga"""
+    return TABLES[division][_index(longitude, division)]
+
+
+def matrix(longitudes: Sequence[float]) -> List[Tuple[int, ...]]:
+    """One row of 0-based varga signs (in VARGAS order) per longitude"""
+    rows = []
+    for longitude in longitudes:
+        longitude %= 360
+        sign = int(longitude // 30)
+        degree = longitude - sign * 30
+        rows.append(tuple(table[sign * d + min(int(degree * d / 30), d - 1)] for table, _, d in _COLUMNS))
+    return rows
+
+
+def chart_matrix(positions: Dict[str, Dict]) -> List[Tuple[int, ...]]:
+    """The BODIES x VARGAS matrix for a positions mapping (name -> dict with longitude)"""
+    return matrix([positions[body]['longitude'] for body in BODIES])
+
+
+def matrix_bulk(longitudes):
+    """
+    Varga signs for arrays of charts: longitudes of any shape (e.g. N x 10 in
+    BODIES order) -> int8 array with a trailing VARGAS axis
+    """
+    import numpy as np
+
+    longitudes = np.asarray(longitudes, dtype=float) % 360
+    signs = (longitudes // 30).astype(np.intp)
+    degrees = longitudes - signs * 30
+    result = np.empty(longitudes.shape + (len(VARGAS),), dtype=np.int8)
+    for column, (table, _, d) in enumerate(_COLUMNS):
+        amsha = np.minimum((degrees * d / 30).astype(np.intp), d - 1)
+        result[..., column] = np.asarray(table, dtype=np.int8)[signs * d + amsha]
+    return result
+
+
+def varga_charts(positions: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Per-body varga dicts keyed like 'd9_navamsa' / 'd9_navamsa_part' with
+    1-based sign numbers, the layout the report engines consume
+    """
+    names = list(positions)
+    rows = matrix([positions[name].get('longitude', 0) for name in names])
+    charts = {}
+    for name, row in zip(names, rows):
+        longitude = positions[name].get('longitude', 0) % 360
+        sign = int(longitude // 30)
+        vargas = {
+            'rasi_sign': sign + 1,
+            'rasi_degree': longitude - sign * 30,
+            'rasi_name': SIGNS[sign],
+            'rasi_sanskrit': SANSKRIT_SIGNS[sign]
+        }
+        for (_, parts, d), varga in zip(_COLUMNS[1:], row[1:]):
+            key = varga_key(d)
+            vargas[key] = varga + 1
+            vargas[f'{key}_part'] = parts[_index(longitude, d)]
+        charts[name] = vargas
+    return charts
+
+
+def main():
+    """Command line: positions mapping as JSON on stdin; prints varga charts and the matrix"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            positions = json.loads(sys.stdin.read())
+            charts = varga_charts(positions)
+            rows = matrix([data['longitude'] for data in positions.values()])
+            log.debug("Computed {} vargas for {} bodies", len(VARGAS), len(rows))
+        result = {
+            'success': True,
+            'vargas': list(VARGAS),
+            'matrix': {name: list(row) for name, row in zip(positions, rows)},
+            'varga_charts': charts
+        }
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
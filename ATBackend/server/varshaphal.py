@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Varshaphal (Tajika Solar Return) Engine
+Exact instant the Sun returns to its natal sidereal longitude each year, with
+the varsha lagna, Muntha, the five office-bearers and the lord of the year
+Batches any number of years from one natal setup for lifetime timelines
+
+Usage:
+    echo '{"date": "1990-06-15", "time": "10:30", "place": "Chennai", "years": 100}' | python varshaphal.py
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+import swisseph as swe
+
+import engine_logging
+from gazetteer import resolve_birth_place
+from tz_resolver import TimezoneResolver
+
+log = engine_logging.get_logger('varshaphal')
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+
+SIGN_LORDS = ['Mars', 'Venus', 'Mercury', 'Moon', 'Sun', 'Mercury',
+              'Venus', 'Mars', 'Jupiter', 'Saturn', 'Saturn', 'Jupiter']
+
+PLANETS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mars': swe.MARS, 'Mercury': swe.MERCURY,
+    'Jupiter': swe.JUPITER, 'Venus': swe.VENUS, 'Saturn': swe.SATURN
+}
+
+EXALTATION_SIGN = {'Sun': 0, 'Moon': 1, 'Mars': 9, 'Mercury': 5, 'Jupiter': 3, 'Venus': 11, 'Saturn': 6}
+
+# Tri-rashi pati by varsha lagna sign: (day return, night return)
+TRI_RASHI_PATI = [
+    ('Sun', 'Jupiter'), ('Venus', 'Moon'), ('Saturn', 'Mercury'), ('Venus', 'Mars'),
+    ('Jupiter', 'Sun'), ('Moon', 'Venus'), ('Mercury', 'Saturn'), ('Mars', 'Venus'),
+    ('Saturn', 'Saturn'), ('Mars', 'Mars'), ('Jupiter', 'Jupiter'), ('Moon', 'Moon')
+]
+
+# Houses from which a planet casts a Tajika aspect on the lagna (2, 6, 8 and 12 do not)
+TAJIKA_ASPECT_HOUSES = {1, 3, 4, 5, 7, 9, 10, 11}
+
+SIDEREAL_YEAR_DAYS = 365.256363
+# Newton on solar longitude is within milliseconds after one step and at float precision
+# after two; four steps leave a margin
+NEWTON_STEPS = 4
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+
+def _jd_to_utc(jd: float) -> datetime:
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    return datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+
+
+def sidereal_sun(jd: float) -> Tuple[float, float]:
+    """Sidereal longitude and daily speed of the Sun"""
+    values = swe.calc_ut(jd, swe.SUN, FLAGS)[0]
+    return values[0], values[3]
+
+
+def solar_return_jd(natal_jd: float, natal_sun: float, age: int) -> float:
+    """Instant after `age` years when the Sun is back at its natal sidereal longitude"""
+    jd = natal_jd + age * SIDEREAL_YEAR_DAYS
+    for _ in range(NEWTON_STEPS):
+        longitude, speed = sidereal_sun(jd)
+        jd -= ((longitude - natal_sun + 180) % 360 - 180) / speed
+    return jd
+
+
+def dignity(planet: str, sign: int) -> int:
+    """Coarse strength used to rank office-bearers: exalted > own sign > other > debilitated"""
+    if EXALTATION_SIGN[planet] == sign:
+        return 3
+    if SIGN_LORDS[sign] == planet:
+        return 2
+    if (EXALTATION_SIGN[planet] + 6) % 12 == sign:
+        return 0
+    return 1
+
+
+class Natal:
+    """Birth instant, natal Sun and lagna, computed once per batch"""
+
+    def __init__(self, birth_details: Dict):
+        location = resolve_birth_place(birth_details.get('place'), birth_details.get('latitude'),
+                                       birth_details.get('longitude'), birth_details.get('timezone'))
+        local = datetime.strptime(f"{birth_details['date']} {birth_details.get('time', '12:00')}", '%Y-%m-%d %H:%M')
+        utc = TimezoneResolver.shared().to_utc(location['timezone'], local)
+
+        self.location = location
+        self.birth_year = local.year
+        self.jd = swe.julday(utc.year, utc.month, utc.day, utc.hour + utc.minute / 60 + utc.second / 3600)
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        self.sun = sidereal_sun(self.jd)[0]
+        ascendant = swe.houses_ex(self.jd, location['latitude'], location['longitude'], b'P', swe.FLG_SIDEREAL)[1][0]
+        self.lagna_sign = int(ascendant // 30)
+
+
+def varsha_chart(natal: Natal, age: int, latitude: float, longitude: float, timezone_str: str) -> Dict:
+    """Annual chart for the year beginning at the given completed age"""
+    jd = solar_return_jd(natal.jd, natal.sun, age)
+    ascendant = swe.houses_ex(jd, latitude, longitude, b'P', swe.FLG_SIDEREAL)[1][0]
+    lagna_sign = int(ascendant // 30)
+
+    signs = {name: int(swe.calc_ut(jd, body, FLAGS)[0][0] // 30) for name, body in PLANETS.items()}
+
+    # Day return when the Sun is above the horizon at the return place
+    sun_tropical = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)[0]
+    altitude = swe.azalt(jd, swe.ECL2HOR, (longitude, latitude, 0), 0, 0, sun_tropical[:3])[1]
+    day_return = altitude > 0
+
+    muntha_sign = (natal.lagna_sign + age) % 12
+    office_bearers = {
+        'muntha_lord': SIGN_LORDS[muntha_sign],
+        'janma_lagna_lord': SIGN_LORDS[natal.lagna_sign],
+        'varsha_lagna_lord': SIGN_LORDS[lagna_sign],
+        'tri_rashi_pati': TRI_RASHI_PATI[lagna_sign][0 if day_return else 1],
+        'dina_ratri_pati': SIGN_LORDS[signs['Sun'] if day_return else signs['Moon']]
+    }
+
+    # Year lord: the strongest office-bearer aspecting the varsha lagna
+    # (all of them when none aspects); listing order breaks ties
+    candidates = list(dict.fromkeys(office_bearers.values()))
+    aspecting = [p for p in candidates if (signs[p] - lagna_sign) % 12 + 1 in TAJIKA_ASPECT_HOUSES]
+    year_lord = max(aspecting or candidates, key=lambda p: dignity(p, signs[p]))
+
+    utc = _jd_to_utc(jd)
+    offset = TimezoneResolver.shared().offset_at_utc(timezone_str, utc).offset_seconds
+    return {
+        'age': age,
+        'year': natal.birth_year + age,
+        'return_utc': utc.replace(microsecond=0).isoformat(),
+        'return_local': utc.astimezone(timezone(timedelta(seconds=offset))).replace(microsecond=0).isoformat(),
+        'julian_day': round(jd, 6),
+        'varsha_lagna': {'sign': SIGNS[lagna_sign], 'degree': round(ascendant % 30, 2)},
+        'muntha': {'sign': SIGNS[muntha_sign], 'house': (muntha_sign - lagna_sign) % 12 + 1},
+        'day_return': day_return,
+        'office_bearers': office_bearers,
+        'year_lord': year_lord,
+        'planet_signs': {name: SIGNS[sign] for name, sign in signs.items()}
+    }
+
+
+def solar_returns(birth_details: Dict, start_age: Optional[int] = None, years: int = 1,
+                  latitude: float = None, longitude: float = None, timezone_str: str = None) -> Dict:
+    """
+    Varshaphal for `years` consecutive years (1-100) starting at start_age
+    (default: the year in progress). The return is cast for the given place,
+    or the birth place when none is given.
+    """
+    years = max(1, min(int(years), 100))
+    natal = Natal(birth_details)
+    if latitude is None or longitude is None:
+        latitude, longitude = natal.location['latitude'], natal.location['longitude']
+        timezone_str = timezone_str or natal.location['timezone']
+    elif not timezone_str:
+        timezone_str = resolve_birth_place(latitude=latitude, longitude=longitude)['timezone']
+
+    if start_age is None:
+        now = swe.julday(*datetime.now(timezone.utc).timetuple()[:3], 12.0)
+        start_age = max(int((now - natal.jd) / SIDEREAL_YEAR_DAYS), 0)
+        if solar_return_jd(natal.jd, natal.sun, start_age) > now and start_age > 0:
+            start_age -= 1
+
+    charts = [varsha_chart(natal, age, latitude, longitude, timezone_str)
+              for age in range(start_age, start_age + years)]
+    log.debug("Computed {} solar returns from age {}", len(charts), start_age)
+    return {
+        'success': True,
+        'natal_sun_longitude': round(natal.sun, 6),
+        'janma_lagna': SIGNS[natal.lagna_sign],
+        'location': {'latitude': latitude, 'longitude': longitude, 'timezone': timezone_str},
+        'years': charts
+    }
+
+
+def main():
+    """Command line: JSON birth details (plus optional years, start_age, latitude, longitude) on stdin"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            request = json.loads(sys.stdin.read())
+            result = solar_returns(
+                request,
+                request.get('start_age'),
+                request.get('years', 1),
+                request.get('return_latitude'),
+                request.get('return_longitude'),
+                request.get('return_timezone')
+            )
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Yoga and Dosha Rule Engine
+Yogas and doshas are declared in yoga-rules.json as conditions on houses,
+lordships, dignities, conjunctions and aspects, together with the named
+conditions the report detectors (premium report, dosha detector, marriage
+analysis) test for their own sections. Each condition is compiled
+once into a closure over a compact chart encoding: the sign and whole-sign
+house of each graha as small integers, with house and sign occupancy held as
+12-bit masks. The same closures run on plain integers for one chart or on
+NumPy columns for a whole population of charts.
+
+Usage:
+    echo '{"planets": [{"name": "Sun", "longitude": 123.4}, ...], "ascendant": 201.5}' | python yoga_rules.py
+    python yoga_rules.py --population 10000     # prevalence of every rule
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+from collections import namedtuple
+from functools import reduce
+from typing import Callable, Dict, List, Optional, Sequence
+
+import arc_geometry
+import engine_logging
+
+log = engine_logging.get_logger('yoga_rules')
+
+SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
+RULES_PATH = os.path.join(SERVER_DIR, 'yoga-rules.json')
+
+# Order matches JyotishaEngine.PLANETS
+PLANET_NAMES = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu')
+PLANET_INDEX = {name: i for i, name in enumerate(PLANET_NAMES)}
+MOON, RAHU, KETU = 1, 7, 8
+SEVEN_GRAHAS = range(7)
+
+# Lord of each sign, Aries first
+SIGN_LORD = (2, 5, 3, 1, 0, 3, 5, 2, 4, 6, 6, 4)
+
+EXALTATION = (0, 1, 9, 5, 3, 11, 6, 1, 7)
+DEBILITATION = tuple((sign + 6) % 12 for sign in EXALTATION)
+OWN_SIGNS = ({4}, {3}, {0, 7}, {2, 5}, {8, 11}, {1, 6}, {9, 10}, set(), set())
+
+# 12-bit sign masks per graha for each dignity
+DIGNITY_MASKS = {
+    'exalted': tuple(1 << sign for sign in EXALTATION),
+    'debilitated': tuple(1 << sign for sign in DEBILITATION),
+    'own': tuple(sum(1 << sign for sign in signs) for signs in OWN_SIGNS)
+}
+
+# Graha drishti as 12-bit masks of houses counted from the graha (bit 6 = 7th house)
+_FULL_ASPECTS = {2: (4, 8), 4: (5, 9), 6: (3, 10)}
+ASPECT_MASKS = tuple(sum(1 << (house - 1) for house in (7,) + _FULL_ASPECTS.get(i, ()))
+                     for i in range(len(PLANET_NAMES)))
+
+ALL_HOUSES = 0xFFF
+KENDRA_MASK = 0b001001001001
+
+Rule = namedtuple('Rule', [
+    'name', 'type', 'category', 'strength', 'when', 'strong_when', 'description', 'notes_key', 'notes'
+])
+
+
+def _house_mask(houses: Sequence[int]) -> int:
+    return sum(1 << (house - 1) for house in houses)
+
+
+def _rotate(mask, shift):
+    """Rotate a 12-bit house mask forward by shift houses"""
+    return ((mask << shift) | (mask >> (12 - shift))) & ALL_HOUSES
+
+
+class ChartBoard:
+    """
+    Signs and whole-sign houses of the nine grahas as integers, or as NumPy
+    columns of equal length for bulk evaluation (pass the numpy module as np).
+    houses (0-based) overrides the whole-sign houses for callers that number
+    houses their own way.
+    """
+
+    def __init__(self, signs: Sequence, ascendant_sign, longitudes: Optional[Sequence] = None, np=None,
+                 houses: Optional[Sequence] = None):
+        self.np = np
+        self.sign = list(signs)
+        self.asc = ascendant_sign
+        self.house = list(houses) if houses is not None else [(sign - ascendant_sign) % 12 for sign in self.sign]
+        self.lon = list(longitudes) if longitudes is not None else None
+        self._occupancy: Dict[tuple, object] = {}
+        if np is not None:
+            self._tables: Dict[tuple, object] = {}
+            self._popcount = np.array([bin(mask).count('1') for mask in range(1 << 12)])
+        # Lord of each 0-based house with the house and sign it occupies
+        self.lord = [self.table(SIGN_LORD, (ascendant_sign + house) % 12) for house in range(12)]
+        self.lord_house = [self.select(self.house, lord) for lord in self.lord]
+        self.lord_sign = [self.select(self.sign, lord) for lord in self.lord]
+
+    def table(self, values: tuple, index):
+        """values[index] for a per-chart index"""
+        if self.np is None:
+            return values[index]
+        array = self._tables.get(values)
+        if array is None:
+            array = self._tables[values] = self.np.asarray(values)
+        return array[index]
+
+    def select(self, columns: List, index):
+        """columns[index] where the graha index differs per chart"""
+        if self.np is None:
+            return columns[index]
+        return self.np.choose(index, columns)
+
+    def popcount(self, mask):
+        return mask.bit_count() if self.np is None else self._popcount[mask]
+
+    def constant(self, value: bool):
+        return value if self.np is None else self.np.full(len(self.asc), value)
+
+    def occupancy(self, members: tuple, key: str = 'house'):
+        """12-bit mask of houses (or signs) holding any of the grahas"""
+        occupied = self._occupancy.get((members, key))
+        if occupied is None:
+            columns = self.house if key == 'house' else self.sign
+            occupied = reduce(lambda mask, i: mask | (1 << columns[i]), members, 0)
+            self._occupancy[(members, key)] = occupied
+        return occupied
+
+
+# ---------------------------------------------------------------------------
+# Condition compiler: every primitive returns a closure board -> bool (or a
+# bool column). Conditions combine with & | ^ rather than and/or/not so the
+# same closure works on NumPy columns.
+# ---------------------------------------------------------------------------
+
+def _planet(name: str) -> int:
+    if name not in PLANET_INDEX:
+        raise ValueError(f"Unknown graha in yoga rules: {name}")
+    return PLANET_INDEX[name]
+
+
+def _members(spec, groups: Dict[str, tuple]) -> tuple:
+    if isinstance(spec, str):
+        if spec not in groups:
+            raise ValueError(f"Unknown graha group in yoga rules: {spec}")
+        return groups[spec]
+    return tuple(_planet(name) for name in spec)
+
+
+def _reference(spec: Dict) -> Optional[int]:
+    ref = spec.get('from', 'Lagna')
+    return None if ref == 'Lagna' else _planet(ref)
+
+
+def _in_houses(spec, groups):
+    planet, mask, ref = _planet(spec['planet']), _house_mask(spec['houses']), _reference(spec)
+    if ref is None:
+        return lambda b: (mask >> b.house[planet]) & 1 == 1
+    return lambda b: (mask >> (b.house[planet] - b.house[ref]) % 12) & 1 == 1
+
+
+def _in_signs(spec, groups):
+    planet = _planet(spec['planet'])
+    mask = reduce(lambda m, dignity: m | DIGNITY_MASKS[dignity][planet], spec['dignity'], 0)
+    return lambda b: (mask >> b.sign[planet]) & 1 == 1
+
+
+def _conjunct(spec, groups):
+    first, *others = (_planet(name) for name in spec['planets'])
+    orb = spec.get('orb')
+
+    def condition(b):
+        together = b.constant(True)
+        for i in others:
+            together = together & (b.house[i] == b.house[first])
+            if orb is not None and b.lon is not None:
+                together = together & (abs((b.lon[i] - b.lon[first] + 180) % 360 - 180) <= orb)
+        return together
+    return condition
+
+
+def _within_orb(spec, groups):
+    """Every graha within orb degrees of the first, whatever houses they fall in"""
+    first, *others = (_planet(name) for name in spec['planets'])
+    orb = spec['orb']
+
+    def condition(b):
+        if b.lon is None:
+            return b.constant(False)
+        return reduce(lambda acc, i: acc & (abs((b.lon[i] - b.lon[first] + 180) % 360 - 180) <= orb),
+                      others, b.constant(True))
+    return condition
+
+
+def _aspects(spec, groups):
+    planet, mask = _planet(spec['planet']), ASPECT_MASKS[_planet(spec['planet'])]
+    if 'lord' in spec:
+        house = spec['lord'] - 1
+        return lambda b: (mask >> (b.lord_house[house] - b.house[planet]) % 12) & 1 == 1
+    target = _planet(spec['target'])
+    return lambda b: (mask >> (b.house[target] - b.house[planet]) % 12) & 1 == 1
+
+
+def _lord_in_houses(spec, groups):
+    house, mask = spec['lord'] - 1, _house_mask(spec['houses'])
+    return lambda b: (mask >> b.lord_house[house]) & 1 == 1
+
+
+def _lord_in_signs(spec, groups):
+    house = spec['lord'] - 1
+    masks = tuple(reduce(lambda m, dignity: m | DIGNITY_MASKS[dignity][i], spec['dignity'], 0)
+                  for i in range(len(PLANET_NAMES)))
+
+    return lambda b: (b.table(masks, b.lord[house]) >> b.lord_sign[house]) & 1 == 1
+
+
+def _lords_related(spec, groups):
+    first, second = (house - 1 for house in spec['lords'])
+
+    def condition(b):
+        lord_a, lord_b = b.lord[first], b.lord[second]
+        house_a, house_b = b.lord_house[first], b.lord_house[second]
+        exchange = ((b.table(SIGN_LORD, b.lord_sign[first]) == lord_b)
+                    & (b.table(SIGN_LORD, b.lord_sign[second]) == lord_a))
+        mutual_aspect = ((b.table(ASPECT_MASKS, lord_a) >> (house_b - house_a) % 12)
+                         & (b.table(ASPECT_MASKS, lord_b) >> (house_a - house_b) % 12) & 1 == 1)
+        return (house_a == house_b) | exchange | mutual_aspect
+    return condition
+
+
+def _lords_apart(spec, groups):
+    first, second = (house - 1 for house in spec['lords'])
+    mask = _house_mask(spec['houses'])
+
+    def condition(b):
+        distance = (b.lord_house[second] - b.lord_house[first]) % 12
+        return (mask >> distance) & 1 == 1
+    return condition
+
+
+def _occupied(spec, groups):
+    members, mask, ref = _members(spec['by'], groups), _house_mask(spec['houses']), _reference(spec)
+    minimum = spec.get('min', 1)
+    if minimum > 1:
+        def condition(b):
+            base = 0 if ref is None else b.house[ref]
+            return sum((mask >> (b.house[i] - base) % 12) & 1 for i in members) >= minimum
+        return condition
+    if ref is None:
+        return lambda b: b.occupancy(members) & mask != 0
+    return lambda b: b.occupancy(members) & _rotate(mask, b.house[ref]) != 0
+
+
+def _empty(spec, groups):
+    occupied = _occupied(dict(spec, min=1), groups)
+    return lambda b: occupied(b) ^ True
+
+
+def _kendras_occupied(spec, groups):
+    members, count = _members(spec['by'], groups), spec['count']
+    return lambda b: b.popcount(b.occupancy(members) & KENDRA_MASK) >= count
+
+
+def _signs_occupied(spec, groups):
+    members, count = _members(spec['planets'], groups), spec['count']
+    return lambda b: b.popcount(b.occupancy(members, 'sign')) == count
+
+
+def _signs_within(spec, groups):
+    members = _members(spec['planets'], groups)
+    outside = ALL_HOUSES & ~sum(1 << sign for sign in spec['signs'])
+    return lambda b: b.occupancy(members, 'sign') & outside == 0
+
+
+def _exchange(spec, groups):
+    """Parivartana: two grahas each in a sign of the other, owning houses from the two sets"""
+    first, second = _house_mask(spec['houses']), _house_mask(spec['with'])
+
+    def condition(b):
+        found = b.constant(False)
+        for planet in SEVEN_GRAHAS:
+            dispositor = b.table(SIGN_LORD, b.sign[planet])
+            swapped = (b.table(SIGN_LORD, b.select(b.sign, dispositor)) == planet) & (dispositor != planet)
+            house_p, house_d = b.house[planet], b.select(b.house, dispositor)
+            matched = ((first >> house_d) & (second >> house_p)) | ((first >> house_p) & (second >> house_d))
+            found = found | (swapped & (matched & 1 == 1))
+        return found
+    return condition
+
+
+def _neecha_bhanga(spec, groups):
+    """
+    A debilitated graha whose sign lord or exaltation-sign lord is in a kendra
+    from Lagna or Moon; any of the seven unless planets narrows it
+    """
+    members = _members(spec['planets'], groups) if 'planets' in spec else SEVEN_GRAHAS
+    cancellers = [(planet, {SIGN_LORD[DEBILITATION[planet]], SIGN_LORD[EXALTATION[planet]]})
+                  for planet in members]
+
+    def in_kendra(b, i):
+        return ((KENDRA_MASK >> b.house[i]) | (KENDRA_MASK >> (b.house[i] - b.house[MOON]) % 12)) & 1 == 1
+
+    def condition(b):
+        found = b.constant(False)
+        for planet, lords in cancellers:
+            cancelled = reduce(lambda acc, lord: acc | in_kendra(b, lord), lords, b.constant(False))
+            found = found | ((b.sign[planet] == DEBILITATION[planet]) & cancelled)
+        return found
+    return condition
+
+
+def _hemmed(spec, groups):
+    """All but `outside` grahas on one side of the node axis, by longitude (whole-sign houses without one)"""
+    members, outside = _members(spec['planets'], groups), spec.get('outside', 0)
+    head, tail = (_planet(name) for name in spec['between'])
+
+    def condition(b):
+        if b.lon is not None:
+            ahead, behind = arc_geometry.arc_counts([b.lon[i] for i in members], b.lon[head], b.lon[tail])
+        else:
+            span = (b.house[tail] - b.house[head]) % 12
+            offsets = [(b.house[i] - b.house[head]) % 12 for i in members]
+            ahead = sum((offset > 0) & (offset < span) for offset in offsets)
+            behind = sum(offset > span for offset in offsets)
+        return ((behind == outside) & (ahead >= outside)) | ((ahead == outside) & (behind >= outside))
+    return condition
+
+
+def _longitude_in(spec, groups):
+    planet, ranges = _planet(spec['planet']), [tuple(r) for r in spec['ranges']]
+
+    def condition(b):
+        if b.lon is None:
+            return b.constant(False)
+        lon = b.lon[planet]
+        return reduce(lambda acc, r: acc | ((lon >= r[0]) & (lon < r[1])), ranges, b.constant(False))
+    return condition
+
+
+def _all(spec, groups):
+    first, *rest = [compile_condition(part, groups) for part in spec]
+
+    def condition(b):
+        result = first(b)
+        for part in rest:
+            result = result & part(b)
+        return result
+    return condition
+
+
+def _any(spec, groups):
+    first, *rest = [compile_condition(part, groups) for part in spec]
+
+    def condition(b):
+        result = first(b)
+        for part in rest:
+            result = result | part(b)
+        return result
+    return condition
+
+
+def _not(spec, groups):
+    part = compile_condition(spec, groups)
+    return lambda b: part(b) ^ True
+
+
+PRIMITIVES = {
+    'all': _all, 'any': _any, 'not': _not,
+    'in_houses': _in_houses, 'in_signs': _in_signs, 'conjunct': _conjunct, 'within_orb': _within_orb,
+    'aspects': _aspects,
+    'lord_in_houses': _lord_in_houses, 'lord_in_signs': _lord_in_signs,
+    'lords_related': _lords_related, 'lords_apart': _lords_apart,
+    'occupied': _occupied, 'empty': _empty, 'kendras_occupied': _kendras_occupied,
+    'signs_occupied': _signs_occupied, 'signs_within': _signs_within,
+    'exchange': _exchange, 'neecha_bhanga': _neecha_bhanga, 'hemmed': _hemmed,
+    'longitude_in': _longitude_in
+}
+
+
+def compile_condition(node: Dict, groups: Dict[str, tuple]) -> Callable:
+    """One {"primitive": spec} node of a rule condition into a closure over a ChartBoard"""
+    if len(node) != 1:
+        raise ValueError(f"Yoga rule condition must have exactly one key: {node}")
+    (primitive, spec), = node.items()
+    if primitive not in PRIMITIVES:
+        raise ValueError(f"Unknown yoga rule primitive: {primitive}")
+    return PRIMITIVES[primitive](spec, groups)
+
+
+class YogaRules:
+    """
+    yoga-rules.json compiled into condition closures: the rules in file order
+    and every rule's or named condition's closure by name
+    """
+
+    def __init__(self, rules: Dict, digest: str):
+        self.digest = digest
+        self.groups = groups = {name: tuple(_planet(p) for p in members)
+                                for name, members in rules.get('groups', {}).items()}
+        self.rules: List[Rule] = []
+        for rule in rules.get('rules', []):
+            notes_key = 'benefits' if rule['type'] == 'yoga' else 'remedies'
+            strong_when = compile_condition(rule['strong_when'], groups) if 'strong_when' in rule else None
+            self.rules.append(Rule(
+                rule['name'], rule['type'], rule.get('category', ''), rule.get('strength', 'Moderate'),
+                compile_condition(rule['when'], groups), strong_when,
+                rule.get('description', ''), notes_key, rule.get(notes_key, [])
+            ))
+        self.conditions: Dict[str, Callable] = {rule.name: rule.when for rule in self.rules}
+        for name, node in rules.get('conditions', {}).items():
+            if name in self.conditions:
+                raise ValueError(f"Yoga rule condition name is already a rule: {name}")
+            self.conditions[name] = compile_condition(node, groups)
+
+
+_rules: Optional[YogaRules] = None
+_rules_stamp: Optional[tuple] = None
+
+
+def load_rules(path: str = RULES_PATH) -> YogaRules:
+    """
+    Compiled rules, recompiled only when the file content changes. Charts are
+    evaluated one at a time, so the file is only re-read when its stat changes.
+    """
+    global _rules, _rules_stamp
+    stat = os.stat(path)
+    stamp = (path, stat.st_mtime_ns, stat.st_size)
+    if _rules is not None and stamp == _rules_stamp:
+        return _rules
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()[:12]
+    if _rules is None or _rules.digest != digest:
+        _rules = YogaRules(json.loads(raw), digest)
+    _rules_stamp = stamp
+    return _rules
+
+
+def board_from_longitudes(longitudes: Dict[str, float], ascendant_longitude: float) -> ChartBoard:
+    """Encode one chart; Ketu is derived from Rahu when absent"""
+    if 'Ketu' not in longitudes:
+        longitudes = dict(longitudes, Ketu=(longitudes['Rahu'] + 180) % 360)
+    lons = [longitudes[name] % 360 for name in PLANET_NAMES]
+    return ChartBoard([int(lon // 30) for lon in lons], int(ascendant_longitude % 360 // 30), lons)
+
+
+def board_from_positions(positions: Dict[str, Dict], ascendant_longitude: Optional[float] = None) -> ChartBoard:
+    """
+    Encode a report's {graha: {'longitude', 'house', ...}} positions. The
+    caller's house numbers are kept when every graha has one; otherwise houses
+    are whole-sign from ascendant_longitude. Without an ascendant the Lagna
+    sign is read back from the Sun's house.
+    """
+    longitudes = {name: positions[name]['longitude'] for name in PLANET_NAMES if name in positions}
+    if 'Ketu' not in longitudes:
+        longitudes['Ketu'] = (longitudes['Rahu'] + 180) % 360
+    lons = [longitudes[name] % 360 for name in PLANET_NAMES]
+    signs = [int(lon // 30) for lon in lons]
+    houses = [positions.get(name, {}).get('house') for name in PLANET_NAMES]
+    houses = None if None in houses else [house - 1 for house in houses]
+    if ascendant_longitude is not None:
+        ascendant_sign = int(ascendant_longitude % 360 // 30)
+    elif houses is not None:
+        ascendant_sign = (signs[0] - houses[0]) % 12
+    else:
+        raise ValueError("Chart positions need house numbers or an ascendant longitude")
+    return ChartBoard(signs, ascendant_sign, lons, houses=houses)
+
+
+def holds(board: ChartBoard, condition) -> bool:
+    """
+    Whether a rule or named condition of yoga-rules.json holds for one chart;
+    condition may also be an inline condition node
+    """
+    rules = load_rules()
+    if isinstance(condition, str):
+        if condition not in rules.conditions:
+            raise ValueError(f"Unknown yoga rule or condition: {condition}")
+        return bool(rules.conditions[condition](board))
+    return bool(compile_condition(condition, rules.groups)(board))
+
+
+def matching(board: ChartBoard, category: str) -> List[str]:
+    """Names of the rules of one category present in a chart"""
+    return [rule.name for rule in load_rules().rules if rule.category == category and rule.when(board)]
+
+
+def evaluate(planets: List[Dict], ascendant_longitude: float) -> Dict:
+    """
+    Yogas and doshas present in one chart. planets is a list of dicts with
+    name and sidereal longitude, as produced by JyotishaEngine.
+    """
+    board = board_from_longitudes({p['name']: p['longitude'] for p in planets}, ascendant_longitude)
+    houses = {name: board.house[i] + 1 for i, name in enumerate(PLANET_NAMES)}
+
+    yogas, doshas = [], []
+    for rule in load_rules().rules:
+        if not rule.when(board):
+            continue
+        strength = 'High' if rule.strong_when is not None and rule.strong_when(board) else rule.strength
+        entry = {
+            'name': rule.name,
+            'category': rule.category,
+            'description': rule.description.format(house=houses) if '{' in rule.description else rule.description,
+            'strength': strength,
+            rule.notes_key: list(rule.notes)
+        }
+        (yogas if rule.type == 'yoga' else doshas).append(entry)
+
+    return {
+        'yogas': yogas,
+        'doshas': doshas,
+        'total_yogas': len(yogas),
+        'total_doshas': len(doshas)
+    }
+
+
+def evaluate_bulk(longitudes, ascendant_longitudes) -> Dict[str, object]:
+    """
+    Every rule over a population: longitudes is an N x 9 array in PLANET_NAMES
+    order and ascendant_longitudes has length N. Returns rule name -> bool array.
+    """
+    import numpy as np
+
+    longitudes = np.asarray(longitudes, dtype=float) % 360
+    signs = (longitudes // 30).astype(np.int64)
+    ascendant = (np.asarray(ascendant_longitudes, dtype=float) % 360 // 30).astype(np.int64)
+    board = ChartBoard([signs[:, i] for i in range(len(PLANET_NAMES))], ascendant,
+                       [longitudes[:, i] for i in range(len(PLANET_NAMES))], np=np)
+    return {rule.name: np.broadcast_to(rule.when(board), ascendant.shape) for rule in load_rules().rules}
+
+
+def population_sample(count: int, latitude: float = 13.0827, longitude: float = 80.2707, seed: int = 0):
+    """Charts for random birth moments 1940-2020 at one place, in evaluate_bulk layout"""
+    import swisseph as swe
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+    bodies = (swe.SUN, swe.MOON, swe.MARS, swe.MERCURY, swe.JUPITER, swe.VENUS, swe.SATURN, swe.MEAN_NODE)
+    rng = random.Random(seed)
+    start, end = swe.julday(1940, 1, 1, 0.0), swe.julday(2020, 1, 1, 0.0)
+
+    rows, ascendants = [], []
+    for _ in range(count):
+        jd = rng.uniform(start, end)
+        row = [swe.calc_ut(jd, body, flags)[0][0] for body in bodies]
+        rows.append(row + [(row[-1] + 180) % 360])
+        ascendants.append(swe.houses_ex(jd, latitude, longitude, b'P', swe.FLG_SIDEREAL)[1][0])
+    return rows, ascendants
+
+
+def main():
+    """Command line: one chart as JSON on stdin, or --population N for rule prevalence"""
+    try:
+        with engine_logging.stdout_to_stderr():
+            if len(sys.argv) > 2 and sys.argv[1] == '--population':
+                rows, ascendants = population_sample(int(sys.argv[2]))
+                matches = evaluate_bulk(rows, ascendants)
+                prevalence = {name: round(float(hits.mean()), 4) for name, hits in matches.items()}
+                log.debug("Evaluated {} rules over {} charts", len(prevalence), len(rows))
+                result = {'success': True, 'charts': len(rows), 'prevalence': prevalence}
+            else:
+                request = json.loads(sys.stdin.read())
+                result = dict(evaluate(request['planets'], float(request['ascendant'])), success=True)
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,7 @@ export default function KPTestPage() {
   });
 
   const [horaryQuestion, setHoraryQuestion] = useState('Will I get the promotion this year?');
+  const [horaryNumber, setHoraryNumber] = useState('1');
 
   const testKPChart = async () => {
     setLoading(true);
@@ -102,7 +103,8 @@ export default function KPTestPage() {
         },
         body: JSON.stringify({
           question: horaryQuestion,
-          query_time: new Date().toISOString(),
+          horary_number: Number(horaryNumber),
+          query_time: new Date().toISOString(), // UTC instant
           latitude: 13.0827, // Chennai coordinates
           longitude: 80.2707
         })
@@ -313,6 +315,17 @@ export default function KPTestPage() {
                   rows={3}
                 />
               </div>
+              <div>
+                <Label htmlFor="horary-number">Horary Number (1-249)</Label>
+                <Input
+                  id="horary-number"
+                  type="number"
+                  min={1}
+                  max={249}
+                  value={horaryNumber}
+                  onChange={(e) => setHoraryNumber(e.target.value)}
+                />
+              </div>
               <Button onClick={testHorary} disabled={loading} className="w-full">
                 {loading ? 'Analyzing...' : 'Analyze Question'}
               </Button>